@@ -0,0 +1,114 @@
+#-------------------------------------------------------------------------------
+#
+#  Benchmark measuring the start up cost of Traits UI: the time taken by a
+#  cold 'python -c "import traitsui.api"', and the time taken to get to a
+#  first user interface.
+#
+#  Each measurement runs in a new Python process. The toolkit used is taken
+#  from the ETS_TOOLKIT environment variable, and defaults to 'null' so the
+#  benchmark can run without a display. The null toolkit cannot create
+#  windows, so there the first user interface stops once its View has been
+#  built and the editor factory of each Item resolved.
+#
+#  Usage: python import_benchmark.py [repeats]
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  License: BSD Style.
+#
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+import os
+import subprocess
+import sys
+import time
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# Code timing the import of traits.api and traitsui.api:
+ImportCode = """
+import time
+start = time.time()
+import traits.api
+middle = time.time()
+import traitsui.api
+end = time.time()
+print middle - start, end - middle
+"""
+
+# Code timing the creation of a first user interface:
+FirstUICode = """
+import time
+start = time.time()
+from traits.api import HasTraits, Bool, Enum, Float, Int, List, Range, Str
+from traitsui.api import View, Item, Group, Handler, toolkit
+
+class Person ( HasTraits ):
+    name    = Str
+    age     = Int
+    weight  = Float
+    married = Bool
+    gender  = Enum( 'female', 'male' )
+    rating  = Range( 0, 10 )
+    tags    = List( Str )
+
+    view = View( Group( Item( 'name' ), Item( 'age' ), Item( 'weight' ),
+                        Item( 'married' ), Item( 'gender' ),
+                        Item( 'rating' ), Item( 'tags' ) ) )
+
+person = Person()
+if toolkit().__class__.__module__.startswith( 'traitsui.null' ):
+    view = person.trait_view()
+    for item in view.content.content[0].content:
+        item.editor or person.base_trait( item.name ).get_editor()
+else:
+    from pyface.api import GUI
+    gui = GUI()
+    person.edit_traits( kind = 'live' ).dispose()
+print time.time() - start
+"""
+
+#-------------------------------------------------------------------------------
+#  Benchmark:
+#-------------------------------------------------------------------------------
+
+def run ( code ):
+    """ Runs code in a new Python process, returning the wall clock time taken
+        by the process and the values it printed.
+    """
+    env = os.environ.copy()
+    env.setdefault( 'ETS_TOOLKIT', 'null' )
+    start  = time.time()
+    output = subprocess.check_output( [ sys.executable, '-c', code ],
+                                      env = env )
+    wall   = time.time() - start
+
+    return [ wall ] + [ float( value ) for value in output.split() ]
+
+def benchmark ( repeats = 10 ):
+    empty    = [ run( 'pass' )[0] for i in range( repeats ) ]
+    imports  = [ run( ImportCode ) for i in range( repeats ) ]
+    first_ui = [ run( FirstUICode ) for i in range( repeats ) ]
+
+    print 'toolkit: %s, best of %d runs' % (
+          os.environ.get( 'ETS_TOOLKIT', 'null' ), repeats )
+    print '  python startup:                  %7.3fs' % min( empty )
+    print '  python -c "import traitsui.api": %7.3fs' % min(
+          [ wall for wall, traits, traitsui in imports ] )
+    print '    import traits.api:             %7.3fs' % min(
+          [ traits for wall, traits, traitsui in imports ] )
+    print '    import traitsui.api:           %7.3fs' % min(
+          [ traitsui for wall, traits, traitsui in imports ] )
+    print '  time to first UI:                %7.3fs' % min(
+          [ ui for wall, ui in first_ui ] )
+
+if __name__ == '__main__':
+    if len( sys.argv ) > 1:
+        benchmark( int( sys.argv[1] ) )
+    else:
+        benchmark()
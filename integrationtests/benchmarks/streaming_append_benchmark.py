@@ -0,0 +1,116 @@
+#-------------------------------------------------------------------------------
+#
+#  Benchmark measuring the cost of streaming rows into a TabularEditor and a
+#  ListStrEditor (e.g. a log view), one row at a time, as the list grows.
+#
+#  Each appended row is reported to the Qt views as a single inserted row, so
+#  the cost per row should stay constant as the list grows. For comparison,
+#  the benchmark also measures the cost of resetting the model on each append
+#  (which is what the editors used to do).
+#
+#  Requires the Qt toolkit (PyQt4 or PySide).
+#
+#  Usage: python streaming_append_benchmark.py [appends]
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  License: BSD Style.
+#
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+import sys
+import time
+
+from traits.etsconfig.api import ETSConfig
+ETSConfig.toolkit = 'qt4'
+
+from pyface.qt import QtGui
+
+from traits.api \
+    import HasTraits, List, Str, Tuple, Int
+
+from traitsui.api \
+    import View, Item, TabularEditor, ListStrEditor
+
+from traitsui.tabular_adapter \
+    import TabularAdapter
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The list sizes the appends are measured at:
+Sizes = ( 1000, 10000, 100000, 1000000 )
+
+#-------------------------------------------------------------------------------
+#  'Log' class:
+#-------------------------------------------------------------------------------
+
+class Log ( HasTraits ):
+
+    # The log records shown in a TabularEditor:
+    records = List( Tuple( Int, Str ) )
+
+    # The log lines shown in a ListStrEditor:
+    lines = List( Str )
+
+    view = View(
+        Item( 'records',
+              editor = TabularEditor(
+                           adapter = TabularAdapter(
+                               columns = [ ( 'Line', 0 ), ( 'Message', 1 ) ] ),
+                           editable = False ) ),
+        Item( 'lines', editor = ListStrEditor( editable = False ) ),
+        width = 600, height = 400, resizable = True )
+
+#-------------------------------------------------------------------------------
+#  Benchmark:
+#-------------------------------------------------------------------------------
+
+def time_appends ( app, log, name, n, reset ):
+    """ Returns the time per row taken to append **n** rows to **log.name**,
+        processing the resulting events after each append. If **reset** is
+        True, the editor model is also reset after each append.
+    """
+    values = getattr( log, name )
+    model  = log._ui.get_editors( name )[0].model
+    start  = time.time()
+    for i in xrange( n ):
+        if name == 'records':
+            values.append( ( len( values ), 'message %d' % i ) )
+        else:
+            values.append( 'message %d' % i )
+        if reset:
+            model.reset()
+        app.processEvents()
+
+    return (time.time() - start) / n
+
+def benchmark ( n = 200 ):
+    app = QtGui.QApplication.instance() or QtGui.QApplication( sys.argv )
+    log = Log()
+    log._ui = log.edit_traits()
+    app.processEvents()
+
+    print 'time per appended row (%d appends)' % n
+    for size in Sizes:
+        log.records = [ ( i, 'message %d' % i ) for i in xrange( size ) ]
+        log.lines   = [ 'message %d' % i for i in xrange( size ) ]
+        app.processEvents()
+
+        for name in ( 'records', 'lines' ):
+            reset_time = time_appends( app, log, name, n, True )
+            row_time   = time_appends( app, log, name, n, False )
+            print '%8d rows %-8s reset: %8.3fms  insert: %8.3fms' % (
+                  size, name, reset_time * 1000.0, row_time * 1000.0 )
+
+    log._ui.dispose()
+
+if __name__ == '__main__':
+    if len( sys.argv ) > 1:
+        benchmark( int( sys.argv[1] ) )
+    else:
+        benchmark()
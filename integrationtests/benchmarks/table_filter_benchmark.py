@@ -0,0 +1,151 @@
+#-------------------------------------------------------------------------------
+#
+#  Benchmark comparing the original per-row evaluation of EvalTableFilter and
+#  RuleTableFilter with the compiled filter predicates.
+#
+#  Usage: python table_filter_benchmark.py [number_of_rows]
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  License: BSD Style.
+#
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+import random
+import sys
+import time
+
+from traits.etsconfig.api import ETSConfig
+ETSConfig.toolkit = 'null'
+
+from traits.api \
+    import HasTraits, Str, Int, Float, Bool
+
+from traitsui.api \
+    import EvalTableFilter, RuleTableFilter, MenuTableFilter
+
+from traitsui.table_filter \
+    import GenericTableFilterRule
+
+#-------------------------------------------------------------------------------
+#  'Person' class:
+#-------------------------------------------------------------------------------
+
+class Person ( HasTraits ):
+
+    name    = Str
+    age     = Int
+    weight  = Float
+    phone   = Str
+    married = Bool
+    city    = Str
+    zip     = Int
+
+def make_people ( n ):
+    names  = [ 'Dave', 'Mike', 'Joe', 'Tom', 'Dick', 'Harry', 'Sally' ]
+    cities = [ 'Austin', 'Boston', 'Chicago', 'Denver' ]
+    return [ Person( name    = random.choice( names ),
+                     age     = random.randint( 18, 90 ),
+                     weight  = random.uniform( 100.0, 250.0 ),
+                     phone   = '555-%04d' % random.randint( 0, 9999 ),
+                     married = random.random() < 0.5,
+                     city    = random.choice( cities ),
+                     zip     = random.randint( 10000, 99999 ) )
+             for i in xrange( n ) ]
+
+#-------------------------------------------------------------------------------
+#  The original (uncompiled) filter implementations:
+#-------------------------------------------------------------------------------
+
+def old_eval_filter ( filter, object ):
+    try:
+        return eval( filter.expression_, globals(),
+                     object.get( *object.trait_names() ) )
+    except:
+        return False
+
+def old_rule_filter ( filter, object ):
+    is_first = is_true = True
+    for rule in filter.rules:
+        if rule.and_or == 'or':
+            if is_true and (not is_first):
+                return True
+            is_true = True
+        if is_true:
+            is_true = rule.is_true( object )
+        is_first = False
+    return is_true
+
+def old_menu_filter ( filter, object ):
+    for rule in filter.rules:
+        if rule.enabled and (not rule.is_true( object )):
+            return False
+    return True
+
+#-------------------------------------------------------------------------------
+#  Benchmark:
+#-------------------------------------------------------------------------------
+
+def make_rules ( filter, specs ):
+    rules = []
+    for name, operation, value, and_or in specs:
+        rule = GenericTableFilterRule( filter    = filter,
+                                       name      = name,
+                                       operation = operation,
+                                       value     = value,
+                                       and_or    = and_or )
+        rule.enabled = True
+        rules.append( rule )
+    filter.rules = rules
+    return filter
+
+def best_time ( function, repeat = 3 ):
+    times = []
+    for i in range( repeat ):
+        start = time.time()
+        result = function()
+        times.append( time.time() - start )
+    return min( times ), result
+
+def benchmark ( n = 100000 ):
+    people  = make_people( n )
+    filters = [
+        ( EvalTableFilter( expression = "age > 40 and city == 'Boston'" ),
+          old_eval_filter ),
+        ( make_rules( RuleTableFilter(), [
+              ( 'age',  '>',        40,       'and' ),
+              ( 'city', '=',        'Boston', 'and' ),
+              ( 'name', 'contains', 'a',      'or'  ) ] ),
+          old_rule_filter ),
+        ( make_rules( MenuTableFilter(), [
+              ( 'weight',  '<',  200.0, 'and' ),
+              ( 'married', '=',  True,  'and' ) ] ),
+          old_menu_filter )
+    ]
+
+    print '%d rows' % n
+    for filter, old_filter in filters:
+        old_time, old_result = best_time(
+            lambda: [ old_filter( filter, person ) for person in people ] )
+        new_time, new_result = best_time(
+            lambda: [ filter.filter( person ) for person in people ] )
+        batch_time, batch_result = best_time(
+            lambda: filter.filter_items( people ) )
+
+        assert [ bool( x ) for x in old_result ] == \
+               [ bool( x ) for x in new_result ] == batch_result
+
+        print '%-16s old: %7.3fs  compiled: %7.3fs (%5.1fx)  ' \
+              'filter_items: %7.3fs (%5.1fx)' % (
+              filter.__class__.__name__, old_time,
+              new_time,   old_time / max( new_time,   1e-9 ),
+              batch_time, old_time / max( batch_time, 1e-9 ) )
+
+if __name__ == '__main__':
+    if len( sys.argv ) > 1:
+        benchmark( int( sys.argv[1] ) )
+    else:
+        benchmark()
@@ -0,0 +1,177 @@
+#-------------------------------------------------------------------------------
+#
+#  Benchmark simulating the repaints of a TabularEditor view of a 100,000 row
+#  by 20 column table, comparing the original TabularAdapter handler lookup
+#  with the cached, precompiled handlers.
+#
+#  Each repaint requests every role the Qt tabular model asks for, for every
+#  cell of a 40 row viewport, at evenly spaced scroll positions.
+#
+#  Usage: python tabular_adapter_benchmark.py [rows [columns [repaints]]]
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  License: BSD Style.
+#
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+import sys
+import time
+
+from traits.etsconfig.api import ETSConfig
+ETSConfig.toolkit = 'null'
+
+from traits.api \
+    import HasTraits, List, Int, Float, Str
+
+from traitsui.tabular_adapter \
+    import TabularAdapter
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The number of rows visible in the simulated view:
+ViewportRows = 40
+
+#-------------------------------------------------------------------------------
+#  Data model:
+#-------------------------------------------------------------------------------
+
+def make_record_class ( columns ):
+    traits = {}
+    for i in range( columns ):
+        traits[ 'c%d' % i ] = ( Int, Float, Str )[ i % 3 ]
+
+    return type( 'Record', ( HasTraits, ), traits )
+
+def make_table ( rows, columns ):
+    Record = make_record_class( columns )
+    names  = [ 'c%d' % i for i in range( columns ) ]
+    values = ( lambda i: i, lambda i: i * 0.5, lambda i: 'item %d' % i )
+    records = []
+    for row in xrange( rows ):
+        record = Record()
+        record.trait_set( **dict( ( name, values[ i % 3 ]( row ) )
+                                  for i, name in enumerate( names ) ) )
+        records.append( record )
+
+    return Table( records = records ), names
+
+class Table ( HasTraits ):
+
+    records = List
+
+#-------------------------------------------------------------------------------
+#  Adapters:
+#-------------------------------------------------------------------------------
+
+def make_adapter_class ( base, names ):
+    class RecordAdapter ( base ):
+        columns      = [ ( name.upper(), name ) for name in names ]
+        c1_format    = Str( '%.2f' )
+        c2_alignment = Str( 'right' )
+        odd_bg_color = ( 240, 240, 255 )
+
+    return RecordAdapter
+
+class OriginalAdapter ( TabularAdapter ):
+    """ The handler lookup used before handlers were cached per item class and
+        column, and compiled.
+    """
+
+    def _result_for ( self, name, object, trait, row, column, value = None ):
+        self.object    = object
+        self.name      = trait
+        self.row       = row
+        self.column    = column
+        self.column_id = column_id = self.column_map[ column ]
+        self.value     = value
+        self.item      = item = self.get_item( object, trait, row )
+        item_class     = item.__class__
+        key            = '%s:%s:%d' % ( item_class.__name__, name, column )
+        handler        = self.cache.get( key )
+        if handler is not None:
+            return handler()
+
+        prefix     = name[:4]
+        trait_name = name[4:]
+        for klass in item_class.__mro__:
+            handler = (self._original_handler_for( '%s_%s_%s' %
+                  ( klass.__name__, column_id, trait_name ), prefix ) or
+                self._original_handler_for( '%s_%s' %
+                  ( klass.__name__, trait_name ), prefix ))
+            if handler is not None:
+                break
+
+        if handler is None:
+            handler = (self._original_handler_for( '%s_%s' % ( column_id,
+                          trait_name ), prefix ) or
+                       self._original_handler_for( trait_name, prefix ))
+
+        self.cache[ key ] = handler
+        return handler()
+
+    def _original_handler_for ( self, name, prefix ):
+        if self.trait( name ) is not None:
+            if prefix == 'get_':
+                return lambda: getattr( self, name )
+
+            return lambda: setattr( self, name, self.value )
+
+        return None
+
+#-------------------------------------------------------------------------------
+#  Benchmark:
+#-------------------------------------------------------------------------------
+
+def repaint ( adapter, table, first, columns ):
+    """ Requests the data for every role of every visible cell, as the Qt
+        tabular model does.
+    """
+    result = []
+    append = result.append
+    for row in xrange( first, first + ViewportRows ):
+        for column in xrange( columns ):
+            append( ( adapter.get_text(       table, 'records', row, column ),
+                      adapter.get_image(      table, 'records', row, column ),
+                      adapter.get_tooltip(    table, 'records', row, column ),
+                      adapter.get_font(       table, 'records', row ),
+                      adapter.get_alignment(  table, 'records', column ),
+                      adapter.get_bg_color(   table, 'records', row ),
+                      adapter.get_text_color( table, 'records', row ) ) )
+
+    return result
+
+def benchmark ( rows = 100000, columns = 20, repaints = 100 ):
+    table, names = make_table( rows, columns )
+    step         = max( ( rows - ViewportRows ) // max( repaints - 1, 1 ), 1 )
+    firsts       = range( 0, rows - ViewportRows + 1, step )[ : repaints ]
+    adapters     = [
+        ( 'original',      make_adapter_class( OriginalAdapter, names )() ),
+        ( 'cached',        make_adapter_class( TabularAdapter, names )() ),
+        ( 'plain context', make_adapter_class( TabularAdapter, names )(
+                                               plain_context = True ) )
+    ]
+
+    print '%d rows x %d columns, %d repaints of %d rows' % (
+          rows, columns, len( firsts ), ViewportRows )
+    reference = None
+    for label, adapter in adapters:
+        start = time.time()
+        result = [ repaint( adapter, table, first, columns )
+                   for first in firsts ]
+        elapsed = time.time() - start
+        if reference is None:
+            reference, original = result, elapsed
+
+        assert result == reference
+        print '%-14s %7.3fs  %6.2f ms/repaint  (%4.1fx)' % (
+              label, elapsed, 1000.0 * elapsed / len( firsts ),
+              original / max( elapsed, 1e-9 ) )
+
+if __name__ == '__main__':
+    benchmark( *[ int( arg ) for arg in sys.argv[1:] ] )
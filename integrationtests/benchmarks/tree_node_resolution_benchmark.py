@@ -0,0 +1,95 @@
+#-------------------------------------------------------------------------------
+#
+#  Benchmark comparing the original linear TreeEditor node resolution with
+#  the per-class node cache, when expanding a tree with 100k children.
+#
+#  Usage: python tree_node_resolution_benchmark.py [number_of_objects]
+#                                                   [number_of_node_types]
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  License: BSD Style.
+#
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+import sys
+import time
+
+from traits.etsconfig.api import ETSConfig
+ETSConfig.toolkit = 'null'
+
+from traits.api \
+    import HasTraits, Int, List
+
+from traitsui.api \
+    import TreeEditor, TreeNode
+
+#-------------------------------------------------------------------------------
+#  Tree classes:
+#-------------------------------------------------------------------------------
+
+class Folder ( HasTraits ):
+
+    items = List
+
+def make_classes ( count ):
+    return [ type( 'Item%d' % i, ( HasTraits, ), { 'value': Int } )
+             for i in xrange( count ) ]
+
+def make_tree ( classes, n ):
+    return Folder( items = [ classes[ i % len( classes ) ]( value = i )
+                             for i in xrange( n ) ] )
+
+#-------------------------------------------------------------------------------
+#  The original (uncached) node resolution:
+#-------------------------------------------------------------------------------
+
+def old_nodes_for ( factory, object ):
+    return [ node for node in factory.nodes if node.is_node_for( object ) ]
+
+#-------------------------------------------------------------------------------
+#  Benchmark:
+#-------------------------------------------------------------------------------
+
+def best_time ( function, repeat = 3 ):
+    times = []
+    for i in range( repeat ):
+        start = time.time()
+        result = function()
+        times.append( time.time() - start )
+    return min( times ), result
+
+def expand ( factory, folder, nodes_for ):
+    """ Resolves the node of each child of the folder, the way the tree editor
+        does when the folder is expanded.
+    """
+    root, = nodes_for( factory, folder )
+    return [ nodes_for( factory, child )[0]
+             for child in root.get_children( folder ) ]
+
+def benchmark ( n = 100000, types = 60 ):
+    classes = make_classes( types )
+    folder  = make_tree( classes, n )
+    factory = TreeEditor( nodes = [ TreeNode( node_for = [ Folder ],
+                                              children = 'items' ) ] +
+                                  [ TreeNode( node_for = [ klass ] )
+                                    for klass in classes ] )
+
+    print '%d objects, %d node types' % ( n, types + 1 )
+    old_time, old_result = best_time(
+        lambda: expand( factory, folder, old_nodes_for ) )
+    new_time, new_result = best_time(
+        lambda: expand( factory, folder,
+                        lambda factory, object: factory.nodes_for( object ) ) )
+
+    assert old_result == new_result
+
+    print 'expand  old: %7.3fs  cached: %7.3fs (%5.1fx)' % (
+          old_time, new_time, old_time / max( new_time, 1e-9 ) )
+
+if __name__ == '__main__':
+    args = [ int( arg ) for arg in sys.argv[1:3] ]
+    benchmark( *args )
@@ -0,0 +1,506 @@
+#-------------------------------------------------------------------------------
+#
+#  Benchmark suite measuring the performance of Traits UI user interfaces:
+#
+#  - view_open_close:   the time to open and close a simple View
+#  - table_editor:      opening a TableEditor on 1k/100k objects
+#  - tabular_editor:    opening a TabularEditor on 1k/100k/1M rows, and
+#                       appending a row
+#  - tree_editor:       opening a model/view TreeEditor on 1k/100k children,
+#                       and a ValueEditor on a 1k/100k/1M item list
+#  - trait_updates:     the time per trait change shown by an editor (with
+#                       and without coalesced updates)
+#  - when_conditions:   the time per trait change re-evaluating the
+#                       'enabled_when' conditions of a View
+#  - memory_per_ui:     the memory used by each open user interface
+#
+#  Each result is a time in seconds or a size in bytes (so lower is better).
+#  The results can be written to a JSON file, and compared with the results
+#  of an earlier run (e.g. of another commit), in which case the script exits
+#  with status 1 if any result is more than 'threshold' times the earlier one.
+#
+#  The suite runs with the 'qt4' toolkit (using Qt's offscreen platform
+#  unless QT_QPA_PLATFORM is set) or the 'null' toolkit. The null toolkit
+#  cannot create windows, so there the benchmarks which need one are skipped,
+#  and the others build their user interfaces from Editors which create no
+#  controls.
+#
+#  Usage: python ui_benchmark_suite.py [--toolkit null|qt4] [--quick]
+#             [--output results.json] [--baseline baseline.json]
+#             [--threshold 1.25] [benchmark ...]
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  License: BSD Style.
+#
+#-------------------------------------------------------------------------------
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The numbers of rows the editors are measured with:
+Sizes = ( 1000, 100000, 1000000 )
+
+# The numbers of rows used by a quick run:
+QuickSizes = ( 1000, )
+
+# The number of times each measurement is repeated (the best time is used):
+Repeats = 3
+
+# The default ratio to an earlier result above which a result is a regression:
+Threshold = 1.25
+
+#-------------------------------------------------------------------------------
+#  Command line:
+#-------------------------------------------------------------------------------
+
+def parse_args ( ):
+    parser = argparse.ArgumentParser(
+        description = 'Benchmarks Traits UI user interfaces.' )
+    parser.add_argument( 'benchmarks', nargs = '*',
+        help = 'the benchmarks to run (default: all)' )
+    parser.add_argument( '--toolkit',
+        default = os.environ.get( 'ETS_TOOLKIT', 'null' ),
+        choices = ( 'null', 'qt4' ) )
+    parser.add_argument( '--quick', action = 'store_true',
+        help = 'only measure the editors with %d rows' % QuickSizes[0] )
+    parser.add_argument( '--output',
+        help = 'the JSON file to write the results to' )
+    parser.add_argument( '--baseline',
+        help = 'the JSON file of earlier results to compare with' )
+    parser.add_argument( '--threshold', type = float, default = Threshold,
+        help = 'the ratio to the baseline above which a result fails '
+               '(default: %s)' % Threshold )
+
+    return parser.parse_args()
+
+args = parse_args()
+
+# The toolkit must be selected before Traits UI is imported:
+if args.toolkit == 'qt4':
+    os.environ.setdefault( 'QT_QPA_PLATFORM', 'offscreen' )
+
+from traits.etsconfig.api import ETSConfig
+ETSConfig.toolkit = args.toolkit
+
+# Without a toolkit, run notification handlers dispatched to the UI thread
+# immediately:
+if args.toolkit == 'null':
+    from traits.trait_notifiers import set_ui_handler
+    set_ui_handler( lambda handler, *args, **kw: handler( *args, **kw ) )
+
+from traits.api \
+    import HasTraits, Bool, Enum, Float, Int, List, Str, Tuple
+
+from traitsui.api \
+    import View, Item, Group, Handler, ObjectColumn, TableEditor, \
+           TabularEditor, TreeEditor, TreeNode, ValueEditor
+
+from traitsui.editor \
+    import Editor
+
+from traitsui.tabular_adapter \
+    import TabularAdapter
+
+from traitsui.ui \
+    import UI
+
+#-------------------------------------------------------------------------------
+#  Model classes:
+#-------------------------------------------------------------------------------
+
+class Person ( HasTraits ):
+
+    name    = Str
+    age     = Int
+    weight  = Float
+    married = Bool
+    gender  = Enum( 'female', 'male' )
+
+    view = View( Group( Item( 'name' ), Item( 'age' ), Item( 'weight' ),
+                        Item( 'married' ), Item( 'gender' ) ) )
+
+class People ( HasTraits ):
+
+    people = List( Person )
+
+    view = View(
+        Item( 'people',
+              editor = TableEditor( columns = [ ObjectColumn( name = 'name' ),
+                                                ObjectColumn( name = 'age' ) ],
+                                    editable = False ),
+              show_label = False ),
+        resizable = True )
+
+class Log ( HasTraits ):
+
+    records = List( Tuple( Int, Str ) )
+
+    view = View(
+        Item( 'records',
+              editor = TabularEditor(
+                           adapter = TabularAdapter(
+                               columns = [ ( 'Line', 0 ), ( 'Message', 1 ) ] ),
+                           editable = False ),
+              show_label = False ),
+        resizable = True )
+
+class Leaf ( HasTraits ):
+
+    name = Str
+
+class Folder ( HasTraits ):
+
+    name   = Str
+    leaves = List( Leaf )
+
+# The view of a Folder as a tree:
+FolderView = View(
+    Item( 'object',
+          editor = TreeEditor(
+                       nodes = [ TreeNode( node_for  = [ Folder ],
+                                           children  = 'leaves',
+                                           label     = 'name',
+                                           auto_open = True ),
+                                 TreeNode( node_for  = [ Leaf ],
+                                           label     = 'name' ) ],
+                       model_view = True,
+                       editable   = False ),
+          show_label = False ),
+    resizable = True )
+
+class Values ( HasTraits ):
+
+    values = List( Int )
+
+    view = View( Item( 'values', editor = ValueEditor(), show_label = False ),
+                 resizable = True )
+
+# A class with many traits, each edited by an Item which is enabled when the
+# 'flag' trait is set:
+Wide = type( 'Wide', ( HasTraits, ), dict(
+    [ ( 'x%d' % i, Int ) for i in range( 200 ) ] + [ ( 'flag', Bool ) ] ) )
+
+WideView = View( *[ Item( 'x%d' % i, enabled_when = 'flag' )
+                    for i in range( 200 ) ] )
+
+#-------------------------------------------------------------------------------
+#  Helpers:
+#-------------------------------------------------------------------------------
+
+def best ( function, repeats = Repeats ):
+    """ Returns the best time taken by calling **function**.
+    """
+    times = []
+    for i in range( repeats ):
+        gc.collect()
+        start = time.time()
+        function()
+        times.append( time.time() - start )
+
+    return min( times )
+
+def memory_used ( ):
+    """ Returns the resident memory of the process in bytes (or None if it
+        is not available on the platform).
+    """
+    try:
+        with open( '/proc/self/statm' ) as file:
+            return int( file.read().split()[1] ) * os.sysconf( 'SC_PAGE_SIZE' )
+    except ( IOError, OSError, ValueError ):
+        return None
+
+def sizes ( limit ):
+    """ Returns the sizes measured by a benchmark, up to **limit** rows.
+    """
+    return [ size for size in (QuickSizes if args.quick else Sizes)
+             if size <= limit ]
+
+#-------------------------------------------------------------------------------
+#  Opening and closing user interfaces:
+#
+#  With the Qt toolkit a user interface is a 'live' window. With the null
+#  toolkit, it is a UI object whose layout and editor factories are resolved,
+#  and whose Items are edited by NullEditors.
+#-------------------------------------------------------------------------------
+
+class NullEditor ( Editor ):
+    """ An editor which creates no control.
+    """
+
+    def init ( self, parent ):
+        self.control = object()
+
+    def update_editor ( self ):
+        pass
+
+class HeadlessUI ( object ):
+    """ A user interface built without a toolkit.
+    """
+
+    def __init__ ( self, object, view ):
+        ui = self.ui = UI( view    = view,
+                           context = { 'object': object },
+                           handler = Handler() )
+        for group in ui._groups:
+            for item in group.get_content( False ):
+                trait = object.base_trait( item.name )
+                factory = ui.get_editor_factory( item, trait )
+                editor = NullEditor( None, ui = ui, object = object,
+                                     name = item.name, factory = factory,
+                                     item = item )
+                editor.prepare( None )
+                ui._editors.append( editor )
+                ui.info.bind( item.name, editor )
+                if item.enabled_when != '':
+                    ui.add_enabled( item.enabled_when, editor )
+        ui._hook_when()
+        ui._evaluate_when()
+
+    def dispose ( self ):
+        self.ui.dispose_editors( self.ui._editors[:] )
+
+def open_ui ( object, view = None ):
+    """ Opens a user interface for an object.
+    """
+    if args.toolkit == 'null':
+        return HeadlessUI( object, view or object.trait_view() )
+
+    ui = object.edit_traits( view = view, kind = 'live' )
+    process_events()
+
+    return ui
+
+def close_ui ( ui ):
+    ui.dispose()
+    process_events()
+
+def process_events ( ):
+    if args.toolkit == 'qt4':
+        from pyface.qt import QtGui
+        QtGui.QApplication.processEvents()
+
+#-------------------------------------------------------------------------------
+#  Benchmarks:
+#-------------------------------------------------------------------------------
+
+def view_open_close ( ):
+    person = Person()
+
+    return { 'open_close': best( lambda: close_ui( open_ui( person ) ) ) }
+
+def table_editor ( ):
+    results = {}
+    for size in sizes( 100000 ):
+        people = People( people = [ Person( name = 'person %d' % i, age = i )
+                                    for i in xrange( size ) ] )
+        results[ 'open_close_%d' % size ] = best(
+            lambda: close_ui( open_ui( people ) ), 1 )
+
+    return results
+
+def tabular_editor ( ):
+    results = {}
+    for size in sizes( 1000000 ):
+        log = Log( records = [ ( i, 'message %d' % i ) for i in xrange( size ) ] )
+        results[ 'open_close_%d' % size ] = best(
+            lambda: close_ui( open_ui( log ) ), 1 )
+
+        ui = open_ui( log )
+
+        def append ( ):
+            for i in range( 100 ):
+                log.records.append( ( i, 'appended' ) )
+                process_events()
+
+        results[ 'append_%d' % size ] = best( append ) / 100
+        close_ui( ui )
+
+    return results
+
+def tree_editor ( ):
+    results = {}
+    for size in sizes( 100000 ):
+        folder = Folder( name = 'root',
+                         leaves = [ Leaf( name = 'leaf %d' % i )
+                                    for i in xrange( size ) ] )
+        results[ 'open_close_%d' % size ] = best(
+            lambda: close_ui( open_ui( folder, FolderView ) ), 1 )
+
+    for size in sizes( 1000000 ):
+        values = Values( values = range( size ) )
+        results[ 'value_open_close_%d' % size ] = best(
+            lambda: close_ui( open_ui( values ) ), 1 )
+
+    return results
+
+def trait_updates ( ):
+    results = {}
+    n       = 10000
+    for coalesce in ( False, True ):
+        person = Person()
+        view   = View( Item( 'name' ), Item( 'age' ),
+                       coalesce_updates = coalesce )
+        ui = open_ui( person, view )
+
+        def update ( ):
+            for i in xrange( n ):
+                person.age = i
+            process_events()
+
+        name = 'coalesced_update' if coalesce else 'update'
+        results[ name ] = best( update ) / n
+        close_ui( ui )
+
+    return results
+
+def when_conditions ( ):
+    wide = Wide()
+    ui   = open_ui( wide, WideView )
+    n    = 100
+
+    def toggle ( ):
+        for i in xrange( n ):
+            wide.flag = not wide.flag
+        process_events()
+
+    # Changes to traits that no condition depends upon:
+    def unrelated ( ):
+        for i in xrange( n ):
+            wide.x0 = i
+        process_events()
+
+    results = { 'dependent_change':   best( toggle ) / n,
+                'independent_change': best( unrelated ) / n }
+    close_ui( ui )
+
+    return results
+
+def memory_per_ui ( ):
+    n      = 50
+    people = [ Person() for i in range( n ) ]
+    gc.collect()
+    before = memory_used()
+    if before is None:
+        return {}
+
+    uis = [ open_ui( person ) for person in people ]
+    gc.collect()
+    used = memory_used() - before
+    for ui in uis:
+        close_ui( ui )
+
+    return { 'bytes': float( used ) / n }
+
+# The benchmarks, and the toolkits each can run with:
+Benchmarks = [
+    ( 'view_open_close', view_open_close, ( 'null', 'qt4' ) ),
+    ( 'table_editor',    table_editor,    ( 'qt4', ) ),
+    ( 'tabular_editor',  tabular_editor,  ( 'qt4', ) ),
+    ( 'tree_editor',     tree_editor,     ( 'qt4', ) ),
+    ( 'trait_updates',   trait_updates,   ( 'null', 'qt4' ) ),
+    ( 'when_conditions', when_conditions, ( 'null', 'qt4' ) ),
+    ( 'memory_per_ui',   memory_per_ui,   ( 'null', 'qt4' ) )
+]
+
+#-------------------------------------------------------------------------------
+#  Running and comparing the benchmarks:
+#-------------------------------------------------------------------------------
+
+def git_commit ( ):
+    """ Returns the commit the suite is run on (or None if unknown).
+    """
+    try:
+        return subprocess.check_output( [ 'git', 'rev-parse', 'HEAD' ],
+            cwd = os.path.dirname( os.path.abspath( __file__ ) ),
+            stderr = open( os.devnull, 'w' ) ).strip()
+    except ( OSError, subprocess.CalledProcessError ):
+        return None
+
+def run ( names ):
+    """ Runs the named benchmarks (all of them if none), returning the
+        results as a dictionary.
+    """
+    if args.toolkit == 'qt4':
+        from pyface.qt import QtGui
+        app = QtGui.QApplication.instance() or QtGui.QApplication( sys.argv )
+
+    results = {}
+    for name, benchmark, toolkits in Benchmarks:
+        if (len( names ) > 0) and (name not in names):
+            continue
+
+        if args.toolkit not in toolkits:
+            print '%-20s skipped (needs %s)' % ( name, ' or '.join( toolkits ) )
+            continue
+
+        results[ name ] = benchmark()
+        for metric, value in sorted( results[ name ].items() ):
+            print '%-20s %-26s %s' % ( name, metric, format_value( metric,
+                                                                    value ) )
+
+    return { 'toolkit': args.toolkit,
+             'commit':  git_commit(),
+             'python':  sys.version.split()[0],
+             'time':    time.time(),
+             'quick':   args.quick,
+             'results': results }
+
+def format_value ( metric, value ):
+    if metric == 'bytes':
+        return '%10.1fKB' % (value / 1024.0)
+
+    return '%10.3fms' % (value * 1000.0)
+
+def compare ( report, baseline, threshold ):
+    """ Compares the results with those of an earlier run, returning the list
+        of regressions.
+    """
+    if baseline.get( 'toolkit' ) != report[ 'toolkit' ]:
+        print 'warning: the baseline was run with the %s toolkit' % (
+              baseline.get( 'toolkit' ) )
+
+    regressions = []
+    print
+    print 'compared with %s:' % (baseline.get( 'commit' ) or 'the baseline')
+    for name, results in sorted( report[ 'results' ].items() ):
+        earlier = baseline.get( 'results', {} ).get( name, {} )
+        for metric, value in sorted( results.items() ):
+            old = earlier.get( metric )
+            if not old:
+                continue
+
+            ratio  = value / old
+            failed = ratio > threshold
+            print '%-20s %-26s %6.2fx%s' % ( name, metric, ratio,
+                                             '  REGRESSION' if failed else '' )
+            if failed:
+                regressions.append( ( name, metric, ratio ) )
+
+    return regressions
+
+if __name__ == '__main__':
+    report = run( args.benchmarks )
+
+    if args.output:
+        with open( args.output, 'w' ) as file:
+            json.dump( report, file, indent = 2, sort_keys = True )
+
+    if args.baseline:
+        with open( args.baseline ) as file:
+            baseline = json.load( file )
+
+        if len( compare( report, baseline, args.threshold ) ) > 0:
+            sys.exit( 1 )
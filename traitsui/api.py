@@ -24,6 +24,8 @@
 
 from __future__ import absolute_import
 
+import sys
+
 from .basic_editor_factory import BasicEditorFactory
 
 from .context_value import CV, CVFloat, CVInt, CVStr, CVType, ContextValue
@@ -32,17 +34,6 @@ from .editor import Editor
 
 from .editor_factory import EditorFactory
 
-from .editors.api import (ArrayEditor, BooleanEditor, ButtonEditor,
-    CheckListEditor, CodeEditor, ColorEditor, CompoundEditor, CustomEditor,
-    CSVListEditor,
-    DNDEditor, DateEditor, DefaultOverride, DirectoryEditor, DropEditor,
-    EnumEditor, FileEditor, FontEditor, HTMLEditor, HistoryEditor, ImageEditor,
-    ImageEnumEditor, InstanceEditor, KeyBindingEditor, ListEditor,
-    ListStrEditor, NullEditor, PopupEditor, ProgressEditor, RGBColorEditor,
-    RangeEditor, ScrubberEditor, SearchEditor, SetEditor, ShellEditor,
-    TableEditor, TabularEditor, TextEditor, TimeEditor, TitleEditor, TreeEditor,
-    TupleEditor, ValueEditor)
-
 from .group import (Group, HFlow, HGroup, HSplit, Tabbed, VFlow, VFold, VGrid,
     VGroup, VSplit)
 
@@ -52,6 +43,8 @@ from .help import on_help_call
 
 from .help_template import help_template
 
+from .helper import LazyModule
+
 from .include import Include
 
 from .item import (Custom, Heading, Item, Label, Readonly, Spring, UCustom,
@@ -99,3 +92,16 @@ from . import view_elements
 _constants  = toolkit().constants()
 WindowColor = _constants.get( 'WindowColor', 0xFFFFFF )
 
+# The editor factories are only imported when first used:
+LazyModule( sys.modules[ __name__ ], dict.fromkeys( [
+    'ArrayEditor', 'BooleanEditor', 'ButtonEditor', 'CheckListEditor',
+    'CodeEditor', 'ColorEditor', 'CompoundEditor', 'CustomEditor',
+    'CSVListEditor', 'DNDEditor', 'DateEditor', 'DefaultOverride',
+    'DirectoryEditor', 'DropEditor', 'EnumEditor', 'FileEditor', 'FontEditor',
+    'HTMLEditor', 'HistoryEditor', 'ImageEditor', 'ImageEnumEditor',
+    'InstanceEditor', 'KeyBindingEditor', 'ListEditor', 'ListStrEditor',
+    'NullEditor', 'PopupEditor', 'ProgressEditor', 'RGBColorEditor',
+    'RangeEditor', 'ScrubberEditor', 'SearchEditor', 'SetEditor',
+    'ShellEditor', 'TableEditor', 'TabularEditor', 'TextEditor', 'TimeEditor',
+    'TitleEditor', 'TreeEditor', 'TupleEditor', 'ValueEditor'
+], '.editors.api' ) )
@@ -29,7 +29,7 @@ from traits.api import (Any, Bool, HasPrivateTraits, HasTraits, Instance, Proper
     ReadOnly, Str, Trait, TraitError, TraitListEvent, Undefined,
     cached_property)
 
-from traits.trait_base import not_none
+from traits.trait_base import TraitsCache, not_none
 
 from .editor_factory import EditorFactory
 
@@ -37,6 +37,8 @@ from .context_value import ContextValue
 
 from .undo import UndoItem
 
+from .ui_profiler import profile_call, profiled
+
 from .item import Item
 
 #-------------------------------------------------------------------------------
@@ -121,6 +123,13 @@ class Editor ( HasPrivateTraits ):
     # The current editor invalid state status:
     invalid = Bool( False )
 
+    # Can the editor be rebound to a different object of the same class (see
+    # 'rebind')? 'rebind' only moves the listener on the object trait being
+    # edited and replays the 'sync_value' calls made by 'init' (e.g. for the
+    # 'low_name' and 'high_name' of a range editor), so only editors which set
+    # up no other listeners on the context objects should set this:
+    rebindable = Bool( False )
+
     #---------------------------------------------------------------------------
     #  Initializes the object:
     #---------------------------------------------------------------------------
@@ -142,16 +151,14 @@ class Editor ( HasPrivateTraits ):
     #  Finishes editor set-up:
     #---------------------------------------------------------------------------
 
+    @profiled( 'Editor.prepare' )
     def prepare ( self, parent ):
         """ Finishes setting up the editor.
         """
-        name = self.extended_name
-        if name != 'None':
-            self.context_object.on_trait_change( self._update_editor, name,
-                                                 dispatch = 'ui' )
-        self.init( parent )
-        self._sync_values()
-        self.update_editor()
+        profile_call( 'Editor._hook_object', self, self._hook_object )
+        profile_call( 'Editor.init', self, self.init, parent )
+        profile_call( 'Editor._sync_values', self, self._sync_values )
+        profile_call( 'Editor.update_editor', self, self.update_editor )
 
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
@@ -183,10 +190,21 @@ class Editor ( HasPrivateTraits ):
         if self.ui is None:
             return
 
-        name = self.extended_name
-        if name != 'None':
-            self.context_object.on_trait_change( self._update_editor, name,
-                                                 remove = True )
+        self.unbind()
+
+        # Break linkages to references we no longer need:
+        self.object = self.ui = self.item = self.factory = self.control = \
+        self.label_control = self.old_value = self._context_object = None
+
+    #---------------------------------------------------------------------------
+    #  Stops listening to the object the editor is editing:
+    #---------------------------------------------------------------------------
+
+    def unbind ( self ):
+        """ Removes the editor's trait change and synchronization handlers
+            from the object (and other context objects) it is editing.
+        """
+        self._unhook_object()
 
         if self._user_from is not None:
             for name, handler in self._user_from:
@@ -196,9 +214,35 @@ class Editor ( HasPrivateTraits ):
             for object, name, handler in self._user_to:
                 object.on_trait_change( handler, name, remove = True )
 
-        # Break linkages to references we no longer need:
-        self.object = self.ui = self.item = self.factory = self.control = \
-        self.label_control = self.old_value = self._context_object = None
+        self._user_from = self._user_to = None
+
+    #---------------------------------------------------------------------------
+    #  Rebinds the editor to the object named in its UI's updated context:
+    #---------------------------------------------------------------------------
+
+    def rebind ( self ):
+        """ Rebinds the editor to the object its **object_name** refers to
+            in its UI's (updated) context, moving its trait change and
+            synchronization handlers to the new object and updating its
+            control to show the new value, without recreating the control.
+
+            Must be preceded by a call to **unbind** made before the context
+            changed. Only valid if the editor is **rebindable**.
+        """
+        self.__dict__.pop( TraitsCache + 'context_object', None )
+        self.object = eval( self.object_name, globals(), self.ui.context )
+        try:
+            self.old_value = getattr( self.object, self.name )
+        except AttributeError:
+            self.old_value = Undefined
+
+        self._hook_object()
+
+        syncs, self._syncs = self._syncs, None
+        for sync in (syncs or []):
+            self.sync_value( *sync )
+
+        self.update_editor()
 
     #---------------------------------------------------------------------------
     #  Returns the context object the editor is using (Property implementation):
@@ -322,6 +366,53 @@ class Editor ( HasPrivateTraits ):
         """
         pass
 
+    #---------------------------------------------------------------------------
+    #  Listens to (or stops listening to) changes to the object trait:
+    #---------------------------------------------------------------------------
+
+    def _hook_object ( self ):
+        """ Listens to changes to the object trait being edited.
+        """
+        name = self.extended_name
+        if name != 'None':
+            view = self.ui.view
+            if (self.item.coalesce_updates or
+                ((view is not None) and view.coalesce_updates)):
+                # Let the UI's update scheduler coalesce the updates, which
+                # are then applied on the UI thread:
+                self._update_scheduler = self.ui.update_scheduler
+                self.context_object.on_trait_change( self._schedule_update,
+                                                     name )
+            else:
+                self.context_object.on_trait_change( self._update_editor,
+                                                     name, dispatch = 'ui' )
+
+    def _unhook_object ( self ):
+        """ Stops listening to changes to the object trait being edited.
+        """
+        name = self.extended_name
+        if name != 'None':
+            self.context_object.on_trait_change( self._editor_updater(), name,
+                                                 remove = True )
+
+    #---------------------------------------------------------------------------
+    #  Schedules an update when the object trait changes (on any thread):
+    #---------------------------------------------------------------------------
+
+    def _schedule_update ( self, object, name, old_value, new_value ):
+        """ Schedules a coalesced update when the object trait changes.
+        """
+        self._update_scheduler.schedule( self, object, name, old_value,
+                                         new_value )
+
+    def _editor_updater ( self ):
+        """ Returns the handler listening to changes to the object trait.
+        """
+        if self._update_scheduler is not None:
+            return self._schedule_update
+
+        return self._update_editor
+
     #---------------------------------------------------------------------------
     #  Performs updates when the object trait changes:
     #---------------------------------------------------------------------------
@@ -347,7 +438,7 @@ class Editor ( HasPrivateTraits ):
 
         # If the editor has gone away for some reason, disconnect and exit:
         if self.control is None:
-            self.context_object.on_trait_change( self._update_editor,
+            self.context_object.on_trait_change( self._editor_updater(),
                                     self.extended_name, remove = True )
             return
 
@@ -462,6 +553,12 @@ class Editor ( HasPrivateTraits ):
             object trait.
         """
         if user_name != '':
+            # Remember the synchronization, so it can be re-established if the
+            # editor is rebound to a different object:
+            if self._syncs is None:
+                self._syncs = []
+            self._syncs.append( ( user_name, editor_name, mode, is_list ) )
+
             key = '%s:%s' % ( user_name, editor_name )
 
             if self._no_trait_update is None:
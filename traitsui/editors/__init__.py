@@ -19,13 +19,22 @@
 
 from __future__ import absolute_import
 
-from .api import (toolkit, ArrayEditor, BooleanEditor, ButtonEditor,
-    CheckListEditor, CodeEditor, ColorEditor, CompoundEditor, CustomEditor,
-    DateEditor, DefaultOverride, DirectoryEditor, DNDEditor, DropEditor,
-    EnumEditor, FileEditor, FontEditor, KeyBindingEditor, ImageEditor,
-    ImageEnumEditor, InstanceEditor, ListEditor, ListStrEditor, NullEditor,
-    RangeEditor, RGBColorEditor, SetEditor, TextEditor, TableEditor,
-    TimeEditor, TitleEditor, TreeEditor, TupleEditor, HistoryEditor,
-    HTMLEditor, PopupEditor, ValueEditor, ShellEditor, ScrubberEditor,
-    TabularEditor, ProgressEditor, SearchEditor)
+import sys
 
+from ..helper import LazyModule
+
+from .api import toolkit
+
+# The editor factories are only imported when first used:
+LazyModule( sys.modules[ __name__ ], dict.fromkeys( [
+    'ArrayEditor', 'BooleanEditor', 'ButtonEditor', 'CheckListEditor',
+    'CodeEditor', 'ColorEditor', 'CompoundEditor', 'CSVListEditor',
+    'CustomEditor', 'DateEditor', 'DefaultOverride', 'DirectoryEditor',
+    'DNDEditor', 'DropEditor', 'EnumEditor', 'FileEditor', 'FontEditor',
+    'KeyBindingEditor', 'ImageEditor', 'ImageEnumEditor', 'InstanceEditor',
+    'ListEditor', 'ListStrEditor', 'NullEditor', 'RangeEditor',
+    'RGBColorEditor', 'SetEditor', 'TextEditor', 'TableEditor', 'TimeEditor',
+    'TitleEditor', 'TreeEditor', 'TupleEditor', 'HistoryEditor', 'HTMLEditor',
+    'PopupEditor', 'ValueEditor', 'ShellEditor', 'ScrubberEditor',
+    'TabularEditor', 'ProgressEditor', 'SearchEditor'
+], '.api' ) )
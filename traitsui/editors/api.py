@@ -1,47 +1,54 @@
-
 from __future__ import absolute_import
 
+import sys
+
+from ..helper import LazyModule
+
 from ..toolkit import toolkit
 
-from .array_editor import ArrayEditor
-from .boolean_editor import BooleanEditor
-from .button_editor import ButtonEditor
-from .check_list_editor import CheckListEditor
-from .code_editor import CodeEditor
-from .color_editor import ColorEditor
-from .compound_editor import CompoundEditor
-from .csv_list_editor import CSVListEditor
-from .custom_editor import CustomEditor
-from .date_editor import DateEditor
-from .default_override import DefaultOverride
-from .directory_editor import DirectoryEditor
-from .dnd_editor import DNDEditor
-from .drop_editor import DropEditor
-from .enum_editor import EnumEditor
-from .file_editor import FileEditor
-from .font_editor import FontEditor
-from .key_binding_editor import KeyBindingEditor
-from .image_editor import ImageEditor
-from .image_enum_editor import ImageEnumEditor
-from .instance_editor import InstanceEditor
-from .list_editor import ListEditor
-from .list_str_editor import ListStrEditor
-from .null_editor import NullEditor
-from .range_editor import RangeEditor
-from .rgb_color_editor import RGBColorEditor
-from .set_editor import SetEditor
-from .text_editor import TextEditor
-from .table_editor import TableEditor
-from .time_editor import TimeEditor
-from .title_editor import TitleEditor
-from .tree_editor import TreeEditor
-from .tuple_editor import TupleEditor
-from .history_editor import HistoryEditor
-from .html_editor import HTMLEditor
-from .popup_editor import PopupEditor
-from .value_editor import ValueEditor
-from .shell_editor import ShellEditor
-from .scrubber_editor import ScrubberEditor
-from .tabular_editor import TabularEditor
-from .progress_editor import ProgressEditor
-from .search_editor import SearchEditor
+# The editor factories are only imported from the module defining each one
+# when first used:
+LazyModule( sys.modules[ __name__ ], {
+    'ArrayEditor':      '.array_editor',
+    'BooleanEditor':    '.boolean_editor',
+    'ButtonEditor':     '.button_editor',
+    'CheckListEditor':  '.check_list_editor',
+    'CodeEditor':       '.code_editor',
+    'ColorEditor':      '.color_editor',
+    'CompoundEditor':   '.compound_editor',
+    'CSVListEditor':    '.csv_list_editor',
+    'CustomEditor':     '.custom_editor',
+    'DateEditor':       '.date_editor',
+    'DefaultOverride':  '.default_override',
+    'DirectoryEditor':  '.directory_editor',
+    'DNDEditor':        '.dnd_editor',
+    'DropEditor':       '.drop_editor',
+    'EnumEditor':       '.enum_editor',
+    'FileEditor':       '.file_editor',
+    'FontEditor':       '.font_editor',
+    'KeyBindingEditor': '.key_binding_editor',
+    'ImageEditor':      '.image_editor',
+    'ImageEnumEditor':  '.image_enum_editor',
+    'InstanceEditor':   '.instance_editor',
+    'ListEditor':       '.list_editor',
+    'ListStrEditor':    '.list_str_editor',
+    'NullEditor':       '.null_editor',
+    'RangeEditor':      '.range_editor',
+    'RGBColorEditor':   '.rgb_color_editor',
+    'SetEditor':        '.set_editor',
+    'TextEditor':       '.text_editor',
+    'TableEditor':      '.table_editor',
+    'TimeEditor':       '.time_editor',
+    'TitleEditor':      '.title_editor',
+    'TreeEditor':       '.tree_editor',
+    'TupleEditor':      '.tuple_editor',
+    'HistoryEditor':    '.history_editor',
+    'HTMLEditor':       '.html_editor',
+    'PopupEditor':      '.popup_editor',
+    'ValueEditor':      '.value_editor',
+    'ShellEditor':      '.shell_editor',
+    'ScrubberEditor':   '.scrubber_editor',
+    'TabularEditor':    '.tabular_editor',
+    'ProgressEditor':   '.progress_editor',
+    'SearchEditor':     '.search_editor'
+} )
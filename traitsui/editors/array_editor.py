@@ -26,7 +26,8 @@ from __future__ import absolute_import
 
 import numpy
 
-from traits.api import Bool, HasTraits, Int, Float, Instance, false, TraitError
+from traits.api import (Any, Bool, Event, HasTraits, Int, Float, Instance,
+    false, TraitError)
 
 from ..editor import Editor
 
@@ -41,6 +42,10 @@ from ..group import Group
 
 from ..item import Item
 
+from ..tabular_adapter import TabularAdapter
+
+from .tabular_editor import TabularEditor
+
 #-------------------------------------------------------------------------------
 #  'ToolkitEditorFactory' class:
 #-------------------------------------------------------------------------------
@@ -62,6 +67,11 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is user input set when the Enter key is pressed?
     enter_set = Bool( False )
 
+    # Should the array be displayed using a virtual table, which only renders
+    # the cells currently visible, rather than using one field per element?
+    # (Recommended for large arrays):
+    virtual = Bool( False )
+
 #-------------------------------------------------------------------------------
 #  'ArrayStructure' class:
 #-------------------------------------------------------------------------------
@@ -205,6 +215,162 @@ class ArrayStructure ( HasTraits ):
 
 
 
+#-------------------------------------------------------------------------------
+#  'ArrayTableAdapter' class:
+#-------------------------------------------------------------------------------
+
+class ArrayTableAdapter ( TabularAdapter ):
+    """ Adapts the cells of a 2D array to a TabularEditor, reading and writing
+        them directly by index.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # Function used to format each cell value (if any):
+    format_func = Any
+
+    # Event fired when the visible cells need to be repainted:
+    refresh = Event( update = True )
+
+    # Event fired with the ( row, column ) index of a cell edited by the user:
+    cell_changed = Event
+
+    alignment = 'right'
+
+    #---------------------------------------------------------------------------
+    #  Returns the text to display for a specified cell:
+    #---------------------------------------------------------------------------
+
+    def get_text ( self, object, trait, row, column ):
+        """ Returns the text to display for a specified
+            *object.trait[row].column* item.
+        """
+        if self.format_func is not None:
+            return self.format_func( getattr( object, trait )[ row, column ] )
+
+        return super( ArrayTableAdapter, self ).get_text( object, trait, row,
+                                                          column )
+
+    #---------------------------------------------------------------------------
+    #  Sets the value of a specified cell from its edited text:
+    #---------------------------------------------------------------------------
+
+    def set_text ( self, object, trait, row, column, text ):
+        """ Sets the value of the specified *object.trait[row].column* array
+            cell from *text*, ignoring text not valid for the array type.
+        """
+        array = getattr( object, trait )
+        try:
+            array[ row, column ] = array.dtype.type( text )
+        except ( TypeError, ValueError ):
+            return
+
+        self.cell_changed = ( row, column )
+
+#-------------------------------------------------------------------------------
+#  'ArrayTable' class:
+#-------------------------------------------------------------------------------
+
+class ArrayTable ( HasTraits ):
+    """ Displays an array using a virtual table, which only renders the
+        visible cells and reads them straight from the array.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # Editor that this table is linked to
+    editor = Instance( Editor )
+
+    # The 2D view of the array being displayed (a 1D array is displayed as a
+    # single column)
+    array = Any
+
+    # The adapter used to display the array cells
+    adapter = Instance( ArrayTableAdapter )
+
+    # The constructed View for the array
+    view = Instance( View )
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, editor ):
+        """ Initializes the object.
+        """
+        super( ArrayTable, self ).__init__( editor = editor )
+
+        factory      = editor.factory
+        self.array   = array = self._array_for( editor.value )
+        self.adapter = adapter = ArrayTableAdapter(
+            columns     = self._columns_for( array ),
+            width       = abs( factory.width ),
+            format      = factory.format_str or '%s',
+            format_func = factory.format_func )
+        adapter.on_trait_change( self._cell_changed, 'cell_changed' )
+
+        self.view = View(
+            Item( 'array',
+                  show_label = False,
+                  editor     = TabularEditor( adapter    = adapter,
+                                              editable   = not editor.readonly,
+                                              operations = [ 'edit' ] ) )
+        )
+
+    #---------------------------------------------------------------------------
+    #  Updates the table to display a new array value:
+    #---------------------------------------------------------------------------
+
+    def update ( self, value ):
+        """ Updates the table to display a new array value. If its shape is
+            unchanged, only the visible cells are repainted.
+        """
+        array = self._array_for( value )
+        if array.shape == self.array.shape:
+            self.trait_setq( array = array )
+            self.adapter.refresh = True
+        else:
+            self.adapter.columns = self._columns_for( array )
+            self.array           = array
+
+    #---------------------------------------------------------------------------
+    #  Returns the 2D view used to display a specified array:
+    #---------------------------------------------------------------------------
+
+    def _array_for ( self, value ):
+        """ Returns the 2D view used to display a specified array.
+        """
+        if len( value.shape ) == 1:
+            return value[ :, numpy.newaxis ]
+
+        if len( value.shape ) == 2:
+            return value
+
+        raise TraitError( 'Only 1D or 2D arrays supported' )
+
+    #---------------------------------------------------------------------------
+    #  Returns the table columns used to display a specified 2D array view:
+    #---------------------------------------------------------------------------
+
+    def _columns_for ( self, array ):
+        """ Returns the table columns used to display a specified 2D array
+            view.
+        """
+        return [ ( str( i ), i ) for i in range( array.shape[1] ) ]
+
+    #---------------------------------------------------------------------------
+    #  Handles the user editing a cell of the array:
+    #---------------------------------------------------------------------------
+
+    def _cell_changed ( self ):
+        """ Handles the user editing a cell of the array.
+        """
+        self.editor.update_cell()
+
 #-------------------------------------------------------------------------------
 #  Toolkit-independent 'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -229,7 +395,12 @@ class SimpleEditor ( Editor ):
         """ Finishes initializing the editor by creating the underlying toolkit
             widget.
         """
-        self._as     = _as = ArrayStructure( self )
+        if self.factory.virtual:
+            self.scrollable = True
+            self._as        = _as = ArrayTable( self )
+        else:
+            self._as = _as = ArrayStructure( self )
+
         ui           = _as.view.ui( _as, parent, kind = 'subpanel' )
         ui.parent    = self.ui
         self.control = ui.control
@@ -249,8 +420,11 @@ class SimpleEditor ( Editor ):
             shape  = object.shape
             _as    = self._as
 
+            # Virtual table
+            if isinstance( _as, ArrayTable ):
+                _as.update( object )
             # 1D
-            if len( shape ) == 1:
+            elif len( shape ) == 1:
                 for i in range( shape[0] ):
                     setattr( _as, 'f%d' % i, object[i] )
             # 2D
@@ -272,6 +446,19 @@ class SimpleEditor ( Editor ):
         self.value = value
         self._busy = False
 
+    #---------------------------------------------------------------------------
+    #  Notifies that a cell of the array value has been edited in place:
+    #---------------------------------------------------------------------------
+
+    def update_cell ( self ):
+        """ Notifies that a cell of the array value associated with the editor
+            has been edited in place.
+        """
+        self._busy = True
+        value      = self.value
+        self.object.trait_property_changed( self.name, value, value )
+        self._busy = False
+
 
 # Define the ArrayEditor class
 ArrayEditor = ToolkitEditorFactory
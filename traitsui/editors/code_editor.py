@@ -25,7 +25,7 @@ useful for tools such as debuggers.
 
 from __future__ import absolute_import
 
-from traits.api import Instance, Str, Color, Enum, Bool
+from traits.api import Instance, Str, Color, Enum, Bool, Int
 
 from ..editor_factory import EditorFactory
 
@@ -83,6 +83,16 @@ class ToolkitEditorFactory ( EditorFactory ):
     # Is user input set on every change?
     auto_set = Bool( True )
 
+    # Should the edits made in the editor be applied to the trait as the
+    # changed part of the text (after a pause in typing), rather than by
+    # copying the whole text on every change? Only used for string traits,
+    # and useful for very large texts.
+    incremental = Bool( False )
+
+    # The pause (in milliseconds) after the last edit before the edits are
+    # applied to the trait in incremental mode
+    sync_delay = Int( 250 )
+
     # Should the editor auto-scroll when a new **selected_line** value is set?
     auto_scroll = Bool( True )
 
@@ -89,6 +89,11 @@ class ToolkitEditorFactory ( EditorFactory ):
     # The number of list columns to create:
     columns = columns_trait
 
+    # The number of list items above which only the item editors visible in
+    # the scrolled list are created (0 means the editors for all of the items
+    # are always created). Not used in notebook mode:
+    virtual_threshold = Int(0)
+
     # Use a notebook for a custom view?
     use_notebook = Bool(False)
 
@@ -130,6 +135,14 @@ class ToolkitEditorFactory ( EditorFactory ):
     # selection with:
     selected = Str
 
+    # Should each notebook page be built only when it is first shown?
+    lazy = Bool(False)
+
+    # The maximum number of built notebook pages to keep when **lazy** is
+    # True. The user interfaces of the least recently shown pages beyond this
+    # number are disposed of (0 means there is no limit):
+    max_pages = Int(0)
+
     #---------------------------------------------------------------------------
     #  Traits view definition:
     #---------------------------------------------------------------------------
@@ -166,7 +179,7 @@ class ListItemProxy ( HasTraits ):
     list = Property
 
     # The item proxies index into the original list:
-    index = Int
+    index = Property( Int )
 
     # Delegate all other traits to the original object:
     _ = PrototypedFrom( '_zzz_object' )
@@ -176,6 +189,11 @@ class ListItemProxy ( HasTraits ):
     _zzz_inited = Any
     _zzz_object = Any
     _zzz_name   = Any
+    _zzz_index  = Int
+
+    # The ListItemIndex containing the proxy (if any), which keeps its index
+    # up to date:
+    _zzz_map    = Any
 
     def __init__ ( self, object, name, index, trait, value ):
         super( ListItemProxy, self ).__init__()
@@ -194,10 +212,124 @@ class ListItemProxy ( HasTraits ):
     def _get_list ( self ):
         return getattr( self._zzz_object, self._zzz_name )
 
+    def _get_index ( self ):
+        if self._zzz_map is not None:
+            self._zzz_map.renumber( self )
+
+        return self._zzz_index
+
+    def _set_index ( self, index ):
+        self._zzz_index = index
+
     def _value_changed ( self, old_value, new_value ):
         if self._zzz_inited:
             self.list[ self.index ] = new_value
 
+#-------------------------------------------------------------------------------
+#  'ListItemIndex' class:
+#   This class maps list indices to the ListItemProxy objects of the items
+#   which currently have an editor.
+#-------------------------------------------------------------------------------
+
+class ListItemIndex ( object ):
+    """ Maps the indices of the items of a list being edited to their
+        ListItemProxy objects, and keeps the proxy indices up to date as items
+        are inserted into or removed from the list.
+
+        Only the items which currently have an editor have a proxy. The
+        indices of the proxies following a change are only renumbered when
+        the index of one of them is needed, so the cost of applying a change
+        depends on the number of items changed, not on the number of proxies.
+    """
+
+    def __init__ ( self ):
+        self.clear()
+
+    def __len__ ( self ):
+        return self._count
+
+    def __contains__ ( self, index ):
+        return (self.get( index ) is not None)
+
+    def get ( self, index ):
+        """ Returns the proxy for the item at the specified index, or None.
+        """
+        if 0 <= index < len( self.proxies ):
+            return self.proxies[ index ]
+
+        return None
+
+    def add ( self, proxy ):
+        """ Adds a proxy at its index.
+        """
+        proxies = self.proxies
+        index   = proxy.index
+        if index >= len( proxies ):
+            proxies.extend( [ None ] * (index + 1 - len( proxies )) )
+
+        self.remove( index )
+        proxies[ index ] = proxy
+        proxy._zzz_map   = self
+        self._count     += 1
+
+    def remove ( self, index ):
+        """ Removes and returns the proxy at the specified index (or None).
+        """
+        proxy = self.get( index )
+        if proxy is not None:
+            self.proxies[ index ] = proxy._zzz_map = None
+            self._count -= 1
+
+        return proxy
+
+    def indices ( self ):
+        """ Returns the sorted indices of the items which have a proxy.
+        """
+        return [ i for i, proxy in enumerate( self.proxies )
+                 if proxy is not None ]
+
+    def clear ( self ):
+        """ Removes all of the proxies.
+        """
+        # The proxy (or None) for each item, and the number of proxies:
+        self.proxies = []
+        self._count  = 0
+
+        # The index of the first proxy whose index may be out of date:
+        self._renumber_from = 0
+
+    def update ( self, index, removed, added ):
+        """ Updates the map for **removed** items starting at **index** being
+            replaced by **added** items, shifting the indices of the proxies of
+            the following items. Returns the proxies of the removed items.
+        """
+        proxies = self.proxies
+        if ((removed == 0) and (added == 0)) or (index >= len( proxies )):
+            return []
+
+        end     = index + removed
+        dropped = [ proxy for proxy in proxies[ index: end ]
+                    if proxy is not None ]
+        for proxy in dropped:
+            proxy._zzz_map = None
+
+        proxies[ index: end ] = [ None ] * added
+        self._count        -= len( dropped )
+        if removed != added:
+            self._renumber_from = min( self._renumber_from, index )
+
+        return dropped
+
+    def renumber ( self, proxy ):
+        """ Makes sure that the index of a proxy is up to date.
+        """
+        if proxy._zzz_index >= self._renumber_from:
+            proxies = self.proxies
+            for i in xrange( self._renumber_from, len( proxies ) ):
+                if proxies[ i ] is not None:
+                    proxies[ i ]._zzz_index = i
+            self._renumber_from = len( proxies )
+
 
 # Define the ListEditor class
 ListEditor = ToolkitEditorFactory
@@ -23,6 +23,8 @@
 
 from __future__ import absolute_import
 
+from bisect import bisect_left
+
 from traits.api import (Int, Float, List, Instance, Str, Color, Font, Any, Tuple,
         Dict, Enum, Trait, Bool, Callable, Range, on_trait_change)
 
@@ -42,6 +44,11 @@ from ..view import View
 
 from .enum_editor import EnumEditor
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #-------------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------------
@@ -549,3 +556,204 @@ class ReversedList ( object ):
             return result
 
         return index
+
+#-------------------------------------------------------------------------------
+#  Returns the range of table items affected by a list change:
+#-------------------------------------------------------------------------------
+
+def list_event_range ( items, event ):
+    """ Returns the ( index, n_removed, n_added ) range of *items* replaced by
+        the TraitListEvent *event* on the list underlying *items*.
+    """
+    index     = event.index
+    n_removed = len( event.removed )
+    n_added   = len( event.added )
+    if isinstance( items, ReversedList ):
+        index = len( items ) - index - n_added
+
+    return ( index, n_removed, n_added )
+
+#-------------------------------------------------------------------------------
+#  Helper class for toolkit-specific editors to maintain the results of
+#  filtering the table items incrementally:
+#-------------------------------------------------------------------------------
+
+class TableFilterIndex ( object ):
+    """ The results of applying a table filter to a list of table items, which
+        can be updated incrementally as the list or its items change.
+
+        **cache** contains the filter result for each item (or is None if
+        there is no filter), and **indices** contains the ascending indices of
+        the items passing the filter. Both lists are modified in place, so
+        **indices** may be replaced by a list whose changes are observed
+        (e.g. a trait list) after calling **reset**.
+    """
+
+    def __init__ ( self ):
+        self.filter  = None
+        self.cache   = None
+        self.indices = []
+
+    def reset ( self, filter, items ):
+        """ Applies a filter (a TableFilter, a callable or None) to all of the
+            specified items.
+        """
+        self.filter = filter
+        if filter is None:
+            self.cache   = None
+            self.indices = range( len( items ) )
+        else:
+            self.cache   = cache = self._filter_items( items )
+            self.indices = [ i for i, ok in enumerate( cache ) if ok ]
+
+    def update_items ( self, items, index, n_removed, n_added ):
+        """ Updates the filter results after *n_removed* items starting at
+            *index* have been replaced by *n_added* new items, evaluating the
+            filter only for the new items.
+        """
+        delta   = n_added - n_removed
+        indices = self.indices
+        cache   = self.cache
+        if cache is None:
+            if delta != 0:
+                indices[ index: ] = range( index, len( items ) )
+        else:
+            added = self._filter_items( [ items[ i ] for i in
+                                          xrange( index, index + n_added ) ] )
+            cache[ index: index + n_removed ] = added
+            first   = bisect_left( indices, index )
+            last    = bisect_left( indices, index + n_removed, first )
+            passing = [ index + i for i, ok in enumerate( added ) if ok ]
+            if delta != 0:
+                passing.extend( [ i + delta for i in indices[ last: ] ] )
+                last = len( indices )
+            if passing != indices[ first: last ]:
+                indices[ first: last ] = passing
+
+    def update_item ( self, items, index ):
+        """ Re-applies the filter to the item at the specified index after the
+            item has been modified. Returns whether the item's filter result
+            changed.
+        """
+        cache = self.cache
+        if cache is None:
+            return False
+
+        ok = self._filter_items( [ items[ index ] ] )[0]
+        if ok == cache[ index ]:
+            return False
+
+        cache[ index ] = ok
+        indices        = self.indices
+        position       = bisect_left( indices, index )
+        if ok:
+            indices.insert( position, index )
+        else:
+            del indices[ position ]
+
+        return True
+
+    def summary ( self, items ):
+        """ Returns a user readable summary of the filter results.
+        """
+        if self.cache is None:
+            return 'All %i items' % len( items )
+
+        return '%i of %i items' % ( len( self.indices ), len( items ) )
+
+    def _filter_items ( self, items ):
+        """ Returns the filter result for each of the specified items.
+        """
+        filter       = self.filter
+        filter_items = getattr( filter, 'filter_items', None )
+        if filter_items is not None:
+            return filter_items( items )
+
+        if not callable( filter ):
+            filter = filter.filter
+
+        return [ bool( filter( item ) ) for item in items ]
+
+#-------------------------------------------------------------------------------
+#  Helper class for toolkit-specific editors to cache the sort keys of the
+#  table items:
+#-------------------------------------------------------------------------------
+
+class TableSortKeys ( object ):
+    """ The sort keys of a list of table items for a table column, which are
+        computed once per sort and can be updated incrementally as the list or
+        its items change.
+    """
+
+    def __init__ ( self, column, items ):
+        self.column = column
+        key         = column.key
+        self.keys   = [ key( item ) for item in items ]
+
+    def update_items ( self, items, index, n_removed, n_added ):
+        """ Updates the sort keys after *n_removed* items starting at *index*
+            have been replaced by *n_added* new items.
+        """
+        key = self.column.key
+        self.keys[ index: index + n_removed ] = [ key( items[ i ] ) for i in
+                                                  xrange( index,
+                                                          index + n_added ) ]
+
+    def update_item ( self, items, index ):
+        """ Recomputes the sort key of the item at the specified index after
+            the item has been modified. Returns whether the key changed.
+        """
+        key = self.column.key( items[ index ] )
+        if key == self.keys[ index ]:
+            return False
+
+        self.keys[ index ] = key
+        return True
+
+    def order ( self, indices = None ):
+        """ Returns the specified item indices (or all item indices) stably
+            sorted by ascending sort key. Numeric keys are sorted using NumPy
+            if it is available.
+        """
+        keys = self.keys
+        if indices is not None:
+            keys = [ keys[ i ] for i in indices ]
+
+        if (numpy is not None) and (len( keys ) > 1):
+            types = set( [ type( key ) for key in keys ] )
+            if (len( types ) == 1) and (types.pop() in ( bool, int, long, float )):
+                order = numpy.argsort( numpy.array( keys ),
+                                       kind = 'mergesort' ).tolist()
+                if indices is None:
+                    return order
+                return [ indices[ i ] for i in order ]
+
+        if indices is None:
+            return sorted( xrange( len( keys ) ), key = keys.__getitem__ )
+
+        return [ indices[ i ] for i in
+                 sorted( xrange( len( keys ) ), key = keys.__getitem__ ) ]
+
+    def reposition ( self, order, index, reverse = False ):
+        """ Moves the item index *index* within *order*, a list of item
+            indices sorted by key (in descending order if *reverse* is True),
+            to the position matching its current sort key using a binary
+            search. Returns the ( old, new ) positions of the index.
+        """
+        old = order.index( index )
+        del order[ old ]
+
+        keys      = self.keys
+        key       = keys[ index ]
+        low, high = 0, len( order )
+        while low < high:
+            middle = (low + high) // 2
+            other  = keys[ order[ middle ] ]
+            if (other < key) if reverse else (key < other):
+                high = middle
+            else:
+                low = middle + 1
+
+        order.insert( low, index )
+
+        return ( old, low )
@@ -0,0 +1,37 @@
+from __future__ import absolute_import
+
+import numpy
+
+from nose.tools import assert_equals
+
+from traits.api import Any, HasTraits
+
+from ..array_editor import ArrayTableAdapter
+
+
+class Cells(HasTraits):
+    array = Any
+
+
+def test_array_table_adapter_reads_cells():
+    cells = Cells(array=numpy.arange(6.0).reshape(2, 3))
+    adapter = ArrayTableAdapter(columns=[ ('0', 0), ('1', 1), ('2', 2) ],
+                                format='%.1f')
+    assert_equals(adapter.len(cells, 'array'), 2)
+    assert_equals(adapter.get_text(cells, 'array', 1, 2), '5.0')
+
+    adapter.format_func = lambda value: 'v=%g' % value
+    assert_equals(adapter.get_text(cells, 'array', 0, 1), 'v=1')
+
+
+def test_array_table_adapter_writes_cells_in_place():
+    values = numpy.zeros(3, int)
+    cells = Cells(array=values[:, numpy.newaxis])
+    adapter = ArrayTableAdapter(columns=[ ('0', 0) ])
+    changes = []
+    adapter.on_trait_change(lambda new: changes.append(new), 'cell_changed')
+
+    adapter.set_text(cells, 'array', 1, 0, '7')
+    adapter.set_text(cells, 'array', 2, 0, 'not a number')
+    assert_equals(values.tolist(), [ 0, 7, 0 ])
+    assert_equals(changes, [ ( 1, 0 ) ])
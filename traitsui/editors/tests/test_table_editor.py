@@ -0,0 +1,177 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals
+
+from traits.api import HasTraits, Int, List, Str
+
+from ...api import ObjectColumn, RuleTableFilter
+from ...table_filter import GenericTableFilterRule
+from ..table_editor import ReversedList, TableFilterIndex, TableSortKeys, \
+    list_event_range
+
+
+class Row(HasTraits):
+    value = Int
+
+
+class Rows(HasTraits):
+    rows = List
+
+
+def make_filter():
+    filter = RuleTableFilter()
+    filter.rules = [ GenericTableFilterRule(filter=filter, name='value',
+                                            operation='>=', value=5) ]
+    return filter
+
+
+def expected(filter, items):
+    return [ i for i in range(len(items)) if filter.filter(items[i]) ]
+
+
+def check_list_changes(reverse):
+    filter = make_filter()
+    model = Rows(rows=[ Row(value=i) for i in range(10) ])
+    events = []
+    model.on_trait_change(lambda event: events.append(event), 'rows_items')
+
+    def items():
+        if reverse:
+            return ReversedList(model.rows)
+        return model.rows
+
+    index = TableFilterIndex()
+    index.reset(filter, items())
+    assert_equals(index.indices, expected(filter, items()))
+
+    changes = [
+        lambda rows: rows.append(Row(value=7)),
+        lambda rows: rows.insert(0, Row(value=9)),
+        lambda rows: rows.pop(3),
+        lambda rows: rows.__setitem__(4, Row(value=1)),
+        lambda rows: rows.extend([ Row(value=2), Row(value=8) ]),
+    ]
+    for change in changes:
+        change(model.rows)
+        index.update_items(items(), *list_event_range(items(), events.pop()))
+        assert_equals(index.indices, expected(filter, items()))
+        assert_equals(index.cache,
+                      [ filter.filter(item) for item in items() ])
+
+
+def test_list_changes():
+    check_list_changes(False)
+
+
+def test_reversed_list_changes():
+    check_list_changes(True)
+
+
+def test_item_change():
+    filter = make_filter()
+    items = [ Row(value=i) for i in range(10) ]
+    index = TableFilterIndex()
+    index.reset(filter, items)
+
+    items[2].value = 6
+    assert index.update_item(items, 2)
+    assert not index.update_item(items, 3)
+    assert_equals(index.indices, [ 2, 5, 6, 7, 8, 9 ])
+    assert_equals(index.summary(items), '6 of 10 items')
+
+
+def test_vectorized_rules_match_scalar_rules():
+    filter = make_filter()
+    filter.rules.append(GenericTableFilterRule(filter=filter, name='value',
+                                               operation='=', value='1',
+                                               and_or='or'))
+    items = [ Row(value=i) for i in range(10) ]
+    assert_equals(filter.filter_items(items),
+                  [ filter.filter(item) for item in items ])
+
+
+def test_compiled_rules_follow_rule_changes():
+    filter = make_filter()
+    items = [ Row(value=i) for i in range(10) ]
+    assert_equals([ filter.filter(item) for item in items ],
+                  [ item.value >= 5 for item in items ])
+
+    filter.rules[0].value = 8
+    assert_equals([ filter.filter(item) for item in items ],
+                  [ item.value >= 8 for item in items ])
+
+    filter.rules.append(GenericTableFilterRule(filter=filter, name='value',
+                                               operation='<', value=2,
+                                               and_or='or'))
+    assert_equals([ filter.filter(item) for item in items ],
+                  [ item.value >= 8 or item.value < 2 for item in items ])
+
+
+def test_appended_rules_follow_rule_changes():
+    filter = RuleTableFilter(rules=[])
+    rule = GenericTableFilterRule(name='value', operation='>=', value=5)
+    filter.rules.append(rule)
+    items = [ Row(value=i) for i in range(10) ]
+    assert_equals(sum(filter.filter(item) for item in items), 5)
+
+    rule.value = 8
+    assert_equals(sum(filter.filter(item) for item in items), 2)
+
+
+class Person(HasTraits):
+    name = Str
+    age = Int
+
+
+def test_vectorized_string_rules_match_scalar_rules():
+    people = [ Person(name=name, age=age) for name, age in
+               [ ('Alice', 30), ('bob', 40), ('Carla', 50), ('al', 60) ] ]
+    for operation, value in [ ('contains', 'AL'), ('starts with', 'al'),
+                              ('ends with', 'A'), ('=', 'bob'),
+                              ('>', 'B') ]:
+        filter = RuleTableFilter(rules=[])
+        filter.rules.append(GenericTableFilterRule(name='name',
+            operation=operation, value=value))
+        filter.rules.append(GenericTableFilterRule(name='age',
+            operation='>', value=35))
+        filter.rules.append(GenericTableFilterRule(name='age',
+            operation='<', value=35.5, and_or='or'))
+        assert_equals(filter.filter_items(people),
+                      [ filter.filter(person) for person in people ])
+        assert_equals(filter.filter_items(people),
+                      [ filter.rules[0].is_true(person) and person.age > 35
+                        or person.age < 35 for person in people ])
+
+
+class ReversedColumn(ObjectColumn):
+    def cmp(self, object1, object2):
+        return -cmp(object1.value, object2.value)
+
+
+def test_sort_keys_order():
+    items = [ Row(value=v) for v in [ 3, 1, 2, 1 ] ]
+    sort_keys = TableSortKeys(ObjectColumn(name='value'), items)
+    assert_equals(sort_keys.order(), [ 1, 3, 2, 0 ])
+    assert_equals(sort_keys.order([ 0, 2, 3 ]), [ 3, 2, 0 ])
+
+    # Columns which only customize 'cmp' are still sorted using it:
+    sort_keys = TableSortKeys(ReversedColumn(name='value'), items)
+    assert_equals(sort_keys.order(), [ 0, 2, 1, 3 ])
+
+
+def test_sort_keys_reposition():
+    items = [ Row(value=v) for v in [ 5, 1, 3, 4 ] ]
+    sort_keys = TableSortKeys(ObjectColumn(name='value'), items)
+    order = sort_keys.order()
+    assert_equals(order, [ 1, 2, 3, 0 ])
+
+    items[1].value = 6
+    assert sort_keys.update_item(items, 1)
+    assert_equals(sort_keys.reposition(order, 1), (0, 3))
+    assert_equals(order, sort_keys.order())
+
+    order.reverse()
+    items[0].value = 0
+    assert sort_keys.update_item(items, 0)
+    sort_keys.reposition(order, 0, reverse=True)
+    assert_equals(order, [ 1, 3, 2, 0 ])
@@ -22,7 +22,10 @@
 
 from __future__ import absolute_import
 
-from traits.api import Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum
+from types import InstanceType
+
+from traits.api import (Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum,
+    on_trait_change)
 
 from ..tree_node import TreeNode
 
@@ -30,6 +33,8 @@ from ..dock_window_theme import DockWindowTheme
 
 from ..editor_factory import EditorFactory
 
+from ..toolkit import toolkit_object
+
 from ..helper import Orientation
 
 #-------------------------------------------------------------------------------
@@ -138,6 +143,127 @@ class ToolkitEditorFactory ( EditorFactory ):
     # This works only in the qt backend and if there is only one column in tree
     word_wrap = Bool(False)
 
+    # Use a tree view on an item model which only creates the nodes that are
+    # needed, in batches, rather than a tree widget item for every node.
+    # This works only in the qt backend (and does not support 'word_wrap')
+    model_view = Bool(False)
+
+    #-- Private Traits ---------------------------------------------------------
+
+    # The nodes that may apply to objects of each class, as a tuple of the
+    # form: ( nodes, dynamic ). If 'dynamic' is False, 'nodes' is the list of
+    # nodes that apply. Otherwise it is a list of ( node, type_only ) tuples,
+    # and the nodes which are not type only must be asked about each object:
+    _class_nodes = Dict
+
+    # The first node that applies to each class (see 'node_for_class'):
+    _node_for_class = Dict
+
+    # The node and class for each class name (see 'node_for_class_name'):
+    _node_for_class_name = Any
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes which apply to a specified object:
+    #---------------------------------------------------------------------------
+
+    def nodes_for ( self, object ):
+        """ Returns the list of nodes (in 'nodes' order) which apply to a
+            specified object. The nodes are found once for each class of
+            object (plus a call to 'is_node_for' for each node which is not
+            **type_only**). The result must not be modified.
+        """
+        klass = type( object )
+        if klass is InstanceType:
+            klass = object.__class__
+
+        class_nodes = self._class_nodes.get( klass )
+        if class_nodes is None:
+            candidates = []
+            dynamic    = False
+            for node in self.nodes:
+                if not node.type_only:
+                    candidates.append( ( node, False ) )
+                    dynamic = True
+                elif node.is_node_for( object ):
+                    candidates.append( ( node, True ) )
+
+            if not dynamic:
+                candidates = [ node for node, _ in candidates ]
+
+            self._class_nodes[ klass ] = class_nodes = ( candidates, dynamic )
+
+        nodes, dynamic = class_nodes
+        if not dynamic:
+            return nodes
+
+        return [ node for node, type_only in nodes
+                 if type_only or node.is_node_for( object ) ]
+
+    #---------------------------------------------------------------------------
+    #  Returns the node associated with a specified class:
+    #---------------------------------------------------------------------------
+
+    def node_for_class ( self, klass ):
+        """ Returns the first node which applies to a specified class (or
+            None).
+        """
+        try:
+            return self._node_for_class[ klass ]
+        except KeyError:
+            for node in self.nodes:
+                if issubclass( klass, tuple( node.node_for ) ):
+                    break
+            else:
+                node = None
+
+            self._node_for_class[ klass ] = node
+
+            return node
+
+    #---------------------------------------------------------------------------
+    #  Returns the node and class associated with a specified class name:
+    #---------------------------------------------------------------------------
+
+    def node_for_class_name ( self, class_name ):
+        """ Returns the node and class associated with a specified class
+            name, or ( None, None ).
+        """
+        if self._node_for_class_name is None:
+            names = {}
+            for node in self.nodes:
+                for klass in node.node_for:
+                    names.setdefault( klass.__name__, ( node, klass ) )
+            self._node_for_class_name = names
+
+        return self._node_for_class_name.get( class_name, ( None, None ) )
+
+    #---------------------------------------------------------------------------
+    #  Property getters:
+    #---------------------------------------------------------------------------
+
+    def _get_simple_editor_class ( self ):
+        """ Returns the editor class to use for a simple style, which is the
+            model/view based editor if **model_view** is set and the toolkit
+            provides one.
+        """
+        if self.model_view:
+            try:
+                return toolkit_object( 'tree_model_editor:SimpleEditor', True )
+            except ( ImportError, AttributeError ):
+                pass
+
+        return super( ToolkitEditorFactory, self )._get_simple_editor_class()
+
+    #-- Private Methods --------------------------------------------------------
+
+    @on_trait_change( 'nodes[], nodes:node_for[], nodes:type_only' )
+    def _reset_node_caches ( self ):
+        """ Discards the cached nodes for each class when the nodes change.
+        """
+        self._class_nodes         = {}
+        self._node_for_class      = {}
+        self._node_for_class_name = None
+
 # Define the TreeEditor class.
 TreeEditor = ToolkitEditorFactory
 
@@ -28,8 +28,8 @@ from __future__ import absolute_import
 from string \
     import find
 
-from traits.api import (Bool, Delegate, Float, Instance, List, Property, Range,
-    ReadOnly, Str, TraitError, cached_property)
+from traits.api import (Bool, Delegate, Float, Instance, Int, List, Property,
+    Range, ReadOnly, Str, TraitError, cached_property)
 
 from traits.trait_base import enumerate
 
@@ -152,6 +152,17 @@ class Group ( ViewSubElement ):
     # parent is not 'tabbed', this attribute is ignored.
     selected = Bool( False )
 
+    # Should the pages of a 'tabbed' or 'fold' layout be built only when they
+    # are first shown? If False, all of the pages (and their editors) are
+    # built when the view is created.
+    lazy = Bool( False )
+
+    # The maximum number of built pages of a **lazy** 'tabbed' or 'fold' layout
+    # to keep. When more pages have been built, the editors of the least
+    # recently shown pages are disposed of (and rebuilt when they are shown
+    # again). 0 means there is no limit.
+    max_pages = Int( 0 )
+
     # Should the group use extra space along its parent group's layout
     # orientation?
     springy = Bool( False )
@@ -345,7 +356,7 @@ class Group ( ViewSubElement ):
         """
         if value.defined_when == '':
             return True
-        return ui.eval_when( value.defined_when )
+        return ui.eval_defined_when( value.defined_when )
 
     #---------------------------------------------------------------------------
     #  Parses Group options specified as a string:
@@ -677,6 +688,12 @@ class ShadowGroup ( Group ):
     # Is group the initially selected page?
     selected = ShadowDelegate
 
+    # Are the pages of a 'tabbed' or 'fold' layout built when first shown?
+    lazy = ShadowDelegate
+
+    # The maximum number of built pages of a lazy layout to keep:
+    max_pages = ShadowDelegate
+
     # Should the group use extra space along its parent group's layout
     # orientation?
     springy = ShadowDelegate
@@ -25,12 +25,25 @@
 
 from __future__ import absolute_import
 
+import re
+import __future__
+import sys
+
+from bisect import bisect_left, bisect_right
+from importlib import import_module
+from itertools import izip
+from operator import itemgetter, methodcaller
+
 from string import uppercase, lowercase
 
+from types import CodeType, ModuleType
+
 from traits.api import BaseTraitHandler, CTrait, Enum, TraitError
 
 from .ui_traits import SequenceTypes
 
+from .undo import common_affixes
+
 #-------------------------------------------------------------------------------
 #  Trait definitions:
 #-------------------------------------------------------------------------------
@@ -41,6 +54,13 @@ Orientation = Enum( 'horizontal', 'vertical' )
 # Docking drag bar style:
 DockStyle = Enum( 'horizontal', 'vertical', 'tab', 'fixed' )
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# Regular expression matching a valid Python identifier:
+identifier_pat = re.compile( r'[A-Za-z_][A-Za-z0-9_]*$' )
+
 #----------------------------------------------------------------------------
 #  Return a 'user-friendly' name for a specified trait:
 #----------------------------------------------------------------------------
@@ -59,6 +79,30 @@ def user_name_for ( name ):
         result    += c
     return result
 
+#-------------------------------------------------------------------------------
+#  Returns whether a string is a valid Python identifier:
+#-------------------------------------------------------------------------------
+
+def is_identifier ( name ):
+    """ Returns whether a specified string is a valid Python identifier.
+    """
+    return (identifier_pat.match( name ) is not None)
+
+#-------------------------------------------------------------------------------
+#  Returns all of the names referenced by a code object:
+#-------------------------------------------------------------------------------
+
+def code_names ( code ):
+    """ Returns the set of names referenced by a code object, including the
+        names referenced by any nested code objects (e.g. lambdas).
+    """
+    names = set( code.co_names )
+    for constant in code.co_consts:
+        if isinstance( constant, CodeType ):
+            names.update( code_names( constant ) )
+
+    return names
+
 #-------------------------------------------------------------------------------
 #  Format a number with embedded commas:
 #-------------------------------------------------------------------------------
@@ -86,7 +130,7 @@ def enum_values_changed ( values ):
     if isinstance( values, dict ):
         data = [ ( unicode( v ), n ) for n, v in values.items() ]
         if len( data ) > 0:
-            data.sort( lambda x, y: cmp( x[0], y[0] ) )
+            data.sort( key = itemgetter( 0 ) )
             col = data[0][0].find( ':' ) + 1
             if col > 0:
                 data = [ ( n[ col: ], v ) for n, v in data ]
@@ -98,17 +142,342 @@ def enum_values_changed ( values ):
             raise TraitError, "Invalid value for 'values' specified"
         if handler.is_mapped:
             data = [ ( unicode( n ), n ) for n in handler.map.keys() ]
-            data.sort( lambda x, y: cmp( x[0], y[0] ) )
+            data.sort( key = itemgetter( 0 ) )
         else:
             data = [ ( unicode( v ), v ) for v in handler.values ]
     else:
         data = [ ( unicode( v ), v ) for v in values ]
 
     names           = [ x[0] for x in data ]
-    mapping         = {}
-    inverse_mapping = {}
-    for name, value in data:
-        mapping[ name ] = value
-        inverse_mapping[ value ] = name
+    mapping         = dict( data )
+    inverse_mapping = dict( [ ( value, name ) for name, value in data ] )
 
     return ( names, mapping, inverse_mapping )
+
+#-------------------------------------------------------------------------------
+#  'EnumIndex' class:
+#-------------------------------------------------------------------------------
+
+class EnumIndex ( object ):
+    """ The names of an enumeration (as returned by **enum_values_changed**),
+        indexed for fast lookup by name or value and for completion of name
+        prefixes, even for enumerations with hundreds of thousands of values.
+    """
+
+    def __init__ ( self ):
+        """ Initializes the object.
+        """
+        self.names           = []
+        self.mapping         = {}
+        self.inverse_mapping = {}
+
+        # Mapping from each name to the index of its first occurrence (built
+        # lazily):
+        self._positions = None
+
+        # The distinct lower-cased names and the names, in sorted order (built
+        # lazily):
+        self._keys = self._sorted = None
+
+    #---------------------------------------------------------------------------
+    #  Returns the range of names that differs from a new list of names:
+    #---------------------------------------------------------------------------
+
+    def diff ( self, names ):
+        """ Returns the range of the current names that must be replaced to
+            get a new list of names, as a tuple of the form: ( start,
+            removed, added ), where *removed* is the number of current names
+            removed and *added* the number of new names inserted at *start*.
+        """
+        old = self.names
+        if names == old:
+            return ( len( old ), 0, 0 )
+
+        prefix, suffix = common_affixes( old, names )
+
+        return ( prefix, len( old ) - prefix - suffix,
+                 len( names ) - prefix - suffix )
+
+    #---------------------------------------------------------------------------
+    #  Updates the index for a new set of enumeration names:
+    #---------------------------------------------------------------------------
+
+    def update ( self, names, mapping, inverse_mapping ):
+        """ Updates the index for a new set of enumeration names and mappings.
+        """
+        start, removed, added = self.diff( names )
+        appended = (removed == 0) and (start == len( self.names ))
+        self.names           = names
+        self.mapping         = mapping
+        self.inverse_mapping = inverse_mapping
+        if (removed == 0) and (added == 0):
+            return
+
+        self._keys = self._sorted = None
+        positions  = self._positions
+        if appended and (positions is not None):
+            # Names were only appended, so the existing positions are valid:
+            for i in xrange( start, start + added ):
+                positions.setdefault( names[ i ], i )
+        else:
+            self._positions = None
+
+    #---------------------------------------------------------------------------
+    #  Returns the index of a name or value:
+    #---------------------------------------------------------------------------
+
+    def index_of ( self, name ):
+        """ Returns the index of the first occurrence of a name, or -1 if the
+            name is not in the enumeration.
+        """
+        positions = self._positions
+        if positions is None:
+            names = self.names
+            last  = len( names ) - 1
+            self._positions = positions = dict( izip( reversed( names ),
+                                                      xrange( last, -1, -1 ) ) )
+
+        return positions.get( name, -1 )
+
+    def index_of_value ( self, value ):
+        """ Returns the index of the name of an enumeration value, or -1 if the
+            value is not in the enumeration.
+        """
+        try:
+            return self.index_of( self.inverse_mapping[ value ] )
+        except ( KeyError, TypeError ):
+            return -1
+
+    #---------------------------------------------------------------------------
+    #  Returns the names starting with a specified prefix:
+    #---------------------------------------------------------------------------
+
+    def complete ( self, prefix, limit = None ):
+        """ Returns the (distinct) names starting with a specified prefix,
+            ignoring case, in sorted order. At most *limit* names are returned
+            if *limit* is not None.
+        """
+        if self._keys is None:
+            # Sort the names list itself unless it contains duplicates, since
+            # it is often sorted already:
+            names    = self.names
+            distinct = set( names )
+            if len( distinct ) < len( names ):
+                names = distinct
+            lower        = methodcaller( 'lower' )
+            self._sorted = sorted( names, key = lower )
+            self._keys   = map( lower, self._sorted )
+
+        keys   = self._keys
+        prefix = prefix.lower()
+        first  = i = bisect_left( keys, prefix )
+        end    = len( keys )
+        if limit is not None:
+            end = min( end, first + limit )
+        while (i < end) and keys[ i ].startswith( prefix ):
+            i += 1
+
+        return self._sorted[ first: i ]
+
+#-------------------------------------------------------------------------------
+#  'SortedIndex' class:
+#-------------------------------------------------------------------------------
+
+class SortedIndex ( object ):
+    """ A list of distinct (hashable) items kept sorted by a key, with a set
+        of its items for membership tests, so that items can be added to,
+        found in and removed from even very long lists without scanning them.
+    """
+
+    def __init__ ( self, items = (), key = None ):
+        """ Initializes the object.
+        """
+        # The function returning the sort key of an item (None to sort the
+        # items themselves):
+        self.key = key
+
+        self.reset( items )
+
+    #---------------------------------------------------------------------------
+    #  Replaces all of the items:
+    #---------------------------------------------------------------------------
+
+    def reset ( self, items ):
+        """ Replaces all of the items.
+        """
+        self._members = set( items )
+        self.items    = sorted( self._members, key = self.key )
+        self._keys    = self._keys_for( self.items )
+
+    #---------------------------------------------------------------------------
+    #  Container protocol:
+    #---------------------------------------------------------------------------
+
+    def __len__ ( self ):
+        return len( self.items )
+
+    def __contains__ ( self, item ):
+        return (item in self._members)
+
+    def __getitem__ ( self, row ):
+        return self.items[ row ]
+
+    def __iter__ ( self ):
+        return iter( self.items )
+
+    #---------------------------------------------------------------------------
+    #  Returns the row of an item:
+    #---------------------------------------------------------------------------
+
+    def index ( self, item ):
+        """ Returns the row of an item, or -1 if the item is not in the list.
+        """
+        if item not in self._members:
+            return -1
+
+        # Skip over any other items with the same key:
+        items = self.items
+        row   = bisect_left( self._keys, self._key_of( item ) )
+        while items[ row ] != item:
+            row += 1
+
+        return row
+
+    def insertion_row ( self, item ):
+        """ Returns the row an item not in the list would be added at.
+        """
+        return bisect_right( self._keys, self._key_of( item ) )
+
+    #---------------------------------------------------------------------------
+    #  Adds and removes items:
+    #---------------------------------------------------------------------------
+
+    def add ( self, item ):
+        """ Adds an item, and returns its row, or -1 if the item is already in
+            the list.
+        """
+        if item in self._members:
+            return -1
+
+        key = self._key_of( item )
+        row = bisect_right( self._keys, key )
+        self._keys.insert( row, key )
+        self.items.insert( row, item )
+        self._members.add( item )
+
+        return row
+
+    def remove ( self, item ):
+        """ Removes an item, and returns the row it was at, or -1 if the item
+            is not in the list.
+        """
+        row = self.index( item )
+        if row >= 0:
+            del self._keys[ row ]
+            del self.items[ row ]
+            self._members.remove( item )
+
+        return row
+
+    def update ( self, added = (), removed = () ):
+        """ Adds and removes many items at once, re-sorting the list only once.
+        """
+        removed = self._members.intersection( removed )
+        members = self._members - removed
+        added   = [ item for item in added if item not in members ]
+        items   = self.items
+        if len( removed ) > 0:
+            items = [ item for item in items if item not in removed ]
+
+        # The list is already sorted, so this only has to merge in the added
+        # items:
+        items = items + added
+        items.sort( key = self.key )
+        members.update( added )
+        self._members = members
+        self.items    = items
+        self._keys    = self._keys_for( items )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _key_of ( self, item ):
+        """ Returns the sort key of an item.
+        """
+        if self.key is None:
+            return item
+
+        return self.key( item )
+
+    def _keys_for ( self, items ):
+        """ Returns the sort keys of a list of items.
+        """
+        if self.key is None:
+            return items[:]
+
+        return map( self.key, items )
+
+#-------------------------------------------------------------------------------
+#  'LazyModule' class:
+#-------------------------------------------------------------------------------
+
+class LazyModule ( ModuleType ):
+    """ A module whose attributes can be imported from other modules only when
+        they are first accessed.
+    """
+
+    def __init__ ( self, module, lazy_attributes ):
+        """ Replaces a module in **sys.modules** by a module with the same
+            contents, plus the attributes listed in *lazy_attributes*, which
+            maps the name of each attribute to the (possibly relative) name of
+            the module it is imported from on first access.
+        """
+        super( LazyModule, self ).__init__( module.__name__, module.__doc__ )
+        self.__dict__.update( module.__dict__ )
+
+        package = module.__name__
+        if not hasattr( module, '__path__' ):
+            package = package.rpartition( '.' )[0]
+
+        # Keep a reference to the original module, whose globals are still
+        # used by its functions (and would be cleared if it were discarded):
+        self._module          = module
+        self._package         = package
+        self._lazy_attributes = lazy_attributes
+
+        # Make 'from module import *' import the lazy attributes as well:
+        if '__all__' not in self.__dict__:
+            self.__all__ = sorted( [ name
+                                     for name, value in module.__dict__.items()
+                                     if _is_exported( name, value ) ] +
+                                   lazy_attributes.keys() )
+
+        sys.modules[ module.__name__ ] = self
+
+    def __getattr__ ( self, name ):
+        """ Imports a lazy attribute on first access.
+        """
+        module_name = self._lazy_attributes.get( name )
+        if module_name is None:
+            raise AttributeError( "'module' object has no attribute '%s'" %
+                                  name )
+
+        value = getattr( import_module( module_name, self._package ), name )
+        setattr( self, name, value )
+
+        return value
+
+    def __dir__ ( self ):
+        """ Returns the names of the module attributes, including the lazy
+            attributes not imported yet.
+        """
+        return sorted( set( self.__dict__ ) | set( self._lazy_attributes ) )
+
+def _is_exported ( name, value ):
+    """ Returns whether a module global is one of the names exported by a
+        LazyModule, which excludes private names, modules, __future__ features
+        and the LazyModule class itself.
+    """
+    return ((name[:1] != '_') and
+            (not isinstance( value, ( ModuleType, __future__._Feature ) )) and
+            (value is not LazyModule))
+
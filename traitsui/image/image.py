@@ -14,12 +14,15 @@
 """ Defines the ImageLibrary object used to manage Traits UI image libraries.
 """
 
+import atexit
 import sys
+import cPickle
 from os import (environ, listdir, remove, stat, makedirs, rename, access,
-                R_OK, W_OK, X_OK)
+                getpid, R_OK, W_OK, X_OK)
 from os.path import (join, isdir, isfile, splitext, abspath, dirname,
                      basename, exists)
 from stat import ST_MTIME
+from struct import unpack, error as StructError
 from platform import system
 from zipfile import is_zipfile, ZipFile, ZIP_DEFLATED
 from time import time, sleep, localtime, strftime
@@ -49,6 +52,18 @@ ImageFileExts = ( '.png', '.gif', '.jpg', 'jpeg' )
 # The image_cache root directory:
 image_cache_path = join( traits_home(), 'image_cache' )
 
+# The file containing the persistent image catalog:
+image_catalog_path = join( traits_home(), 'image_catalog' )
+
+# The format version of the persistent image catalog:
+ImageCatalogVersion = 1
+
+# The PNG file signature:
+PNGSignature = '\x89PNG\r\n\x1a\n'
+
+# The JPEG 'start of frame' markers (the ones that contain the image size):
+JPEGFrameMarkers = frozenset( range( 0xC0, 0xD0 ) ) - set( [ 0xC4, 0xC8, 0xCC ] )
+
 # Names of files that should not be copied when ceating a new library copy:
 dont_copy_list = ( 'image_volume.py', 'image_info.py', 'license.txt' )
 
@@ -165,6 +180,55 @@ def time_stamp_for ( time ):
     """
     return strftime( '%Y%m%d%H%M%S', localtime( time ) )
 
+#-------------------------------------------------------------------------------
+#  Returns the size of an image parsed from its file header:
+#-------------------------------------------------------------------------------
+
+def image_size_for ( data ):
+    """ Returns the ( width, height ) of the PNG, GIF or JPEG image whose file
+        contents are specified by **data**. The size is parsed from the image
+        file header, without decoding the image. Returns None if the size can
+        not be determined.
+    """
+    try:
+        if data[:8] == PNGSignature:
+            if data[12:16] == 'IHDR':
+                return unpack( '>II', data[16:24] )
+
+        elif data[:6] in ( 'GIF87a', 'GIF89a' ):
+            return unpack( '<HH', data[6:10] )
+
+        elif data[:2] == '\xff\xd8':
+            # Walk the JPEG segments until a 'start of frame' segment is found:
+            index = 2
+            while data[ index ] == '\xff':
+                # Skip over any fill bytes preceding the marker:
+                while data[ index ] == '\xff':
+                    index += 1
+
+                marker = ord( data[ index ] )
+                index += 1
+
+                # Markers without a segment body:
+                if (0xD0 <= marker <= 0xD8) or (marker == 0x01):
+                    continue
+
+                # The end of image and start of scan markers mean that there is
+                # no frame header to be found:
+                if marker in ( 0xD9, 0xDA ):
+                    break
+
+                if marker in JPEGFrameMarkers:
+                    height, width = unpack( '>HH', data[ index + 3: index + 7 ])
+
+                    return ( width, height )
+
+                index += unpack( '>H', data[ index: index + 2 ] )[0]
+    except ( IndexError, StructError ):
+        pass
+
+    return None
+
 #-------------------------------------------------------------------------------
 #  Adds all traits from a specified object to a dictionary with a specified name
 #  prefix:
@@ -369,13 +433,7 @@ class ImageInfo ( HasPrivateTraits ):
         if self.volume is None:
             return 0
 
-        image = self.volume.image_resource( self.image_name )
-        if image is None:
-            self.height = 0
-
-            return 0
-
-        width, self.height = toolkit().image_size( image.create_image() )
+        width, self.height = self.volume.image_size( self.image_name )
 
         return width
 
@@ -383,13 +441,7 @@ class ImageInfo ( HasPrivateTraits ):
         if self.volume is None:
             return 0
 
-        image = self.volume.image_resource( self.image_name )
-        if image is None:
-            self.width = 0
-
-            return 0
-
-        self.width, height = toolkit().image_size( image.create_image() )
+        self.width, height = self.volume.image_size( self.image_name )
 
         return height
 
@@ -557,7 +609,9 @@ class ImageVolume ( HasPrivateTraits ):
         for image in self.images:
             image.volume = None
 
-        # Make sure the images are up to date by deleting any current value:
+        # Make sure the images are up to date by deleting any current value
+        # (and any catalog entry it could be reloaded from):
+        image_catalog.remove( self.path )
         del self.images
 
         # Save the new image volume information:
@@ -716,6 +770,22 @@ class ImageVolume ( HasPrivateTraits ):
         else:
             return read_file( join( self.path, file_name ) )
 
+    def image_size ( self, image_name ):
+        """ Returns the ( width, height ) of the image specified by
+            **image_name**. The size is parsed from the image file header when
+            possible, and only otherwise by decoding the image.
+        """
+        try:
+            size = image_size_for( self.image_data( image_name ) )
+        except ( IOError, KeyError ):
+            return ( 0, 0 )
+
+        if size is None:
+            image = self.image_resource( image_name )
+            size  = toolkit().image_size( image.create_image() )
+
+        return size
+
     def volume_info ( self, image_name ):
         """ Returns the ImageVolumeInfo object that corresponds to the
             image specified by **image_name**.
@@ -734,7 +804,12 @@ class ImageVolume ( HasPrivateTraits ):
         return [ ImageVolumeInfo() ]
 
     def _images_default ( self ):
-        return self._load_image_info()
+        images = image_catalog.images_for( self )
+        if images is None:
+            images = self._load_image_info()
+            image_catalog.add_images( self, images )
+
+        return images
 
     #-- Property Implementations -----------------------------------------------
 
@@ -929,6 +1004,208 @@ class ZipFileReference ( ResourceReference ):
 
         return self.cache_file
 
+#-------------------------------------------------------------------------------
+#  'ImageCatalog' class:
+#-------------------------------------------------------------------------------
+
+class ImageCatalog ( HasPrivateTraits ):
+    """ A persistent index of the image volumes in the image library. For
+        each volume path it records a stamp of the volume's modification
+        times, the volume description (category, keywords, aliases and
+        license information) and the names and sizes of its images, so that a
+        volume which has not changed can be loaded without opening it.
+
+        Changes to the catalog are only written to its file by **flush**,
+        which the image library calls once it has added a batch of volumes
+        (and which is called on exit for the shared catalog).
+    """
+
+    # The file the catalog is saved in:
+    path = File( image_catalog_path )
+
+    # The catalog entries (the keys are volume paths, and the values are
+    # ( stamp, data ) tuples):
+    entries = Dict
+
+    # Does the catalog have changes which have not been saved yet?
+    dirty = Bool( False )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def volume_for ( self, path, name ):
+        """ Returns an ImageVolume object called **name** for the zip file
+            volume specified by **path**, or None if the catalog does not have
+            an up to date entry for the volume.
+        """
+        data = self._data_for( path )
+        if (data is None) or ('volume' not in data):
+            return None
+
+        volume_data = data[ 'volume' ].copy()
+        volume_data[ 'info' ] = [ ImageVolumeInfo( **info )
+                                  for info in volume_data[ 'info' ] ]
+
+        return ImageVolume( name     = name,
+                            path     = path,
+                            zip_file = FastZipFile( path = path ),
+                            **volume_data )
+
+    def add_volume ( self, volume ):
+        """ Adds the description of the specified zip file **volume** to the
+            catalog.
+        """
+        data = volume.get( 'category', 'keywords', 'aliases', 'time_stamp' )
+        data[ 'info' ] = [ info.get( 'description', 'copyright', 'license',
+                                     'image_names' )
+                           for info in volume.info ]
+        self._update( volume.path, volume = data )
+
+    def images_for ( self, volume ):
+        """ Returns the list of ImageInfo objects for the images in the
+            specified **volume**, or None if the catalog does not have an up to
+            date entry for the volume.
+        """
+        data = self._data_for( volume.path )
+        if (data is None) or ('images' not in data):
+            return None
+
+        return [ ImageInfo( volume = volume, **image )
+                 for image in data[ 'images' ] ]
+
+    def add_images ( self, volume, images ):
+        """ Adds the list of ImageInfo objects specified by **images** to the
+            catalog entry for the specified **volume**.
+        """
+        data = []
+        for image in images:
+            image_data = image.get( 'name', 'image_name', 'description',
+                                    'category', 'keywords', 'width', 'height',
+                                    'alignment' )
+            for name in ( 'border', 'content', 'label' ):
+                margin = getattr( image, name )
+                image_data[ name ] = ( margin.left, margin.right,
+                                       margin.top,  margin.bottom )
+            data.append( image_data )
+
+        self._update( volume.path, images = data )
+
+    def remove ( self, path ):
+        """ Removes the catalog entry (if any) for the volume specified by
+            **path**.
+        """
+        if self.entries.pop( path, None ) is not None:
+            self.dirty = True
+
+    def flush ( self ):
+        """ Saves the catalog if it has unsaved changes.
+        """
+        if self.dirty:
+            self.save()
+
+    def save ( self ):
+        """ Saves the catalog. Failures (such as a read-only home directory)
+            are ignored, since the catalog can always be rebuilt.
+        """
+        temp_name = '%s.%d' % ( self.path, getpid() )
+        try:
+            fh = file( temp_name, 'wb' )
+            try:
+                cPickle.dump( ( ImageCatalogVersion, self.entries ), fh,
+                              cPickle.HIGHEST_PROTOCOL )
+            finally:
+                fh.close()
+
+            try:
+                rename( temp_name, self.path )
+            except OSError:
+                # Windows will not rename over an existing file:
+                remove( self.path )
+                rename( temp_name, self.path )
+        except ( IOError, OSError ):
+            try:
+                remove( temp_name )
+            except OSError:
+                pass
+
+            return
+
+        self.dirty = False
+
+    #-- Default Value Implementations ------------------------------------------
+
+    def _entries_default ( self ):
+        try:
+            fh = file( self.path, 'rb' )
+            try:
+                version, entries = cPickle.load( fh )
+            finally:
+                fh.close()
+
+            if version == ImageCatalogVersion:
+                return entries
+        except:
+            # An unreadable or corrupt catalog is simply rebuilt:
+            pass
+
+        return {}
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _stamp_for ( self, path ):
+        """ Returns a stamp which changes whenever the volume specified by
+            **path** is modified, or None if it does not exist. For a zip file
+            volume, this is its modification time. For a directory volume, it
+            is the name, modification time and size of each of its files,
+            since editing a file in place does not change the modification
+            time of the directory.
+        """
+        try:
+            info = stat( path )
+            if not isdir( path ):
+                return info.st_mtime
+
+            stamp = []
+            for name in sorted( listdir( path ) ):
+                file_info = stat( join( path, name ) )
+                stamp.append( ( name, file_info.st_mtime,
+                                file_info.st_size ) )
+
+            return tuple( stamp )
+        except OSError:
+            return None
+
+    def _data_for ( self, path ):
+        """ Returns the catalog data for the volume specified by **path** if
+            it is up to date, and None otherwise.
+        """
+        entry = self.entries.get( path )
+        if (entry is not None) and (entry[0] == self._stamp_for( path )):
+            return entry[1]
+
+        return None
+
+    def _update ( self, path, **data ):
+        """ Merges the specified **data** into the catalog entry for the
+            volume specified by **path**, and marks the catalog as having
+            unsaved changes.
+        """
+        stamp = self._stamp_for( path )
+        if stamp is None:
+            return
+
+        entry = self.entries.get( path )
+        if (entry is None) or (entry[0] != stamp):
+            self.entries[ path ] = entry = ( stamp, {} )
+
+        entry[1].update( data )
+        self.dirty = True
+
+# Create the singleton image catalog object, and save any changes made to it
+# on exit:
+image_catalog = ImageCatalog()
+
+atexit.register( image_catalog.flush )
+
 #-------------------------------------------------------------------------------
 #  'ImageLibrary' class:
 #-------------------------------------------------------------------------------
@@ -1023,6 +1300,7 @@ class ImageLibrary ( HasPrivateTraits ):
 
             self.catalog[ volume.name ] = volume
             self.volumes.append( volume )
+            image_catalog.flush()
 
         elif isdir( file_name ):
             # Load all image volumes from the specified path:
@@ -1267,6 +1545,9 @@ class ImageLibrary ( HasPrivateTraits ):
                     if volume is not None:
                         result.append( volume )
 
+            # Save the catalog entries added for the volumes once:
+            image_catalog.flush()
+
         # Return the list of volumes found:
         return result
 
@@ -1277,15 +1558,22 @@ class ImageLibrary ( HasPrivateTraits ):
         """
         path = abspath( path )
 
+        # Extract the volume name from the path:
+        volume_name = splitext( basename( path ) )[0]
+
+        # Use the image catalog entry for the volume if it is up to date:
+        volume = image_catalog.volume_for( path, volume_name )
+        if volume is not None:
+            self._add_aliases( volume )
+
+            return volume
+
         # Make sure the path is a valid zip file:
         if is_zipfile( path ):
 
             # Create a fast zip file for reading:
             zf = FastZipFile( path = path )
 
-            # Extract the volume name from the path:
-            volume_name = splitext( basename( path ) )[0]
-
             # Get the names of all top-level entries in the zip file:
             names = zf.namelist()
 
@@ -1322,6 +1610,9 @@ class ImageLibrary ( HasPrivateTraits ):
                 # require write access to the volume:
                 volume.save()
 
+            # Record the volume in the image catalog:
+            image_catalog.add_volume( volume )
+
             # Return the volume:
             return volume
 
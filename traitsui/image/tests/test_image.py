@@ -0,0 +1,96 @@
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+
+from struct import pack
+from zipfile import ZipFile
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from ..image import (FastZipFile, ImageCatalog, ImageVolume, PNGSignature,
+                     image_size_for)
+
+
+def png_data(width, height):
+    return (PNGSignature + pack('>I', 13) + 'IHDR' +
+            pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+
+
+def test_image_size_for():
+    assert_equals(image_size_for(png_data(20, 10)), (20, 10))
+    assert_equals(image_size_for('GIF89a' + pack('<HH', 7, 3)), (7, 3))
+
+    jpeg = ('\xff\xd8' +
+            '\xff\xe0' + pack('>H', 16) + 'JFIF\x00' + '\x00' * 9 +
+            '\xff\xff\xc0' + pack('>HBHHB', 11, 8, 30, 40, 1))
+    assert_equals(image_size_for(jpeg), (40, 30))
+
+    assert_equals(image_size_for('not an image'), None)
+    assert_equals(image_size_for(png_data(20, 10)[:20]), None)
+    assert_equals(image_size_for('\xff\xd8\xff\xe0'), None)
+
+
+def test_image_catalog_round_trip():
+    path = tempfile.mkdtemp()
+    try:
+        zip_path = os.path.join(path, 'test.zip')
+        zf = ZipFile(zip_path, 'w')
+        zf.writestr('wide.png', png_data(20, 10))
+        zf.writestr('tall.png', png_data(10, 20))
+        zf.close()
+
+        volume = ImageVolume(name='test', path=zip_path,
+                             zip_file=FastZipFile(path=zip_path),
+                             keywords=['test'])
+        catalog = ImageCatalog(path=os.path.join(path, 'catalog'))
+        catalog.add_volume(volume)
+        catalog.add_images(volume, volume._load_image_info())
+
+        # Changes are only written by a flush:
+        assert_true(catalog.dirty)
+        assert_false(os.path.exists(os.path.join(path, 'catalog')))
+        catalog.flush()
+        assert_false(catalog.dirty)
+
+        # A new catalog reloads the volume and its image sizes without
+        # opening the zip file:
+        catalog = ImageCatalog(path=os.path.join(path, 'catalog'))
+        cached = catalog.volume_for(zip_path, 'test')
+        assert_equals(cached.keywords, ['test'])
+        assert_equals([(image.image_name, image.width, image.height)
+                       for image in catalog.images_for(cached)],
+                      [('@test:tall', 10, 20), ('@test:wide', 20, 10)])
+        assert_equals(cached.zip_file._zf, None)
+
+        # Modifying the volume invalidates its entry:
+        mtime = os.stat(zip_path).st_mtime
+        os.utime(zip_path, (mtime + 10, mtime + 10))
+        assert_equals(catalog.volume_for(zip_path, 'test'), None)
+    finally:
+        shutil.rmtree(path)
+
+
+def test_image_catalog_directory_stamp():
+    path = tempfile.mkdtemp()
+    try:
+        image_path = os.path.join(path, 'image.png')
+        with open(image_path, 'wb') as fh:
+            fh.write(png_data(20, 10))
+
+        catalog = ImageCatalog(path=os.path.join(path, 'catalog'))
+        volume = ImageVolume(name='test', path=path, is_zip_file=False)
+        catalog.add_images(volume, [])
+        assert_equals(catalog.images_for(volume), [])
+
+        # Editing a file in place invalidates the directory's entry, even if
+        # the directory's modification time is unchanged:
+        mtime = os.stat(path).st_mtime
+        with open(image_path, 'wb') as fh:
+            fh.write(png_data(30, 10) + 'more')
+        os.utime(path, (mtime, mtime))
+        assert_equals(catalog.images_for(volume), None)
+    finally:
+        shutil.rmtree(path)
+
@@ -150,6 +150,11 @@ class Item ( ViewSubElement ):
     # Should the item receive focus initially?
     has_focus = Bool( False )
 
+    # Should the editor updates caused by changes to the item's trait be
+    # coalesced (see View.coalesce_updates)? Updates are also coalesced if the
+    # View requests it.
+    coalesce_updates = Bool( False )
+
     # Pre-condition for including the item in the display. If the expression
     # evaluates to False, the item is not defined in the display. Conditions
     # for **defined_when** are evaluated only once, when the display is first
@@ -0,0 +1,241 @@
+#-------------------------------------------------------------------------------
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#-------------------------------------------------------------------------------
+
+""" Defines the LayoutCache class, which caches the resolved layout of a View
+    (its Includes resolved and its **defined_when** conditions applied), so
+    that opening the same View many times only resolves it once.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from weakref import ref
+
+from traits.api import Any, Bool, HasPrivateTraits, Int, Property
+
+#-------------------------------------------------------------------------------
+#  'LayoutPlan' class:
+#-------------------------------------------------------------------------------
+
+class LayoutPlan ( object ):
+    """ The resolved layout of a View for one kind of context.
+    """
+
+    __slots__ = ( 'view', 'view_elements', 'conditions', 'groups',
+                  'factories' )
+
+    def __init__ ( self, view, view_elements, conditions, groups ):
+        # A weak reference to the View the plan is for:
+        self.view = ref( view )
+
+        # A weak reference to the ViewElements used to resolve the View's
+        # Includes (or None):
+        self.view_elements = None
+        if view_elements is not None:
+            self.view_elements = ref( view_elements )
+
+        # The ( expression, result ) of each 'defined_when' condition
+        # evaluated while resolving the layout (in evaluation order):
+        self.conditions = conditions
+
+        # The resolved top-level ShadowGroups of the View:
+        self.groups = groups
+
+        # The editor factory chosen for each Item, as a mapping from the id of
+        # the Item to a ( trait, editor factory ) tuple:
+        self.factories = {}
+
+    def matches ( self, view, ui, results ):
+        """ Returns whether the plan applies to a user interface for a View,
+            evaluating any conditions not already in **results** (a mapping
+            from expression to result).
+        """
+        if (not self.is_alive()) or (self.view() is not view):
+            return False
+
+        view_elements = self.view_elements
+        if view_elements is not None:
+            view_elements = view_elements()
+        if view_elements is not ui.view_elements:
+            return False
+
+        for when, result in self.conditions:
+            value = results.get( when )
+            if value is None:
+                value = results[ when ] = bool( ui.eval_when( when ) )
+
+            if value != result:
+                return False
+
+        return True
+
+    def is_alive ( self ):
+        """ Returns whether the View (and ViewElements) the plan is for still
+            exist.
+        """
+        return ((self.view() is not None) and
+                ((self.view_elements is None) or
+                 (self.view_elements() is not None)))
+
+#-------------------------------------------------------------------------------
+#  'LayoutCache' class:
+#-------------------------------------------------------------------------------
+
+class LayoutCache ( HasPrivateTraits ):
+    """ Caches the resolved layouts of Views.
+
+        A layout is cached for each View, the classes of the context objects
+        it is used with and the results of the **defined_when** conditions
+        evaluated while resolving it. Only the conditions are re-evaluated
+        when the View is used again. Layouts which used a handler or object
+        method to resolve an Include are never cached, since the method may
+        return a different result each time.
+
+        The cache is off by default, since changes made to the content of a
+        View (or to its ViewElements) after it has been used are not
+        detected. An application whose Views do not change once used can turn
+        it on by setting **enabled**. A View (or ViewElements) modified after
+        it has been used then requires a call to **clear**.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # Is the cache used?
+    enabled = Bool( False )
+
+    # The maximum number of ( View, context classes ) keys to keep plans for:
+    max_views = Int( 256 )
+
+    # The number of layouts found in the cache:
+    hits = Int
+
+    # The number of layouts which had to be resolved:
+    misses = Int
+
+    # The number of resolved layouts which could not be cached:
+    uncacheable = Int
+
+    # The number of cached layout plans:
+    plans = Property
+
+    #-- Private Traits ---------------------------------------------------------
+
+    # The cached plans (mapping ( View, context classes ) keys to lists of
+    # LayoutPlans, in least recently used order):
+    _plans = Any
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, **traits ):
+        """ Initializes the object.
+        """
+        super( LayoutCache, self ).__init__( **traits )
+
+        self._plans = OrderedDict()
+
+    #---------------------------------------------------------------------------
+    #  Returns the top-level groups of a user interface:
+    #---------------------------------------------------------------------------
+
+    def groups_for ( self, ui ):
+        """ Returns the resolved top-level groups for a user interface, using
+            a cached plan if possible. Sets the user interface's layout plan.
+        """
+        view = ui.view
+        key  = None
+        if self.enabled and (view is not None):
+            key = self._key_for( ui )
+
+        if key is not None:
+            plans = self._plans.pop( key, None )
+            if plans is not None:
+                self._plans[ key ] = plans
+                results = {}
+                for plan in plans:
+                    if plan.matches( view, ui, results ):
+                        self.hits    += 1
+                        ui._layout_plan = plan
+
+                        return plan.groups
+
+        # Resolve the layout, recording the conditions evaluated:
+        self.misses += 1
+        ui._layout_plan       = None
+        ui._layout_conditions = conditions = []
+        ui._dynamic_layout    = False
+        try:
+            groups = ui._resolve_groups()
+        finally:
+            ui._layout_conditions = None
+
+        if key is None:
+            return groups
+
+        if ui._dynamic_layout:
+            self.uncacheable += 1
+            return groups
+
+        plan  = ui._layout_plan = LayoutPlan( view, ui.view_elements,
+                                              conditions, groups )
+        plans = [ p for p in self._plans.pop( key, [] ) if p.is_alive() ]
+        plans.append( plan )
+        self._plans[ key ] = plans
+        while len( self._plans ) > self.max_views:
+            self._plans.popitem( False )
+
+        return groups
+
+    #---------------------------------------------------------------------------
+    #  Discards all cached plans:
+    #---------------------------------------------------------------------------
+
+    def clear ( self ):
+        """ Discards all cached plans, and resets the statistics.
+        """
+        self._plans.clear()
+        self.hits = self.misses = self.uncacheable = 0
+
+    #-- Property Implementations -----------------------------------------------
+
+    def _get_plans ( self ):
+        return sum( [ len( plans ) for plans in self._plans.itervalues() ] )
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _key_for ( self, ui ):
+        """ Returns the cache key for a user interface.
+        """
+        classes = [ ( name, getattr( value, '__class__', type( value ) ) )
+                    for name, value in ui.context.iteritems() ]
+        classes.sort()
+
+        view_elements = ui.view_elements
+        if view_elements is not None:
+            view_elements = id( view_elements )
+
+        return ( id( ui.view ), view_elements, tuple( classes ) )
+
+#-------------------------------------------------------------------------------
+#  The shared layout cache:
+#-------------------------------------------------------------------------------
+
+layout_cache = LayoutCache()
@@ -43,6 +43,9 @@ from constants \
 class SimpleEditor ( Editor ):
     """ Simple style of editor for Boolean values, which displays a check box.
     """
+
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -87,6 +90,9 @@ class ReadonlyEditor ( Editor ):
     """ Read-only style of editor for Boolean values, which displays static text
     of either "True" or "False".
     """
+
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -184,7 +184,9 @@ class CustomEditor ( SimpleEditor ):
         # Clear any existing content:
         self.clear_layout()
 
-        cur_value = parse_value( self.value )
+        # The check box of each value, and the values currently checked:
+        self._boxes   = boxes = {}
+        self._checked = cur_value = set( parse_value( self.value ) )
 
         # Create a sizer to manage the radio buttons:
         labels = self.names
@@ -206,6 +208,7 @@ class CustomEditor ( SimpleEditor ):
                 if n > 0:
                     cb = QtGui.QCheckBox(labels[index])
                     cb.value = values[index]
+                    boxes[ cb.value ] = cb
 
                     if cb.value in cur_value:
                         cb.setCheckState(QtCore.Qt.Checked)
@@ -237,10 +240,12 @@ class CustomEditor ( SimpleEditor ):
         elif cb.value in cur_value:
             cur_value.remove(cb.value)
 
+        checked = set(cur_value)
         if isinstance(self.value, basestring):
             cur_value = ','.join(cur_value)
 
         self.value = cur_value
+        self._checked = checked
 
     #---------------------------------------------------------------------------
     #  Updates the editor when the object trait changes external to the editor:
@@ -248,15 +253,23 @@ class CustomEditor ( SimpleEditor ):
 
     def update_editor ( self ):
         """ Updates the editor when the object trait changes externally to the
-            editor.
+            editor, changing only the check boxes of the values which have been
+            checked or unchecked.
         """
-        new_values = parse_value( self.value )
-        for cb in self.control.findChildren(QtGui.QCheckBox, None):
-            if cb.value in new_values:
+        new_values = set( parse_value( self.value ) )
+        boxes      = self._boxes
+        for value in new_values.symmetric_difference( self._checked ):
+            cb = boxes.get( value )
+            if cb is None:
+                continue
+
+            if value in new_values:
                 cb.setCheckState(QtCore.Qt.Checked)
             else:
                 cb.setCheckState(QtCore.Qt.Unchecked)
 
+        self._checked = new_values
+
 #-------------------------------------------------------------------------------
 #  'TextEditor' class:
 #-------------------------------------------------------------------------------
@@ -28,6 +28,7 @@ from traits.trait_base import SequenceTypes
 # compatibility. The class has been moved to the
 # traitsui.editors.code_editor file.
 from traitsui.editors.code_editor import ToolkitEditorFactory
+from traitsui.undo import TextUndoItem, common_affixes
 
 from pyface.key_pressed_event import KeyPressedEvent
 
@@ -121,7 +122,18 @@ class SourceEditor ( Editor ):
 
         # Set up listeners for the signals we care about
         code_editor = self._widget.code
-        if not self.readonly:
+        if self.readonly:
+            pass
+        elif factory.incremental:
+            # Collect the changed part of the document, and apply it to the
+            # trait after a pause in the edits:
+            self._sync_timer = timer = QtCore.QTimer(self.control)
+            timer.setSingleShot(True)
+            timer.setInterval(factory.sync_delay)
+            timer.timeout.connect(self._sync_object)
+            code_editor.document().contentsChange.connect(
+                self._contents_changed)
+        else:
             code_editor.textChanged.connect(self.update_object)
             if factory.auto_set:
                 code_editor.textChanged.connect(self.update_object)
@@ -172,6 +184,11 @@ class SourceEditor ( Editor ):
         QtCore.QObject.disconnect(self._widget, QtCore.SIGNAL('lostFocus'),
                                   self.update_object)
 
+        # Apply any edits still waiting for the end of the sync delay:
+        if self._sync_timer is not None:
+            self._sync_timer.stop()
+            self._sync_object()
+
         super( SourceEditor, self ).dispose()
 
     #---------------------------------------------------------------------------
@@ -190,6 +207,94 @@ class SourceEditor ( Editor ):
             except TraitError, excp:
                 pass
 
+    #---------------------------------------------------------------------------
+    #  Handles a change to the document in incremental mode:
+    #---------------------------------------------------------------------------
+
+    def _contents_changed ( self, position, removed, added ):
+        """ Handles 'removed' characters at 'position' of the document being
+            replaced by 'added' characters. Extends the changed part of the
+            document (as a list of the form: [ start, end in the last synced
+            text, end in the document ]) to include the change.
+        """
+        if self._locked:
+            return
+
+        changed = self._changed
+        if changed is None:
+            self._changed = [ position, position + removed, position + added ]
+        else:
+            start, old_end, new_end = changed
+            end        = max( new_end, position + removed )
+            changed[0] = min( start, position )
+            changed[1] = old_end + end - new_end
+            changed[2] = end + added - removed
+
+        self._sync_timer.start()
+
+    #---------------------------------------------------------------------------
+    #  Applies the changed part of the document to the trait:
+    #---------------------------------------------------------------------------
+
+    def _sync_object ( self ):
+        """ Applies the changed part of the document to the object trait in
+            incremental mode.
+        """
+        changed, self._changed = self._changed, None
+        if (changed is None) or self._locked:
+            return
+
+        text = self._text
+        if not isinstance( self.value, basestring ):
+            self.update_object()
+            return
+
+        # Get the new text of the changed part of the document (the reported
+        # changes may extend past the end of the text, and include formatting
+        # only changes):
+        start, old_end, new_end = changed
+        document = self._widget.code.document()
+        old_end  = min( old_end, len( text ) )
+        new_end  = min( new_end, document.characterCount() - 1 )
+        cursor   = QtGui.QTextCursor( document )
+        cursor.setPosition( start )
+        cursor.setPosition( new_end, QtGui.QTextCursor.KeepAnchor )
+        added   = unicode( cursor.selection().toPlainText() )
+        removed = text[ start: old_end ]
+
+        prefix, suffix = common_affixes( removed, added )
+        if (prefix + suffix) >= max( len( removed ), len( added ) ):
+            return
+
+        self._text = text[ : start ] + added + text[ old_end: ]
+        self._edit = ( start + prefix, removed[ prefix: len( removed ) - suffix ],
+                       added[ prefix: len( added ) - suffix ] )
+        try:
+            self.value = self._text
+        except TraitError, excp:
+            pass
+        finally:
+            self._edit = None
+
+    #---------------------------------------------------------------------------
+    #  Creates an undo history entry:
+    #---------------------------------------------------------------------------
+
+    def get_undo_item ( self, object, name, old_value, new_value ):
+        """ Creates an undo history entry, which is just the changed part of
+            the text for changes applied in incremental mode.
+        """
+        if self._edit is None:
+            return super( SourceEditor, self ).get_undo_item( object, name,
+                                                       old_value, new_value )
+
+        index, removed, added = self._edit
+        return TextUndoItem( object  = object,
+                             name    = name,
+                             index   = index,
+                             removed = removed,
+                             added   = added )
+
     #---------------------------------------------------------------------------
     #  Updates the editor when the object trait changes external to the editor:
     #---------------------------------------------------------------------------
@@ -203,7 +308,24 @@ class SourceEditor ( Editor ):
         if isinstance( new_value, SequenceTypes ):
             new_value = '\n'.join( [ line.rstrip() for line in new_value ] )
         control = self._widget
-        if control.code.toPlainText() != new_value:
+        if self.factory.incremental and (self._text is not None):
+            # Replace only the changed part of the document, which keeps the
+            # cursor and scroll position. Edits not yet applied to the trait
+            # are overridden by the new value:
+            old_value = self._text
+            if self._changed is not None:
+                self._changed = None
+                self._sync_timer.stop()
+                old_value = unicode(control.code.toPlainText())
+
+            if old_value != new_value:
+                prefix, suffix = common_affixes(old_value, new_value)
+                cursor = QtGui.QTextCursor(control.code.document())
+                cursor.setPosition(prefix)
+                cursor.setPosition(len(old_value) - suffix,
+                                   QtGui.QTextCursor.KeepAnchor)
+                cursor.insertText(new_value[prefix: len(new_value) - suffix])
+        elif control.code.toPlainText() != new_value:
             control.code.setPlainText(new_value)
 
             # TODO: check the readonly flag and make sure the editor
@@ -215,6 +337,9 @@ class SourceEditor ( Editor ):
 
             # TODO: put the cursor somewhere
 
+        if self.factory.incremental:
+            self._text = new_value
+
         self._locked = False
 
     #---------------------------------------------------------------------------
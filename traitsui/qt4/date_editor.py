@@ -37,6 +37,8 @@ class SimpleEditor(Editor):
     """ Simple Traits UI date editor that wraps QDateEdit.
     """
 
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -88,6 +90,8 @@ class CustomEditor(Editor):
     """ Custom Traits UI date editor that wraps QCalendarWidget.
     """
 
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -52,6 +52,9 @@ class SimpleEditor ( Editor ):
     the text field displays an editor-specific dialog box for changing the
     value.
     """
+
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -83,6 +86,9 @@ class TextEditor ( Editor ):
     """ Base class for text style editors, which displays an editable text
     field, containing a text representation of the object trait value.
     """
+
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -117,6 +123,9 @@ class ReadonlyEditor ( Editor ):
     """ Base class for read-only style editors, which displays a read-only text
     field, containing a text representation of the object trait value.
     """
+
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
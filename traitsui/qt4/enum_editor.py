@@ -30,6 +30,9 @@ from traits.api \
 from traitsui.editors.enum_editor \
     import ToolkitEditorFactory
 
+from traitsui.helper \
+    import EnumIndex
+
 from editor \
     import Editor
 
@@ -39,6 +42,14 @@ from constants \
 from helper \
     import enum_values_changed
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The maximum number of completions shown while typing into an editable combo
+# box:
+CompletionLimit = 100
+
 #-------------------------------------------------------------------------------
 #  'BaseEditor' class:
 #-------------------------------------------------------------------------------
@@ -183,7 +194,9 @@ class SimpleEditor ( BaseEditor ):
         super( SimpleEditor, self ).init( parent )
 
         self.control = control = self.create_combo_box()
-        control.addItems(self.names)
+        self._model = EnumListModel()
+        self._model.set_values(self.names, self.mapping, self.inverse_mapping)
+        control.setModel(self._model)
 
         QtCore.QObject.connect(control,
                                QtCore.SIGNAL('currentIndexChanged(QString)'),
@@ -191,6 +204,19 @@ class SimpleEditor ( BaseEditor ):
 
         if self.factory.evaluate is not None:
             control.setEditable(True)
+            control.setInsertPolicy(QtGui.QComboBox.NoInsert)
+
+            # Complete the typed text from the sorted index of the names,
+            # rather than letting Qt search the whole list:
+            self._completer = completer = QtGui.QCompleter(
+                QtGui.QStringListModel(), control)
+            completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+            completer.setModelSorting(
+                QtGui.QCompleter.CaseInsensitivelySortedModel)
+            control.setCompleter(completer)
+            QtCore.QObject.connect(control,
+                                   QtCore.SIGNAL('editTextChanged(QString)'),
+                                   self.update_completions)
             if self.factory.auto_set:
                 QtCore.QObject.connect(control,
                                        QtCore.SIGNAL('editTextChanged(QString)'),
@@ -260,6 +286,17 @@ class SimpleEditor ( BaseEditor ):
             text = self.control.lineEdit().text()
             return self.update_text_object(text)
 
+    #---------------------------------------------------------------------------
+    #  Updates the completions offered for the text typed into the combo box:
+    #---------------------------------------------------------------------------
+
+    def update_completions(self, text):
+        """ Updates the completions offered for the text typed into the combo
+            box text entry field.
+        """
+        self._completer.model().setStringList(
+            self._model.enum.complete(unicode(text), CompletionLimit))
+
     #---------------------------------------------------------------------------
     #  Updates the editor when the object trait changes external to the editor:
     #---------------------------------------------------------------------------
@@ -271,11 +308,8 @@ class SimpleEditor ( BaseEditor ):
         if self._no_enum_update == 0:
             self._no_enum_update += 1
             if self.factory.evaluate is None:
-                try:
-                    index = self.names.index(self.inverse_mapping[self.value])
-                    self.control.setCurrentIndex(index)
-                except:
-                    self.control.setCurrentIndex(-1)
+                self.control.setCurrentIndex(
+                    self._model.enum.index_of_value(self.value))
             else:
                 try:
                     self.control.setEditText(self.str_value)
@@ -312,8 +346,7 @@ class SimpleEditor ( BaseEditor ):
             object's **values** trait changes.
         """
         self.control.blockSignals(True)
-        self.control.clear()
-        self.control.addItems(self.names)
+        self._model.set_values(self.names, self.mapping, self.inverse_mapping)
         self.control.blockSignals(False)
 
         self.update_editor()
@@ -458,14 +491,27 @@ class ListEditor ( BaseEditor ):
         """
         super( ListEditor, self ).init( parent )
 
-        self.control = QtGui.QListWidget()
-        QtCore.QObject.connect(self.control,
-                QtCore.SIGNAL('currentTextChanged(QString)'),
-                self.update_object)
+        self.control = QtGui.QListView()
+        self.control.setUniformItemSizes(True)
+        self._model = EnumListModel()
+        self.control.setModel(self._model)
+        QtCore.QObject.connect(self.control.selectionModel(),
+                QtCore.SIGNAL('currentChanged(QModelIndex,QModelIndex)'),
+                self._current_changed)
 
         self.rebuild_editor()
         self.set_tooltip()
 
+    #---------------------------------------------------------------------------
+    #  Handles the current list box item changing:
+    #---------------------------------------------------------------------------
+
+    def _current_changed(self, current, previous):
+        """ Handles the current list box item changing.
+        """
+        if current.isValid():
+            self.update_object(self._model.enum.names[current.row()])
+
     #---------------------------------------------------------------------------
     #  Handles the user selecting a list box item:
     #---------------------------------------------------------------------------
@@ -494,19 +540,11 @@ class ListEditor ( BaseEditor ):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
-        control = self.control
-        try:
-            value = self.inverse_mapping[self.value]
-
-            for row in range(control.count()):
-                itm = control.item(row)
-
-                if itm.text() == value:
-                    control.setCurrentItem(itm)
-                    control.scrollToItem(itm)
-                    break
-        except:
-            pass
+        row = self._model.enum.index_of_value(self.value)
+        if row >= 0:
+            index = self._model.index(row)
+            self.control.setCurrentIndex(index)
+            self.control.scrollTo(index)
 
     #---------------------------------------------------------------------------
     #  Rebuilds the contents of the editor whenever the original factory
@@ -518,10 +556,69 @@ class ListEditor ( BaseEditor ):
             object's **values** trait changes.
         """
 
-        self.control.blockSignals(True)
-        self.control.clear()
-        for name in self.names:
-            self.control.addItem(name)
-        self.control.blockSignals(False)
+        self.control.selectionModel().blockSignals(True)
+        self._model.set_values(self.names, self.mapping, self.inverse_mapping)
+        self.control.selectionModel().blockSignals(False)
 
         self.update_editor()
+
+#-------------------------------------------------------------------------------
+#  'EnumListModel' class:
+#-------------------------------------------------------------------------------
+
+class EnumListModel(QtCore.QAbstractListModel):
+    """ A list model of the names of an enumeration, which applies changes to
+        the names as row insertions and removals, rather than resetting.
+    """
+
+    def __init__(self):
+        """ Initializes the model.
+        """
+        QtCore.QAbstractListModel.__init__(self)
+
+        # The index of the enumeration names:
+        self.enum = EnumIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of names.
+        """
+        if parent.isValid():
+            return 0
+        return len(self.enum.names)
+
+    def data(self, mi, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the names.
+        """
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return self.enum.names[mi.row()]
+
+        return None
+
+    def set_values(self, names, mapping, inverse_mapping):
+        """ Updates the model for a new set of enumeration names, reporting
+            only the rows which changed to the views.
+        """
+        enum = self.enum
+        start, removed, added = enum.diff(names)
+        if removed == added:
+            enum.update(names, mapping, inverse_mapping)
+            if removed > 0:
+                signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+                self.emit(signal, self.index(start),
+                          self.index(start + removed - 1))
+            return
+
+        parent = QtCore.QModelIndex()
+        if removed > 0:
+            old = enum.names
+            self.beginRemoveRows(parent, start, start + removed - 1)
+            enum.update(old[:start] + old[start + removed:], mapping,
+                        inverse_mapping)
+            self.endRemoveRows()
+
+        if added > 0:
+            self.beginInsertRows(parent, start, start + added - 1)
+            enum.update(names, mapping, inverse_mapping)
+            self.endInsertRows()
+        else:
+            enum.update(names, mapping, inverse_mapping)
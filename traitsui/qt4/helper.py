@@ -19,6 +19,8 @@
 
 import os.path
 
+from operator import itemgetter
+
 from pyface.qt import QtCore, QtGui
 
 from traits.api \
@@ -152,7 +154,7 @@ def enum_values_changed ( values ):
     if isinstance( values, dict ):
         data = [ ( str( v ), n ) for n, v in values.items() ]
         if len( data ) > 0:
-            data.sort( lambda x, y: cmp( x[0], y[0] ) )
+            data.sort( key = itemgetter( 0 ) )
             col = data[0][0].find( ':' ) + 1
             if col > 0:
                 data = [ ( n[ col: ], v ) for n, v in data ]
@@ -164,18 +166,15 @@ def enum_values_changed ( values ):
             raise TraitError, "Invalid value for 'values' specified"
         if handler.is_mapped:
             data = [ ( str( n ), n ) for n in handler.map.keys() ]
-            data.sort( lambda x, y: cmp( x[0], y[0] ) )
+            data.sort( key = itemgetter( 0 ) )
         else:
             data = [ ( str( v ), v ) for v in handler.values ]
     else:
         data = [ ( str( v ), v ) for v in values ]
 
     names           = [ x[0] for x in data ]
-    mapping         = {}
-    inverse_mapping = {}
-    for name, value in data:
-        mapping[ name ] = value
-        inverse_mapping[ value ] = name
+    mapping         = dict( data )
+    inverse_mapping = dict( [ ( value, name ) for name, value in data ] )
 
     return ( names, mapping, inverse_mapping )
 
@@ -115,6 +115,10 @@ class CustomEditor ( Editor ):
             droppable  |= item.is_droppable()
             selectable |= item.is_selectable()
 
+        # Without a selector, the editor's only listener is on the object
+        # trait, so it can be rebound as part of a containing sub-view:
+        self.rebindable = not selectable
+
         if selectable:
             self._object_cache = {}
             item = self.item_for( self.value )
@@ -344,6 +348,11 @@ class CustomEditor ( Editor ):
         """
         panel = self._panel
         if panel is not None:
+            # If the current contents of the panel can display the new value,
+            # just rebind them to it:
+            if self._rebind_ui():
+                return
+
             # Dispose of the previous contents of the panel:
             layout = panel.layout()
             if layout is None:
@@ -388,6 +397,32 @@ class CustomEditor ( Editor ):
             # FIXME: Handle stretch.
             layout.addWidget(control)
 
+    #---------------------------------------------------------------------------
+    #  Rebinds the current sub-view to a new value:
+    #---------------------------------------------------------------------------
+
+    def _rebind_ui ( self ):
+        """ Rebinds the editors of the current sub-view to the new value of
+            the object trait, if it has the same class as the previous value
+            and uses the same View. Returns True if the sub-view was rebound,
+            and False if it must be rebuilt.
+        """
+        ui    = self._ui
+        value = self.value
+        if ((ui is None) or (not isinstance( value, HasTraits )) or
+            isinstance( value, Handler ) or
+            (type( value ) is not type( ui.context.get( 'object' ) ))):
+            return False
+
+        if self.view_for( value, self.item_for( value ) ) is not ui.view:
+            return False
+
+        context = value.trait_context()
+        context.setdefault( 'context', self.object )
+        context.setdefault( 'context_handler', self.ui.handler )
+
+        return ui.rebind( context )
+
     #---------------------------------------------------------------------------
     #  Disposes of the contents of an editor:
     #---------------------------------------------------------------------------
@@ -26,13 +26,20 @@ from traits.trait_base import user_name_for, enumerate, xgetattr
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
 # compatibility. The class has been moved to the
 # traitsui.editors.list_editor file.
-from traitsui.editors.list_editor import ListItemProxy, \
+from traitsui.editors.list_editor import ListItemIndex, ListItemProxy, \
     ToolkitEditorFactory
 
 from editor import Editor
 from helper import IconButton
 from menu import MakeMenu
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The maximum size of a QWidget (Qt's QWIDGETSIZE_MAX):
+QWIDGETSIZE_MAX = (1 << 24) - 1
+
 #-------------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -105,14 +112,38 @@ class SimpleEditor ( Editor ):
         self.control.setFrameShape(QtGui.QFrame.NoFrame)
         self.control.setWidgetResizable(True)
 
-        # Create a widget with a grid layout as the container.
+        # Create a widget with a vertical layout as the container. It holds a
+        # row for each list item which has an editor, between two spacers
+        # standing in for the items (if any) scrolled out of view:
         self._list_pane = QtGui.QWidget()
         self._list_pane.setSizePolicy(QtGui.QSizePolicy.Expanding,
                                       QtGui.QSizePolicy.Expanding)
-        layout = QtGui.QGridLayout(self._list_pane)
+        layout = QtGui.QVBoxLayout(self._list_pane)
         layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        self._top_spacer = QtGui.QWidget()
+        self._bottom_spacer = QtGui.QWidget()
+        layout.addWidget(self._top_spacer)
+        layout.addWidget(self._bottom_spacer)
+        self._top_spacer.hide()
+        self._bottom_spacer.hide()
+
+        # The proxies of the items which have an editor, the row widget and
+        # editor of each of them, and the range of items shown:
+        self._index = ListItemIndex()
+        self._rows = {}
+        self._first = self._last = 0
+        self._row_height = None
+        self._empty_row = None
+
+        # Show the item editors scrolled into view:
+        scroll_bar = self.control.verticalScrollBar()
+        QtCore.QObject.connect(scroll_bar,
+                QtCore.SIGNAL('valueChanged(int)'), self._scrolled)
+        QtCore.QObject.connect(scroll_bar,
+                QtCore.SIGNAL('rangeChanged(int,int)'), self._scrolled)
+
         # Remember the editor to use for each individual list item:
         editor = self.factory.editor
         if editor is None:
@@ -155,45 +186,19 @@ class SimpleEditor ( Editor ):
         # Disconnect the editor from any control about to be destroyed:
         self._dispose_items()
 
-        list_pane = self._list_pane
-        layout = list_pane.layout()
-
-        # Create all of the list item trait editors:
-        trait_handler = self._trait_handler
-        resizable     = ((trait_handler.minlen != trait_handler.maxlen) and
-                         self.mutable)
-        item_trait    = trait_handler.item_trait
-
-        is_fake = (resizable and (len( self.value ) == 0))
-        if is_fake:
-           self.empty_list()
-
-        editor = self._editor
-        # FIXME: Add support for more than one column.
-        for index, value in enumerate(self.value):
-            if resizable:
-                control = IconButton('list_editor.png', self.popup_menu)
-                layout.addWidget(control, index, 0)
-
-            proxy = ListItemProxy( self.object, self.name, index, item_trait,
-                                   value )
-            if resizable:
-                control.proxy = proxy
-            peditor = editor( self.ui, proxy, 'value', self.description,
-                              list_pane ).set( object_name = '' )
-            peditor.prepare( list_pane )
-            pcontrol = peditor.control
-            pcontrol.proxy = proxy
-
-            if isinstance(pcontrol, QtGui.QWidget):
-                layout.addWidget(pcontrol, index, 1)
-            else:
-                layout.addLayout(pcontrol, index, 1)
+        trait_handler   = self._trait_handler
+        self._resizable = ((trait_handler.minlen != trait_handler.maxlen) and
+                           self.mutable)
+
+        if self._resizable and (len( self.value ) == 0):
+            self.empty_list()
+
+        self._show_items()
 
         # QScrollArea can have problems if the widget being scrolled is set too
         # early (ie. before it contains something).
         if self.control.widget() is None:
-            self.control.setWidget(list_pane)
+            self.control.setWidget(self._list_pane)
 
     #---------------------------------------------------------------------------
     #  Updates the editor when an item in the object trait changes external to
@@ -204,21 +209,12 @@ class SimpleEditor ( Editor ):
         """ Updates the editor when an item in the object trait changes
         externally to the editor.
         """
-        # If this is not a simple, single item update, rebuild entire editor:
-        if (len( event.removed ) != 1) or (len( event.added ) != 1):
+        if not isinstance( event.index, int ):
+            # Extended slices rebuild the entire editor:
             self.update_editor()
             return
 
-        # Otherwise, find the proxy for this index and update it with the
-        # changed value:
-        for control in self.control.widget().children():
-            if isinstance(control, QtGui.QLayout):
-                continue
-
-            proxy = control.proxy
-            if proxy.index == event.index:
-                proxy.value = event.added[0]
-                break
+        self._update_rows( event.index, len( event.removed ), event.added )
 
     #---------------------------------------------------------------------------
     #  Creates an empty list entry (so the user can add a new item):
@@ -235,9 +231,13 @@ class SimpleEditor ( Editor ):
         pcontrol = QtGui.QLabel('   (Empty List)')
         pcontrol.proxy = control.proxy = proxy
 
-        layout = self._list_pane.layout()
-        layout.addWidget(control, 0, 0)
-        layout.addWidget(pcontrol, 0, 1)
+        row = QtGui.QWidget()
+        row_layout = QtGui.QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.addWidget(control)
+        row_layout.addWidget(pcontrol)
+        self._list_pane.layout().insertWidget(1, row)
+        self._empty_row = row
 
     #---------------------------------------------------------------------------
     #  Returns the associated object list and current item index:
@@ -299,8 +299,7 @@ class SimpleEditor ( Editor ):
         index      += offset
         item_trait  = self._trait_handler.item_trait
         value       = item_trait.default_value_for( self.object, self.name )
-        self.value = list[:index] + [ value ] + list[index:]
-        self.update_editor()
+        self._set_items( index, 0, [ value ] )
 
     #---------------------------------------------------------------------------
     #  Inserts a new item before the current item:
@@ -338,8 +337,7 @@ class SimpleEditor ( Editor ):
         """ Delete the current item.
         """
         list, index = self.get_info()
-        self.value  = list[:index] + list[index+1:]
-        self.update_editor()
+        self._set_items( index, 1, [] )
 
     #---------------------------------------------------------------------------
     #  Move the current item up one in the list:
@@ -349,9 +347,7 @@ class SimpleEditor ( Editor ):
         """ Move the current item up one in the list.
         """
         list, index = self.get_info()
-        self.value  = (list[:index-1] + [ list[index], list[index-1] ] +
-                       list[index+1:])
-        self.update_editor()
+        self._set_items( index - 1, 2, [ list[ index ], list[ index - 1 ] ] )
 
     #---------------------------------------------------------------------------
     #  Moves the current item down one in the list:
@@ -361,9 +357,7 @@ class SimpleEditor ( Editor ):
         """ Moves the current item down one in the list.
         """
         list, index = self.get_info()
-        self.value  = (list[:index] + [ list[index+1], list[index] ] +
-                       list[index+2:])
-        self.update_editor()
+        self._set_items( index, 2, [ list[ index + 1 ], list[ index ] ] )
 
     #---------------------------------------------------------------------------
     #  Moves the current item to the top of the list:
@@ -373,8 +367,7 @@ class SimpleEditor ( Editor ):
         """ Moves the current item to the top of the list.
         """
         list, index = self.get_info()
-        self.value  = [ list[index] ] + list[:index] + list[index+1:]
-        self.update_editor()
+        self._set_items( 0, index + 1, [ list[ index ] ] + list[ :index ] )
 
     #---------------------------------------------------------------------------
     #  Moves the current item to the bottom of the list:
@@ -384,26 +377,182 @@ class SimpleEditor ( Editor ):
         """ Moves the current item to the bottom of the list.
         """
         list, index = self.get_info()
-        self.value  = list[:index] + list[index+1:] + [ list[index] ]
-        self.update_editor()
+        self._set_items( index, len( list ) - index,
+                         list[ index + 1: ] + [ list[ index ] ] )
 
     #-- Private Methods --------------------------------------------------------
 
+    def _set_items ( self, index, removed, added ):
+        """ Replaces the **removed** items starting at **index** by the
+            **added** items. The list is replaced by a new list (as a change
+            of the trait itself is expected to be notified), and the rows are
+            updated for just the changed items.
+        """
+        list       = self.value
+        self.value = list[ :index ] + added + list[ index + removed: ]
+        if self.value is not list:
+            self._update_rows( index, removed, added )
+
+    def _update_rows ( self, index, removed, added ):
+        """ Updates the rows for the **removed** items starting at **index**
+            having been replaced by the **added** items.
+        """
+        if (self._empty_row is not None) or (len( self.value ) == 0):
+            # Changes to or from an empty list rebuild the entire editor:
+            self.update_editor()
+            return
+
+        if removed == len( added ):
+            # Replaced items keep their editors, which are updated with the
+            # changed values:
+            for i, value in enumerate( added ):
+                proxy = self._index.get( index + i )
+                if proxy is not None:
+                    proxy.value = value
+            return
+
+        # Otherwise, remove the rows of the removed items:
+        for proxy in self._index.update( index, removed, len( added ) ):
+            self._dispose_row( proxy )
+
+        threshold = self.factory.virtual_threshold
+        if ((self._row_height is not None) or
+            ((threshold > 0) and (len( self.value ) > threshold))):
+            # Only the rows scrolled into view are shown:
+            self._show_items()
+            return
+
+        # Otherwise, all of the items have rows, so only the added items need
+        # rows created for them:
+        for i in xrange( index, index + len( added ) ):
+            self._create_row( i, 1 + i )
+        self._last = len( self.value )
+
     def _dispose_items ( self ):
         """ Disposes of each current list item.
         """
-        layout = self._list_pane.layout()
-        child = layout.takeAt(0)
-        while child is not None:
-            control = child.widget()
-            if control is not None:
-                editor = getattr( control, '_editor', None )
-                if editor is not None:
-                    editor.dispose()
-                    editor.control = None
-                control.deleteLater()
-            child = layout.takeAt(0)
-        del child
+        for index in self._index.indices():
+            self._dispose_row( self._index.remove( index ) )
+
+        if self._empty_row is not None:
+            self._list_pane.layout().removeWidget(self._empty_row)
+            self._empty_row.deleteLater()
+            self._empty_row = None
+
+        self._first = self._last = 0
+
+    def _dispose_row ( self, proxy ):
+        """ Disposes of the row (and item editor) of the specified proxy.
+        """
+        row, editor = self._rows.pop( proxy )
+        editor.dispose()
+        editor.control = None
+        self._list_pane.layout().removeWidget(row)
+        row.deleteLater()
+
+    def _create_row ( self, index, position ):
+        """ Creates the row (and item editor) for the list item at the
+            specified index, and inserts it at the specified layout position.
+        """
+        list_pane  = self._list_pane
+        item_trait = self._trait_handler.item_trait
+
+        row = QtGui.QWidget()
+        row_layout = QtGui.QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+
+        proxy = ListItemProxy( self.object, self.name, index, item_trait,
+                               self.value[ index ] )
+        if self._resizable:
+            control = IconButton('list_editor.png', self.popup_menu)
+            control.proxy = proxy
+            row_layout.addWidget(control)
+
+        peditor = self._editor( self.ui, proxy, 'value', self.description,
+                                list_pane ).set( object_name = '' )
+        peditor.prepare( list_pane )
+        pcontrol = peditor.control
+        pcontrol.proxy = proxy
+
+        if isinstance(pcontrol, QtGui.QWidget):
+            row_layout.addWidget(pcontrol)
+        else:
+            row_layout.addLayout(pcontrol)
+
+        if self._row_height is not None:
+            row.setFixedHeight(self._row_height)
+
+        list_pane.layout().insertWidget(position, row)
+        self._index.add( proxy )
+        self._rows[ proxy ] = ( row, peditor )
+
+        return row
+
+    def _show_items ( self ):
+        """ Makes sure the rows of the list items which are shown (all of them,
+            or only those scrolled into view if the list is longer than the
+            factory's **virtual_threshold**) exist, and disposes of the others.
+        """
+        n         = len( self.value )
+        threshold = self.factory.virtual_threshold
+        first, last = 0, n
+        if (threshold > 0) and (n > threshold):
+            if self._row_height is None:
+                # Use the height of the first row for all of the rows:
+                if 0 not in self._index:
+                    self._create_row( 0, 1 )
+                row = self._rows[ self._index.get( 0 ) ][0]
+                self._row_height = row.sizeHint().height()
+                for row, _ in self._rows.itervalues():
+                    row.setFixedHeight(self._row_height)
+
+            height  = self._row_height + self._list_pane.layout().spacing()
+            visible = (self.control.viewport().height() // height) + 2
+            first   = min( self.control.verticalScrollBar().value() // height,
+                           n )
+            last    = min( first + visible, n )
+        elif self._row_height is not None:
+            self._row_height = None
+            for row, _ in self._rows.itervalues():
+                row.setMinimumHeight(0)
+                row.setMaximumHeight(QWIDGETSIZE_MAX)
+
+        for index in self._index.indices():
+            if (index < first) or (index >= last):
+                self._dispose_row( self._index.remove( index ) )
+
+        # Rows are created in index order, so the rows for all of the shown
+        # items before an item already exist when its row is created:
+        for index in xrange( first, last ):
+            if index not in self._index:
+                self._create_row( index, 1 + index - first )
+
+        self._first, self._last = first, last
+        self._update_spacers()
+
+    def _update_spacers ( self ):
+        """ Sizes the spacers standing in for the items scrolled out of view.
+        """
+        if self._row_height is None:
+            self._top_spacer.hide()
+            self._bottom_spacer.hide()
+            return
+
+        spacing = self._list_pane.layout().spacing()
+        height  = self._row_height + spacing
+        for spacer, count in ( ( self._top_spacer, self._first ),
+                ( self._bottom_spacer, len( self.value ) - self._last ) ):
+            if count > 0:
+                spacer.setFixedHeight((count * height) - spacing)
+                spacer.show()
+            else:
+                spacer.hide()
+
+    def _scrolled ( self, *args ):
+        """ Handles the list being scrolled or resized.
+        """
+        if self._row_height is not None:
+            self._show_items()
 
     #-- Trait initializers ----------------------------------------------------
 
@@ -500,6 +649,7 @@ class NotebookEditor ( Editor ):
             widget.
         """
         self._uis = []
+        self._loaded = []
 
         # Create a tab widget to hold each separate object's view:
         self.control = QtGui.QTabWidget()
@@ -545,10 +695,10 @@ class NotebookEditor ( Editor ):
 
         # Create a tab page for each object in the trait's value:
         for object in self.value:
-            ui, view_object, monitoring = self._create_page(object)
-
             # Remember the page for later deletion processing:
-            self._uis.append([ui.control, ui, view_object, monitoring])
+            self._uis.append(self._create_page(object))
+
+        self._load_current_page()
 
     #---------------------------------------------------------------------------
     #  Handles some subset of the trait's list being updated:
@@ -567,7 +717,8 @@ class NotebookEditor ( Editor ):
             if monitoring:
                 view_object.on_trait_change(self.update_page_name, page_name,
                         remove=True)
-            ui.dispose()
+            if ui is not None:
+                ui.dispose()
             self.control.removeTab(self.control.indexOf(page))
 
             if self.factory.show_notebook_menu:
@@ -577,21 +728,25 @@ class NotebookEditor ( Editor ):
                 self._context_menu.removeAction(self._action_dict[name])
                 del self._action_dict[name]
 
+            if self._uis[index] in self._loaded:
+                self._loaded.remove(self._uis[index])
             del self._uis[index]
 
         # Add a page for each added object:
         first_page = None
         for object in event.added:
-            ui, view_object, monitoring  = self._create_page(object)
-            self._uis[index:index] = [[ui.control, ui, view_object, monitoring]]
+            entry = self._create_page(object)
+            self._uis[index:index] = [entry]
             index += 1
 
             if first_page is None:
-                first_page = ui.control
+                first_page = entry[0]
 
         if first_page is not None:
             self.control.setCurrentWidget(first_page)
 
+        self._load_current_page()
+
     #---------------------------------------------------------------------------
     #  Closes the currently selected tab:
     #---------------------------------------------------------------------------
@@ -603,7 +758,9 @@ class NotebookEditor ( Editor ):
         for i in xrange( len( self._uis ) ):
             page, ui, _, _ = self._uis[i]
             if page is widget:
-                if force or ui.handler.close( ui.info, True ):
+                # A page that has not been built yet can always be closed:
+                if (force or (ui is None) or
+                    ui.handler.close( ui.info, True )):
                     del self.value[i]
                 break
 
@@ -637,11 +794,13 @@ class NotebookEditor ( Editor ):
             if monitoring:
                 view_object.on_trait_change(self.update_page_name, page_name,
                         remove=True)
-            ui.dispose()
+            if ui is not None:
+                ui.dispose()
 
         # Reset the list of ui's and dictionary of page name counts:
         self._uis = []
         self._pages = {}
+        self._loaded = []
 
         self.control.clear()
 
@@ -666,8 +825,8 @@ class NotebookEditor ( Editor ):
         """ Handles the trait defining a particular page's name being changed.
         """
         for i, value in enumerate(self._uis):
-            page, ui, _, _ = value
-            if object is ui.info.object:
+            page, ui, view_object, _ = value
+            if object is view_object:
                 name = None
                 handler = getattr(self.ui.handler,
                         '%s_%s_page_name' % (self.object_name, self.name),
@@ -691,10 +850,19 @@ class NotebookEditor ( Editor ):
         factory = self.factory
         if factory.factory is not None:
             view_object = factory.factory(object)
-        ui = view_object.edit_traits( parent = self.control,
-                                 view   = factory.view,
-                                 kind   = factory.ui_kind ).set(
-                                 parent = self.ui )
+
+        if factory.lazy:
+            # The view is only created when the page is first shown:
+            ui   = None
+            page = QtGui.QWidget()
+            layout = QtGui.QVBoxLayout(page)
+            layout.setContentsMargins(0, 0, 0, 0)
+        else:
+            ui = view_object.edit_traits( parent = self.control,
+                                     view   = factory.view,
+                                     kind   = factory.ui_kind ).set(
+                                     parent = self.ui )
+            page = ui.control
 
         # Get the name of the page being added to the notebook:
         name       = ''
@@ -729,17 +897,16 @@ class NotebookEditor ( Editor ):
             if count > 1:
                 name += (' %d' % count)
 
-        # Return the control for the ui, and whether or not its name is being
-        # monitored:
+        # Add the page to the notebook:
         image   = None
         method  = getattr( self.ui.handler, prefix + 'image', None )
         if method is not None:
             image = method( self.ui.info, object )
 
         if image is None:
-            self.control.addTab(ui.control, name)
+            self.control.addTab(page, name)
         else:
-            self.control.addTab(ui.control, image, name)
+            self.control.addTab(page, image, name)
 
         if self.factory.show_notebook_menu:
             newaction = self._context_menu.addAction(name)
@@ -748,24 +915,66 @@ class NotebookEditor ( Editor ):
             newaction.setChecked(True)
             newaction.triggered.connect(lambda e,name=name: self._menu_action(e,name=name))
             self._action_dict[name] = newaction
-            self._pagewidgets[name] = ui.control
+            self._pagewidgets[name] = page
 
-        return (ui, view_object, monitoring)
+        # Return the page, the ui (if created), the object viewed, and whether
+        # or not its name is being monitored:
+        return [page, ui, view_object, monitoring]
+
+    def _load_page(self, entry):
+        """ Creates the view for a lazily created notebook page (if it has
+            not been created yet), and disposes of the views of the least
+            recently shown pages beyond the factory's **max_pages** limit.
+        """
+        page, ui, view_object, _ = entry
+        if not self.factory.lazy:
+            return
+
+        loaded = self._loaded
+        if ui is None:
+            factory = self.factory
+            ui = view_object.edit_traits( parent = page,
+                                     view   = factory.view,
+                                     kind   = factory.ui_kind ).set(
+                                     parent = self.ui )
+            page.layout().addWidget(ui.control)
+            entry[1] = ui
+        elif entry in loaded:
+            loaded.remove(entry)
+        loaded.append(entry)
+
+        max_pages = self.factory.max_pages
+        if max_pages > 0:
+            while len(loaded) > max_pages:
+                old = loaded.pop(0)
+                old[1].dispose()
+                old[1] = None
+
+    def _load_current_page(self):
+        """ Makes sure the view for the current notebook page is created.
+        """
+        widget = self.control.currentWidget()
+        for entry in self._uis:
+            if entry[0] is widget:
+                self._load_page(entry)
+                break
 
     def _tab_activated(self, idx):
         """ Handles a notebook tab being "activated" (i.e. clicked on) by the
             user.
         """
         widget = self.control.widget(idx)
-        for page, ui, _, _ in self._uis:
-            if page is widget:
-                self.selected = ui.info.object
+        for entry in self._uis:
+            if entry[0] is widget:
+                self._load_page(entry)
+                self.selected = entry[2]
                 break
+
     def _selected_changed(self, selected):
         """ Handles the **selected** trait being changed.
         """
-        for page, ui, _, _ in self._uis:
-            if ui.info and selected is ui.info.object:
+        for page, _, view_object, _ in self._uis:
+            if selected is view_object:
                 self.control.setCurrentWidget(page)
                 break
 
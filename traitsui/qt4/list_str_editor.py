@@ -163,7 +163,8 @@ class _ListStrEditor(Editor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements:
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', dispatch='ui')
+            self.update_editor_item, self.extended_name + '_items',
+            dispatch='ui')
 
         # Create the mapping from user supplied images to QIcons:
         for image_resource in factory.images:
@@ -180,7 +181,8 @@ class _ListStrEditor(Editor):
         """ Disposes of the contents of an editor.
         """
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self.update_editor_item, self.extended_name + '_items',
+            remove=True)
 
         self.on_trait_change(
             self.refresh_editor, 'adapter.+update', remove=True)
@@ -192,6 +194,14 @@ class _ListStrEditor(Editor):
         if not self._no_update:
             self.model.reset()
 
+    def update_editor_item(self, event):
+        """ Updates the editor when some of the items in the object trait
+            change externally to the editor. Only the affected rows are
+            updated, so the view keeps its selection and scroll position.
+        """
+        if not (self._no_update or self.model.items_changed(event)):
+            self.model.reset()
+
     #---------------------------------------------------------------------------
     #  ListStrEditor interface:
     #---------------------------------------------------------------------------
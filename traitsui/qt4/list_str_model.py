@@ -48,6 +48,9 @@ class ListStrModel(QtCore.QAbstractListModel):
 
         self._editor = editor
 
+        # The number of rows reported to the views (None if not yet counted):
+        self._rows = None
+
     #---------------------------------------------------------------------------
     #  QAbstractItemModel interface:
     #---------------------------------------------------------------------------
@@ -55,8 +58,10 @@ class ListStrModel(QtCore.QAbstractListModel):
     def rowCount(self, mi):
         """ Reimplemented to return items in the list.
         """
-        editor = self._editor
-        return editor.adapter.len(editor.object, editor.name)
+        if self._rows is None:
+            editor = self._editor
+            self._rows = editor.adapter.len(editor.object, editor.name)
+        return self._rows
 
     def data(self, mi, role):
         """ Reimplemented to return the data.
@@ -172,6 +177,7 @@ class ListStrModel(QtCore.QAbstractListModel):
         self.beginInsertRows(parent, row, row)
         editor.callx(
             editor.adapter.insert, editor.object, editor.name, row, obj)
+        self._rows = None
         self.endInsertRows()
         return True
 
@@ -185,6 +191,7 @@ class ListStrModel(QtCore.QAbstractListModel):
         for i in xrange(count):
             value = adapter.get_default_value(editor.object, editor.name)
             editor.callx(adapter.insert, editor.object, editor.name, row, value)
+        self._rows = None
         self.endInsertRows()
         return True
 
@@ -198,6 +205,7 @@ class ListStrModel(QtCore.QAbstractListModel):
         self.beginRemoveRows(parent, row, row + count - 1)
         for i in xrange(count):
             editor.callx(adapter.delete, editor.object, editor.name, row)
+        self._rows = None
         self.endRemoveRows()
         return True
 
@@ -240,10 +248,49 @@ class ListStrModel(QtCore.QAbstractListModel):
         """
         return QtCore.Qt.MoveAction
 
+    def reset(self):
+        """ Reimplemented to recount the rows.
+        """
+        self._rows = None
+        QtCore.QAbstractListModel.reset(self)
+
     #---------------------------------------------------------------------------
     #  ListStrModel interface:
     #---------------------------------------------------------------------------
 
+    def items_changed(self, event):
+        """ Notifies the views of the rows affected by a change to the items
+            of the edited list, described by the TraitListEvent **event**.
+            Returns False if the change does not map to a range of rows (in
+            which case the model should be reset).
+        """
+        rows = self._rows
+        if rows is None:
+            # The views have not asked for any rows yet:
+            return True
+
+        index = event.index
+        removed, added = len(event.removed), len(event.added)
+        if ((not isinstance(index, (int, long))) or (index < 0) or
+            ((index + removed) > rows)):
+            return False
+
+        parent = QtCore.QModelIndex()
+        if added > removed:
+            self.beginInsertRows(parent, index + removed, index + added - 1)
+            self._rows = rows + added - removed
+            self.endInsertRows()
+        elif removed > added:
+            self.beginRemoveRows(parent, index + added, index + removed - 1)
+            self._rows = rows + added - removed
+            self.endRemoveRows()
+
+        changed = min(removed, added)
+        if changed > 0:
+            signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+            self.emit(signal, self.index(index), self.index(index + changed - 1))
+        return True
+
     def moveRow(self, old_row, new_row):
         """ Convenience method to move a single row.
         """
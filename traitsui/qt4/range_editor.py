@@ -52,6 +52,10 @@ class BaseRangeEditor ( Editor ):
         when assigning numbers the object trait.
     """
 
+    # Can be rebound to another object (the listeners on its 'low_name',
+    # 'high_name' and 'evaluate_name' traits are set up by 'sync_value'):
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Trait definitions:
     #---------------------------------------------------------------------------
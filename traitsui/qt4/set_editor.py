@@ -24,6 +24,12 @@ from pyface.qt import QtCore, QtGui
 from traitsui.editors.set_editor \
     import ToolkitEditorFactory
 
+from traitsui.helper \
+    import SortedIndex
+
+from traitsui.undo \
+    import common_affixes
+
 from helper \
     import enum_values_changed
 
@@ -33,6 +39,14 @@ from editor \
 from traits.api \
     import Instance, Property
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The number of values added to or removed from a sorted list box at once
+# above which its model is reset, rather than updated row by row:
+ResetThreshold = 100
+
 #-------------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------------
@@ -45,6 +59,9 @@ class SimpleEditor ( Editor ):
     is True, then buttons are displayed for moving all the items to one box
     or the other. If the set is ordered, buttons are displayed for moving the
     selected item up or down in right-side list box.
+
+    Both list boxes are views of virtual list models, which are updated with
+    only the differences between the old and new values of the set.
     """
 
     #---------------------------------------------------------------------------
@@ -93,7 +110,7 @@ class SimpleEditor ( Editor ):
         blayout = QtGui.QVBoxLayout()
 
         self._unused = self._create_listbox(0, self._on_unused, self._on_use,
-                factory.left_column_title)
+                factory.left_column_title, SortedSetListModel(True))
 
         self._use_all = self._unuse_all = self._up = self._down = None
 
@@ -115,8 +132,14 @@ class SimpleEditor ( Editor ):
 
         self.root_layout.addLayout(blayout, 1, 1, QtCore.Qt.AlignCenter)
 
+        # Keep the right list box sorted unless insertion order is relevant:
+        if factory.ordered:
+            used_model = OrderedSetListModel()
+        else:
+            used_model = SortedSetListModel(False)
+
         self._used = self._create_listbox(2, self._on_value, self._on_unuse,
-                factory.right_column_title)
+                factory.right_column_title, used_model)
 
         self.context_object.on_trait_change( self.update_editor,
                                self.extended_name + '_items?', dispatch = 'ui' )
@@ -161,7 +184,7 @@ class SimpleEditor ( Editor ):
     #  Creates a list box:
     #---------------------------------------------------------------------------
 
-    def _create_listbox(self, col, handler1, handler2, title):
+    def _create_listbox(self, col, handler1, handler2, title, model):
         """Creates a list box.
         """
         # Add the column title in emphasized text:
@@ -173,14 +196,15 @@ class SimpleEditor ( Editor ):
         self.root_layout.addWidget(title_widget, 0, col, QtCore.Qt.AlignLeft)
 
         # Create the list box and add it to the column:
-        list = QtGui.QListWidget()
+        list = QtGui.QListView()
+        list.setModel(model)
+        list.setUniformItemSizes(True)
         list.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
         self.root_layout.addWidget(list, 1, col)
 
-        list.connect(list,
-                QtCore.SIGNAL('itemClicked(QListWidgetItem *)'), handler1)
-        list.connect(list,
-                QtCore.SIGNAL('itemDoubleClicked(QListWidgetItem *)'), handler2)
+        list.connect(list, QtCore.SIGNAL('clicked(QModelIndex)'), handler1)
+        list.connect(list, QtCore.SIGNAL('doubleClicked(QModelIndex)'),
+                handler2)
 
         return list
 
@@ -226,66 +250,23 @@ class SimpleEditor ( Editor ):
         """
         # Check for any items having been deleted from the enumeration that are
         # still present in the object value:
-        mapping = self.inverse_mapping.copy()
+        mapping = self.inverse_mapping
         values  = [ v for v in self.value if v in mapping ]
         if len( values ) < len( self.value ):
             self.value = values
 
-        # Get a list of the selected items in the right box:
-        used        = self._used
-        used_labels = self._get_selected_strings( used )
-
-        # Get a list of the selected items in the left box:
-        unused        = self._unused
-        unused_labels = self._get_selected_strings( unused )
-
-        # Empty list boxes in preparation for rebuilding from current values:
-        used.clear()
-        unused.clear()
-
-        # Ensure right list box is kept alphabetized unless insertion
-        # order is relevant:
-        if not self.factory.ordered:
-            values = values[:]
-            values.sort()
-
-        # Rebuild the right listbox:
-        used_selections = []
-        for i, value in enumerate( values ):
-            label = mapping[ value ]
-            used.addItem(label)
-            del mapping[ value ]
-            if label in used_labels:
-                used_selections.append(i)
-
-        # Rebuild the left listbox:
-        unused_selections = []
-        unused_items      = mapping.values()
-        unused_items.sort()
-        mapping            = self.mapping
-        self._unused_items = [ mapping[ ui ] for ui in unused_items ]
-        for i, unused_item in enumerate( unused_items ):
-            unused.addItem(unused_item)
-            if unused_item in unused_labels:
-                unused_selections.append( i )
+        self._show_values( values )
 
         # If nothing is selected, default selection should be top of left box,
         # or of right box if left box is empty:
-        if (len( used_selections ) == 0) and (len( unused_selections ) == 0):
-            if unused.count() == 0:
-                used_selections.append(0)
+        used   = self._used
+        unused = self._unused
+        if ((self._get_first_selection( used ) < 0) and
+            (self._get_first_selection( unused ) < 0)):
+            if unused.model().rowCount() == 0:
+                self._select_rows( used, [ 0 ] )
             else:
-                unused_selections.append(0)
-
-        used_count = used.count()
-        for i in used_selections:
-            if i < used_count:
-                used.item(i).setSelected(True)
-
-        unused_count = unused.count()
-        for i in unused_selections:
-            if i < unused_count:
-                unused.item(i).setSelected(True)
+                self._select_rows( unused, [ 0 ] )
 
         self._check_up_down()
         self._check_left_right()
@@ -335,20 +316,16 @@ class SimpleEditor ( Editor ):
         self._check_up_down()
 
     def _on_use(self):
-        self._unused_items, self.value = self._transfer_items( self._unused,
-                                    self._used, self._unused_items, self.value )
+        self._transfer_items( self._unused, self._used, True )
 
     def _on_unuse(self):
-        self.value, self._unused_items = self._transfer_items( self._used,
-                                  self._unused, self.value, self._unused_items )
+        self._transfer_items( self._used, self._unused, False )
 
     def _on_use_all(self):
-        self._unused_items, self.value = self._transfer_all( self._unused,
-                                    self._used, self._unused_items, self.value )
+        self._transfer_all( self._unused, self._used, True )
 
     def _on_unuse_all(self):
-        self.value, self._unused_items = self._transfer_all( self._used,
-                                 self._unused, self.value, self._unused_items )
+        self._transfer_all( self._used, self._unused, False )
 
     def _on_up(self):
         self._move_item(-1)
@@ -360,84 +337,91 @@ class SimpleEditor ( Editor ):
     #  Private methods:
     #---------------------------------------------------------------------------
 
+    #---------------------------------------------------------------------------
+    #  Updates the list boxes to show a new list of used values:
+    #---------------------------------------------------------------------------
+
+    def _show_values ( self, values ):
+        """ Updates the list boxes to show a new list of used values, applying
+            only the differences from the values currently shown.
+        """
+        used    = self._used.model()
+        unused  = self._unused.model()
+        mapping = self.inverse_mapping
+        if used.labels is mapping:
+            added, removed = used.set_values( values )
+            unused.update( removed, added )
+            return
+
+        # The enumeration has changed, so rebuild both list boxes, keeping the
+        # selected values selected:
+        used_selection   = self._get_selected_values( self._used )
+        unused_selection = self._get_selected_values( self._unused )
+        members          = set( values )
+        used.reset( values, mapping )
+        unused.reset( [ v for v in mapping if v not in members ], mapping )
+        self._select_values( self._used,   used_selection )
+        self._select_values( self._unused, unused_selection )
+
     #---------------------------------------------------------------------------
     #  Transfers all items from one list to another:
     #---------------------------------------------------------------------------
 
-    def _transfer_all ( self, list_from, list_to, values_from, values_to ):
+    def _transfer_all ( self, list_from, list_to, use ):
         """ Transfers all items from one list to another.
         """
-        values_from = values_from[:]
-        values_to   = values_to[:]
+        if use:
+            values = self.value + list( list_from.model().values )
+        else:
+            values = []
+
+        self.value = values
+        self._show_values( values )
 
         list_from.clearSelection()
-        while list_from.count() > 0:
-            index_to = list_to.count()
-            list_from.item(0).setSelected(True)
-            list_to.insertItems(index_to, self._get_selected_strings(list_from))
-            list_from.takeItem(0)
-            values_to.append(values_from[0])
-            del values_from[0]
-
-        list_to.item(0).setSelected(True)
+        self._select_rows( list_to, [ 0 ] )
         self._check_left_right()
         self._check_up_down()
 
-        return ( values_from, values_to )
-
     #---------------------------------------------------------------------------
-    #  Transfers the selected item from one list to another:
+    #  Transfers the selected items from one list to another:
     #---------------------------------------------------------------------------
 
-    def _transfer_items ( self, list_from, list_to, values_from, values_to ):
-        """ Transfers the selected item from one list to another.
+    def _transfer_items ( self, list_from, list_to, use ):
+        """ Transfers the selected items from one list to another.
         """
-        values_from  = values_from[:]
-        values_to    = values_to[:]
-        index_from   = max( self._get_first_selection( list_from ), 0 )
-        index_to     = max( self._get_first_selection( list_to ),   0 )
+        selected = self._get_selected_values( list_from )
+        if len( selected ) == 0:
+            return
+
+        index_from = max( self._get_first_selection( list_from ), 0 )
+        values     = self.value
+        if not use:
+            moved  = set( selected )
+            values = [ v for v in values if v not in moved ]
+        elif self.factory.ordered:
+            # Insert the items before the selected item in the ordered list:
+            index_to = max( self._get_first_selection( list_to ), 0 )
+            values   = values[ : index_to ] + selected + values[ index_to: ]
+        else:
+            values = values + selected
 
+        self.value = values
+        self._show_values( values )
+
+        # If right list is ordered, keep moved items selected:
         list_to.clearSelection()
+        if self.factory.ordered:
+            self._select_values( list_to, selected )
 
-        # Get the list of strings in the "from" box to be moved:
-        selected_list = self._get_selected_strings( list_from )
-
-        # fixme: I don't know why I have to reverse the list to get
-        # correct behavior from the ordered list box.  Investigate -- LP
-        selected_list.reverse()
-        list_to.insertItems(index_to, selected_list)
-
-        # Delete the transferred items from the left box:
-        items_from = list_from.selectedItems()
-        for i in range(len(items_from) - 1, -1, -1):
-            list_from.takeItem(list_from.row(items_from[i]))
-        del items_from
-
-        # Delete the transferred items from the "unused" value list:
-        for item_label in selected_list:
-            val_index_from = values_from.index( self.mapping[ item_label ] )
-            values_to.insert( index_to, values_from[ val_index_from ] )
-            del values_from[ val_index_from ]
-
-            # If right list is ordered, keep moved items selected:
-            if self.factory.ordered:
-                items = list_to.findItems(item_label,
-                        QtCore.Qt.MatchFixedString|QtCore.Qt.MatchCaseSensitive)
-                if items:
-                    items[0].setSelected(True)
-
-        # Reset the selection in the left box:
-        count = list_from.count()
+        # Reset the selection in the "from" box:
+        count = list_from.model().rowCount()
         if count > 0:
-            if index_from >= count:
-                index_from = count - 1
-            list_from.item(index_from).setSelected(True)
+            self._select_rows( list_from, [ min( index_from, count - 1 ) ] )
 
         self._check_left_right()
         self._check_up_down()
 
-        return ( values_from, values_to )
-
     #---------------------------------------------------------------------------
     #  Moves an item up or down with the 'used' list:
     #---------------------------------------------------------------------------
@@ -445,26 +429,21 @@ class SimpleEditor ( Editor ):
     def _move_item ( self, direction ):
         """ Moves an item up or down within the "used" list.
         """
-        # Move the item up/down within the list:
-        listbox    = self._used
-        index_from = self._get_first_selection(listbox)
+        # Move the item up/down within the editor's trait value:
+        index_from = self._get_first_selection( self._used )
         index_to   = index_from + direction
-        label = listbox.takeItem(index_from).text()
-        listbox.insertItem(index_to, label)
-        listbox.item(index_to).setSelected(True)
+        values     = self.value[:]
+        values[ index_from ], values[ index_to ] = \
+            values[ index_to ], values[ index_from ]
+        self.value = values
+
+        # Move the item up/down within the list:
+        self._show_values( values )
+        self._select_rows( self._used, [ index_to ] )
 
         # Enable the up/down buttons appropriately:
         self._check_up_down()
 
-        # Move the item up/down within the editor's trait value:
-        value = self.value
-        if direction < 0:
-            index  = index_to
-            values = [ value[ index_from ], value[ index_to ] ]
-        else:
-            index  = index_from
-            values = [ value[ index_to ], value[ index_from ] ]
-        self.value = value[ : index ] + values + value[ index + 2: ]
     #---------------------------------------------------------------------------
     #  Sets the proper enable state for the up and down buttons:
     #---------------------------------------------------------------------------
@@ -473,11 +452,10 @@ class SimpleEditor ( Editor ):
         """ Sets the proper enabled state for the up and down buttons.
         """
         if self.factory.ordered:
-            selected = self._used.selectedItems()
-            self._up.setEnabled(len(selected) == 1 and
-                    selected[0] is not self._used.item(0))
-            self._down.setEnabled(len(selected) == 1 and
-                    selected[0] is not self._used.item(self._used.count() - 1))
+            rows = self._get_selected_rows(self._used)
+            last = self._used.model().rowCount() - 1
+            self._up.setEnabled(len(rows) == 1 and rows[0] != 0)
+            self._down.setEnabled(len(rows) == 1 and rows[0] != last)
 
     #---------------------------------------------------------------------------
     #  Sets the proper enable state for the left and right buttons:
@@ -486,25 +464,33 @@ class SimpleEditor ( Editor ):
     def _check_left_right(self):
         """ Sets the proper enabled state for the left and right buttons.
         """
-        self._use.setEnabled(self._unused.count() > 0 and
-                self._get_first_selection(self._unused) >= 0)
-        self._unuse.setEnabled(self._used.count() > 0 and
+        unused = (self._unused.model().rowCount() > 0 and
+                  self._get_first_selection(self._unused) >= 0)
+        used = (self._used.model().rowCount() > 0 and
                 self._get_first_selection(self._used) >= 0)
 
+        self._use.setEnabled(unused)
+        self._unuse.setEnabled(used)
+
         if self.factory.can_move_all:
-            self._use_all.setEnabled(self._unused.count() > 0 and
-                    self._get_first_selection(self._unused) >= 0)
-            self._unuse_all.setEnabled(self._used.count() > 0 and
-                    self._get_first_selection(self._used) >= 0)
+            self._use_all.setEnabled(unused)
+            self._unuse_all.setEnabled(used)
 
     #---------------------------------------------------------------------------
-    # Returns a list of the selected strings in the listbox
+    #  Returns the selected rows or values of a list box:
     #---------------------------------------------------------------------------
 
-    def _get_selected_strings(self, listbox):
-        """ Returns a list of the selected strings in the given *listbox*.
+    def _get_selected_rows(self, listbox):
+        """ Returns the sorted list of the selected rows in the given *listbox*.
+        """
+        return sorted([mi.row() for mi in
+                       listbox.selectionModel().selectedRows()])
+
+    def _get_selected_values(self, listbox):
+        """ Returns a list of the selected values in the given *listbox*.
         """
-        return [unicode(itm.text()) for itm in listbox.selectedItems()]
+        values = listbox.model().values
+        return [values[row] for row in self._get_selected_rows(listbox)]
 
     #---------------------------------------------------------------------------
     # Returns the index of the first (or only) selected item.
@@ -513,8 +499,234 @@ class SimpleEditor ( Editor ):
     def _get_first_selection ( self, listbox ):
         """ Returns the index of the first (or only) selected item.
         """
-        select_list = listbox.selectedItems()
-        if len(select_list) == 0:
+        rows = self._get_selected_rows(listbox)
+        if len(rows) == 0:
             return -1
 
-        return listbox.row(select_list[0])
+        return rows[0]
+
+    #---------------------------------------------------------------------------
+    #  Selects rows or values of a list box:
+    #---------------------------------------------------------------------------
+
+    def _select_rows(self, listbox, rows):
+        """ Adds the given *rows* to the selection of the given *listbox*.
+        """
+        model = listbox.model()
+        count = model.rowCount()
+        selection = QtGui.QItemSelection()
+        for row in rows:
+            if 0 <= row < count:
+                mi = model.index(row)
+                selection.select(mi, mi)
+
+        listbox.selectionModel().select(selection,
+                QtGui.QItemSelectionModel.Select)
+
+    def _select_values(self, listbox, values):
+        """ Adds the given *values* to the selection of the given *listbox*.
+        """
+        model = listbox.model()
+        self._select_rows(listbox, [model.row_of(v) for v in values])
+
+#-------------------------------------------------------------------------------
+#  'SetListModel' class:
+#-------------------------------------------------------------------------------
+
+class SetListModel(QtCore.QAbstractListModel):
+    """ A virtual list model of the values shown in one of the list boxes of a
+        set editor, which displays the label of each value.
+    """
+
+    def __init__(self):
+        """ Initializes the model.
+        """
+        QtCore.QAbstractListModel.__init__(self)
+
+        # The mapping from values to labels:
+        self.labels = {}
+
+        # The values shown (a sequence):
+        self.values = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of values.
+        """
+        if parent.isValid():
+            return 0
+        return len(self.values)
+
+    def data(self, mi, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the labels of the values.
+        """
+        if role == QtCore.Qt.DisplayRole:
+            return self.labels[self.values[mi.row()]]
+
+        return None
+
+    def reset(self, values, labels):
+        """ Replaces all of the values and the mapping from values to labels.
+        """
+        self.beginResetModel()
+        self.labels = labels
+        self.set_all(values)
+        self.endResetModel()
+
+    def diff(self, values):
+        """ Returns the values which must be added to and removed from the
+            values shown to get a new list of values, as a tuple of the form:
+            ( added, removed ).
+        """
+        members = set(values)
+        added = [v for v in values if not self.contains(v)]
+        removed = [v for v in self.values if v not in members]
+        return (added, removed)
+
+    #-- Methods Implemented by Subclasses --------------------------------------
+
+    def set_all(self, values):
+        """ Replaces all of the values, without notifying the views.
+        """
+        raise NotImplementedError
+
+    def contains(self, value):
+        """ Returns whether a value is shown.
+        """
+        raise NotImplementedError
+
+    def row_of(self, value):
+        """ Returns the row of a value, or -1 if it is not shown.
+        """
+        raise NotImplementedError
+
+#-------------------------------------------------------------------------------
+#  'SortedSetListModel' class:
+#-------------------------------------------------------------------------------
+
+class SortedSetListModel(SetListModel):
+    """ A set list model which keeps its values sorted, either by label or by
+        value, in a SortedIndex.
+    """
+
+    def __init__(self, by_label):
+        """ Initializes the model.
+        """
+        SetListModel.__init__(self)
+
+        key = None
+        if by_label:
+            key = self._label_for
+        self.values = SortedIndex(key=key)
+
+    def set_all(self, values):
+        self.values.reset(values)
+
+    def contains(self, value):
+        return (value in self.values)
+
+    def row_of(self, value):
+        return self.values.index(value)
+
+    def set_values(self, values):
+        """ Updates the model for a new list of values, and returns the values
+            added and removed as a tuple of the form: ( added, removed ).
+        """
+        added, removed = self.diff(values)
+        self.update(added, removed)
+        return (added, removed)
+
+    def update(self, added, removed):
+        """ Adds and removes values, reporting the rows inserted and removed
+            to the views (or resetting the views if there are many of them).
+        """
+        sorted_values = self.values
+        if len(added) + len(removed) > ResetThreshold:
+            self.beginResetModel()
+            sorted_values.update(added, removed)
+            self.endResetModel()
+            return
+
+        parent = QtCore.QModelIndex()
+        for value in removed:
+            row = sorted_values.index(value)
+            if row >= 0:
+                self.beginRemoveRows(parent, row, row)
+                sorted_values.remove(value)
+                self.endRemoveRows()
+
+        for value in added:
+            if value not in sorted_values:
+                row = sorted_values.insertion_row(value)
+                self.beginInsertRows(parent, row, row)
+                sorted_values.add(value)
+                self.endInsertRows()
+
+    def _label_for(self, value):
+        """ Returns the label of a value (used as the sort key).
+        """
+        return self.labels[value]
+
+#-------------------------------------------------------------------------------
+#  'OrderedSetListModel' class:
+#-------------------------------------------------------------------------------
+
+class OrderedSetListModel(SetListModel):
+    """ A set list model which shows its values in the order of the editor's
+        value.
+    """
+
+    def __init__(self):
+        """ Initializes the model.
+        """
+        SetListModel.__init__(self)
+
+        # The mapping from values to rows (built lazily):
+        self._rows = None
+
+    def set_all(self, values):
+        self.values = list(values)
+        self._rows = None
+
+    def contains(self, value):
+        return (self.row_of(value) >= 0)
+
+    def row_of(self, value):
+        if self._rows is None:
+            values = self.values
+            self._rows = dict(zip(values, xrange(len(values))))
+        return self._rows.get(value, -1)
+
+    def set_values(self, values):
+        """ Updates the model for a new list of values, reporting the range of
+            rows which changed to the views, and returns the values added and
+            removed as a tuple of the form: ( added, removed ).
+        """
+        old = self.values
+        if values == old:
+            return ([], [])
+
+        added, removed = self.diff(values)
+        prefix, suffix = common_affixes(old, values)
+        n_removed = len(old) - prefix - suffix
+        n_added = len(values) - prefix - suffix
+        if n_removed == n_added:
+            self.set_all(values)
+            signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+            self.emit(signal, self.index(prefix),
+                      self.index(prefix + n_removed - 1))
+            return (added, removed)
+
+        parent = QtCore.QModelIndex()
+        if n_removed > 0:
+            self.beginRemoveRows(parent, prefix, prefix + n_removed - 1)
+            self.set_all(old[:prefix] + old[prefix + n_removed:])
+            self.endRemoveRows()
+
+        if n_added > 0:
+            self.beginInsertRows(parent, prefix, prefix + n_added - 1)
+            self.set_all(values)
+            self.endInsertRows()
+        else:
+            self.set_all(values)
+
+        return (added, removed)
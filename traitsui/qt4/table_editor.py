@@ -27,7 +27,8 @@ from traitsui.api import EnumEditor, InstanceEditor, Group, \
     Handler, Item, Label, TableColumn, TableFilter, UI, View, default_handler, \
     spring
 from traitsui.editors.table_editor import BaseTableEditor, \
-    ReversedList, ToolkitEditorFactory, customize_filter
+    ReversedList, TableFilterIndex, ToolkitEditorFactory, customize_filter, \
+    list_event_range
 from traitsui.ui_traits import SequenceTypes
 
 from editor import Editor
@@ -218,11 +219,12 @@ class TableEditor(Editor, BaseTableEditor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', dispatch='ui')
+            self._on_items_changed, self.extended_name + '_items',
+            dispatch='ui')
 
         # Listen for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + '.-', dispatch='ui')
+            self._on_item_changed, self.extended_name + '.-', dispatch='ui')
 
         # Listen for changes on column definitions
         self.on_trait_change(self._update_columns, 'columns', dispatch='ui')
@@ -237,7 +239,8 @@ class TableEditor(Editor, BaseTableEditor):
         self.sync_value(factory.selected, 'selected', is_list=is_list)
         self.sync_value(factory.selected_indices, 'selected_indices', is_list=is_list)
         self.sync_value(factory.filter_name, 'filter', 'from')
-        self.sync_value(factory.filtered_indices, 'filtered_indices', 'to')
+        self.sync_value(factory.filtered_indices, 'filtered_indices', 'to',
+                        is_list=True)
 
 
         # Initialize the ItemDelegates for each column
@@ -262,11 +265,12 @@ class TableEditor(Editor, BaseTableEditor):
 
         # Remove listener for 'items' changes on object trait
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self._on_items_changed, self.extended_name + '_items',
+            remove=True)
 
         # Remove listener for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + '.-', remove=True)
+            self._on_item_changed, self.extended_name + '.-', remove=True)
 
         # Remove listeners for column definition changes
         self.on_trait_change(self._update_columns, 'columns', remove=True)
@@ -287,8 +291,7 @@ class TableEditor(Editor, BaseTableEditor):
 
         self.table_view.setUpdatesEnabled(False)
         try:
-            filtering = len(self.factory.filters) > 0
-            if filtering:
+            if self._is_filtering():
                 self._update_filtering()
 
             # invalidate the model, but do not reset it. Resetting the model
@@ -460,23 +463,51 @@ class TableEditor(Editor, BaseTableEditor):
         else:
             self.setx(filter = filter)
 
+    def _rows_for(self, object):
+        """Returns the rows containing the specified table item."""
+
+        value = self.value
+        if not isinstance(value, SequenceTypes):
+            return []
+
+        rows = []
+        start = 0
+        while True:
+            try:
+                start = value.index(object, start)
+            except ValueError:
+                break
+
+            rows.append(start)
+            start += 1
+
+        if self.factory.reverse:
+            rows = [ len(value) - row - 1 for row in rows ]
+
+        return rows
+
+    def _is_filtering(self):
+        """Returns whether the filter results need to be maintained."""
+
+        return (len(self.factory.filters) > 0 or
+                self._filtered_cache is not None)
+
     def _update_filtering(self):
         """Update the filter summary and the filtered indices."""
 
         items = self.items()
-        num_items = len(items)
+        index = self._filter_index
+        if index is None:
+            self._filter_index = index = TableFilterIndex()
 
-        f = self.filter
-        if f is None:
-            self._filtered_cache = None
-            self.filtered_indices = range(num_items)
-            self.filter_summary = 'All %i items' % num_items
-        else:
-            if not callable(f):
-                f = f.filter
-            self._filtered_cache = fc = [ f(item) for item in items ]
-            self.filtered_indices = fi = [ i for i, ok in enumerate(fc) if ok ]
-            self.filter_summary = '%i of %i items' % (len(fi), num_items)
+        index.reset(self.filter, items)
+        self._filtered_cache = index.cache
+        self.filtered_indices = index.indices
+        self.filter_summary = index.summary(items)
+
+        # Patch the trait list from now on so that only the changed indices
+        # are propagated to any synchronized trait:
+        index.indices = self.filtered_indices
 
     #-- Trait Property getters/setters -----------------------------------------
 
@@ -554,6 +585,58 @@ class TableEditor(Editor, BaseTableEditor):
 
     #-- Event Handlers ---------------------------------------------------------
 
+    def _on_items_changed(self, event):
+        """Handle items being added to or removed from the list of table
+        items, re-filtering and updating only the affected rows."""
+
+        items = self.items()
+        row, n_removed, n_added = list_event_range(items, event)
+
+        # The filter results and sort keys must be kept up to date even for
+        # changes made by the editor itself, since the models will query them:
+        if self._is_filtering() and (self._filter_index is not None):
+            index = self._filter_index
+            index.update_items(items, row, n_removed, n_added)
+            self.filter_summary = index.summary(items)
+
+        self.model.update_sort_keys(row, n_removed, n_added)
+
+        if self._no_notify:
+            return
+
+        self.table_view.setUpdatesEnabled(False)
+        try:
+            self.source_model.rows_replaced(row, n_removed, n_added)
+
+            if self.factory.auto_size:
+                self.table_view.resizeColumnsToContents()
+
+        finally:
+            self.table_view.setUpdatesEnabled(True)
+
+    def _on_item_changed(self, object, name, old, new):
+        """Handle a trait of one of the table items being changed,
+        re-filtering and re-sorting only that item."""
+
+        index = self._filter_index
+        filtering = (self._filtered_cache is not None) and (index is not None)
+        if not (filtering or self.model.is_sorted()):
+            self.refresh_editor()
+            return
+
+        items = self.items()
+        for row in self._rows_for(object):
+            changed = filtering and index.update_item(items, row)
+            if changed:
+                self.filter_summary = index.summary(items)
+
+            # Notifying the proxy model of the change makes it move just this
+            # row to its new sorted position:
+            if self.model.update_sort_key(row) or changed:
+                self.source_model.rows_changed(row, row)
+
+        self.refresh_editor()
+
     def _on_row_selection(self, added, removed):
         """Handle the row selection being changed."""
 
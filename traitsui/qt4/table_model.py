@@ -18,6 +18,7 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.editors.table_editor import TableSortKeys
 from traitsui.ui_traits import SequenceTypes
 
 #-------------------------------------------------------------------------------
@@ -237,6 +238,31 @@ class TableModel(QtCore.QAbstractTableModel):
     #  TableModel interface:
     #---------------------------------------------------------------------------
 
+    def rows_changed(self, first, last):
+        """Notifies any views that the rows from 'first' to 'last' (inclusive)
+        have changed."""
+
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        self.emit(signal, self.index(first, 0),
+                  self.index(last, self.columnCount(None) - 1))
+
+    def rows_replaced(self, row, removed, added):
+        """Notifies any views that 'removed' rows starting at 'row' have been
+        replaced by 'added' rows in the underlying list, so that only the
+        affected rows are updated."""
+
+        changed = min(removed, added)
+        if changed > 0:
+            self.rows_changed(row, row + changed - 1)
+
+        parent = QtCore.QModelIndex()
+        if added > removed:
+            self.beginInsertRows(parent, row + changed, row + added - 1)
+            self.endInsertRows()
+        elif removed > added:
+            self.beginRemoveRows(parent, row + changed, row + removed - 1)
+            self.endRemoveRows()
+
     def moveRow(self, old_row, new_row):
         """Convenience method to move a single row."""
 
@@ -287,6 +313,9 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
 
         self._editor = editor
 
+        # The cached sort keys of the items for the current sort column:
+        self._sort_keys = None
+
     #---------------------------------------------------------------------------
     #  QSortFilterProxyModel interface:
     #---------------------------------------------------------------------------
@@ -305,20 +334,56 @@ class SortFilterTableModel(QtGui.QSortFilterProxyModel):
         return True
 
     def lessThan(self, left_mi, right_mi):
-        """Reimplemented to sort according to the 'cmp' method defined for
-        TableColumn."""
+        """Reimplemented to sort according to the 'key' method defined for
+        TableColumn, using sort keys which are computed once per sort."""
 
-        editor = self._editor
-        column = editor.columns[left_mi.column()]
-        items = editor.items()
-        left, right = items[left_mi.row()], items[right_mi.row()]
+        sort_keys = self._sort_keys
+        column = self._editor.columns[left_mi.column()]
+        if (sort_keys is None) or (sort_keys.column is not column):
+            self._sort_keys = sort_keys = TableSortKeys(column,
+                                                        self._editor.items())
+
+        keys = sort_keys.keys
+        return keys[left_mi.row()] < keys[right_mi.row()]
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Reimplemented to recompute the sort keys for each sort."""
 
-        return column.cmp(left, right) < 0
+        self._sort_keys = None
+        QtGui.QSortFilterProxyModel.sort(self, column, order)
+
+    def invalidate(self):
+        """Reimplemented to discard the cached sort keys."""
+
+        self._sort_keys = None
+        QtGui.QSortFilterProxyModel.invalidate(self)
 
     #---------------------------------------------------------------------------
     #  SortFilterTableModel interface:
     #---------------------------------------------------------------------------
 
+    def is_sorted(self):
+        """Returns whether the model is sorted using cached sort keys."""
+
+        return self._sort_keys is not None
+
+    def update_sort_keys(self, row, removed, added):
+        """Updates the cached sort keys after 'removed' items starting at
+        'row' have been replaced by 'added' items."""
+
+        if self._sort_keys is not None:
+            self._sort_keys.update_items(self._editor.items(), row, removed,
+                                         added)
+
+    def update_sort_key(self, row):
+        """Updates the cached sort key of the item at 'row' after it has been
+        modified. Returns whether the item needs to be re-sorted."""
+
+        if self._sort_keys is None:
+            return False
+
+        return self._sort_keys.update_item(self._editor.items(), row)
+
     def moveRow(self, old_row, new_row):
         """Convenience method to move a single row."""
 
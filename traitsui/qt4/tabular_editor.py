@@ -161,16 +161,16 @@ class TabularEditor(Editor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements:
         try:
-            self.context_object.on_trait_change(
-                self.update_editor, self.extended_name+'_items', dispatch='ui')
+            self.context_object.on_trait_change(self.update_editor_item,
+                self.extended_name + '_items', dispatch='ui')
         except:
             pass
 
         # If the user has requested automatic update, attempt to set up the
         # appropriate listeners:
         if factory.auto_update:
-            self.context_object.on_trait_change(
-                self.refresh_editor, self.extended_name + '.-', dispatch='ui')
+            self.context_object.on_trait_change(self.refresh_editor_item,
+                self.extended_name + '.-', dispatch='ui')
 
         # Create the mapping from user supplied images to QImages:
         for image_resource in factory.images:
@@ -188,12 +188,12 @@ class TabularEditor(Editor):
     def dispose (self):
         """ Disposes of the contents of an editor.
         """
-        self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+        self.context_object.on_trait_change(self.update_editor_item,
+            self.extended_name + '_items', remove=True)
 
         if self.factory.auto_update:
-            self.context_object.on_trait_change(
-                self.refresh_editor, self.extended_name + '.-', remove=True)
+            self.context_object.on_trait_change(self.refresh_editor_item,
+                self.extended_name + '.-', remove=True)
 
         self.on_trait_change(self.refresh_editor, 'adapter.+update',
                              remove=True)
@@ -209,6 +209,14 @@ class TabularEditor(Editor):
         if not self._no_update:
             self.model.reset()
 
+    def update_editor_item(self, event):
+        """ Updates the editor when some of the items in the object trait
+            change externally to the editor. Only the affected rows are
+            updated, so the view keeps its selection and scroll position.
+        """
+        if not (self._no_update or self.model.items_changed(event)):
+            self.model.reset()
+
     #---------------------------------------------------------------------------
     #  TabularEditor interface:
     #---------------------------------------------------------------------------
@@ -218,6 +226,29 @@ class TabularEditor(Editor):
         """
         self.control.viewport().update()
 
+    def refresh_editor_item(self, object, name, old, new):
+        """ Requests the table view to redraw the visible rows showing an
+            item whose traits have changed.
+        """
+        # Changes to the list itself are handled by 'update_editor' and
+        # 'update_editor_item':
+        control = self.control
+        if (object is self.object) or (control is None):
+            return
+
+        first = control.rowAt(0)
+        if first < 0:
+            return
+
+        last = control.rowAt(control.viewport().height() - 1)
+        if last < 0:
+            last = self.model.rowCount(None) - 1
+
+        adapter, list_object, list_name = self.adapter, self.object, self.name
+        for row in xrange(first, last + 1):
+            if adapter.get_item(list_object, list_name, row) is object:
+                self.model.rows_changed(row, row)
+
     def callx(self, func, *args, **kw):
         """ Call a function without allowing the editor to update.
         """
@@ -55,6 +55,9 @@ class TabularModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # The number of rows reported to the views (None if not yet counted):
+        self._rows = None
+
     #---------------------------------------------------------------------------
     #  QAbstractItemModel interface:
     #---------------------------------------------------------------------------
@@ -155,8 +158,10 @@ class TabularModel(QtCore.QAbstractTableModel):
     def rowCount(self, mi):
         """ Reimplemented to return the number of rows.
         """
-        editor = self._editor
-        return editor.adapter.len(editor.object, editor.name)
+        if self._rows is None:
+            editor = self._editor
+            self._rows = editor.adapter.len(editor.object, editor.name)
+        return self._rows
 
     def columnCount(self, mi):
         """ Reimplemented to return the number of columns.
@@ -175,6 +180,7 @@ class TabularModel(QtCore.QAbstractTableModel):
             obj = adapter.get_default_value(editor.object, editor.name)
         self.beginInsertRows(parent, row, row)
         editor.callx(editor.adapter.insert, editor.object, editor.name, row, obj)
+        self._rows = None
         self.endInsertRows()
         return True
 
@@ -188,6 +194,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         for i in xrange(count):
             value = adapter.get_default_value(editor.object, editor.name)
             editor.callx(adapter.insert, editor.object, editor.name, row, value)
+        self._rows = None
         self.endInsertRows()
         return True
 
@@ -200,6 +207,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         self.beginRemoveRows(parent, row, row + count - 1)
         for i in xrange(count):
             editor.callx(adapter.delete, editor.object, editor.name, row)
+        self._rows = None
         self.endRemoveRows()
         n = self.rowCount(None)
         if not editor.factory.multi_select:
@@ -246,10 +254,56 @@ class TabularModel(QtCore.QAbstractTableModel):
         """
         return QtCore.Qt.MoveAction
 
+    def reset(self):
+        """ Reimplemented to recount the rows.
+        """
+        self._rows = None
+        QtCore.QAbstractTableModel.reset(self)
+
     #---------------------------------------------------------------------------
     #  TabularModel interface:
     #---------------------------------------------------------------------------
 
+    def items_changed(self, event):
+        """ Notifies the views of the rows affected by a change to the items
+            of the edited list, described by the TraitListEvent **event**.
+            Returns False if the change does not map to a range of rows (in
+            which case the model should be reset).
+        """
+        rows = self._rows
+        if rows is None:
+            # The views have not asked for any rows yet:
+            return True
+
+        index = event.index
+        removed, added = len(event.removed), len(event.added)
+        if ((not isinstance(index, (int, long))) or (index < 0) or
+            ((index + removed) > rows)):
+            return False
+
+        parent = QtCore.QModelIndex()
+        if added > removed:
+            self.beginInsertRows(parent, index + removed, index + added - 1)
+            self._rows = rows + added - removed
+            self.endInsertRows()
+        elif removed > added:
+            self.beginRemoveRows(parent, index + added, index + removed - 1)
+            self._rows = rows + added - removed
+            self.endRemoveRows()
+
+        changed = min(removed, added)
+        if changed > 0:
+            self.rows_changed(index, index + changed - 1)
+        return True
+
+    def rows_changed(self, first, last):
+        """ Notifies the views that the contents of rows **first** through
+            **last** have changed.
+        """
+        signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+        self.emit(signal, self.index(first, 0),
+                  self.index(last, self.columnCount(None) - 1))
+
     def moveRow(self, old_row, new_row):
         """ Convenience method to move a single row.
         """
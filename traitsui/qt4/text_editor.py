@@ -44,6 +44,10 @@ class SimpleEditor ( Editor ):
     """ Simple style text editor, which displays a text field.
     """
 
+    # Can be rebound to another object (the listener on its 'evaluate_name'
+    # trait is set up by 'sync_value'):
+    rebindable = True
+
     # Flag for window styles:
     base_style = QtGui.QLineEdit
 
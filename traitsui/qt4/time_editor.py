@@ -37,6 +37,8 @@ class SimpleEditor(Editor):
     """ Simple Traits UI time editor that wraps QTimeEdit.
     """
 
+    rebindable = True
+
     #---------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
     #  widget:
@@ -151,10 +151,10 @@ class SimpleEditor ( Editor ):
                     self._editor = editor.control
 
                 # Finally, create only the tree control:
-                self.control = self._tree = _TreeWidget(self)
+                self.control = self._tree = self._create_tree()
             else:
                 # If editable, create a tree control and an editor panel:
-                self._tree = _TreeWidget(self)
+                self._tree = self._create_tree()
 
                 self._editor = sa = QtGui.QScrollArea()
                 sa.setFrameShape(QtGui.QFrame.NoFrame)
@@ -172,7 +172,7 @@ class SimpleEditor ( Editor ):
                 splitter.addWidget(sa)
         else:
             # Otherwise, just create the tree control:
-            self.control = self._tree = _TreeWidget(self)
+            self.control = self._tree = self._create_tree()
 
         # Set up the mapping between objects and tree id's:
         self._map = {}
@@ -201,13 +201,13 @@ class SimpleEditor ( Editor ):
                 item_selection = QtGui.QItemSelection()
                 for sel in selection:
                     item = self._object_info(sel)[2]
-                    idx = tree.indexFromItem(item)
+                    idx = self._model_index(item)
                     item_selection.append(QtGui.QItemSelectionRange(idx))
                 
                 tree.selectionModel().select(item_selection,
                     QtGui.QItemSelectionModel.ClearAndSelect)
             else:
-                tree.setCurrentItem(self._object_info(selection)[2])
+                self._set_current(self._object_info(selection)[2])
         except:
             pass
 
@@ -241,7 +241,7 @@ class SimpleEditor ( Editor ):
             # Stop the chatter (specifically about the changing selection).
             self._tree.blockSignals(True)
 
-            self._delete_node(self._tree.invisibleRootItem())
+            self._delete_node(self._root_nid())
 
             self._tree = None
 
@@ -259,7 +259,7 @@ class SimpleEditor ( Editor ):
             if self._has_children( node, object ):
                 self._expand_node( nid )
                 if expand:
-                    nid.setExpanded(True)
+                    self._set_expanded( nid, True )
                 for cnid in self._nodes_for( nid ):
                     self.expand_levels( cnid, levels - 1 )
 
@@ -284,7 +284,7 @@ class SimpleEditor ( Editor ):
         object, node = self._node_for( self.value )
         if node is not None:
             if self.factory.hide_root:
-                nid = tree.invisibleRootItem()
+                nid = self._root_nid()
             else:
                 nid = self._create_item(tree, node, object)
 
@@ -294,8 +294,8 @@ class SimpleEditor ( Editor ):
             if self.factory.hide_root or self._has_children( node, object ):
                 self._expand_node( nid )
                 if not self.factory.hide_root:
-                    nid.setExpanded(True)
-                    tree.setCurrentItem(nid)
+                    self._set_expanded( nid, True )
+                    self._set_current( nid )
 
             self.expand_levels( nid, self.factory.auto_open, False )
         # FIXME: Clear the current editor (if any)...
@@ -396,7 +396,7 @@ class SimpleEditor ( Editor ):
         # Automatically expand the new node (if requested):
         if has_children:
             if node.can_auto_open( object ):
-                cnid.setExpanded(True)
+                self._set_expanded( cnid, True )
             else:
                 # Qt only draws the control that expands the tree if there is a
                 # child.  As the tree is being populated lazily we create a
@@ -417,7 +417,7 @@ class SimpleEditor ( Editor ):
         for cnid in self._nodes_for( nid ):
             self._delete_node( cnid )
 
-        if nid is self._tree.invisibleRootItem():
+        if nid is self._root_nid():
             return
 
         # See if it is a dummy.
@@ -488,7 +488,7 @@ class SimpleEditor ( Editor ):
     #---------------------------------------------------------------------------
 
     def _node_index ( self, nid ):
-        pnid = nid.parent()
+        pnid = self._parent_nid( nid )
         if pnid is None:
             return ( None, None, None )
 
@@ -615,8 +615,7 @@ class SimpleEditor ( Editor ):
 
         # Select all nodes which understand this object:
         factory = self.factory
-        nodes   = [ node for node in factory.nodes
-                    if node.is_node_for( object ) ]
+        nodes   = factory.nodes_for( object )
 
         # If only one found, we're done, return it:
         if len( nodes ) == 1:
@@ -667,10 +666,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class ( self, klass ):
         """ Returns the TreeNode associated with a specified class.
         """
-        for node in self.factory.nodes:
-            if issubclass( klass, tuple( node.node_for ) ):
-                return node
-        return None
+        return self.factory.node_for_class( klass )
 
     #---------------------------------------------------------------------------
     #  Returns the node and class associated with a specified class name:
@@ -679,11 +675,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class_name ( self, class_name ):
         """ Returns the node and class associated with a specified class name.
         """
-        for node in self.factory.nodes:
-            for klass in node.node_for:
-                if class_name == klass.__name__:
-                    return ( node, klass )
-        return ( None, None )
+        return self.factory.node_for_class_name( class_name )
 
     #---------------------------------------------------------------------------
     #  Updates the icon for a specified node:
@@ -812,6 +804,60 @@ class SimpleEditor ( Editor ):
         """ Sets the node specific data. """
         nid._py_data = data
 
+    #---------------------------------------------------------------------------
+    #  Tree control specific methods (overridden by editors using a different
+    #  kind of tree control, where a node id is whatever identifies a node):
+    #---------------------------------------------------------------------------
+
+    def _create_tree(self):
+        """ Returns the tree control. """
+        return _TreeWidget(self)
+
+    def _root_nid(self):
+        """ Returns the (hidden) root node id of the tree. """
+        return self._tree.invisibleRootItem()
+
+    def _parent_nid(self, nid):
+        """ Returns the parent of a node id (None for top level nodes). """
+        return nid.parent()
+
+    def _set_expanded(self, nid, expanded):
+        """ Expands or collapses a node. """
+        nid.setExpanded(expanded)
+
+    def _set_current(self, nid):
+        """ Makes a node the current node. """
+        self._tree.setCurrentItem(nid)
+
+    def _current_nid(self):
+        """ Returns the current node id (or None). """
+        return self._tree.currentItem()
+
+    def _selected_nids(self):
+        """ Returns the list of selected node ids. """
+        return self._tree.selectedItems()
+
+    def _nid_at(self, pos):
+        """ Returns the node id at a position in the tree (or None). """
+        return self._tree.itemAt(pos)
+
+    def _model_index(self, nid):
+        """ Returns the QModelIndex of a node id. """
+        return self._tree.indexFromItem(nid)
+
+    def _set_renameable(self, nid, can_rename):
+        """ Sets whether the label of a node can be edited. """
+        flags = nid.flags()
+        if can_rename:
+            flags |= QtCore.Qt.ItemIsEditable
+        else:
+            flags &= ~QtCore.Qt.ItemIsEditable
+        nid.setFlags(flags)
+
+    def _edit_label(self, nid):
+        """ Starts editing the label of a node. """
+        self._tree.editItem(nid)
+
 #----- User callable methods: --------------------------------------------------
 
     #---------------------------------------------------------------------------
@@ -834,8 +880,8 @@ class SimpleEditor ( Editor ):
         """
         nid = self._get_object_nid( object, name )
         if nid is not None:
-            pnid = nid.parent()
-            if pnid is not self._tree.invisibleRootItem():
+            pnid = self._parent_nid( nid )
+            if pnid is not None:
                 return self.get_object( pnid )
         return None
 
@@ -865,12 +911,12 @@ class SimpleEditor ( Editor ):
         # If 'auto_close' requested for this node type, close all of the node's
         # siblings:
         if node.can_auto_close(object):
-            parent = nid.parent()
+            parent = self._parent_nid(nid)
 
             if parent is not None:
                 for snid in self._nodes_for(parent):
                     if snid is not nid:
-                        snid.setExpanded(False)
+                        self._set_expanded(snid, False)
 
         # Expand the node (i.e. populate its children if they are not there
         # yet):
@@ -929,7 +975,7 @@ class SimpleEditor ( Editor ):
         """ Handles a tree node being selected.
         """
         # Get the new selection:
-        nids = self._tree.selectedItems()
+        nids = self._selected_nids()
 
         selected = []
         if len(nids) > 0:
@@ -1011,7 +1057,7 @@ class SimpleEditor ( Editor ):
     def _on_context_menu(self, pos):
         """ Handles the user requesting a context menuright clicking on a tree node.
         """
-        nid = self._tree.itemAt(pos)
+        nid = self._nid_at(pos)
 
         if nid is None:
             return
@@ -1026,8 +1072,8 @@ class SimpleEditor ( Editor ):
                          'handler': self.ui.handler}
 
         # Try to get the parent node of the node clicked on:
-        pnid = nid.parent()
-        if pnid is None or pnid is self._tree.invisibleRootItem():
+        pnid = self._parent_nid(nid)
+        if pnid is None:
             parent_node = parent_object = None
         else:
             _, parent_node, parent_object = self._get_node_data(pnid)
@@ -1151,13 +1197,7 @@ class SimpleEditor ( Editor ):
         can_rename = (can_rename and self._menu_node.can_rename_me( object ))
 
         # Set the widget item's editable flag appropriately.
-        nid = self._get_object_nid(object)
-        flags = nid.flags()
-        if can_rename:
-            flags |= QtCore.Qt.ItemIsEditable
-        else:
-            flags &= ~QtCore.Qt.ItemIsEditable
-        nid.setFlags(flags)
+        self._set_renameable(self._get_object_nid(object), can_rename)
 
         return can_rename
 
@@ -1349,7 +1389,7 @@ class SimpleEditor ( Editor ):
         """
         _, _, nid = self._data
         self._data = None
-        self._tree.editItem(nid)
+        self._edit_label(nid)
 
     def _on_nid_changed(self, nid, col):
         """ Handle changes to a widget item.
@@ -1357,11 +1397,16 @@ class SimpleEditor ( Editor ):
         # The node data may not have been set up for the nid yet.  Ignore it if
         # it hasn't.
         try:
-            _, node, object = self._get_node_data(nid)
+            self._get_node_data(nid)
         except:
             return
 
-        new_label = unicode(nid.text(col))
+        self._label_edited(nid, unicode(nid.text(col)), col)
+
+    def _label_edited(self, nid, new_label, col=0):
+        """ Handles the label of a node being edited by the user.
+        """
+        _, node, object = self._get_node_data(nid)
         old_label = node.get_label(object)
 
         if new_label != old_label:
@@ -1387,7 +1432,7 @@ class SimpleEditor ( Editor ):
 
             # Automatically select the new object if editing is being performed:
             if self.factory.editable:
-                self._tree.setCurrentItem(nid.child(nid.childCount() - 1))
+                self._set_current(self._nodes_for(nid)[-1])
 
 #----- Model event handlers: ---------------------------------------------------
 
@@ -1416,7 +1461,7 @@ class SimpleEditor ( Editor ):
 
             # Try to expand the node (if requested):
             if node.can_auto_open( object ):
-                nid.setExpanded(True)
+                self._set_expanded( nid, True )
 
     #---------------------------------------------------------------------------
     #  Handles the children of a node being changed:
@@ -1458,7 +1503,7 @@ class SimpleEditor ( Editor ):
 
             # Try to expand the node (if requested):
             if node.can_auto_open( object ):
-                nid.setExpanded(True)
+                self._set_expanded( nid, True )
 
     #---------------------------------------------------------------------------
     #   Handles the label of an object being changed:
@@ -1514,63 +1559,33 @@ class SimpleEditor ( Editor ):
 #-- End UI preference save/restore interface -----------------------------------
 
 #-------------------------------------------------------------------------------
-#  '_TreeWidget' class:
+#  '_TreeDragDrop' class:
 #-------------------------------------------------------------------------------
 
-class _TreeWidget(QtGui.QTreeWidget):
-    """ The _TreeWidget class is a specialised QTreeWidget that reimplements
-        the drag'n'drop support so that it hooks into the provided Traits
-        support.
+class _TreeDragDrop(object):
+    """ The _TreeDragDrop class reimplements the drag'n'drop support of a tree
+        control so that it hooks into the provided Traits support. The tree
+        control must have '_editor' and '_dragging' attributes.
     """
-    def __init__(self, editor, parent=None):
-        """ Initialise the tree widget.
-        """
-        QtGui.QTreeWidget.__init__(self, parent)
-
-        self.header().hide()
-        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-
-        if editor.factory.selection_mode == 'extended':
-            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
-
-        self.itemExpanded.connect(editor._on_item_expanded)
-        self.itemCollapsed.connect(editor._on_item_collapsed)
-        self.itemClicked.connect(editor._on_item_clicked)
-        self.itemDoubleClicked.connect(editor._on_item_dclicked)
-        self.itemSelectionChanged.connect(editor._on_tree_sel_changed)
-        self.customContextMenuRequested.connect(editor._on_context_menu)
-        self.itemChanged.connect(editor._on_nid_changed)
-
-        self._editor = editor
-        self._dragging = None
-
-    def resizeEvent(self, event):
-        """ Overridden to emit sizeHintChanged() of items for word wrapping """
-        if self._editor.factory.word_wrap:
-            for i in range(self.topLevelItemCount()):
-                mi = self.indexFromItem(self.topLevelItem(i))
-                id = self.itemDelegate(mi)
-                id.sizeHintChanged.emit(mi)
-        super(self.__class__, self).resizeEvent(event)
 
     def startDrag(self, actions):
         """ Reimplemented to start the drag of a tree widget item.
         """
-        nid = self.currentItem()
+        editor = self._editor
+        nid = editor._current_nid()
         if nid is None:
             return
 
         self._dragging = nid
 
-        _, node, object = self._editor._get_node_data(nid)
+        _, node, object = editor._get_node_data(nid)
 
         # Convert the item being dragged to MIME data.
         md = PyMimeData(node.get_drag_object(object))
 
         # Render the item being dragged as a pixmap.
-        nid_rect = self.visualItemRect(nid)
+        index = editor._model_index(nid)
+        nid_rect = self.visualRect(index)
         rect = nid_rect.intersected(self.viewport().rect())
 
         pm = QtGui.QPixmap(rect.size())
@@ -1582,7 +1597,7 @@ class _TreeWidget(QtGui.QTreeWidget):
         option.state |= QtGui.QStyle.State_Selected
         option.rect = QtCore.QRect(nid_rect.topLeft() - rect.topLeft(), nid_rect.size())
 
-        self.itemDelegate().paint(painter, option, self.indexFromItem(nid))
+        self.itemDelegate().paint(painter, option, index)
 
         painter.end()
 
@@ -1622,7 +1637,7 @@ class _TreeWidget(QtGui.QTreeWidget):
         e.ignore()
 
         # Get the tree widget item under the cursor.
-        nid = self.itemAt(e.pos())
+        nid = self._editor._nid_at(e.pos())
         if nid is None:
             return
 
@@ -1633,7 +1648,7 @@ class _TreeWidget(QtGui.QTreeWidget):
                 if pnid is self._dragging:
                     return
 
-                pnid = pnid.parent()
+                pnid = self._editor._parent_nid(pnid)
 
         # A copy action is interpreted as moving the source to a particular
         # place within the target's parent.  A move action is interpreted as
@@ -1663,7 +1678,7 @@ class _TreeWidget(QtGui.QTreeWidget):
         self._dragging = None
 
         # Get the tree widget item under the cursor.
-        nid = self.itemAt(e.pos())
+        nid = self._editor._nid_at(e.pos())
         if nid is None:
             return
 
@@ -1717,3 +1732,45 @@ class _TreeWidget(QtGui.QTreeWidget):
                                                data, False )
 
         e.acceptProposedAction()
+
+#-------------------------------------------------------------------------------
+#  '_TreeWidget' class:
+#-------------------------------------------------------------------------------
+
+class _TreeWidget(_TreeDragDrop, QtGui.QTreeWidget):
+    """ The _TreeWidget class is a specialised QTreeWidget that reimplements
+        the drag'n'drop support so that it hooks into the provided Traits
+        support.
+    """
+    def __init__(self, editor, parent=None):
+        """ Initialise the tree widget.
+        """
+        QtGui.QTreeWidget.__init__(self, parent)
+
+        self.header().hide()
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+
+        if editor.factory.selection_mode == 'extended':
+            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
+        self.itemExpanded.connect(editor._on_item_expanded)
+        self.itemCollapsed.connect(editor._on_item_collapsed)
+        self.itemClicked.connect(editor._on_item_clicked)
+        self.itemDoubleClicked.connect(editor._on_item_dclicked)
+        self.itemSelectionChanged.connect(editor._on_tree_sel_changed)
+        self.customContextMenuRequested.connect(editor._on_context_menu)
+        self.itemChanged.connect(editor._on_nid_changed)
+
+        self._editor = editor
+        self._dragging = None
+
+    def resizeEvent(self, event):
+        """ Overridden to emit sizeHintChanged() of items for word wrapping """
+        if self._editor.factory.word_wrap:
+            for i in range(self.topLevelItemCount()):
+                mi = self.indexFromItem(self.topLevelItem(i))
+                id = self.itemDelegate(mi)
+                id.sizeHintChanged.emit(mi)
+        super(self.__class__, self).resizeEvent(event)
@@ -0,0 +1,582 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2011, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD license.
+# However, when used with the GPL version of PyQt the additional terms described in the PyQt GPL exception also apply
+
+#------------------------------------------------------------------------------
+
+""" Defines a tree editor for the PyQt user interface toolkit which is based on
+    a QAbstractItemModel, for trees with very many nodes.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from pyface.qt import QtCore, QtGui
+
+from traitsui.tree_record import TreeRecord
+
+from tree_editor import SimpleEditor as TreeWidgetEditor, _TreeDragDrop
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The number of children of a node fetched at a time:
+FetchBatchSize = 1000
+
+#-------------------------------------------------------------------------------
+#  'SimpleEditor' class:
+#-------------------------------------------------------------------------------
+
+class SimpleEditor ( TreeWidgetEditor ):
+    """ Simple style of tree editor which uses a QTreeView on a model whose
+        rows are only created as they are needed.
+
+        A node id is the TreeRecord of the node. The children of a node are
+        fetched in batches of FetchBatchSize as the view needs them (i.e. as
+        the node is expanded and scrolled through), and only the fetched nodes
+        have listeners. Children which no TreeNode matches are not shown.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #---------------------------------------------------------------------------
+
+    def update_editor ( self ):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        model = self._model
+
+        model.beginResetModel()
+        self._release( model.root )
+        self._map = {}
+
+        root   = model.root = TreeRecord()
+        record = None
+        object, node = self._node_for( self.value )
+        if node is not None:
+            if self.factory.hide_root:
+                record        = root
+                record.node   = node
+                record.object = object
+                self._register( record )
+            else:
+                record = self._create_record( node, object )
+                root.insert( 0, [ record ] )
+        model.endResetModel()
+
+        if record is not None:
+            if self.factory.hide_root or self._has_children( node, object ):
+                self._expand_node( record )
+                if not self.factory.hide_root:
+                    self._set_expanded( record, True )
+                    self._set_current( record )
+
+            self.expand_levels( record, self.factory.auto_open, False )
+
+    #---------------------------------------------------------------------------
+    #  Record management:
+    #---------------------------------------------------------------------------
+
+    def _create_record ( self, node, object ):
+        """ Returns a new (unparented) record for an object.
+        """
+        record = TreeRecord( None, node, object )
+        self._register( record )
+
+        return record
+
+    def _register ( self, record ):
+        """ Adds a record to the object map, and listens to its object (if no
+            other record is for the same object).
+        """
+        node, object = record.node, record.object
+        info = self._map.setdefault( id( object ), [] )
+        info.append( ( node.get_children_id( object ), record ) )
+        if len( info ) == 1:
+            self._add_listeners( node, object )
+
+    def _release ( self, record ):
+        """ Removes a record, and the records below it, from the object map,
+            and stops listening to objects which no longer have a record.
+        """
+        editor = self._editor
+        for record in record.walk():
+            if record.node is None:
+                continue
+
+            node, object = record.node, record.object
+            id_object    = id( object )
+            object_info  = self._map.get( id_object )
+            if object_info is None:
+                continue
+
+            for i, info in enumerate( object_info ):
+                if info[1] is record:
+                    del object_info[i]
+                    break
+
+            if len( object_info ) == 0:
+                self._remove_listeners( node, object )
+                del self._map[ id_object ]
+
+            # If the node had an active editor panel showing, remove it:
+            if (editor is not None) and (record is editor._editor_nid):
+                self._clear_editor()
+
+    def _fetch_more ( self, record, count = FetchBatchSize ):
+        """ Creates the records for the next batch of a record's children.
+        """
+        # Keep fetching until a batch has children which a node matches:
+        added = []
+        while (len( added ) == 0) and record.can_fetch():
+            added = record.fetch( count, self._node_for )
+
+        if len( added ) == 0:
+            return
+
+        records = [ self._create_record( child_node, child )
+                    for child, child_node in added ]
+
+        start = len( record.children )
+        model = self._model
+        model.beginInsertRows( self._model_index( record ), start,
+                               start + len( records ) - 1 )
+        record.insert( start, records )
+        model.endInsertRows()
+
+        for child in records:
+            if (child.node.can_auto_open( child.object ) and
+                self._has_children( child.node, child.object )):
+                self._set_expanded( child, True )
+
+    def _remove_children ( self, record, start, end ):
+        """ Removes the records for the children of a record from **start** to
+            **end**.
+        """
+        if end <= start:
+            return
+
+        model = self._model
+        model.beginRemoveRows( self._model_index( record ), start, end - 1 )
+        removed = record.remove( start, end )
+        model.endRemoveRows()
+
+        for child in removed:
+            self._release( child )
+
+    #---------------------------------------------------------------------------
+    #  Overridden node methods:
+    #---------------------------------------------------------------------------
+
+    def _append_node ( self, nid, node, object ):
+        """ Appends a new node to the specified node.
+        """
+        # If not all of the children have been fetched yet, the new node is
+        # simply fetched after them:
+        if nid.pend( object ):
+            return None
+
+        record = self._create_record( node, object )
+        start  = len( nid.children )
+        model  = self._model
+        model.beginInsertRows( self._model_index( nid ), start, start )
+        nid.insert( start, [ record ] )
+        model.endInsertRows()
+
+        if node.can_auto_open( object ) and self._has_children( node, object ):
+            self._set_expanded( record, True )
+
+        return record
+
+    def _delete_node ( self, nid ):
+        """ Deletes a specified tree node and all its children.
+        """
+        if nid is self._root_nid():
+            model = self._model
+            model.beginResetModel()
+            self._release( nid )
+            nid.remove( 0, len( nid.children ) )
+            model.endResetModel()
+            return
+
+        parent = nid.parent
+        if parent is not None:
+            row = nid.row
+            self._remove_children( parent, row, row + 1 )
+
+    def _expand_node ( self, nid ):
+        """ Expands the contents of a specified node (if required).
+        """
+        if not nid.expanded:
+            nid.expand( nid.node.get_children( nid.object ) )
+            self._fetch_more( nid )
+
+    def _nodes_for ( self, nid ):
+        """ Returns all (fetched) child node ids of a specified node id.
+        """
+        return nid.children[:]
+
+    def _node_index ( self, nid ):
+        pnid = self._parent_nid( nid )
+        if pnid is None:
+            return ( None, None, None )
+
+        return ( pnid.node, pnid.object, nid.row )
+
+    def _update_icon ( self, nid ):
+        """ Updates the icon for a specified node.
+        """
+        self._model.record_changed( nid )
+
+    def _set_label ( self, nid, text, col = 0 ):
+        """ Set the label of the specified item.
+        """
+        self._model.record_changed( nid )
+
+    @staticmethod
+    def _get_node_data ( nid ):
+        """ Gets the node specific data. """
+        return ( nid.expanded, nid.node, nid.object )
+
+    @staticmethod
+    def _set_node_data ( nid, data ):
+        """ Sets the node specific data. """
+        nid.expanded, nid.node, nid.object = data
+
+    #---------------------------------------------------------------------------
+    #  Overridden tree control specific methods:
+    #---------------------------------------------------------------------------
+
+    def _create_tree ( self ):
+        """ Returns the tree control. """
+        self._model = _TreeModel( self )
+
+        return _TreeView( self )
+
+    def _root_nid ( self ):
+        """ Returns the (hidden) root node id of the tree. """
+        return self._model.root
+
+    def _parent_nid ( self, nid ):
+        """ Returns the parent of a node id (None for top level nodes). """
+        parent = nid.parent
+        if parent is self._model.root:
+            return None
+
+        return parent
+
+    def _set_expanded ( self, nid, expanded ):
+        """ Expands or collapses a node. """
+        self._tree.setExpanded( self._model_index( nid ), expanded )
+
+    def _set_current ( self, nid ):
+        """ Makes a node the current node. """
+        self._tree.setCurrentIndex( self._model_index( nid ) )
+
+    def _current_nid ( self ):
+        """ Returns the current node id (or None). """
+        return self._model.record_for( self._tree.currentIndex() )
+
+    def _selected_nids ( self ):
+        """ Returns the list of selected node ids. """
+        record_for = self._model.record_for
+        return [ record_for( index )
+                 for index in self._tree.selectionModel().selectedRows() ]
+
+    def _nid_at ( self, pos ):
+        """ Returns the node id at a position in the tree (or None). """
+        return self._model.record_for( self._tree.indexAt( pos ) )
+
+    def _model_index ( self, nid ):
+        """ Returns the QModelIndex of a node id. """
+        return self._model.index_for( nid )
+
+    def _set_renameable ( self, nid, can_rename ):
+        """ Sets whether the label of a node can be edited. """
+        nid.editable = can_rename
+
+    def _edit_label ( self, nid ):
+        """ Starts editing the label of a node. """
+        self._tree.edit( self._model_index( nid ) )
+
+    #---------------------------------------------------------------------------
+    #  Overridden model event handlers:
+    #---------------------------------------------------------------------------
+
+    def _children_replaced ( self, object, name = '', new = None ):
+        """ Handles the children of a node being completely replaced.
+        """
+        for expanded, node, nid in self._object_info_for( object, name ):
+            # Only replace the children if they have already been requested;
+            # the new children are then fetched as they are needed:
+            if expanded:
+                self._remove_children( nid, 0, len( nid.children ) )
+                nid.expand( node.get_children( object ) )
+                self._fetch_more( nid )
+
+            # Try to expand the node (if requested):
+            if node.can_auto_open( object ):
+                self._set_expanded( nid, True )
+
+    def _children_updated ( self, object, name, event ):
+        """ Handles the children of a node being changed.
+        """
+        # Log the change that was made made (removing '_items' from the end of
+        # the name):
+        name = name[:-6]
+        self.log_change( self._get_undo_item, object, name, event )
+
+        start = event.index
+        end   = start + len( event.removed )
+
+        for expanded, node, nid in self._object_info_for( object, name ):
+            if expanded:
+                if nid.can_fetch() or (not isinstance( start, int )):
+                    # Not all of the children have been fetched yet (or the
+                    # change is an extended slice), so just fetch them again:
+                    self._remove_children( nid, 0, len( nid.children ) )
+                    nid.expand( node.get_children( object ) )
+                    self._fetch_more( nid )
+                else:
+                    # Remove the rows of the removed children, and insert rows
+                    # for the added children (the rows of the children which
+                    # no node matches are skipped):
+                    row_start, row_end, added = nid.replace(
+                        start, end, event.added, self._node_for )
+                    self._remove_children( nid, row_start, row_end )
+
+                    records = [ self._create_record( child_node, child )
+                                for child, child_node in added ]
+                    if len( records ) > 0:
+                        model = self._model
+                        model.beginInsertRows( self._model_index( nid ),
+                                row_start, row_start + len( records ) - 1 )
+                        nid.insert( row_start, records )
+                        model.endInsertRows()
+
+            # Try to expand the node (if requested):
+            if node.can_auto_open( object ):
+                self._set_expanded( nid, True )
+
+#-------------------------------------------------------------------------------
+#  '_TreeModel' class:
+#-------------------------------------------------------------------------------
+
+class _TreeModel(QtCore.QAbstractItemModel):
+    """ The model of the tree of TreeRecords shown by the editor.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the object.
+        """
+        QtCore.QAbstractItemModel.__init__(self, parent)
+
+        self._editor = editor
+
+        # The (hidden) root record:
+        self.root = TreeRecord()
+
+        # The icons used, keyed by ( node, icon name ):
+        self._icons = {}
+
+    #---------------------------------------------------------------------------
+    #  Record helpers:
+    #---------------------------------------------------------------------------
+
+    def record_for(self, mi):
+        """ Returns the record for a model index (or None).
+        """
+        if mi.isValid():
+            return mi.internalPointer()
+
+        return None
+
+    def index_for(self, record):
+        """ Returns the model index of a record.
+        """
+        if (record is None) or (record is self.root):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(record.row, 0, record)
+
+    def record_changed(self, record):
+        """ Notifies the views that the label or icon of a record changed.
+        """
+        if (record is not None) and (record.parent is not None):
+            mi = self.index_for(record)
+            signal = QtCore.SIGNAL('dataChanged(QModelIndex,QModelIndex)')
+            self.emit(signal, mi, mi)
+
+    def _record(self, mi):
+        """ Returns the record for a model index (the root if invalid).
+        """
+        if mi.isValid():
+            return mi.internalPointer()
+
+        return self.root
+
+    #---------------------------------------------------------------------------
+    #  QAbstractItemModel interface:
+    #---------------------------------------------------------------------------
+
+    def index(self, row, column, parent):
+        """ Reimplemented to return the index of a child of a record.
+        """
+        children = self._record(parent).children
+        if (0 <= row < len(children)) and (column == 0):
+            return self.createIndex(row, column, children[row])
+
+        return QtCore.QModelIndex()
+
+    def parent(self, mi):
+        """ Reimplemented to return the index of the parent of a record.
+        """
+        if not mi.isValid():
+            return QtCore.QModelIndex()
+
+        return self.index_for(mi.internalPointer().parent)
+
+    def rowCount(self, parent):
+        """ Reimplemented to return the number of fetched children.
+        """
+        if parent.column() > 0:
+            return 0
+
+        return len(self._record(parent).children)
+
+    def columnCount(self, parent):
+        """ Reimplemented to return the number of columns.
+        """
+        return 1
+
+    def hasChildren(self, parent):
+        """ Reimplemented to avoid requesting the children of a node.
+        """
+        record = self._record(parent)
+        if len(record.children) > 0:
+            return True
+
+        if record.expanded:
+            return record.can_fetch()
+
+        return ((record.node is not None) and
+                self._editor._has_children(record.node, record.object))
+
+    def canFetchMore(self, parent):
+        """ Reimplemented to return whether a node has unfetched children.
+        """
+        record = self._record(parent)
+        if record.expanded:
+            return record.can_fetch()
+
+        return ((record.node is not None) and
+                self._editor._has_children(record.node, record.object))
+
+    def fetchMore(self, parent):
+        """ Reimplemented to fetch the next batch of a node's children.
+        """
+        record = self._record(parent)
+        if record.expanded:
+            self._editor._fetch_more(record)
+        else:
+            self._editor._expand_node(record)
+
+    def data(self, mi, role):
+        """ Reimplemented to return the label, icon or tooltip of a node.
+        """
+        record = self._record(mi)
+        node, object = record.node, record.object
+        if node is None:
+            return None
+
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return node.get_label(object)
+
+        if role == QtCore.Qt.DecorationRole:
+            editor = self._editor
+            if not editor.factory.show_icons:
+                return None
+
+            is_expanded = editor._tree.isExpanded(mi)
+            key = (node, node.get_icon(object, is_expanded))
+            icon = self._icons.get(key)
+            if icon is None:
+                self._icons[key] = icon = editor._get_icon(node, object,
+                                                           is_expanded)
+            return icon
+
+        if role == QtCore.Qt.ToolTipRole:
+            return node.get_tooltip(object)
+
+        return None
+
+    def setData(self, mi, value, role):
+        """ Reimplemented to rename a node.
+        """
+        if role != QtCore.Qt.EditRole:
+            return False
+
+        self._editor._label_edited(self._record(mi), unicode(value))
+        self.record_changed(self._record(mi))
+
+        return True
+
+    def flags(self, mi):
+        """ Reimplemented to set the editable status of a node.
+        """
+        if not mi.isValid():
+            return QtCore.Qt.ItemIsDropEnabled
+
+        flags = (QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled |
+                 QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled)
+        if mi.internalPointer().editable:
+            flags |= QtCore.Qt.ItemIsEditable
+
+        return flags
+
+#-------------------------------------------------------------------------------
+#  '_TreeView' class:
+#-------------------------------------------------------------------------------
+
+class _TreeView(_TreeDragDrop, QtGui.QTreeView):
+    """ The _TreeView class is a specialised QTreeView that reimplements the
+        drag'n'drop support so that it hooks into the provided Traits support.
+    """
+
+    def __init__(self, editor, parent=None):
+        """ Initialise the tree view.
+        """
+        QtGui.QTreeView.__init__(self, parent)
+
+        self.setModel(editor._model)
+        self.header().hide()
+        self.setUniformRowHeights(True)
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setEditTriggers(QtGui.QAbstractItemView.NoEditTriggers)
+
+        if editor.factory.selection_mode == 'extended':
+            self.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
+        record_for = editor._model.record_for
+        self.expanded.connect(
+            lambda mi: editor._on_item_expanded(record_for(mi)))
+        self.collapsed.connect(
+            lambda mi: editor._on_item_collapsed(record_for(mi)))
+        self.clicked.connect(
+            lambda mi: editor._on_item_clicked(record_for(mi), mi.column()))
+        self.doubleClicked.connect(
+            lambda mi: editor._on_item_dclicked(record_for(mi), mi.column()))
+        self.selectionModel().selectionChanged.connect(
+            lambda selected, deselected: editor._on_tree_sel_changed())
+        self.customContextMenuRequested.connect(editor._on_context_menu)
+
+        self._editor = editor
+        self._dragging = None
@@ -19,6 +19,8 @@
 import cgi
 import re
 
+from collections import OrderedDict
+
 from pyface.qt import QtCore, QtGui, QtWebKit
 
 from traits.api \
@@ -39,6 +41,9 @@ from traitsui.help_template \
 from traitsui.menu \
     import UndoButton, RevertButton, HelpButton
 
+from traitsui.ui_profiler \
+    import profiled
+
 from helper \
     import position_window
 
@@ -249,47 +254,28 @@ def panel(ui):
     return panel
 
 
-def _fill_panel(panel, content, ui, item_handler=None):
-    """Fill a page based container panel with content.
+def _fill_panel(panel, content, ui, item_handler=None, lazy=False,
+                max_pages=0):
+    """Fill a page based container panel with content.  If lazy is True, the
+       contents of each page are only built when the page is first shown.
     """
     active = 0
+    pages = None
+    if lazy:
+        pages = _LazyPages(panel, ui, max_pages)
 
     for index, item in enumerate(content):
         page_name = item.get_label(ui)
         if page_name == "":
            page_name = "Page %d" % index
 
-        if isinstance(item, Group):
-            if item.selected:
-                active = index
-
-            gp = _GroupPanel(item, ui, suppress_label=True)
-            page = gp.control
-            sub_page = gp.sub_control
-
-            # If the result is the same type with only one page, collapse it
-            # down into just the page.
-            if type(sub_page) is type(panel) and sub_page.count() == 1:
-                new = sub_page.widget(0)
-                if isinstance(panel, QtGui.QTabWidget):
-                    sub_page.removeTab(0)
-                else:
-                    sub_page.removeItem(0)
-            elif isinstance(page, QtGui.QWidget):
-                new = page
-            else:
-                new = QtGui.QWidget()
-                new.setLayout(page)
-
-            layout = new.layout()
-            if layout is not None:
-                layout.setAlignment(QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        if isinstance(item, Group) and item.selected:
+            active = index
 
+        if pages is None:
+            new = _create_page(panel, item, ui, item_handler)
         else:
-            new = QtGui.QWidget()
-            layout = QtGui.QVBoxLayout(new)
-            layout.setContentsMargins(0, 0, 0, 0)
-            item_handler(item, layout)
+            new = pages.add_page(panel, item, item_handler)
 
         # Add the content.
         if isinstance(panel, QtGui.QTabWidget):
@@ -299,6 +285,137 @@ def _fill_panel(panel, content, ui, item_handler=None):
 
     panel.setCurrentIndex(active)
 
+    # Make sure the initially shown page is built (the current index may not
+    # have changed):
+    if pages is not None:
+        pages.show_page(active)
+
+
+def _create_page(panel, item, ui, item_handler=None):
+    """Returns the widget for a page of a page based container panel.
+    """
+    if isinstance(item, Group):
+        gp = _GroupPanel(item, ui, suppress_label=True)
+        page = gp.control
+        sub_page = gp.sub_control
+
+        # If the result is the same type with only one page, collapse it
+        # down into just the page.
+        if type(sub_page) is type(panel) and sub_page.count() == 1:
+            new = sub_page.widget(0)
+            if isinstance(panel, QtGui.QTabWidget):
+                sub_page.removeTab(0)
+            else:
+                sub_page.removeItem(0)
+        elif isinstance(page, QtGui.QWidget):
+            new = page
+        else:
+            new = QtGui.QWidget()
+            new.setLayout(page)
+
+        layout = new.layout()
+        if layout is not None:
+            layout.setAlignment(QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+
+    else:
+        new = QtGui.QWidget()
+        layout = QtGui.QVBoxLayout(new)
+        layout.setContentsMargins(0, 0, 0, 0)
+        item_handler(item, layout)
+
+    return new
+
+
+class _LazyPages(QtCore.QObject):
+    """Builds the pages of a page based container panel when they are first
+       shown, and disposes of the editors of the least recently shown pages
+       when more than max_pages pages have been built.
+    """
+
+    def __init__(self, panel, ui, max_pages):
+        """Initialise the object.  It is owned by the panel.
+        """
+        QtCore.QObject.__init__(self, panel)
+
+        self.panel = panel
+        self.ui = ui
+        self.max_pages = max_pages
+
+        # The arguments used to build the contents of each page, keyed by the
+        # (initially empty) page widget.
+        self._pages = {}
+
+        # The editors of each built page, in least recently shown order.
+        self._built = OrderedDict()
+
+        QtCore.QObject.connect(panel, QtCore.SIGNAL('currentChanged(int)'),
+                self.show_page)
+
+    def add_page(self, panel, item, item_handler):
+        """Returns the (empty) widget for a page whose contents are built when
+           it is first shown.
+        """
+        page = QtGui.QWidget()
+        layout = QtGui.QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._pages[page] = (item, item_handler)
+
+        return page
+
+    def show_page(self, index):
+        """Builds the contents of the page at the given index if needed.
+        """
+        ui = self.ui
+        page = self.panel.widget(index)
+        if page not in self._pages or ui.control is None:
+            return
+
+        built = self._built
+        if page in built:
+            built[page] = built.pop(page)
+            return
+
+        # Build the page, noting the editors created for it.
+        counts = (len(ui._editors), len(ui._visible), len(ui._enabled),
+                  len(ui._checked))
+        item, item_handler = self._pages[page]
+        page.layout().addWidget(_create_page(self.panel, item, ui,
+                                             item_handler))
+
+        # An editor controlled by several conditions (or which is also one of
+        # the UI's editors) is only listed once:
+        editors = ui._editors[counts[0]:]
+        ids = set(id(editor) for editor in editors)
+        for conditions, n in zip((ui._visible, ui._enabled, ui._checked),
+                                 counts[1:]):
+            for condition in conditions[n:]:
+                if id(condition.editor) not in ids:
+                    ids.add(id(condition.editor))
+                    editors.append(condition.editor)
+        built[page] = editors
+
+        # Pages built after the UI has been initialized must monitor their own
+        # conditions and call any 'name_defined' Handler methods themselves.
+        if ui.info.initialized:
+            ui._hook_when()
+            ui._evaluate_when()
+
+            for method in ui._defined:
+                method(ui.info)
+            del ui._defined[:]
+
+        # Dispose of the least recently shown pages beyond the limit.
+        if self.max_pages > 0:
+            while len(built) > self.max_pages:
+                old_page, old_editors = built.popitem(last=False)
+                ui.dispose_editors(old_editors)
+
+                layout = old_page.layout()
+                while layout.count() > 0:
+                    widget = layout.takeAt(0).widget()
+                    if widget is not None:
+                        widget.deleteLater()
+
 
 def _size_hint_wrapper(f, ui):
     """Wrap an existing sizeHint method with sizes from a UI object.
@@ -525,7 +642,8 @@ class _GroupPanel(object):
             policy.setVerticalStretch(50)
             sub.setSizePolicy(policy)
 
-            _fill_panel(sub, content, self.ui, self._add_page_item)
+            _fill_panel(sub, content, self.ui, self._add_page_item,
+                        group.lazy, group.max_pages)
 
             if outer is None:
                 outer = sub
@@ -629,6 +747,7 @@ class _GroupPanel(object):
 
         return outer
 
+    @profiled('_GroupPanel._add_items')
     def _add_items(self, content, outer=None):
         """Adds a list of Item objects, creating a layout if needed.  Return
            the outermost layout.
@@ -783,27 +902,7 @@ class _GroupPanel(object):
                 label = None
 
             # Get the editor factory associated with the Item:
-            editor_factory = item.editor
-            if editor_factory is None:
-                editor_factory = trait.get_editor()
-
-                # If still no editor factory found, use a default text editor:
-                if editor_factory is None:
-                    from text_editor import ToolkitEditorFactory
-                    editor_factory = ToolkitEditorFactory()
-
-                # If the item has formatting traits set them in the editor
-                # factory:
-                if item.format_func is not None:
-                    editor_factory.format_func = item.format_func
-
-                if item.format_str != '':
-                    editor_factory.format_str = item.format_str
-
-                # If the item has an invalid state extended trait name, set it
-                # in the editor factory:
-                if item.invalid != '':
-                    editor_factory.invalid = item.invalid
+            editor_factory = ui.get_editor_factory( item, trait )
 
             # Create the requested type of editor from the editor factory:
             factory_method = getattr( editor_factory, item.style + '_editor' )
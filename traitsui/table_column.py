@@ -25,6 +25,8 @@
 
 from __future__ import absolute_import
 
+from functools import cmp_to_key
+
 from traits.api import (Any, Bool, Callable, Color, Constant, Enum, Expression, Float,
     Font, HasPrivateTraits, Instance, Int, Property, Str)
 
@@ -352,6 +354,19 @@ class TableColumn ( HasPrivateTraits ):
         """
         pass
 
+    #---------------------------------------------------------------------------
+    #  Returns the sort key of the column for a specified object:
+    #---------------------------------------------------------------------------
+
+    def key ( self, object ):
+        """ Returns the value used to sort the column for a specified object.
+
+            The default implementation orders objects using the column's
+            **cmp** method. Subclasses should override it to return a plain
+            value so that sorting does not need to call back into the column.
+        """
+        return cmp_to_key( self.cmp )( object )
+
     #---------------------------------------------------------------------------
     #  Returns the string representation of the table column:
     #---------------------------------------------------------------------------
@@ -508,6 +523,19 @@ class ObjectColumn ( TableColumn ):
         return cmp( self.get_raw_value( object1 ),
                     self.get_raw_value( object2 ) )
 
+    #---------------------------------------------------------------------------
+    #  Returns the sort key of the column for a specified object:
+    #---------------------------------------------------------------------------
+
+    def key ( self, object ):
+        """ Returns the value used to sort the column for a specified object.
+        """
+        # Respect subclasses which only customize the comparison:
+        if overrides( self, 'cmp', ObjectColumn ):
+            return super( ObjectColumn, self ).key( object )
+
+        return self.get_raw_value( object )
+
     #---------------------------------------------------------------------------
     #  Returns whether a specified value is valid for dropping on the column
     #  for a specified object:
@@ -858,3 +886,26 @@ class ListColumn ( TableColumn ):
         """
         return cmp( object1[ self.index ], object2[ self.index ] )
 
+    #---------------------------------------------------------------------------
+    #  Returns the sort key of the column for a specified object:
+    #---------------------------------------------------------------------------
+
+    def key ( self, object ):
+        """ Returns the value used to sort the column for a specified object.
+        """
+        if overrides( self, 'cmp', ListColumn ):
+            return super( ListColumn, self ).key( object )
+
+        return object[ self.index ]
+
+#-------------------------------------------------------------------------------
+#  Returns whether an object overrides a method defined by a base class:
+#-------------------------------------------------------------------------------
+
+def overrides ( object, name, base ):
+    """ Returns whether the class of *object* overrides the method called
+        *name* defined by the class *base*.
+    """
+    return (getattr( object.__class__, name ).im_func is not
+            getattr( base, name ).im_func)
+
@@ -24,18 +24,28 @@
 
 from __future__ import absolute_import
 
+import operator
+
+from operator import attrgetter
+
 from traits.api import (Any, Bool, Callable, Enum, Event, Expression, HasPrivateTraits,
-    Instance, List, Str, Trait)
+    Instance, List, Str, Trait, Undefined)
 
 from .editor_factory import EditorFactory
 from .editors.api import EnumEditor
 from .group import Group
+from .helper import code_names, is_identifier
 from .include import Include
 from .item import Item
 from .menu import Action
 from .table_column import ObjectColumn
 from .view import View
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #-------------------------------------------------------------------------------
 #  Trait definitions:
 #-------------------------------------------------------------------------------
@@ -52,6 +62,64 @@ GenericTableFilterRuleOperation = Trait( '=', {
     'ends with':   'ends_with'
 } )
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# Rule operations which can be applied to a whole column of values at once
+# (maps the rule operation name to the corresponding array operation):
+VectorRuleOperations = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge
+}
+
+# The item value types which can be handled by the vectorized rule operations:
+VectorRuleTypes = ( bool, int, long, float )
+
+# The item value types which the vectorized rule operations compare as Python
+# objects:
+VectorStringTypes = ( str, unicode )
+
+# Rule operations on strings which can be applied to a whole column of string
+# values at once (maps the rule operation name to a function of the list of
+# item values and the lower-cased rule value):
+VectorStringOperations = {
+    'contains':    lambda values, value2:
+                       [ value2 in value1.lower() for value1 in values ],
+    'starts_with': lambda values, value2:
+                       [ value1[ : len( value2 ) ].lower() == value2
+                         for value1 in values ],
+    'ends_with':   lambda values, value2:
+                       [ value1[ -len( value2 ): ].lower() == value2
+                         for value1 in values ]
+}
+
+# Rule operations which can be compiled inline (maps the rule operation name to
+# the corresponding Python operator):
+InlineRuleOperations = {
+    'eq': '==',
+    'ne': '!=',
+    'lt': '<',
+    'le': '<=',
+    'gt': '>',
+    'ge': '>='
+}
+
+# Rule operations used by compiled filters (maps the rule operation name to a
+# function of the item value and the rule value):
+RuleOperations = dict( VectorRuleOperations,
+    contains    = lambda value1, value2:
+                      value1.lower().find( value2.lower() ) >= 0,
+    starts_with = lambda value1, value2:
+                      value1[ : len( value2 ) ].lower() == value2.lower(),
+    ends_with   = lambda value1, value2:
+                      value1[ -len( value2 ): ].lower() == value2.lower()
+)
+
 #-------------------------------------------------------------------------------
 #  'TableFilter' class:
 #-------------------------------------------------------------------------------
@@ -85,7 +153,7 @@ class TableFilter ( HasPrivateTraits ):
     #---------------------------------------------------------------------------
 
     # Traits that are ignored by the _anytrait_changed() handler
-    ignored_traits = [ '_name', 'template', 'desc' ]
+    ignored_traits = [ '_name', 'template', 'desc', '_predicate' ]
 
     #---------------------------------------------------------------------------
     #  Traits view definitions:
@@ -134,6 +202,19 @@ class TableFilter ( HasPrivateTraits ):
         """
         return self.allowed( object )
 
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #  (Can be overridden to evaluate many objects more efficiently)
+    #---------------------------------------------------------------------------
+
+    def filter_items ( self, items ):
+        """ Returns a list containing, for each object in *items*, whether
+        the object meets the filter or search criteria.
+        """
+        filter = self.filter
+        return [ bool( filter( item ) ) for item in items ]
+
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
     #  satisfy the filter:
@@ -215,14 +296,48 @@ class EvalTableFilter ( TableFilter ):
         """ Returns whether a specified object meets the filter or search
         criteria.
         """
-        if self._traits is None:
-            self._traits = object.trait_names()
         try:
-            return eval( self.expression_, globals(),
-                         object.get( *self._traits ) )
+            predicate = self._predicate
+            if predicate is None:
+                self._predicate = predicate = self._compile( object )
+            return predicate( object )
         except:
             return False
 
+    #---------------------------------------------------------------------------
+    #  Compiles the filter expression into a function of a table item:
+    #---------------------------------------------------------------------------
+
+    def _compile ( self, object ):
+        """ Returns a function which evaluates the filter expression for a
+            specified object, reading only the object traits which the
+            expression references.
+        """
+        if self._traits is None:
+            self._traits = object.trait_names()
+
+        referenced = code_names( self.expression_ )
+        names      = [ name for name in self._traits if name in referenced ]
+        function   = eval( 'lambda %s: (%s)' % ( ', '.join( names ),
+                                                 self.expression ), globals() )
+        if len( names ) == 0:
+            return lambda object: function()
+
+        getter = attrgetter( *names )
+        if len( names ) == 1:
+            return lambda object: function( getter( object ) )
+
+        return lambda object: function( *getter( object ) )
+
+    #---------------------------------------------------------------------------
+    #  Handles the 'expression' trait being changed:
+    #---------------------------------------------------------------------------
+
+    def _expression_changed ( self ):
+        """ Handles a change to the **expression** trait.
+        """
+        self._predicate = None
+
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
     #  satisfy the filter:
@@ -520,16 +635,55 @@ class RuleTableFilter ( TableFilter ):
         """ Returns whether a specified object meets the filter or search
         criteria.
         """
-        is_first = is_true = True
-        for rule in self.rules:
-            if rule.and_or == 'or':
-                if is_true and (not is_first):
-                    return True
-                is_true = True
-            if is_true:
-                is_true = rule.is_true( object )
-            is_first = False
-        return is_true
+        predicate = self._predicate
+        if predicate is None:
+            groups = []
+            for rule in self.rules:
+                if (rule.and_or == 'or') or (len( groups ) == 0):
+                    groups.append( [] )
+                groups[-1].append( rule )
+            self._predicate = predicate = _compile_rules( groups )
+
+        return predicate( object )
+
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #---------------------------------------------------------------------------
+
+    def filter_items ( self, items ):
+        """ Returns a list containing, for each object in *items*, whether
+        the object meets the filter or search criteria.
+
+        If NumPy is available and all of the rules compare numeric trait
+        values, the rules are evaluated a column at a time.
+        """
+        rules = self.rules
+        masks = _rule_masks( items, rules )
+        if masks is None:
+            return super( RuleTableFilter, self ).filter_items( items )
+
+        result = current = None
+        for rule, mask in zip( rules, masks ):
+            if (rule.and_or == 'or') and (current is not None):
+                if result is None:
+                    result = current
+                else:
+                    result = result | current
+                current = None
+
+            if current is None:
+                current = mask
+            else:
+                current = current & mask
+
+        if current is None:
+            return [ True ] * len( items )
+
+        if result is not None:
+            current = result | current
+
+        return current.tolist()
 
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
@@ -628,6 +782,7 @@ class RuleTableFilter ( TableFilter ):
         if '_object' in dict:
             del dict[ '_object' ]
             del dict[ '_trait_values' ]
+        dict.pop( '_predicate', None )
         return dict
 
     #---------------------------------------------------------------------------
@@ -637,9 +792,27 @@ class RuleTableFilter ( TableFilter ):
     def _rules_changed ( self, rules ):
         """ Handles a change to the **rules** trait.
         """
+        self._predicate = None
         for rule in rules:
             rule.filter = self
 
+    def _rules_items_changed ( self, event ):
+        """ Handles rules being added to or removed from the **rules**
+            trait.
+        """
+        self._predicate = None
+        for rule in event.added:
+            rule.filter = self
+
+    #---------------------------------------------------------------------------
+    #  Handles the contents of the filter being changed:
+    #---------------------------------------------------------------------------
+
+    def _modified_fired ( self ):
+        """ Handles one of the filter rules being modified.
+        """
+        self._predicate = None
+
 #-------------------------------------------------------------------------------
 #  Defines the columns to display in the menu filter rule table:
 #-------------------------------------------------------------------------------
@@ -679,10 +852,31 @@ class MenuTableFilter ( RuleTableFilter ):
         """ Returns whether a specified object meets the filter or search
         criteria.
         """
-        for rule in self.rules:
-            if rule.enabled and (not rule.is_true( object )):
-                return False
-        return True
+        predicate = self._predicate
+        if predicate is None:
+            self._predicate = predicate = _compile_rules(
+                [ [ rule for rule in self.rules if rule.enabled ] ] )
+
+        return predicate( object )
+
+    #---------------------------------------------------------------------------
+    #  Returns whether each of a list of objects meets the filter/search
+    #  criteria:
+    #---------------------------------------------------------------------------
+
+    def filter_items ( self, items ):
+        """ Returns a list containing, for each object in *items*, whether
+        the object meets the filter or search criteria.
+        """
+        rules = [ rule for rule in self.rules if rule.enabled ]
+        masks = _rule_masks( items, rules )
+        if masks is None:
+            return super( MenuTableFilter, self ).filter_items( items )
+
+        if len( masks ) == 0:
+            return [ True ] * len( items )
+
+        return reduce( operator.and_, masks ).tolist()
 
     #---------------------------------------------------------------------------
     #  Returns a user readable description of what kind of object will
@@ -732,6 +926,214 @@ class MenuTableFilter ( RuleTableFilter ):
                                 'filter':      self,
                                 'name_editor': name_editor  } )
 
+#-------------------------------------------------------------------------------
+#  Returns a function converting a rule value to the type of an item value:
+#-------------------------------------------------------------------------------
+
+def _rule_value_converter ( value ):
+    """ Returns a function which returns a rule value converted to a specified
+        type, caching the result for each type.
+    """
+    converted = {}
+
+    def convert ( type1 ):
+        result = converted.get( type1, Undefined )
+        if result is Undefined:
+            converted[ type1 ] = result = type1( value )
+        return result
+
+    return convert
+
+#-------------------------------------------------------------------------------
+#  Compiles lists of filter rules into a function of a table item:
+#-------------------------------------------------------------------------------
+
+def _compile_rules ( groups ):
+    """ Returns a function which returns whether an object satisfies all of
+        the rules in any of the specified groups of rules (i.e. the 'or' of
+        the 'and' of each group). All of the rules are compiled into a single
+        code object.
+
+        If possible, the function first evaluates all of the rules as a single
+        expression, guarded by a check that each item value has the type of
+        its rule value. Only objects which fail the check (or raise an
+        exception) are evaluated rule by rule, converting the rule values to
+        the types of the item values.
+    """
+    namespace = {}
+    lines     = [ 'def checked ( object ):' ]
+    for group in groups:
+        lines.append( '    ok = True' )
+        for rule in group:
+            i = len( namespace )
+            namespace[ 'value%d'   % i ] = rule.value
+            namespace[ 'type%d'    % i ] = type( rule.value )
+            namespace[ 'convert%d' % i ] = _rule_value_converter( rule.value )
+            if is_identifier( rule.name ):
+                getter = 'object.%s' % rule.name
+            else:
+                namespace[ 'name%d' % i ] = rule.name
+                getter = 'getattr( object, name%d )' % i
+            symbol = InlineRuleOperations.get( rule.operation_ )
+            if symbol is not None:
+                test = 'value1 %s value2' % symbol
+            else:
+                namespace[ 'operation%d' % i ] = RuleOperations[
+                                                     rule.operation_ ]
+                test = 'operation%d( value1, value2 )' % i
+            lines.extend( [
+                '    if ok:',
+                '        try:',
+                '            value1 = %s' % getter,
+                '            value2 = value%d' % i,
+                '            if type( value1 ) is not type%d:' % i,
+                '                value2 = convert%d( type( value1 ) )' % i,
+                '            ok = %s' % test,
+                '        except:',
+                '            ok = False' ] )
+        lines.extend( [ '    if ok:', '        return True' ] )
+    lines.append( '    return %s' % ( len( groups ) == 0 ) )
+
+    lines.extend( _fast_rules_lines( groups, namespace ) )
+
+    exec '\n'.join( lines ) in namespace
+
+    return namespace.get( 'predicate', namespace[ 'checked' ] )
+
+def _fast_rules_lines ( groups, namespace ):
+    """ Returns the lines of the source code of a 'predicate' function which
+        evaluates the specified groups of rules as a single expression when
+        each item value has the type of its rule value, and otherwise calls
+        the 'checked' function. Returns an empty list if the rules cannot be
+        evaluated that way.
+    """
+    names  = {}
+    guards = []
+    ors    = []
+    for group in groups:
+        ands = []
+        for rule in group:
+            name = rule.name
+            if not is_identifier( name ):
+                return []
+
+            if name not in names:
+                names[ name ] = len( names )
+            value = 'a%d' % names[ name ]
+            i     = len( namespace )
+            namespace[ 'value%d' % i ] = rule.value
+            namespace[ 'type%d'  % i ] = type( rule.value )
+            guards.append( 'type( %s ) is type%d' % ( value, i ) )
+
+            operation = rule.operation_
+            symbol    = InlineRuleOperations.get( operation )
+            if symbol is not None:
+                ands.append( '(%s %s value%d)' % ( value, symbol, i ) )
+                continue
+
+            if not isinstance( rule.value, basestring ):
+                return []
+
+            namespace[ 'lower%d' % i ] = rule.value.lower()
+            namespace[ 'len%d'   % i ] = len( rule.value )
+            if operation == 'contains':
+                test = '(lower%d in %s.lower())' % ( i, value )
+            elif operation == 'starts_with':
+                test = '(%s[ : len%d ].lower() == lower%d)' % ( value, i, i )
+            elif operation == 'ends_with':
+                test = '(%s[ -len%d: ].lower() == lower%d)' % ( value, i, i )
+            else:
+                return []
+            ands.append( test )
+
+        ors.append( '(%s)' % ( ' and '.join( ands ) or 'True' ) )
+
+    if len( names ) == 0:
+        return []
+
+    lines = [ 'def predicate ( object ):', '    try:' ]
+    for name, index in sorted( names.items(), key = lambda x: x[1] ):
+        lines.append( '        a%d = object.%s' % ( index, name ) )
+
+    return lines + [
+        '        if %s:' % ' and '.join( guards ),
+        '            if %s:' % ' or '.join( ors ),
+        '                return True',
+        '            return False',
+        '    except:',
+        '        pass',
+        '    return checked( object )' ]
+
+#-------------------------------------------------------------------------------
+#  Evaluates a list of filter rules a column at a time:
+#-------------------------------------------------------------------------------
+
+def _rule_masks ( items, rules ):
+    """ Returns a list containing a boolean NumPy array for each rule in
+        *rules*, indicating which of the objects in *items* the rule is true
+        for, or None if the rules cannot be evaluated a column at a time.
+    """
+    if numpy is None:
+        return None
+
+    for rule in rules:
+        if ((rule.operation_ not in VectorRuleOperations) and
+            (rule.operation_ not in VectorStringOperations)):
+            return None
+
+    columns = {}
+    masks   = []
+    for rule in rules:
+        name   = rule.name
+        column = columns.get( name )
+        if column is None:
+            try:
+                values = map( attrgetter( name ), items )
+            except:
+                return None
+
+            types = set( map( type, values ) )
+            if len( types ) > 1:
+                return None
+
+            type1 = bool
+            if len( types ) == 1:
+                type1 = types.pop()
+
+            if type1 in VectorStringTypes:
+                array = numpy.array( values, dtype = object )
+            elif type1 in VectorRuleTypes:
+                array = numpy.array( values )
+            else:
+                return None
+
+            columns[ name ] = column = ( type1, values, array )
+
+        type1, values, array = column
+        string_operation     = VectorStringOperations.get( rule.operation_ )
+        if (string_operation is not None) and (type1 not in VectorStringTypes):
+            if len( values ) > 0:
+                return None
+            string_operation = None
+
+        try:
+            value2 = rule.value
+            if type1 is not type( value2 ):
+                value2 = type1( value2 )
+            if string_operation is not None:
+                mask = numpy.array( string_operation( values, value2.lower() ),
+                                    dtype = bool )
+            else:
+                mask = numpy.asarray(
+                    VectorRuleOperations[ rule.operation_ ]( array, value2 ),
+                    dtype = bool )
+        except:
+            mask = numpy.zeros( len( values ), dtype = bool )
+
+        masks.append( mask )
+
+    return masks
+
 #-------------------------------------------------------------------------------
 #  Define some standard template filters:
 #-------------------------------------------------------------------------------
@@ -24,10 +24,20 @@
 
 from __future__ import absolute_import
 
+from operator import attrgetter, itemgetter
+
 from traits.api import (Any, Bool, Color, Enum, Event, Float, Font, HasPrivateTraits,
     HasTraits, Instance, Int, Interface, List, Property, Str, cached_property,
     implements, on_trait_change)
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The traits describing the item currently being adapted:
+ContextTraits = ( 'object', 'name', 'row', 'column', 'column_id', 'item',
+                  'value' )
+
 #-------------------------------------------------------------------------------
 #  'ITabularAdapter' interface:
 #-------------------------------------------------------------------------------
@@ -170,6 +180,12 @@ class TabularAdapter ( HasPrivateTraits ):
     # List of optional delegated adapters:
     adapters = List( ITabularAdapter, update = True )
 
+    # Should the traits describing the item currently being adapted (*row*,
+    # *item*, ...) be set as plain attributes? This skips their validation and
+    # change notification, so it should only be enabled when nothing listens
+    # to them:
+    plain_context = Bool( False )
+
     #-- Traits Set by the Editor -----------------------------------------------
 
     # The object whose trait is being edited:
@@ -195,7 +211,8 @@ class TabularAdapter ( HasPrivateTraits ):
 
     #-- Private Trait Definitions ----------------------------------------------
 
-    # Cache of attribute handlers:
+    # Cache of ( handler, contextual ) attribute handler pairs, keyed by
+    # ( item class, method name, column index ):
     cache = Any( {} )
 
     # Event fired when the cache is flushed:
@@ -357,16 +374,10 @@ class TabularAdapter ( HasPrivateTraits ):
         return self.item
 
     def _get_text_color ( self ):
-        if (self.row % 2) == 1:
-            return self.even_text_color_ or self.default_text_color
-
-        return self.odd_text_color or self.default_text_color_
+        return self._text_color_for( self.item, self.row )
 
     def _get_bg_color ( self ):
-        if (self.row % 2) == 1:
-            return self.even_bg_color_ or self.default_bg_color_
-
-        return self.odd_bg_color or self.default_bg_color_
+        return self._bg_color_for( self.item, self.row )
 
     def _get_text ( self ):
         return self.get_format(
@@ -456,78 +467,202 @@ class TabularAdapter ( HasPrivateTraits ):
         """ Returns/Sets the value of the specified *name* attribute for the
             specified *object.trait[row].column* item.
         """
-        self.object    = object
-        self.name      = trait
-        self.row       = row
-        self.column    = column
-        self.column_id = column_id = self.column_map[ column ]
-        self.value     = value
-        self.item      = item = self.get_item( object, trait, row )
-        item_class     = item.__class__
-        key            = '%s:%s:%d' % ( item_class.__name__, name, column )
-        handler        = self.cache.get( key )
-        if handler is not None:
-            return handler()
-
+        item  = self.get_item( object, trait, row )
+        entry = self.cache.get( ( item.__class__, name, column ) )
+        if entry is None:
+            self._set_context( object, trait, row, column, item, value )
+            entry = self._entry_for( name, item, column )
+        elif entry[1]:
+            self._set_context( object, trait, row, column, item, value )
+
+        return entry[0]( item, row )
+
+    def _set_context ( self, object, trait, row, column, item, value ):
+        """ Sets the traits describing the item currently being adapted.
+        """
+        column_id = self.column_map[ column ]
+        if self.plain_context:
+            self.__dict__.update( object = object, name  = trait,
+                                  row    = row,    column = column,
+                                  column_id = column_id,
+                                  item   = item,   value = value )
+        else:
+            self.object    = object
+            self.name      = trait
+            self.row       = row
+            self.column    = column
+            self.column_id = column_id
+            self.value     = value
+            self.item      = item
+
+    def _entry_for ( self, name, item, column ):
+        """ Returns the ( handler, contextual ) pair used to get or set the
+            specified *name* attribute for items of the same class as *item*
+            in the specified column, caching it when possible. A handler is
+            called with the item and row, and a contextual handler also
+            requires the current item context to have been set.
+        """
         prefix     = name[:4]
         trait_name = name[4:]
+        column_id  = self.column_id
+        contextual = (prefix != 'get_') or self._context_observed()
+        entry      = None
 
         for i, adapter in enumerate( self.adapters ):
             if column in self.adapter_column_indices[i]:
-                adapter.row    = row
+                adapter.row    = self.row
                 adapter.item   = item
-                adapter.value  = value
-                adapter.column = column_id = self.adapter_column_map[i][column]
+                adapter.value  = self.value
+                adapter.column = adapter_id = self.adapter_column_map[i][column]
                 if adapter.accepts:
-                    get_name = '%s_%s' % ( column_id, trait_name )
+                    get_name = '%s_%s' % ( adapter_id, trait_name )
                     if adapter.trait( get_name ) is not None:
                         if prefix == 'get_':
-                            handler = lambda: getattr( adapter.set(
-                                row  = self.row, column = column_id,
-                                item = self.item ), get_name )
+                            handler = lambda item, row: getattr( adapter.set(
+                                row  = row, column = adapter_id,
+                                item = item ), get_name )
                         else:
-                            handler = lambda: setattr( adapter.set(
-                                row  = self.row, column = column_id,
-                                item = self.item ), get_name, self.value )
+                            handler = lambda item, row: setattr( adapter.set(
+                                row  = row, column = adapter_id,
+                                item = item ), get_name, self.value )
 
+                        entry = ( handler, contextual )
                         if adapter.is_cacheable:
                             break
 
-                        return handler()
+                        return entry
         else:
-            if item is not None and hasattr(item_class, '__mro__'):
+            item_class = item.__class__
+            if item is not None and hasattr( item_class, '__mro__' ):
                 for klass in item_class.__mro__:
-                    handler = (self._get_handler_for( '%s_%s_%s' %
-                          ( klass.__name__, column_id, trait_name ), prefix ) or
+                    entry = (self._get_handler_for( '%s_%s_%s' %
+                          ( klass.__name__, column_id, trait_name ), prefix,
+                          item, column, contextual ) or
                         self._get_handler_for( '%s_%s' %
-                          ( klass.__name__, trait_name ), prefix ))
-                    if handler is not None:
+                          ( klass.__name__, trait_name ), prefix,
+                          item, column, contextual ))
+                    if entry is not None:
                         break
 
-            if handler is None:
-                handler = (self._get_handler_for( '%s_%s' % ( column_id,
-                              trait_name ), prefix ) or
-                           self._get_handler_for( trait_name, prefix ))
+            if entry is None:
+                entry = (self._get_handler_for( '%s_%s' % ( column_id,
+                             trait_name ), prefix, item, column, contextual ) or
+                         self._get_handler_for( trait_name, prefix,
+                             item, column, contextual ))
+
+        self.cache[ ( item.__class__, name, column ) ] = entry
+
+        return entry
+
+    def _get_handler_for ( self, name, prefix, item, column, contextual ):
+        """ Returns the ( handler, contextual ) pair for a specified trait name
+            (or None if not found).
+        """
+        trait = self.trait( name )
+        if trait is None:
+            return None
+
+        if prefix != 'get_':
+            return ( lambda item, row: setattr( self, name, self.value ), True )
 
-        self.cache[ key ] = handler
-        return handler()
+        if not contextual:
+            if trait.type != 'property':
+                return ( lambda item, row: getattr( self, name ), False )
 
-    def _get_handler_for ( self, name, prefix ):
-        """ Returns the handler for a specified trait name (or None if not
-            found).
+            handler = self._compiled_getter( name, trait.property()[0],
+                                             item, column )
+            if handler is not None:
+                return ( handler, False )
+
+        return ( lambda item, row: getattr( self, name ), True )
+
+    def _compiled_getter ( self, name, getter, item, column ):
+        """ Returns a handler computing one of the default *drag*, *text*,
+            *content*, *text_color* or *bg_color* properties directly from the
+            item and row, or None if the property has been overridden.
         """
-        if self.trait( name ) is not None:
-            if prefix == 'get_':
-                return lambda: getattr( self, name )
+        if getter is not TabularAdapter.__dict__.get( '_get_' + name ):
+            return None
 
-            return lambda: setattr( self, name, self.value )
+        if name == 'content':
+            column_id = self.column_id
+            if isinstance( column_id, int ):
+                getter = itemgetter( column_id )
+            elif isinstance( column_id, basestring ) and ('.' not in column_id):
+                getter = attrgetter( column_id )
+            else:
+                return None
+
+            return lambda item, row: getter( item )
+
+        if name == 'text':
+            if not (self._is_default( 'get_format' ) and
+                    self._is_default( 'get_content' )):
+                return None
+
+            format  = self._entry_for( 'get_format',  item, column )
+            content = self._entry_for( 'get_content', item, column )
+            if format[1] or content[1]:
+                return None
+
+            format, content = format[0], content[0]
+
+            return lambda item, row: format( item, row ) % content( item, row )
+
+        if name == 'drag':
+            return lambda item, row: item
+
+        if name == 'text_color':
+            return self._text_color_for
+
+        if name == 'bg_color':
+            return self._bg_color_for
 
         return None
 
-    @on_trait_change( 'columns,adapters.+update' )
+    def _context_observed ( self ):
+        """ Returns whether anything listens to changes of the traits
+            describing the item currently being adapted, in which case they
+            must be set for every item.
+        """
+        if self.plain_context:
+            return False
+
+        for name in ContextTraits:
+            for trait in ( self._trait( name, 0 ),
+                           self.__class_traits__.get( name ) ):
+                if (trait is not None) and trait._notifiers( 0 ):
+                    return True
+
+        return False
+
+    def _is_default ( self, name ):
+        """ Returns whether the specified adapter method has not been
+            overridden by a subclass.
+        """
+        return (getattr( self.__class__, name ).im_func is
+                TabularAdapter.__dict__[ name ])
+
+    def _text_color_for ( self, item, row ):
+        """ Returns the default text color for a specified row item.
+        """
+        if (row % 2) == 1:
+            return self.even_text_color_ or self.default_text_color
+
+        return self.odd_text_color or self.default_text_color_
+
+    def _bg_color_for ( self, item, row ):
+        """ Returns the default background color for a specified row item.
+        """
+        if (row % 2) == 1:
+            return self.even_bg_color_ or self.default_bg_color_
+
+        return self.odd_bg_color or self.default_bg_color_
+
+    @on_trait_change( 'columns,plain_context,adapters.+update' )
     def _flush_cache ( self ):
-        """ Flushes the cache when the columns or any trait on any adapter
-            changes.
+        """ Flushes the cache when the columns, the context mode or any trait
+            on any adapter changes.
         """
         self.cache = {}
         self.cache_flushed = True
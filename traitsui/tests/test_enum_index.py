@@ -0,0 +1,40 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals
+
+from ..helper import EnumIndex, enum_values_changed
+
+
+def test_enum_values_changed():
+    names, mapping, inverse = enum_values_changed({1: 'b:one', 2: 'a:two'})
+    assert_equals(names, ['two', 'one'])
+    assert_equals(mapping, {'one': 1, 'two': 2})
+    assert_equals(inverse, {1: 'one', 2: 'two'})
+
+
+def test_enum_index():
+    enum = EnumIndex()
+    enum.update(*enum_values_changed(['c', 'a', 'B', 'a']))
+    assert_equals(enum.index_of('a'), 1)
+    assert_equals(enum.index_of('x'), -1)
+    assert_equals(enum.index_of_value('B'), 2)
+    assert_equals(enum.index_of_value([]), -1)
+    assert_equals(enum.complete('b'), ['B'])
+    assert_equals(enum.complete(''), ['a', 'B', 'c'])
+    assert_equals(enum.complete('', 2), ['a', 'B'])
+
+    # Appending keeps the existing positions:
+    values = ['c', 'a', 'B', 'a', 'ab', 'c']
+    assert_equals(enum.diff(values), (4, 0, 2))
+    enum.update(*enum_values_changed(values))
+    assert_equals(enum.index_of('ab'), 4)
+    assert_equals(enum.index_of('c'), 0)
+    assert_equals(enum.complete('A'), ['a', 'ab'])
+
+    # Other changes are reported as a single replaced range:
+    values = ['c', 'x', 'y', 'ab', 'c']
+    assert_equals(enum.diff(values), (1, 3, 2))
+    enum.update(*enum_values_changed(values))
+    assert_equals(enum.index_of('ab'), 3)
+    assert_equals(enum.index_of('a'), -1)
+    assert_equals(enum.diff(values), (5, 0, 0))
@@ -0,0 +1,112 @@
+from __future__ import absolute_import
+
+import gc
+
+from nose.tools import assert_equals, assert_true
+
+from traits.api import Bool, HasTraits, Str
+
+from ..group import Group
+from ..handler import Handler
+from ..include import Include
+from ..item import Item
+from ..layout_cache import LayoutCache, layout_cache
+from ..ui import UI
+from ..view import View
+from ..view_elements import ViewElements
+
+
+class Person(HasTraits):
+    name = Str
+    age = Str
+    advanced = Bool(False)
+
+    def dynamic_group(self):
+        return Group('age')
+
+
+def item_names(ui):
+    names = []
+    for group in ui._groups:
+        names.extend(item.name for item in group.get_content(False))
+    return names
+
+
+def new_ui(view, person, view_elements=None):
+    return UI(view=view, context={'object': person}, handler=Handler(),
+              view_elements=view_elements)
+
+
+def test_layout_cache():
+    view = View(Group('name'),
+                Group('age', defined_when='advanced'))
+    layout_cache.clear()
+    layout_cache.enabled = True
+    try:
+        check_layout_cache(view)
+    finally:
+        layout_cache.enabled = False
+
+
+def check_layout_cache(view):
+    uis = [new_ui(view, Person()) for i in range(3)]
+    assert_equals([item_names(ui) for ui in uis], [['name']] * 3)
+    assert_equals((layout_cache.hits, layout_cache.misses), (2, 1))
+    assert_true(uis[0]._groups is uis[2]._groups)
+
+    # A different 'defined_when' result needs its own plan:
+    for i in range(2):
+        ui = new_ui(view, Person(advanced=True))
+        assert_equals(item_names(ui), ['name', 'age'])
+    assert_equals((layout_cache.hits, layout_cache.misses), (3, 2))
+    assert_equals(layout_cache.plans, 2)
+
+    # The editor factory chosen for an item is remembered by the plan:
+    person = Person()
+    ui = new_ui(view, person)
+    item = ui._groups[0].get_content(False)[0]
+    factory = ui.get_editor_factory(item, person.base_trait('name'))
+    assert_true(ui._layout_plan.factories[id(item)][1] is factory)
+
+
+def test_layout_cache_dynamic_include():
+    cache = LayoutCache(enabled=True)
+    view = View(Include('dynamic_group'))
+    for i in range(2):
+        ui = new_ui(view, Person())
+        assert_equals(cache.groups_for(ui)[0].get_content(False)[0].name,
+                      'age')
+    assert_equals((cache.hits, cache.misses, cache.uncacheable), (0, 2, 2))
+    assert_equals(cache.plans, 0)
+
+
+def test_layout_cache_disabled_by_default():
+    cache = LayoutCache()
+    view = View(Group('name'))
+    assert_equals(cache.groups_for(new_ui(view, Person()))[0].get_content(
+        False)[0].name, 'name')
+
+    # Changes made to a View after it has been used are seen:
+    view.content.content[0].content.append(Item('age'))
+    ui = new_ui(view, Person())
+    assert_equals(item_names(ui), ['name', 'age'])
+    assert_equals(cache.plans, 0)
+
+
+def test_layout_cache_view_elements():
+    cache = LayoutCache(enabled=True)
+    view = View(Include('extra'))
+    elements = ViewElements(content={'extra': Group('age')})
+    ui = new_ui(view, Person(), elements)
+    cache.groups_for(ui)
+    plan = ui._layout_plan
+    assert_true(plan.matches(view, new_ui(view, Person(), elements), {}))
+
+    # A plan only applies to the ViewElements it was resolved with:
+    other = ViewElements(content={'extra': Group('name')})
+    assert_true(not plan.matches(view, new_ui(view, Person(), other), {}))
+
+    del ui, elements
+    gc.collect()
+    assert_true(not plan.is_alive())
+
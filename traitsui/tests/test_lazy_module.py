@@ -0,0 +1,34 @@
+from __future__ import absolute_import
+
+import sys
+import types
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from ..helper import LazyModule
+
+
+def test_lazy_module_exports():
+    module = types.ModuleType('traitsui.tests._lazy_example')
+    exec ('from __future__ import absolute_import\n'
+          'import sys\n'
+          'from traitsui.helper import LazyModule\n'
+          'from traitsui.helper import commatize\n'
+          '_private = 1\n') in module.__dict__
+    sys.modules[module.__name__] = module
+    try:
+        lazy = LazyModule(module, {'user_name_for': 'traitsui.helper'})
+        assert_true(sys.modules[module.__name__] is lazy)
+        assert_equals(lazy.__all__, ['commatize', 'user_name_for'])
+        assert_false('user_name_for' in lazy.__dict__)
+        assert_equals(lazy.user_name_for('a_name'), 'A name')
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_api_exports():
+    from traitsui import api
+    for name in ('sys', 'absolute_import', 'LazyModule'):
+        assert_false(name in api.__all__)
+    for name in ('View', 'Item', 'TableEditor'):
+        assert_true(name in api.__all__)
@@ -0,0 +1,57 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals, assert_true
+
+from traits.api import HasTraits, List, Int
+
+from ..editors.list_editor import ListItemIndex, ListItemProxy
+
+
+class Model(HasTraits):
+    values = List(Int)
+
+
+def test_list_item_index():
+    model = Model(values=range(10))
+    index = ListItemIndex()
+    for i in (1, 3, 5, 7):
+        index.add(ListItemProxy(model, 'values', i, Int, model.values[i]))
+
+    # Inserting two items before item 5 shifts the proxies after it:
+    assert_equals(index.update(4, 0, 2), [])
+    assert_equals(index.indices(), [1, 3, 7, 9])
+    assert_equals([index.get(i).index for i in index.indices()], [1, 3, 7, 9])
+
+    # Removing items drops their proxies:
+    dropped = index.update(2, 3, 0)
+    assert_equals([proxy.value for proxy in dropped], [3])
+    assert_equals(index.indices(), [1, 4, 6])
+    assert_equals(index.get(4).value, 5)
+
+    # A proxy still writes back to the right list item after being shifted:
+    model.values = range(10)
+    index.get(4).value = 50
+    assert_equals(model.values[4], 50)
+
+
+def test_list_item_index_renumbers_lazily():
+    model = Model(values=range(100))
+    index = ListItemIndex()
+    for i in range(100):
+        index.add(ListItemProxy(model, 'values', i, Int, model.values[i]))
+    last = index.get(99)
+
+    # Changes only touch the proxies of the changed items:
+    for i in range(10):
+        index.update(0, 1, 0)
+    index.update(5, 0, 3)
+    assert_equals(last._zzz_index, 99)
+    assert_equals(len(index), 90)
+    assert_true(index.get(92) is last)
+    assert_true(5 not in index)
+
+    # The indices are brought up to date when one of them is needed:
+    assert_equals(last.index, 92)
+    assert_equals([index.get(i).index for i in index.indices()],
+                  range(5) + range(8, 93))
+    assert_equals(index.get(8).value, 15)
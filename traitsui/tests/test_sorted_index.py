@@ -0,0 +1,39 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from ..helper import SortedIndex
+
+
+def test_sorted_index():
+    labels = {1: 'one', 2: 'two', 3: 'three', 4: 'four', 5: 'five'}
+    index = SortedIndex([1, 2, 3], key=labels.get)
+    assert_equals(list(index), [1, 3, 2])
+    assert_true(2 in index)
+    assert_false(4 in index)
+
+    assert_equals(index.insertion_row(4), 0)
+    assert_equals(index.add(4), 0)
+    assert_equals(index.add(4), -1)
+    assert_equals(index.add(5), 0)
+    assert_equals(list(index), [5, 4, 1, 3, 2])
+    assert_equals(index.index(3), 3)
+    assert_equals(index.remove(1), 2)
+    assert_equals(index.remove(1), -1)
+    assert_equals(index.index(1), -1)
+    assert_equals(list(index), [5, 4, 3, 2])
+
+    index.update(added=[1, 5], removed=[4, 2, 9])
+    assert_equals(list(index), [5, 1, 3])
+    assert_equals(len(index), 3)
+    assert_equals(index[1], 1)
+
+
+def test_sorted_index_duplicate_keys():
+    index = SortedIndex(['b', 'A', 'a', 'B'], key=str.lower)
+    assert_equals(sorted(index[:2]), ['A', 'a'])
+    for item in 'aAbB':
+        assert_equals(index[index.index(item)], item)
+    index.remove('a')
+    assert_equals(index.index('A'), 0)
+    assert_equals(index.add('a'), 1)
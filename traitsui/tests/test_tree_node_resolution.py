@@ -0,0 +1,55 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from traits.api import HasTraits, Str
+
+from ..editors.tree_editor import TreeEditor
+from ..tree_node import ObjectTreeNode, TreeNode
+
+
+class Base(HasTraits):
+    name = Str
+
+
+class Derived(Base):
+    pass
+
+
+class Other(HasTraits):
+    pass
+
+
+class NamedNode(TreeNode):
+    def is_node_for(self, object):
+        return getattr(object, 'name', '') == 'special'
+
+
+def test_nodes_for():
+    base = TreeNode(node_for=[Base])
+    named = NamedNode(node_for=[Base])
+    editor = TreeEditor(nodes=[base, named])
+    assert_true(base.type_only)
+    assert_false(named.type_only)
+    assert_false(ObjectTreeNode().type_only)
+
+    assert_equals(editor.nodes_for(Derived()), [base])
+    assert_equals(editor.nodes_for(Derived(name='special')), [base, named])
+    assert_equals(editor.nodes_for(Other()), [])
+
+    # Changing the nodes discards the cached results:
+    derived = TreeNode(node_for=[Derived])
+    editor.nodes = [derived, base]
+    assert_equals(editor.nodes_for(Derived()), [derived, base])
+    derived.node_for = [Other]
+    assert_equals(editor.nodes_for(Derived()), [base])
+    assert_equals(editor.nodes_for(Other()), [derived])
+
+
+def test_node_for_class():
+    base = TreeNode(node_for=[Base])
+    editor = TreeEditor(nodes=[TreeNode(node_for=[Other]), base])
+    assert_true(editor.node_for_class(Derived) is base)
+    assert_true(editor.node_for_class(str) is None)
+    assert_equals(editor.node_for_class_name('Base'), (base, Base))
+    assert_equals(editor.node_for_class_name('Derived'), (None, None))
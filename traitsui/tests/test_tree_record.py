@@ -0,0 +1,105 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals
+
+from ..tree_record import TreeRecord
+
+
+def _rows(record):
+    return [child.row for child in record.children]
+
+
+def _node_for(object):
+    # Only the even numbers are matched by a node:
+    if object % 2 == 0:
+        return (object, 'node')
+    return (object, None)
+
+
+def _objects(record):
+    return [child.object for child in record.children]
+
+
+def _fetch(record, count):
+    records = [TreeRecord(None, node, object)
+               for object, node in record.fetch(count, _node_for)]
+    record.insert(len(record.children), records)
+
+
+def test_tree_record_rows():
+    root = TreeRecord()
+    root.insert(0, [TreeRecord(object=i) for i in range(5)])
+    assert_equals(_rows(root), range(5))
+
+    # Inserting before a record renumbers the records after it:
+    last = root.children[-1]
+    root.insert(1, [TreeRecord(object='a'), TreeRecord(object='b')])
+    assert_equals(last.row, 6)
+    assert_equals([child.object for child in root.children],
+                  [0, 'a', 'b', 1, 2, 3, 4])
+    assert_equals(_rows(root), range(7))
+
+    # Removed records are detached from their parent:
+    removed = root.remove(0, 3)
+    assert_equals([record.object for record in removed], [0, 'a', 'b'])
+    assert_equals([record.parent for record in removed], [None] * 3)
+    assert_equals(last.row, 3)
+    assert_equals(_rows(root), range(4))
+
+
+def test_tree_record_fetch():
+    root = TreeRecord()
+    assert_equals(root.can_fetch(), False)
+    assert_equals(root.pend('x'), False)
+
+    root.expand(range(5))
+    assert_equals(root.expanded, True)
+    assert_equals(root.fetch(2, _node_for), [(0, 'node')])
+
+    # An object appended before all of the children are fetched is pending:
+    assert_equals(root.pend(6), True)
+    assert_equals(root.fetch(10, _node_for), [(2, 'node'), (4, 'node'),
+                                              (6, 'node')])
+    assert_equals(root.can_fetch(), False)
+    assert_equals(root.fetch(10, _node_for), [])
+
+
+def test_tree_record_skips_unmatched_children():
+    children = [0, 1, 2, 3, 4, 5, 6]
+    root = TreeRecord()
+    root.expand(children)
+    _fetch(root, 3)
+    _fetch(root, 10)
+    assert_equals(_objects(root), [0, 2, 4, 6])
+    assert_equals([root.row_for(i) for i in range(8)],
+                  [0, 1, 1, 2, 2, 3, 3, 4])
+
+    # Apply changes to the children as the editor does for a list event,
+    # checking that the records always match the matched children:
+    changes = [(1, 3, [8, 9, 10]), (0, 1, []), (5, 5, [11, 12]),
+               (2, 4, [13]), (0, 0, [15, 14]), (3, 9, [])]
+    for start, end, added in changes:
+        children[start:end] = added
+        row_start, row_end, pairs = root.replace(start, end, added,
+                                                 _node_for)
+        root.remove(row_start, row_end)
+        root.insert(row_start, [TreeRecord(None, node, object)
+                                for object, node in pairs])
+        assert_equals(_objects(root),
+                      [child for child in children if child % 2 == 0])
+        assert_equals(_rows(root), range(len(root.children)))
+
+    # Expanding the node again forgets the skipped children:
+    root.remove(0, len(root.children))
+    root.expand([2, 4])
+    assert_equals([root.row_for(i) for i in range(3)], [0, 1, 2])
+
+
+def test_tree_record_walk():
+    root = TreeRecord()
+    a, b, c = TreeRecord(object='a'), TreeRecord(object='b'), \
+              TreeRecord(object='c')
+    root.insert(0, [a, b])
+    a.insert(0, [c])
+    assert_equals([record.object for record in root.walk()],
+                  [None, 'a', 'b', 'c'])
@@ -0,0 +1,73 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from traits.api import Bool, HasTraits, Str
+
+from ..editor import Editor
+from ..editor_factory import EditorFactory
+from ..handler import Handler
+from ..item import Item
+from ..ui import UI
+from ..view import View
+
+
+class Person(HasTraits):
+    name = Str
+    flag = Bool(True)
+
+
+class Dummy(Editor):
+    def init(self, parent):
+        self.control = object()
+
+    def update_editor(self):
+        pass
+
+
+def test_dispose_editors():
+    person = Person(name='first')
+    ui = UI(view=View('name'), context={'object': person}, handler=Handler())
+    editors = []
+    for name in ('name', 'flag'):
+        editor = Dummy(None, ui=ui, object=person, name=name,
+                       factory=EditorFactory(), item=Item(name))
+        editor.prepare(None)
+        ui._editors.append(editor)
+        ui.info.bind(name, editor)
+        ui.add_enabled('flag', editor)
+        editors.append(editor)
+    ui._hook_when()
+
+    kept, disposed = editors
+    ui.dispose_editors([disposed])
+    assert_equals(ui._editors, [kept])
+    assert_true(ui.info.name is kept)
+    assert_false(hasattr(ui.info, 'flag'))
+    assert_equals([condition.editor for condition in ui._enabled], [kept])
+    assert_true(disposed.ui is None)
+
+
+class FactoryListener(Dummy):
+    # Like the enum editor, disposing of the editor uses its factory:
+    def dispose(self):
+        self.factory.on_trait_change(self.update_editor, 'values',
+                                     remove=True)
+        super(FactoryListener, self).dispose()
+
+
+def test_dispose_editors_listed_twice():
+    person = Person(name='first')
+    ui = UI(view=View('name'), context={'object': person}, handler=Handler())
+    editor = FactoryListener(None, ui=ui, object=person, name='name',
+                             factory=EditorFactory(), item=Item('name'))
+    editor.prepare(None)
+    ui._editors.append(editor)
+    ui.add_visible('flag', editor)
+    ui.add_enabled('flag', editor)
+
+    # An editor controlled by several conditions may be listed repeatedly:
+    ui.dispose_editors([editor, editor, editor])
+    assert_equals(ui._editors, [])
+    assert_equals(ui._visible + ui._enabled, [])
+    assert_true(editor.ui is None)
@@ -0,0 +1,86 @@
+from __future__ import absolute_import
+
+import os
+import shelve
+import shutil
+import tempfile
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from traits import trait_notifiers
+
+from ..ui_prefs import UIPreferences
+
+
+def test_ui_prefs_round_trip():
+    path = tempfile.mkdtemp()
+    try:
+        prefs_path = os.path.join(path, 'prefs')
+        legacy_path = os.path.join(path, 'legacy')
+        db = shelve.open(legacy_path, protocol=-1)
+        db['old_view'] = {'': (1, 2)}
+        db.close()
+
+        # The legacy database is imported if there is no preferences file:
+        prefs = UIPreferences(path=prefs_path, legacy_path=legacy_path)
+        assert_equals(prefs.get('old_view'), {'': (1, 2)})
+        assert_equals(prefs.get('missing'), None)
+
+        prefs.set('view', {'': (10, 20)})
+        assert_true(prefs.dirty)
+        assert_false(os.path.exists(prefs_path))
+        prefs.flush()
+        assert_false(prefs.dirty)
+        assert_equals(prefs.flushes, 1)
+
+        # Saving unchanged preferences does not require a flush:
+        prefs.set('view', {'': (10, 20)})
+        assert_false(prefs.dirty)
+
+        # Changes made by another process are merged when flushing:
+        other = UIPreferences(path=prefs_path, legacy_path=legacy_path)
+        other.set('other_view', {'': 3})
+        prefs.set('view', {'': (30, 40)})
+        other.flush()
+        os.utime(prefs_path, (0, 0))
+        prefs.flush()
+
+        prefs = UIPreferences(path=prefs_path, legacy_path=legacy_path)
+        assert_equals(prefs.get('old_view'), {'': (1, 2)})
+        assert_equals(prefs.get('view'), {'': (30, 40)})
+        assert_equals(prefs.get('other_view'), {'': 3})
+    finally:
+        shutil.rmtree(path)
+
+
+def test_ui_prefs_failed_flush():
+    path = tempfile.mkdtemp()
+    handler = trait_notifiers.ui_handler
+    trait_notifiers.ui_handler = lambda func, *args: func(*args)
+    try:
+        # The preferences file cannot be replaced if it is a directory:
+        prefs_path = os.path.join(path, 'prefs')
+        os.mkdir(prefs_path)
+        prefs = UIPreferences(path=prefs_path,
+                              legacy_path=os.path.join(path, 'legacy'))
+
+        # Without toolkit timers, the flush is left for later:
+        prefs.set('view', {'': (10, 20)})
+        assert_true(prefs.dirty)
+
+        prefs.flush()
+        assert_true(prefs.dirty)
+        assert_equals(prefs.flushes, 0)
+        assert_equals(os.listdir(path), ['prefs'])
+
+        # The unsaved changes are written by the next successful flush:
+        os.rmdir(prefs_path)
+        prefs.flush()
+        assert_false(prefs.dirty)
+        assert_equals(prefs.flushes, 1)
+        prefs = UIPreferences(path=prefs_path,
+                              legacy_path=os.path.join(path, 'legacy'))
+        assert_equals(prefs.get('view'), {'': (10, 20)})
+    finally:
+        trait_notifiers.ui_handler = handler
+        shutil.rmtree(path)
@@ -0,0 +1,72 @@
+from __future__ import absolute_import
+
+import json
+
+from nose.tools import assert_equals, assert_true
+
+from traits.api import HasTraits, Str
+
+from ..editor import Editor
+from ..editor_factory import EditorFactory
+from ..handler import Handler
+from ..item import Item
+from ..ui import UI
+from ..ui_profiler import (active_profiler, count_listeners, profile_call,
+    profile_ui)
+from ..view import View
+
+
+class Person(HasTraits):
+    name = Str
+
+
+class Dummy(Editor):
+    def init(self, parent):
+        self.control = object()
+
+    def update_editor(self):
+        pass
+
+
+def test_profile_editor_prepare():
+    person = Person()
+    ui = UI(view=View('name'), context={'object': person}, handler=Handler())
+    before = count_listeners(person)
+    editors = []
+    with profile_ui() as profiler:
+        for i in range(3):
+            editor = Dummy(None, ui=ui, object=person, name='name',
+                           factory=EditorFactory(), item=Item('name'))
+            editor.prepare(None)
+            editors.append(editor)
+    assert_true(active_profiler() is None)
+    assert_equals(count_listeners(person), before + 3)
+
+    for phase in ('Editor.prepare', 'Editor.init', 'Editor.update_editor'):
+        assert_equals(profiler.stats[(phase, 'Dummy')][0], 3)
+
+    report = json.loads(profiler.report_json())
+    assert_equals(report['phases']['Editor.init']['Dummy']['calls'], 3)
+    assert_true('Editor.prepare (Dummy)' in profiler.report_text())
+
+
+def test_profile_nested_calls():
+    def nested(n):
+        if n > 0:
+            profile_call('nested', '', nested, n - 1)
+
+    # Calls made while profiling is off are not recorded:
+    nested(2)
+    with profile_ui() as profiler:
+        profile_call('nested', '', nested, 2)
+    calls, own, total = profiler.stats[('nested', '')]
+    assert_equals(calls, 3)
+    assert_true(own <= total + 1e-6)
+
+
+def test_count_listeners_does_not_create_notifiers():
+    person = Person()
+    person.on_trait_change(lambda: None, 'name')
+    assert_equals(person._notifiers(False), None)
+    assert_equals(count_listeners(person), 1)
+    assert_equals(person._notifiers(False), None)
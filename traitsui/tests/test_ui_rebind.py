@@ -0,0 +1,81 @@
+from __future__ import absolute_import
+
+from thread import get_ident
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from traits import trait_notifiers
+from traits.api import Bool, HasTraits, List, Str
+
+from ..editor import Editor
+from ..editor_factory import EditorFactory
+from ..handler import Handler
+from ..item import Item
+from ..ui import UI
+from ..view import View
+
+
+class Person(HasTraits):
+    name = Str
+    flag = Bool(True)
+
+
+class Recorder(Editor):
+    rebindable = True
+    values = List
+
+    def init(self, parent):
+        self.control = object()
+
+    def update_editor(self):
+        self.values.append(self.value)
+
+
+def make_ui(object):
+    ui = UI(view=View('name'), context={'object': object}, handler=Handler())
+    ui.control = object
+    editor = Recorder(None, ui=ui, object=object, name='name',
+                      factory=EditorFactory(), item=Item('name'))
+    editor.prepare(None)
+    ui._editors.append(editor)
+    ui._hook_when()
+    ui.add_enabled('flag', editor)
+    return ui, editor
+
+
+def test_rebind():
+    first, second = Person(name='first'), Person(name='second', flag=False)
+    ui, editor = make_ui(first)
+    assert_true(editor.enabled)
+
+    assert_true(ui.rebind({'object': second}))
+    assert_true(editor.object is second)
+    assert_true(ui.context['object'] is second)
+    assert_equals(editor.values, ['first', 'second'])
+    assert_false(editor.enabled)
+
+    # The listeners have moved to the new object:
+    ui_thread = trait_notifiers.ui_thread
+    trait_notifiers.ui_thread = get_ident()
+    try:
+        first.name = 'changed'
+        first.flag = False
+        second.name = 'updated'
+        second.flag = True
+    finally:
+        trait_notifiers.ui_thread = ui_thread
+    assert_equals(editor.values, ['first', 'second', 'updated'])
+    assert_true(editor.enabled)
+
+
+def test_rebind_requires_same_classes():
+    class Other(HasTraits):
+        name = Str
+
+    ui, editor = make_ui(Person(name='first'))
+    assert_false(ui.rebind({'object': Other()}))
+    assert_false(ui.rebind({'object': Person(), 'extra': Person()}))
+
+    editor.rebindable = False
+    assert_false(ui.rebind({'object': Person()}))
+    assert_equals(editor.values, ['first'])
@@ -0,0 +1,109 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals, assert_false, assert_true
+
+from traits import trait_notifiers
+from traits.api import Bool, HasTraits, Instance, Int, Str
+
+from ..handler import Handler
+from ..ui import UI
+from ..view import View
+
+
+class Sub(HasTraits):
+    active = Bool(True)
+    label = Str
+
+
+class Model(HasTraits):
+    flag = Bool(True)
+    name = Str
+    sub = Instance(Sub, ())
+
+
+class Target(HasTraits):
+    enabled = Bool(True)
+
+
+class CountingUI(UI):
+    evaluations = Int
+
+    def _evaluate_condition(self, conditions):
+        self.evaluations += 1
+        super(CountingUI, self)._evaluate_condition(conditions)
+
+
+_ui_handler = None
+
+
+def setup():
+    # Dispatch the 'ui' change notifications synchronously:
+    global _ui_handler
+    _ui_handler = trait_notifiers.ui_handler
+    trait_notifiers.ui_handler = lambda func, *args: func(*args)
+
+
+def teardown():
+    trait_notifiers.ui_handler = _ui_handler
+
+
+def new_ui(model, when):
+    ui = CountingUI(view=View(), context={'object': model},
+                    handler=Handler())
+    target = Target()
+    ui._hook_when()
+    ui.add_enabled(when, target)
+    ui.evaluations = 0
+    return ui, target
+
+
+def test_when_only_reevaluated_for_referenced_traits():
+    model = Model()
+    ui, target = new_ui(model, 'flag')
+    assert_true(target.enabled)
+
+    model.name = 'changed'
+    model.sub.label = 'changed'
+    assert_equals(ui.evaluations, 0)
+
+    model.flag = False
+    assert_equals(ui.evaluations, 1)
+    assert_false(target.enabled)
+
+
+def test_when_sub_object_trait():
+    model = Model()
+    ui, target = new_ui(model, 'object.sub.active')
+    assert_true(target.enabled)
+
+    model.sub.active = False
+    assert_false(target.enabled)
+
+    model.sub.label = 'changed'
+    assert_equals(ui.evaluations, 1)
+
+    # Replacing the sub-object re-evaluates the condition and follows the
+    # new object:
+    old_sub = model.sub
+    model.sub = Sub()
+    assert_true(target.enabled)
+
+    old_sub.active = True
+    evaluations = ui.evaluations
+    model.sub.active = False
+    assert_false(target.enabled)
+    assert_equals(ui.evaluations, evaluations + 1)
+
+
+def test_when_unhooked_on_dispose():
+    model = Model()
+    ui, target = new_ui(model, 'flag and sub.active')
+    # Resetting the editors is the part of disposing of the UI which
+    # unhooks the conditions:
+    ui.reset(destroy=False)
+    assert_true(ui._when_listeners is None)
+
+    model.flag = False
+    model.sub.active = False
+    assert_true(target.enabled)
+    assert_equals(ui.evaluations, 0)
@@ -0,0 +1,167 @@
+from __future__ import absolute_import
+
+import numpy
+
+from nose.tools import assert_equals, assert_true
+
+from traits.api import Array, HasTraits, List, Str
+
+from ..undo import TextUndoItem, UndoHistory, UndoItem, make_delta
+
+
+class Document(HasTraits):
+    text = Str
+    values = Array
+    items = List
+
+
+def edit(history, document, name, value):
+    old = getattr(document, name)
+    setattr(document, name, value)
+    history.add(UndoItem(object=document, name=name, old_value=old,
+                         new_value=getattr(document, name)))
+
+
+def test_deltas():
+    text = 'abc' * 10000
+    changed = text[:100] + 'xyz' + text[101:]
+    delta = make_delta(text, changed)
+    assert_true(delta.size < 100)
+    assert_equals(delta.value(changed), text)
+
+    values = numpy.arange(100000.0)
+    changed = values.copy()
+    changed[10:20] = numpy.nan
+    delta = make_delta(values, changed)
+    assert_true(delta.size < values.nbytes / 100)
+    assert_equals(delta.value(changed).tolist(), values.tolist())
+
+    assert_equals(make_delta('small', 'smell'), None)
+    assert_equals(make_delta(text, text[::-1]), None)
+
+
+def test_history_stores_deltas():
+    document = Document(text='x' * 100000, values=numpy.zeros(100000),
+                        items=range(10000))
+    history = UndoHistory()
+    texts, arrays, lists = [document.text], [document.values], [document.items]
+    for i in range(20):
+        edit(history, document, 'text', texts[-1][:i] + 'y' + texts[-1][i:])
+        texts.append(document.text)
+        values = arrays[-1].copy()
+        values[i] = i + 1
+        edit(history, document, 'values', values)
+        arrays.append(document.values)
+        edit(history, document, 'items', lists[-1][:i] + lists[-1][i + 1:])
+        lists.append(document.items[:])
+
+    # Only the most recent value of each trait is stored whole:
+    assert_true(history.memory_size < 2 * (100000 + 800000 + 80000))
+
+    for i in range(19, -1, -1):
+        history.undo()
+        assert_equals(document.items, lists[i])
+        history.undo()
+        assert_equals(document.values.tolist(), arrays[i].tolist())
+        history.undo()
+        assert_equals(document.text, texts[i])
+
+    for i in range(1, 21):
+        history.redo()
+        history.redo()
+        history.redo()
+        assert_equals(document.text, texts[i])
+        assert_equals(document.values.tolist(), arrays[i].tolist())
+        assert_equals(document.items, lists[i])
+
+
+def test_history_memory_limit():
+    document = Document()
+    history = UndoHistory(max_memory=100000)
+    for i in range(20):
+        edit(history, document, 'text', str(i) * 20000)
+    assert_true(history.memory_size <= 100000)
+    assert_true(0 < len(history.history) < 20)
+
+    history = UndoHistory(max_memory=100000, spill=True)
+    for i in range(20):
+        edit(history, document, 'text', str(i) * 20000)
+    assert_equals(len(history.history), 20)
+    assert_true(history.memory_size <= 100000)
+    assert_true(history.spilled_size > 0)
+
+    # The spilled transactions are read back when they are undone:
+    while history.can_undo:
+        history.undo()
+    assert_equals(document.text, '19' * 20000)
+
+
+def test_truncate_unlinks_discarded_items():
+    document = Document(values=numpy.random.random(100000))
+    history = UndoHistory()
+    edit(history, document, 'values', numpy.random.random(100000))
+    edit(history, document, 'text', 'changed')
+    edit(history, document, 'values', numpy.random.random(100000))
+    first = history.history[0][0]
+    assert_true(first._next is history.history[2][0])
+
+    # Discarding the undone change stores its old value in the item it was
+    # linked to, and frees the new value only it stored:
+    history.undo()
+    edit(history, document, 'text', 'again')
+    assert_equals(len(history.history), 3)
+    assert_true(first._next is None)
+    assert_equals(first.new_value.tolist(), document.values.tolist())
+    assert_true(history.memory_size >= 2 * document.values.nbytes)
+    assert_true(history.memory_size < 3 * document.values.nbytes)
+
+
+def test_merge_single_character_edits():
+    document = Document(text='abc')
+    history = UndoHistory()
+    edit(history, document, 'text', 'abxc')
+    edit(history, document, 'text', 'abxyc')
+    edit(history, document, 'text', 'axyc')
+    assert_equals(len(history.history), 1)
+    edit(history, document, 'text', 'replaced')
+    assert_equals(len(history.history), 2)
+
+    history.undo()
+    history.undo()
+    assert_equals(document.text, 'abc')
+
+
+def text_edit(history, document, index, removed, added):
+    text = document.text
+    assert_equals(text[index:index + len(removed)], removed)
+    document.text = text[:index] + added + text[index + len(removed):]
+    history.add(TextUndoItem(object=document, name='text', index=index,
+                             removed=removed, added=added))
+
+
+def test_text_undo_items():
+    document = Document(text='hello world')
+    history = UndoHistory()
+
+    # Typing, deleting and replacing characters next to each other is merged
+    # into a single change:
+    text_edit(history, document, 5, '', ',')
+    text_edit(history, document, 6, '', '!')
+    text_edit(history, document, 6, '!', '')
+    text_edit(history, document, 4, 'o', '0')
+    text_edit(history, document, 3, 'l', '')
+    assert_equals(document.text, 'hel0, world')
+    assert_equals(len(history.history), 1)
+
+    # A change elsewhere is not merged:
+    text_edit(history, document, 8, 'r', 'R')
+    assert_equals(document.text, 'hel0, woRld')
+    assert_equals(len(history.history), 2)
+
+    history.undo()
+    assert_equals(document.text, 'hel0, world')
+    history.undo()
+    assert_equals(document.text, 'hello world')
+    history.redo()
+    history.redo()
+    assert_equals(document.text, 'hel0, woRld')
@@ -0,0 +1,98 @@
+from __future__ import absolute_import
+
+import threading
+
+from nose.tools import assert_equals
+
+from traits import trait_notifiers
+from traits.api import Any, Bool, HasTraits, Int, List
+
+from ..update_scheduler import UpdateScheduler
+
+
+class Recorder(HasTraits):
+    ui = Any(True)
+    updates = List
+    editor_updates = Int
+    _no_update = Bool(False)
+
+    def _update_editor(self, object, name, old, new):
+        self.updates.append((name, old, new))
+        if not self._no_update:
+            self.editor_updates += 1
+
+
+class Model(HasTraits):
+    count = Int
+
+
+def test_coalesced_background_updates():
+    queue = []
+    handler, thread = trait_notifiers.ui_handler, trait_notifiers.ui_thread
+    trait_notifiers.ui_handler = lambda func, *args: queue.append(
+        lambda: func(*args))
+    trait_notifiers.ui_thread = threading.current_thread().ident
+    try:
+        model = Model()
+        editor = Recorder()
+        scheduler = UpdateScheduler(interval=0.0)
+
+        def worker():
+            for i in range(1000):
+                scheduler.schedule(editor, model, 'count', i, i + 1)
+
+        background = threading.Thread(target=worker)
+        background.start()
+        background.join()
+
+        # A single flush was requested, which applies the last value once:
+        assert_equals(len(queue), 1)
+        queue.pop()()
+        assert_equals(editor.updates, [('count', 0, 1000)])
+        assert_equals((scheduler.scheduled, scheduler.merged,
+                       scheduler.flushes), (1000, 999, 1))
+
+        # Updates for disposed of editors are dropped:
+        editor.ui = None
+        background = threading.Thread(target=worker)
+        background.start()
+        background.join()
+        queue.pop()()
+        assert_equals(scheduler.dropped, 1)
+        assert_equals(len(editor.updates), 1)
+    finally:
+        trait_notifiers.ui_handler = handler
+        trait_notifiers.ui_thread = thread
+
+
+def test_deferred_updates_made_by_editor():
+    queue = []
+    handler = trait_notifiers.ui_handler
+    trait_notifiers.ui_handler = lambda func, *args: queue.append(
+        lambda: func(*args))
+    try:
+        model = Model()
+        editor = Recorder()
+        scheduler = UpdateScheduler(interval=0.0)
+
+        # Changes made by the editor itself are logged, but do not update the
+        # editor when the flush is deferred:
+        editor._no_update = True
+        scheduler.schedule(editor, model, 'count', 0, 1)
+        scheduler.schedule(editor, model, 'count', 1, 2)
+        editor._no_update = False
+        queue.pop()()
+        assert_equals(editor.updates, [('count', 0, 2)])
+        assert_equals(editor.editor_updates, 0)
+        assert_equals(editor._no_update, False)
+
+        # Unless any of the merged changes was made elsewhere:
+        editor._no_update = True
+        scheduler.schedule(editor, model, 'count', 2, 3)
+        editor._no_update = False
+        scheduler.schedule(editor, model, 'count', 3, 4)
+        queue.pop()()
+        assert_equals(editor.updates[-1], ('count', 2, 4))
+        assert_equals(editor.editor_updates, 1)
+    finally:
+        trait_notifiers.ui_handler = handler
@@ -0,0 +1,53 @@
+from __future__ import absolute_import
+
+from nose.tools import assert_equals, assert_true
+
+from traits.api import HasTraits, Int
+
+from ..value_tree import (DictNode, IntNode, ListNode, RangeNode, RootNode,
+    TraitsNode, node_type_for)
+
+
+class Point(HasTraits):
+    x = Int
+
+
+def test_node_type_for():
+    assert_true(node_type_for(True) is not IntNode)
+    assert_true(node_type_for(1) is IntNode)
+    assert_true(node_type_for([]) is ListNode)
+    assert_true(node_type_for(Point()) is TraitsNode)
+
+
+def test_large_list_is_grouped_into_ranges():
+    root = RootNode(value=range(2500000))
+    node, = root.tno_get_children(None)
+
+    ranges = node.tno_get_children(None)
+    assert_equals(len(ranges), 3)
+    assert_true(isinstance(ranges[0], RangeNode))
+    assert_equals(ranges[-1].tno_get_label(None), '[2000000..2499999]')
+
+    sub_ranges = ranges[-1].tno_get_children(None)
+    assert_equals(len(sub_ranges), 500)
+    children = sub_ranges[1].tno_get_children(None)
+    assert_equals(len(children), 1000)
+    assert_equals(children[0].tno_get_label(None), '[2001000]: 2001000')
+
+
+def test_dict_children():
+    node = DictNode(value=dict((i, str(i)) for i in range(1500)))
+    ranges = node.tno_get_children(None)
+    assert_equals([r.tno_get_label(None) for r in ranges],
+                  ['[0..999]', '[1000..1499]'])
+    assert_equals(ranges[1].tno_get_children(None)[0].tno_get_label(None),
+                  "[1000]: '1000' [4]")
+
+
+def test_dict_keys_deleted_before_range_opened():
+    value = dict((i, str(i)) for i in range(1500))
+    node = DictNode(value=value)
+    ranges = node.tno_get_children(None)
+    del value[1000]
+    assert_equals(ranges[1].tno_get_children(None)[0].tno_get_label(None),
+                  "[1000]: '1000' [4]")
@@ -98,6 +98,11 @@ class TreeNode ( HasPrivateTraits ):
     # List of object interfaces that the node applies to
     node_for_interface = Property( depends_on = 'node_for' )
 
+    # Does whether the node applies to an object depend only on the object's
+    # class (so the tree editor can cache the result for each class)? The
+    # default is True unless a subclass overrides 'is_node_for':
+    type_only = Bool
+
     # Function for formatting the label
     formatter = Callable
 
@@ -148,6 +153,12 @@ class TreeNode ( HasPrivateTraits ):
         if self.icon_path == '':
             self.icon_path = get_resource_path()
 
+    #-- Default Value Implementations ------------------------------------------
+
+    def _type_only_default ( self ):
+        return (self.__class__.is_node_for.im_func is
+                TreeNode.is_node_for.im_func)
+
     #-- Property Implementations -----------------------------------------------
 
     @cached_property
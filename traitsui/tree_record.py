@@ -0,0 +1,245 @@
+#-------------------------------------------------------------------------------
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#-------------------------------------------------------------------------------
+
+""" Defines the TreeRecord class, the compact record kept for each node shown
+    by a model/view based tree editor.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from bisect import bisect_left
+
+#-------------------------------------------------------------------------------
+#  'TreeRecord' class:
+#-------------------------------------------------------------------------------
+
+class TreeRecord ( object ):
+    """ The record kept for each node shown by a model/view based tree editor.
+
+        Each record knows its parent and its row within the parent, so the
+        model index of a record (and the record's removal) does not require
+        searching its siblings. The rows of the children following an inserted
+        or removed child are only renumbered when one of them is needed.
+
+        The children of a record are fetched in batches: **expand** takes a
+        snapshot of the node's children, and **fetch** returns the next batch
+        of child objects to create records for. Child objects which no
+        TreeNode matches have no record, so the record also maps the index of
+        each child object onto the row of its record.
+    """
+
+    __slots__ = ( 'parent', 'node', 'object', 'expanded', 'editable',
+                  'children', '_row', '_renumber_from', '_pending', '_next',
+                  '_skipped' )
+
+    def __init__ ( self, parent = None, node = None, object = None ):
+        # The parent record (None for the root, or a removed record):
+        self.parent = parent
+
+        # The TreeNode and object the record is for:
+        self.node   = node
+        self.object = object
+
+        # Have the node's children been requested (i.e. is **fetch** valid)?
+        self.expanded = False
+
+        # Can the node's label be edited?
+        self.editable = False
+
+        # The records for the children fetched so far:
+        self.children = []
+
+        # The row of the record within its parent (valid unless it is at or
+        # after the parent's '_renumber_from' index):
+        self._row = 0
+
+        # The index of the first child whose '_row' may be out of date:
+        self._renumber_from = 0
+
+        # The snapshot of the child objects, and the index of the next child
+        # to fetch:
+        self._pending = None
+        self._next    = 0
+
+        # The sorted indices of the fetched child objects which have no record
+        # (None if there are none):
+        self._skipped = None
+
+    #---------------------------------------------------------------------------
+    #  Returns the row of the record within its parent:
+    #---------------------------------------------------------------------------
+
+    @property
+    def row ( self ):
+        """ The row of the record within its parent.
+        """
+        parent = self.parent
+        if parent is None:
+            return 0
+
+        if self._row >= parent._renumber_from:
+            children = parent.children
+            for i in xrange( parent._renumber_from, len( children ) ):
+                children[ i ]._row = i
+            parent._renumber_from = len( children )
+
+        return self._row
+
+    #---------------------------------------------------------------------------
+    #  Inserts child records:
+    #---------------------------------------------------------------------------
+
+    def insert ( self, index, records ):
+        """ Inserts child records at the specified index.
+        """
+        for i, record in enumerate( records ):
+            record.parent = self
+            record._row   = index + i
+
+        self.children[ index: index ] = records
+        self._renumber_from = min( self._renumber_from, index )
+
+    #---------------------------------------------------------------------------
+    #  Removes child records:
+    #---------------------------------------------------------------------------
+
+    def remove ( self, start, end ):
+        """ Removes and returns the child records from **start** to **end**.
+        """
+        records = self.children[ start: end ]
+        del self.children[ start: end ]
+        self._renumber_from = min( self._renumber_from, start )
+        for record in records:
+            record.parent = None
+
+        return records
+
+    #---------------------------------------------------------------------------
+    #  Returns the record and all of its descendants:
+    #---------------------------------------------------------------------------
+
+    def walk ( self ):
+        """ Returns the record and all of the records below it.
+        """
+        records = [ self ]
+        i       = 0
+        while i < len( records ):
+            records.extend( records[ i ].children )
+            i += 1
+
+        return records
+
+    #---------------------------------------------------------------------------
+    #  Fetching children:
+    #---------------------------------------------------------------------------
+
+    def expand ( self, children ):
+        """ Records the child objects of the node, which are then returned by
+            **fetch** in batches. Any child records must have been removed.
+        """
+        self.expanded = True
+        self._pending = list( children )
+        self._next    = len( self.children )
+        self._skipped = None
+
+    def can_fetch ( self ):
+        """ Returns whether there are child objects which have not been
+            fetched yet.
+        """
+        return ((self._pending is not None) and
+                (self._next < len( self._pending )))
+
+    def fetch ( self, count, node_for ):
+        """ Returns the ( object, node ) pairs to create records for from the
+            next **count** child objects, where **node_for** returns the
+            ( object, node ) pair for a child object. Child objects whose node
+            is None are skipped.
+        """
+        if self._pending is None:
+            return []
+
+        start      = self._next
+        self._next = min( start + count, len( self._pending ) )
+        objects    = self._pending[ start: self._next ]
+        if self._next >= len( self._pending ):
+            self._pending = None
+
+        return self._match( start, objects, node_for )
+
+    def pend ( self, object ):
+        """ Adds an object to the child objects still to be fetched. Returns
+            False if all of the children have already been fetched.
+        """
+        if not self.can_fetch():
+            return False
+
+        self._pending.append( object )
+
+        return True
+
+    #---------------------------------------------------------------------------
+    #  Mapping child objects onto rows:
+    #---------------------------------------------------------------------------
+
+    def row_for ( self, index ):
+        """ Returns the row of the first record at or after the child object
+            with the specified index.
+        """
+        if self._skipped is None:
+            return index
+
+        return index - bisect_left( self._skipped, index )
+
+    def replace ( self, start, end, added, node_for ):
+        """ Records that the child objects from **start** to **end** have been
+            replaced by the **added** objects, once all of the children have
+            been fetched. Returns the rows from **start** to **end** of the
+            records to remove, and the ( object, node ) pairs to insert
+            records for at the start row (see **fetch**).
+        """
+        row_start, row_end = self.row_for( start ), self.row_for( end )
+        skipped            = self._skipped
+        if skipped is not None:
+            # Renumber the skipped children after the replaced ones:
+            delta = len( added ) - (end - start)
+            lo    = bisect_left( skipped, start )
+            hi    = bisect_left( skipped, end )
+            skipped[ lo: ] = [ index + delta for index in skipped[ hi: ] ]
+
+        return ( row_start, row_end, self._match( start, added, node_for ) )
+
+    def _match ( self, start, objects, node_for ):
+        """ Returns the ( object, node ) pairs for the child objects starting
+            at index **start** which a node matches, and records the indices
+            of those which no node matches.
+        """
+        pairs   = []
+        skipped = []
+        for i, object in enumerate( objects ):
+            object, node = node_for( object )
+            if node is None:
+                skipped.append( start + i )
+            else:
+                pairs.append( ( object, node ) )
+
+        if len( skipped ) > 0:
+            if self._skipped is None:
+                self._skipped = []
+
+            lo = bisect_left( self._skipped, start )
+            self._skipped[ lo: lo ] = skipped
+
+        return pairs
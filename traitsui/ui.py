@@ -28,11 +28,11 @@ from __future__ import absolute_import
 import shelve
 import os
 
-from traits.api import (Any, Bool, Callable, DictStrAny, Event, HasPrivateTraits,
-    Instance, Int, List, Property, Str, TraitError, on_trait_change,
-    property_depends_on)
+from traits.api import (Any, Bool, Callable, Constant, DictStrAny, Event,
+    HasPrivateTraits, HasTraits, Instance, Int, List, Property, Str,
+    TraitError, on_trait_change, property_depends_on)
 
-from traits.trait_base import traits_home, is_str
+from traits.trait_base import traits_home, is_str, Missing
 
 from .editor import Editor
 
@@ -44,10 +44,21 @@ from .toolkit import toolkit
 
 from .ui_info import UIInfo
 
+from .update_scheduler import UpdateScheduler
+
+from .layout_cache import layout_cache
+
+from .ui_profiler import (active_profiler, count_listeners, profile_call,
+    profiled)
+
+from .ui_prefs import ui_prefs
+
 from .item import Item
 
 from .group import Group, ShadowGroup
 
+from .helper import code_names
+
 #-------------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------------
@@ -55,6 +66,9 @@ from .group import Group, ShadowGroup
 # List of **kind** types for views that must have a **parent** window specified
 kind_must_have_parent = ( 'panel', 'subpanel' )
 
+# The compiled code of each expression evaluated by 'eval_when':
+compiled_when = {}
+
 #-------------------------------------------------------------------------------
 #  'UI' class:
 #-------------------------------------------------------------------------------
@@ -124,6 +138,10 @@ class UI ( HasPrivateTraits ):
     # The code used to rebuild an updated user interface
     rebuild = Callable
 
+    # The scheduler used to coalesce the updates of editors whose Item (or
+    # View) requests coalesced updates:
+    update_scheduler = Property # Instance( UpdateScheduler )
+
     #-- Private Traits ---------------------------------------------------------
 
     # Original context when used with a modal dialog
@@ -132,18 +150,27 @@ class UI ( HasPrivateTraits ):
     # Copy of original context used for reverting changes
     _revert = DictStrAny
 
+    # The (lazily created) update scheduler:
+    _update_scheduler = Any
+
     # List of methods to call once the user interface is created
     _defined = List
 
-    # List of (visible_when,Editor) pairs
+    # List of 'visible_when' WhenCondition objects
     _visible = List
 
-    # List of (enabled_when,Editor) pairs
+    # List of 'enabled_when' WhenCondition objects
     _enabled = List
 
-    # List of (checked_when,Editor) pairs
+    # List of 'checked_when' WhenCondition objects
     _checked = List
 
+    # Mapping from ( id( object ), trait name ) keys to the WhenListener
+    # objects re-evaluating the conditions depending upon each (possibly
+    # extended) context object trait name (a None trait name listens to any
+    # trait of the object)
+    _when_listeners = Any
+
     # Search stack used while building a user interface
     _search = List
 
@@ -163,6 +190,17 @@ class UI ( HasPrivateTraits ):
     _groups = Property
     _groups_cache = Any
 
+    # The cached layout plan the top-level groups were taken from (if any)
+    _layout_plan = Any
+
+    # The 'defined_when' conditions evaluated (and their results) while
+    # resolving the top-level groups for the layout cache
+    _layout_conditions = Any
+
+    # Was an Include resolved by calling a handler or object method while
+    # resolving the top-level groups?
+    _dynamic_layout = Bool( False )
+
     # Count of levels of nesting for undoable actions
     _undoable = Int( -1 )
 
@@ -183,14 +221,14 @@ class UI ( HasPrivateTraits ):
     recyclable_traits = [
         '_context', '_revert', '_defined', '_visible', '_enabled', '_checked',
         '_search', '_dispatchers', '_editors', '_names', '_active_group',
-        '_undoable', '_rebuild', '_groups_cache'
+        '_undoable', '_rebuild', '_groups_cache', '_layout_plan'
     ]
 
     # List of additional traits that are discarded when a user interface is
     # disposed.
     disposable_traits = [
         'view_elements', 'info', 'handler', 'context', 'view', 'history',
-        'key_bindings', 'icon', 'rebuild',
+        'key_bindings', 'icon', 'rebuild', '_update_scheduler',
     ]
 
     #---------------------------------------------------------------------------
@@ -207,6 +245,7 @@ class UI ( HasPrivateTraits ):
     #  Creates a user interface from the associated View template object:
     #---------------------------------------------------------------------------
 
+    @profiled( 'UI.ui' )
     def ui ( self, parent, kind ):
         """ Creates a user interface from the associated View template object.
         """
@@ -217,6 +256,13 @@ class UI ( HasPrivateTraits ):
         self.rebuild = getattr( toolkit(), 'ui_' + kind )
         self.rebuild( self, parent )
 
+        # Record the number of trait listeners on the context objects:
+        profiler = active_profiler()
+        if profiler is not None:
+            for object in self.context.itervalues():
+                profiler.count( 'trait listeners', object.__class__.__name__,
+                                count_listeners( object ) )
+
     #---------------------------------------------------------------------------
     #  Disposes of the contents of a user interface:
     #---------------------------------------------------------------------------
@@ -252,6 +298,117 @@ class UI ( HasPrivateTraits ):
         # Reset all recyclable traits:
         self.reset_traits( self.recyclable_traits )
 
+    #---------------------------------------------------------------------------
+    #  Rebinds the user interface to the objects in a new context:
+    #---------------------------------------------------------------------------
+
+    def rebind ( self, context ):
+        """ Rebinds the user interface to the objects in a new context,
+            reusing its editors and their controls instead of rebuilding them.
+
+            The new context must bind the same names as the current one, to
+            objects of the same classes. Returns True if the user interface was
+            rebound, or False (leaving it unchanged) if it cannot be rebound,
+            in which case it should be rebuilt.
+        """
+        old_context = self.context
+        if ((self.control is None) or
+            (sorted( context.keys() ) != sorted( old_context.keys() ))):
+            return False
+
+        for name, value in old_context.items():
+            if ((value is self.handler) or
+                (type( context[ name ] ) is not type( value ))):
+                return False
+
+        for editor in self._editors:
+            if not editor.rebindable:
+                return False
+
+        # Move the editors' and our own listeners off the current objects:
+        for editor in self._editors:
+            editor.unbind()
+
+        for dispatcher in self._dispatchers:
+            dispatcher.remove()
+
+        for object, handler, name in self._statusbar:
+            object.on_trait_change( handler, name, remove = True )
+
+        self._unhook_when()
+
+        # Update the context in place, so that everything referring to it sees
+        # the new objects:
+        names = dict( [ ( id( value ), name )
+                        for name, value in old_context.items() ] )
+        old_context.clear()
+        old_context.update( context )
+
+        info = self.info
+        for name, value in context.items():
+            if info.trait( name ) is not None:
+                info.add_trait( name, Constant( value ) )
+
+        if self.key_bindings is not None:
+            self.key_bindings.controllers = context.values()
+
+        # Then move all of the listeners onto the new objects:
+        self._statusbar = [ ( context[ names[ id( object ) ] ], handler, name )
+                            for object, handler, name in self._statusbar ]
+        for object, handler, name in self._statusbar:
+            object.on_trait_change( handler, name, dispatch = 'ui' )
+
+        dispatchers, self._dispatchers = self._dispatchers, []
+        for dispatcher in dispatchers:
+            object = context[ names[ id( dispatcher.object ) ] ]
+            name   = dispatcher.method_name
+            self._dispatchers.append( Dispatcher( dispatcher.method, info,
+                                                  object, name ) )
+            if object.base_trait( name ).type != 'event':
+                dispatcher.method( info )
+
+        for editor in self._editors:
+            editor.rebind()
+
+        self._hook_when()
+        self._evaluate_when()
+
+        return True
+
+    #---------------------------------------------------------------------------
+    #  Disposes of some of the editors of the user interface:
+    #---------------------------------------------------------------------------
+
+    def dispose_editors ( self, editors ):
+        """ Disposes of some of the editors of the user interface (such as
+            those on a notebook page which is no longer needed), removing them
+            and any conditions controlling them from the user interface.
+        """
+        ids = set()
+        for editor in editors:
+            # Each editor is only disposed of once, even if listed repeatedly:
+            if id( editor ) not in ids:
+                ids.add( id( editor ) )
+                editor.dispose()
+
+        self._editors = [ editor for editor in self._editors
+                          if id( editor ) not in ids ]
+
+        # Unbind the names referring to the editors:
+        info = self.info
+        for name in self._names[:]:
+            if id( getattr( info, name, None ) ) in ids:
+                info.remove_trait( name )
+                self._names.remove( name )
+
+        # Stop monitoring the conditions controlling the editors:
+        for conditions in ( self._visible, self._enabled, self._checked ):
+            conditions[:] = [ condition for condition in conditions
+                              if id( condition.editor ) not in ids ]
+
+        if self._when_listeners is not None:
+            self._hook_when()
+
     #---------------------------------------------------------------------------
     #  Finishes a user interface:
     #---------------------------------------------------------------------------
@@ -262,11 +419,6 @@ class UI ( HasPrivateTraits ):
         # Reset the contents of the user interface:
         self.reset( destroy = False )
 
-        # Make sure that 'visible', 'enabled', and 'checked' handlers are not
-        # called after the editor has been disposed:
-        for object in self.context.values():
-            object.on_trait_change( self._evaluate_when, remove = True )
-
         # Notify the handler that the view has been closed:
         self.handler.closed( self.info, self.result )
 
@@ -312,12 +464,20 @@ class UI ( HasPrivateTraits ):
 
         del self._statusbar[:]
 
+        # Discard any editor updates that have not been applied yet:
+        if self._update_scheduler is not None:
+            self._update_scheduler.discard()
+
         if destroy:
             toolkit().destroy_children( self.control )
 
         for dispatcher in self._dispatchers:
             dispatcher.remove()
 
+        # Make sure that 'visible', 'enabled', and 'checked' handlers are not
+        # called after the editors have been disposed:
+        self._unhook_when()
+
     #---------------------------------------------------------------------------
     #  Find the definition of the specified Include object in the current user
     #  interface building context:
@@ -356,11 +516,13 @@ class UI ( HasPrivateTraits ):
                 method = getattr( handler, include.id, None )
                 if callable( method ):
                     result = method()
+                    self._dynamic_layout = True
 
             if (result is None) and (object is not None):
                 method = getattr( object, include.id, None )
                 if callable( method ):
                     result = method()
+                    self._dynamic_layout = True
 
         return result
 
@@ -386,6 +548,7 @@ class UI ( HasPrivateTraits ):
     #  Performs all post user interface creation processing:
     #---------------------------------------------------------------------------
 
+    @profiled( 'UI.prepare_ui' )
     def prepare_ui ( self ):
         """ Performs all processing that occurs after the user interface is
             created.
@@ -410,7 +573,7 @@ class UI ( HasPrivateTraits ):
             toolkit().hook_events( self, self.control )
 
         # Invoke the handler's 'init' method, and abort if it indicates failure:
-        if handler.init( info ) == False:
+        if profile_call( 'Handler.init', handler, handler.init, info ) == False:
             raise TraitError, 'User interface creation aborted'
 
         # For each Handler method whose name is of the form
@@ -432,21 +595,19 @@ class UI ( HasPrivateTraits ):
                         self._dispatchers.append( Dispatcher(
                              method, info, object, trait_name ) )
                         if object.base_trait( trait_name ).type != 'event':
-                            method( info )
+                            profile_call( 'Handler._changed', name, method,
+                                          info )
 
         # If there are any Editor object's whose 'visible', 'enabled' or
         # 'checked' state is controlled by a 'visible_when', 'enabled_when' or
-        # 'checked_when' expression, set up an 'anytrait' changed notification
-        # handler on each object in the 'context' that will cause the 'visible',
-        # 'enabled' or 'checked' state of each affected Editor to be set. Also
-        # trigger the evaluation immediately, so the visible, enabled or checked
-        # state of each Editor can be correctly initialized:
-        if (len( self._visible ) +
-            len( self._enabled ) +
-            len( self._checked )) > 0:
-            for object in context.values():
-                object.on_trait_change( self._evaluate_when, dispatch = 'ui' )
-            self._evaluate_when()
+        # 'checked_when' expression, set up changed notification handlers for
+        # the traits of the objects in the 'context' that each expression
+        # references, so that only the expressions depending upon a changed
+        # trait are re-evaluated. Also trigger the evaluation immediately, so
+        # the visible, enabled or checked state of each Editor can be
+        # correctly initialized:
+        self._hook_when()
+        self._evaluate_when()
 
         # Indicate that the user interface has been initialized:
         info.initialized = True
@@ -515,14 +676,10 @@ class UI ( HasPrivateTraits ):
         """
         id = self.id
         if id != '':
-            db = self.get_ui_db()
-            if db is not None:
-                try:
-                    ui_prefs = db.get( id )
-                    db.close()
-                    return self.set_prefs( ui_prefs )
-                except:
-                    pass
+            try:
+                return self.set_prefs( ui_prefs.get( id ) )
+            except:
+                pass
 
         return None
 
@@ -564,10 +721,7 @@ class UI ( HasPrivateTraits ):
 
         id = self.id
         if id != '':
-            db = self.get_ui_db( mode = 'c' )
-            if db is not None:
-                db[ id ] = self.get_prefs( prefs )
-                db.close()
+            ui_prefs.set( id, self.get_prefs( prefs ) )
 
     #---------------------------------------------------------------------------
     #  Gets the preferences to be saved for the user interface:
@@ -598,7 +752,9 @@ class UI ( HasPrivateTraits ):
     #---------------------------------------------------------------------------
 
     def get_ui_db ( self, mode = 'r' ):
-        """ Returns a reference to the Traits UI preference database.
+        """ Returns a reference to the Traits UI preference database used by
+            earlier versions. The preferences are now kept by
+            **traitsui.ui_prefs.ui_prefs**, which imports this database.
         """
         try:
             return shelve.open( os.path.join( traits_home(), 'traits_ui' ),
@@ -654,12 +810,7 @@ class UI ( HasPrivateTraits ):
         """ Adds a conditionally enabled Editor object to the list of monitored
             'visible_when' objects.
         """
-        try:
-            self._visible.append( ( compile( visible_when, '<string>', 'eval' ),
-                                    editor ) )
-        except:
-            pass
-            # fixme: Log an error here...
+        self._add_condition( self._visible, visible_when, editor, 'visible' )
 
     #---------------------------------------------------------------------------
     #  Add's a conditionally enabled Editor object to the list of monitored
@@ -670,12 +821,7 @@ class UI ( HasPrivateTraits ):
         """ Adds a conditionally enabled Editor object to the list of monitored
             'enabled_when' objects.
         """
-        try:
-            self._enabled.append( ( compile( enabled_when, '<string>', 'eval' ),
-                                    editor ) )
-        except:
-            pass
-            # fixme: Log an error here...
+        self._add_condition( self._enabled, enabled_when, editor, 'enabled' )
 
     #---------------------------------------------------------------------------
     #  Add's a conditionally checked (menu/toolbar) Editor object to the list of
@@ -686,12 +832,7 @@ class UI ( HasPrivateTraits ):
         """ Adds a conditionally enabled (menu) Editor object to the list of
             monitored 'checked_when' objects.
         """
-        try:
-            self._checked.append( ( compile( checked_when, '<string>', 'eval' ),
-                                    editor ) )
-        except:
-            pass
-            # fixme: Log an error here...
+        self._add_condition( self._checked, checked_when, editor, 'checked' )
 
     #---------------------------------------------------------------------------
     #  Performs an 'undoable' action:
@@ -767,7 +908,11 @@ class UI ( HasPrivateTraits ):
         """
         context = self._get_context( self.context )
         try:
-            result = eval( when, globals(), context )
+            code = compiled_when.get( when )
+            if code is None:
+                code = compiled_when[ when ] = compile( when, '<string>',
+                                                        'eval' )
+            result = eval( code, globals(), context )
         except:
             # fixme: Should the exception be logged somewhere?
             pass
@@ -776,6 +921,65 @@ class UI ( HasPrivateTraits ):
 
         return result
 
+    #---------------------------------------------------------------------------
+    #  Evaluates a 'defined_when' expression:
+    #---------------------------------------------------------------------------
+
+    def eval_defined_when ( self, when ):
+        """ Evaluates a **defined_when** expression while resolving the
+            layout of the view, recording the result for the layout cache.
+        """
+        result = bool( self.eval_when( when ) )
+        if self._layout_conditions is not None:
+            self._layout_conditions.append( ( when, result ) )
+
+        return result
+
+    #---------------------------------------------------------------------------
+    #  Returns the editor factory to use for an Item:
+    #---------------------------------------------------------------------------
+
+    def get_editor_factory ( self, item, trait ):
+        """ Returns the editor factory to use for an Item which edits a
+            specified trait. The choice is remembered by the layout plan the
+            Item came from (if any).
+        """
+        plan   = self._layout_plan
+        choice = None
+        if plan is not None:
+            choice = plan.factories.get( id( item ) )
+
+        if (choice is not None) and (choice[0] is trait):
+            editor_factory = choice[1]
+        else:
+            editor_factory = item.editor
+            if editor_factory is None:
+                editor_factory = trait.get_editor()
+
+                # If still no editor factory found, use a default text editor:
+                if editor_factory is None:
+                    from .editors.text_editor import ToolkitEditorFactory
+                    editor_factory = ToolkitEditorFactory()
+
+            if plan is not None:
+                plan.factories[ id( item ) ] = ( trait, editor_factory )
+
+        if item.editor is None:
+            # If the item has formatting traits set them in the editor
+            # factory:
+            if item.format_func is not None:
+                editor_factory.format_func = item.format_func
+
+            if item.format_str != '':
+                editor_factory.format_str = item.format_str
+
+            # If the item has an invalid state extended trait name, set it in
+            # the editor factory:
+            if item.invalid != '':
+                editor_factory.invalid = item.invalid
+
+        return editor_factory
+
     #---------------------------------------------------------------------------
     #  Gets the context to use for evaluating an expression:
     #---------------------------------------------------------------------------
@@ -792,13 +996,7 @@ class UI ( HasPrivateTraits ):
         elif n == 1:
             name = context.keys()[0]
 
-        value = context.get( name )
-        if value is not None:
-            context2 = value.trait_get()
-            context2.update( context )
-        else:
-            context2 = context.copy()
-
+        context2       = ContextDict( context, context.get( name ) )
         context2['ui'] = self
 
         return context2
@@ -814,30 +1012,157 @@ class UI ( HasPrivateTraits ):
             controlled by a 'visible_when', 'enabled_when' or 'checked_when'
             expression.
         """
-        self._evaluate_condition( self._visible, 'visible' )
-        self._evaluate_condition( self._enabled, 'enabled' )
-        self._evaluate_condition( self._checked, 'checked' )
+        self._evaluate_condition( self._visible )
+        self._evaluate_condition( self._enabled )
+        self._evaluate_condition( self._checked )
 
     #---------------------------------------------------------------------------
-    #  Evaluates a list of ( eval, editor ) pairs and sets a specified trait on
-    #  each editor to reflect the boolean truth of the expression evaluated:
+    #  Evaluates a list of WhenCondition objects and sets the trait each one
+    #  controls on its editor to reflect the boolean truth of its expression:
     #---------------------------------------------------------------------------
 
-    def _evaluate_condition ( self, conditions, trait ):
-        """ Evaluates a list of (eval,editor) pairs and sets a specified trait
-        on each editor to reflect the Boolean value of the expression.
+    def _evaluate_condition ( self, conditions ):
+        """ Evaluates a list of WhenCondition objects and sets the trait each
+            one controls on its editor to reflect the Boolean value of its
+            expression, whenever that value changes.
         """
         context = self._get_context( self.context )
-        for when, editor in conditions:
+        for condition in conditions:
             value = True
             try:
-                if not eval( when, globals(), context ):
+                if not eval( condition.when, globals(), context ):
                     value = False
             except:
                 # fixme: Should the exception be logged somewhere?
                 pass
 
-            setattr( editor, trait, value )
+            if value is not condition.value:
+                condition.value = value
+                setattr( condition.editor, condition.trait, value )
+
+    #---------------------------------------------------------------------------
+    #  Adds a 'visible_when', 'enabled_when' or 'checked_when' expression
+    #  controlling an Editor to a specified list of conditions:
+    #---------------------------------------------------------------------------
+
+    def _add_condition ( self, conditions, when, editor, trait ):
+        """ Adds a condition controlling the specified *trait* of an editor to
+            a list of conditions. If the user interface has already been
+            prepared, the condition is monitored and evaluated immediately.
+        """
+        try:
+            condition = WhenCondition( compile( when, '<string>', 'eval' ),
+                                       editor, trait )
+        except:
+            return
+            # fixme: Log an error here...
+
+        conditions.append( condition )
+        if self._when_listeners is not None:
+            self._hook_condition( condition )
+            self._evaluate_condition( [ condition ] )
+
+    #---------------------------------------------------------------------------
+    #  Sets up the change notification handlers needed to re-evaluate a
+    #  condition:
+    #---------------------------------------------------------------------------
+
+    def _hook_condition ( self, condition ):
+        """ Sets up the change notification handlers needed to re-evaluate a
+            condition whenever a context object trait it depends upon changes.
+        """
+        objects      = self.context.values()
+        dependencies = []
+        for object in objects:
+            names = self._when_names( object, condition.names )
+            if names is None:
+                dependencies = [ ( object, None ) for object in objects ]
+                break
+
+            dependencies.extend( [ ( object, name ) for name in names ] )
+
+        for object, name in dependencies:
+            key      = ( id( object ), name )
+            listener = self._when_listeners.get( key )
+            if listener is None:
+                listener = self._when_listeners[ key ] = WhenListener(
+                                                     self, object, name )
+            listener.conditions.append( condition )
+
+    #---------------------------------------------------------------------------
+    #  Returns the trait names of an object a condition depends upon:
+    #---------------------------------------------------------------------------
+
+    def _when_names ( self, object, names, prefix = '', visited = None ):
+        """ Returns the (possibly extended) names of the traits of an object
+            which a condition referencing a set of names depends upon,
+            following the traits whose values are HasTraits objects (e.g. for
+            'object.sub.trait'). Returns None if the condition may depend
+            upon any trait of the object.
+        """
+        if visited is None:
+            visited = set()
+        visited.add( id( object ) )
+
+        result = []
+        for name in names:
+            trait = object.trait( name )
+            if trait is None:
+                if hasattr( object.__class__, name ):
+                    # The expression uses a method or plain attribute
+                    # whose result may depend upon any trait:
+                    return None
+            elif trait.type == 'property':
+                if trait.depends_on is None:
+                    # Changes to the property are never notified:
+                    return None
+
+                result.append( prefix + name )
+            else:
+                result.append( prefix + name )
+                if getattr( trait.handler, 'has_items', False ):
+                    result.append( prefix + name + '_items' )
+
+                value = getattr( object, name, None )
+                if (isinstance( value, HasTraits ) and
+                    (id( value ) not in visited)):
+                    sub_names = self._when_names( value, names,
+                                                  prefix + name + '.', visited )
+                    if sub_names is None:
+                        sub_names = [ prefix + name + '.-' ]
+                    result.extend( sub_names )
+
+        return result
+
+    #---------------------------------------------------------------------------
+    #  Sets up the change notification handlers needed to re-evaluate all of
+    #  the conditions:
+    #---------------------------------------------------------------------------
+
+    def _hook_when ( self ):
+        """ Sets up the change notification handlers needed to re-evaluate
+            all of the 'visible_when', 'enabled_when' and 'checked_when'
+            conditions.
+        """
+        self._unhook_when()
+        self._when_listeners = {}
+        for condition in (self._visible + self._enabled + self._checked):
+            self._hook_condition( condition )
+
+    #---------------------------------------------------------------------------
+    #  Removes the change notification handlers used to re-evaluate the
+    #  conditions:
+    #---------------------------------------------------------------------------
+
+    def _unhook_when ( self ):
+        """ Removes the change notification handlers used to re-evaluate the
+            'visible_when', 'enabled_when' and 'checked_when' conditions.
+        """
+        if self._when_listeners is not None:
+            for listener in self._when_listeners.values():
+                listener.remove()
+
+        self._when_listeners = None
 
     #---------------------------------------------------------------------------
     #  Implementation of the '_groups' property:
@@ -849,18 +1174,22 @@ class UI ( HasPrivateTraits ):
         Includes. (Implements the **_groups** property.)
         """
         if self._groups_cache is None:
-            shadow_group       = self.view.content.get_shadow( self )
-            self._groups_cache = shadow_group.get_content()
-            for item in self._groups_cache:
-                if isinstance( item, Item ):
-                    self._groups_cache = [
-                        ShadowGroup( shadow  = Group( *self._groups_cache ),
-                                     content = self._groups_cache,
-                                     groups  = 1 )
-                    ]
-                    break
+            self._groups_cache = layout_cache.groups_for( self )
         return self._groups_cache
 
+    def _resolve_groups ( self ):
+        """ Returns the top-level Groups for the view, resolving its
+            Includes and 'defined_when' conditions.
+        """
+        shadow_group = self.view.content.get_shadow( self )
+        groups       = shadow_group.get_content()
+        for item in groups:
+            if isinstance( item, Item ):
+                return [ ShadowGroup( shadow  = Group( *groups ),
+                                      content = groups,
+                                      groups  = 1 ) ]
+        return groups
+
     #-- Property Implementations -----------------------------------------------
 
     @property_depends_on( 'view, context' )
@@ -879,6 +1208,15 @@ class UI ( HasPrivateTraits ):
 
         return key_bindings.clone( controllers = values )
 
+    def _get_update_scheduler ( self ):
+        if self._update_scheduler is None:
+            interval = 1.0 / 60.0
+            if self.view is not None:
+                interval = self.view.update_interval
+            self._update_scheduler = UpdateScheduler( interval = interval )
+
+        return self._update_scheduler
+
     #-- Traits Event Handlers --------------------------------------------------
 
     def _updated_changed ( self ):
@@ -944,3 +1282,105 @@ class Dispatcher ( object ):
         self.object.on_trait_change( self.dispatch, self.method_name,
                                      remove = True )
 
+#-------------------------------------------------------------------------------
+#  'WhenListener' class:
+#-------------------------------------------------------------------------------
+
+class WhenListener ( object ):
+    """ Re-evaluates the 'visible_when', 'enabled_when' and 'checked_when'
+        conditions depending upon a (possibly extended) trait name of a
+        context object whenever it changes.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, ui, object, name ):
+        """ Initializes the object.
+        """
+        self.ui         = ui
+        self.object     = object
+        self.name       = name
+        self.conditions = []
+        object.on_trait_change( self.dispatch, name, dispatch = 'ui' )
+
+    #---------------------------------------------------------------------------
+    #  Re-evaluates the dependent conditions:
+    #---------------------------------------------------------------------------
+
+    def dispatch ( self ):
+        """ Re-evaluates the dependent conditions.
+        """
+        if self.ui._when_listeners is not None:
+            self.ui._evaluate_condition( self.conditions )
+
+    #---------------------------------------------------------------------------
+    #  Remove the listener:
+    #---------------------------------------------------------------------------
+
+    def remove ( self ):
+        """ Removes the listener.
+        """
+        self.object.on_trait_change( self.dispatch, self.name, remove = True )
+
+#-------------------------------------------------------------------------------
+#  'WhenCondition' class:
+#-------------------------------------------------------------------------------
+
+class WhenCondition ( object ):
+    """ A 'visible_when', 'enabled_when' or 'checked_when' expression
+        controlling the state of an Editor.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, when, editor, trait ):
+        """ Initializes the object.
+        """
+        self.when   = when
+        self.editor = editor
+        self.trait  = trait
+
+        # The names referenced by the compiled expression:
+        self.names = code_names( when )
+
+        # The last value the editor trait was set to (if any):
+        self.value = None
+
+#-------------------------------------------------------------------------------
+#  'ContextDict' class:
+#-------------------------------------------------------------------------------
+
+class ContextDict ( dict ):
+    """ The dictionary used to evaluate an expression in a UI's context, which
+        also resolves the names of the traits of a specified object, reading
+        their values only when the expression references them.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, context, object ):
+        """ Initializes the object.
+        """
+        super( ContextDict, self ).__init__( context )
+        self.object = object
+
+    #---------------------------------------------------------------------------
+    #  Returns the value of the object trait with a specified name:
+    #---------------------------------------------------------------------------
+
+    def __missing__ ( self, name ):
+        """ Returns the value of the object trait with a specified name.
+        """
+        object = self.object
+        if (object is not None) and (object.trait( name ) is not None):
+            value = getattr( object, name, Missing )
+            if value is not Missing:
+                return value
+
+        raise KeyError( name )
@@ -22,7 +22,12 @@
 
 from __future__ import absolute_import
 
-from traits.api import Instance, Property, List, Str, Bool, Font
+from collections import OrderedDict
+
+import numpy
+
+from traits.api import Any, Instance, Int, Long, Property, List, Str, Bool, \
+    Font, Event, on_trait_change
 
 from ..api import View, Item, TabularEditor, BasicEditorFactory
 
@@ -32,9 +37,19 @@ from ..toolkit import toolkit_object
 
 from ..ui_editor import UIEditor
 
+#-- Constants ------------------------------------------------------------------
+
+# The largest number of rows a toolkit table can display at once:
+MaxRows = 2**31 - 1
+
 #-- Tabular Adapter Definition -------------------------------------------------
 
 class ArrayViewAdapter ( TabularAdapter ):
+    """ Adapts a 1D, 2D or record array to a TabularEditor. Cell text is
+        formatted straight from the array, a block of rows at a time, using
+        one vectorized call per block, and the most recently displayed blocks
+        are cached.
+    """
 
     # Is the array 1D or 2D?
     is_2d = Bool( True )
@@ -42,11 +57,38 @@ class ArrayViewAdapter ( TabularAdapter ):
     # Should array rows and columns be transposed:
     transpose  = Bool( False )
 
+    # The names of the fields displayed as columns (for record arrays):
+    fields = List( Str )
+
+    # The index of the array row displayed as the first table row (for
+    # arrays with more rows than a table can display):
+    first_row = Long( 0, update = True )
+
+    # The number of rows formatted together as a block:
+    block_rows = Int( 64 )
+
+    # The maximum number of formatted blocks cached:
+    max_blocks = Int( 32 )
+
+    # Event fired when the visible cells need to be repainted:
+    refresh = Event( update = True )
+
     alignment  = 'right'
     index_text = Property
 
+    #-- Private Traits ---------------------------------------------------------
+
+    # The array the cached blocks were formatted from:
+    _array = Any
+
+    # The 2D (or record) view of the array being displayed:
+    _data = Any
+
+    # Mapping from block indices to the list of formatted row texts:
+    _blocks = Any
+
     def _get_index_text ( self ):
-        return str( self.row )
+        return str( self.first_row + self.row )
 
     def _get_content ( self ):
         if self.is_2d:
@@ -57,22 +99,89 @@ class ArrayViewAdapter ( TabularAdapter ):
     def get_item ( self, object, trait, row ):
         """ Returns the value of the *object.trait[row]* item.
         """
-        if self.is_2d:
-            if self.transpose:
-                return getattr( object, trait )[:,row]
-
-            return super( ArrayViewAdapter, self ).get_item( object, trait,
-                                                             row )
+        data = self._data_for( getattr( object, trait ) )
+        item = data[ self.first_row + row ]
+        if self.is_2d or self.fields:
+            return item
 
-        return getattr( object, trait )[ row ]
+        return item[0]
 
     def len ( self, object, trait ):
         """ Returns the number of items in the specified *object.trait* list.
         """
-        if self.transpose:
-            return getattr( object, trait ).shape[1]
+        data = self._data_for( getattr( object, trait ) )
+
+        return min( len( data ) - self.first_row, MaxRows )
+
+    def get_text ( self, object, trait, row, column ):
+        """ Returns the text to display for a specified
+            *object.trait[row].column* item.
+        """
+        data  = self._data_for( getattr( object, trait ) )
+        row  += self.first_row
+        block = row // self.block_rows
+        texts = self._blocks.get( block )
+        if texts is None:
+            texts = self._format_block( data, block )
+
+        return texts[ row - (block * self.block_rows) ][ column ]
+
+    def flush ( self ):
+        """ Discards the cached text of the array cells, so that changes made
+            to the array in place are displayed.
+        """
+        self._array = self._data = None
+        self.refresh = True
 
-        return super( ArrayViewAdapter, self ).len( object, trait )
+    #-- Private Methods --------------------------------------------------------
+
+    def _data_for ( self, array ):
+        """ Returns the view of a specified array used to display it, which
+            does not copy its contents.
+        """
+        if array is not self._array:
+            self._array  = array
+            self._blocks = OrderedDict()
+            if self.fields:
+                self._data = array
+            elif len( array.shape ) == 1:
+                self._data = array[ :, numpy.newaxis ]
+            elif self.transpose:
+                self._data = array.T
+            else:
+                self._data = array
+
+        return self._data
+
+    def _format_block ( self, data, block ):
+        """ Formats and caches the text of a specified block of rows.
+        """
+        first = block * self.block_rows
+        rows  = data[ first: first + self.block_rows ]
+        if self.fields:
+            columns = [ numpy.char.mod( self.format, rows[ name ] ).tolist()
+                        for name in self.fields ]
+        else:
+            columns = zip( *numpy.char.mod( self.format, rows ).tolist() )
+
+        column_map = self.column_map
+        if 'index' in column_map:
+            index = [ str( i ) for i in xrange( first, first + len( rows ) ) ]
+            columns.insert( column_map.index( 'index' ), index )
+
+        texts  = zip( *columns )
+        blocks = self._blocks
+        blocks[ block ] = texts
+        if len( blocks ) > self.max_blocks:
+            blocks.popitem( last = False )
+
+        return texts
+
+    @on_trait_change( 'columns,format' )
+    def _flush_blocks ( self ):
+        """ Discards the formatted blocks when the columns or format change.
+        """
+        self._blocks = OrderedDict()
 
 # Define the actual abstract Traits UI array view editor (each backend should
 # implement its own editor that inherits from this class.
@@ -87,22 +196,40 @@ class _ArrayViewEditor ( UIEditor ):
     # The tabular adapter being used for the editor view:
     adapter = Instance( ArrayViewAdapter )
 
+    # The index of the first array row displayed (for arrays with more rows
+    # than the table can display):
+    first_row = Long( 0 )
+
     #-- Private Methods --------------------------------------------------------
 
     def _array_view ( self ):
         """ Return the view used by the editor.
         """
-        return View(
+        items = [
             Item( 'object.object.' + self.name,
                   id         = 'tabular_editor',
                   show_label = False,
                   editor     = TabularEditor( show_titles = self.show_titles,
                                               editable    = False,
                                               adapter     = self.adapter )
-        ),
-        id        = 'array_view_editor',
-        resizable = True
-    )
+            )
+        ]
+        if len( self._rows() ) > MaxRows:
+            items.insert( 0, Item( 'first_row', label = 'First row' ) )
+
+        return View( id        = 'array_view_editor',
+                     resizable = True,
+                     *items )
+
+    def _rows ( self ):
+        """ Returns the rows of the array as displayed (i.e. after any
+            transposition).
+        """
+        value = self.value
+        if self.factory.transpose and (len( value.shape ) == 2):
+            return value.T
+
+        return value
 
     def init_ui ( self, parent ):
         """ Creates the Traits UI for displaying the array.
@@ -118,13 +245,24 @@ class _ArrayViewEditor ( UIEditor ):
         cols             = 1
         titles           = factory.titles
         n                = len( titles )
+        fields           = list( self.value.dtype.names or [] )
+        if (len_shape == 2) and fields:
+            raise ValueError( "ArrayViewEditor can only display 1D record "
+                              "arrays" )
+
+        if fields and (n == 0):
+            titles, n = fields, len( fields )
+
         self.show_titles = (n > 0)
-        is_2d            = (len_shape == 2)
+        is_2d            = (len_shape == 2) or (len( fields ) > 0)
         if is_2d:
             index = 1
             if factory.transpose:
                 index = 0
-            cols = shape[ index ]
+            if fields:
+                cols = len( fields )
+            else:
+                cols = shape[ index ]
             if self.show_titles:
                 if n > cols:
                     titles = titles[:cols]
@@ -147,6 +285,7 @@ class _ArrayViewEditor ( UIEditor ):
 
         self.adapter = ArrayViewAdapter( is_2d     = is_2d,
                                          columns   = columns,
+                                         fields    = fields,
                                          transpose = factory.transpose,
                                          format    = factory.format,
                                          font      = factory.font )
@@ -155,6 +294,22 @@ class _ArrayViewEditor ( UIEditor ):
                                  parent = parent,
                                  kind   = 'subpanel' )
 
+    def update_editor ( self ):
+        """ Updates the editor when the object trait changes external to the
+            editor.
+        """
+        if self.adapter is not None:
+            self.adapter.flush()
+
+    def _first_row_changed ( self, first_row ):
+        """ Handles the index of the first array row displayed being changed.
+        """
+        first_row = max( 0, min( first_row, len( self._rows() ) - MaxRows ) )
+        if first_row != self.first_row:
+            self.first_row = first_row
+        else:
+            self.adapter.first_row = first_row
+
 # Define the ArrayViewEditor class used by client code:
 class ArrayViewEditor ( BasicEditorFactory ):
 
@@ -0,0 +1,284 @@
+#-------------------------------------------------------------------------------
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#-------------------------------------------------------------------------------
+
+""" Defines the UIPreferences class, the store for the user preferences (such
+    as window positions and column widths) saved for each user interface.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import atexit
+import cPickle
+import shelve
+
+from os import getpid, remove, rename, stat
+from os.path import join
+from time import time
+
+from traits import trait_notifiers
+from traits.api import Any, Bool, Dict, File, Float, HasPrivateTraits, Int
+from traits.trait_base import traits_home
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The file the user interface preferences are saved in:
+ui_prefs_path = join( traits_home(), 'traits_ui.prefs' )
+
+# The shelve database the preferences were saved in by earlier versions:
+ui_db_path = join( traits_home(), 'traits_ui' )
+
+# The version of the preferences file format:
+UIPreferencesVersion = 1
+
+#-------------------------------------------------------------------------------
+#  'UIPreferences' class:
+#-------------------------------------------------------------------------------
+
+class UIPreferences ( HasPrivateTraits ):
+    """ The user preferences saved for each user interface, keyed by the user
+        interface id.
+
+        The preferences are loaded once and kept in memory. Changes are
+        written back in a batch, **flush_delay** seconds after the first
+        unsaved change (and when the application exits), by writing a
+        temporary file which then replaces the preferences file. Each user
+        interface's preferences are stored pickled separately, so loading the
+        file only unpickles the preferences of the user interfaces actually
+        used.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # The file the preferences are saved in:
+    path = File( ui_prefs_path )
+
+    # The shelve database the preferences are imported from if **path** does
+    # not exist yet (if any):
+    legacy_path = File( ui_db_path )
+
+    # The delay (in seconds) between the first unsaved change and writing the
+    # changes to the file:
+    flush_delay = Float( 5.0 )
+
+    # The pickled preferences for each user interface id:
+    entries = Dict
+
+    # Are there unsaved changes?
+    dirty = Bool( False )
+
+    # The time (in seconds) taken by the last load of the preferences file:
+    load_time = Float
+
+    # The time (in seconds) taken by the last flush of the preferences:
+    flush_time = Float
+
+    # The number of times the preferences have been written to the file:
+    flushes = Int
+
+    #-- Private Traits ---------------------------------------------------------
+
+    # The ids of the user interfaces whose preferences changed since the last
+    # flush:
+    _changed = Dict
+
+    # The modification time of the preferences file when last read or written:
+    _mtime = Any
+
+    # Has a delayed flush been requested?
+    _flush_requested = Bool( False )
+
+    #-- Public Methods ---------------------------------------------------------
+
+    def get ( self, id ):
+        """ Returns the preferences saved for the user interface with the
+            specified **id**, or None if there are none.
+        """
+        data = self.entries.get( id )
+        if data is not None:
+            try:
+                return cPickle.loads( data )
+            except:
+                # Preferences that cannot be unpickled are ignored:
+                pass
+
+        return None
+
+    def set ( self, id, prefs ):
+        """ Sets the preferences for the user interface with the specified
+            **id**, and schedules writing them to the file.
+        """
+        data = cPickle.dumps( prefs, cPickle.HIGHEST_PROTOCOL )
+        if self.entries.get( id ) != data:
+            self.entries[ id ] = data
+            self._changed[ id ] = True
+            self.dirty = True
+            self._request_flush()
+
+    def flush ( self ):
+        """ Writes any unsaved changes to the preferences file. Failures (such
+            as a read-only home directory) are ignored, and the changes are
+            kept to be written by the next flush.
+        """
+        if not self.dirty:
+            return
+
+        start = time()
+
+        # Merge in the changes made by other processes since the file was
+        # last read, without losing our own changes:
+        if self._mtime_for( self.path ) != self._mtime:
+            entries = self._load()
+            if entries is not None:
+                for id in self._changed:
+                    entries[ id ] = self.entries[ id ]
+                self.entries = entries
+
+        temp_name = '%s.%d' % ( self.path, getpid() )
+        try:
+            fh = file( temp_name, 'wb' )
+            try:
+                cPickle.dump( ( UIPreferencesVersion, self.entries ), fh,
+                              cPickle.HIGHEST_PROTOCOL )
+            finally:
+                fh.close()
+
+            try:
+                rename( temp_name, self.path )
+            except OSError:
+                # Windows will not rename over an existing file:
+                remove( self.path )
+                rename( temp_name, self.path )
+        except ( IOError, OSError ):
+            try:
+                remove( temp_name )
+            except OSError:
+                pass
+
+            return
+
+        self._mtime     = self._mtime_for( self.path )
+        self._changed   = {}
+        self.dirty      = False
+        self.flushes   += 1
+        self.flush_time = time() - start
+
+    #-- Default Value Implementations ------------------------------------------
+
+    def _entries_default ( self ):
+        start   = time()
+        entries = self._load()
+        if entries is None:
+            entries = self._load_legacy()
+        self.load_time = time() - start
+
+        return entries
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _mtime_for ( self, path ):
+        """ Returns the modification time of the specified **path**, or None
+            if it does not exist.
+        """
+        try:
+            return stat( path ).st_mtime
+        except OSError:
+            return None
+
+    def _load ( self ):
+        """ Returns the entries in the preferences file, or None if the file
+            does not exist or cannot be read.
+        """
+        self._mtime = self._mtime_for( self.path )
+        try:
+            fh = file( self.path, 'rb' )
+            try:
+                version, entries = cPickle.load( fh )
+            finally:
+                fh.close()
+
+            if version == UIPreferencesVersion:
+                return entries
+        except:
+            pass
+
+        return None
+
+    def _load_legacy ( self ):
+        """ Returns the entries imported from the legacy shelve database (if
+            any).
+        """
+        entries = {}
+        try:
+            db = shelve.open( self.legacy_path, flag = 'r', protocol = -1 )
+        except:
+            return entries
+
+        try:
+            for id in db.keys():
+                try:
+                    entries[ id ] = cPickle.dumps( db[ id ],
+                                                   cPickle.HIGHEST_PROTOCOL )
+                except:
+                    pass
+        finally:
+            db.close()
+
+        if len( entries ) > 0:
+            self._changed = dict.fromkeys( entries, True )
+            self.dirty    = True
+
+        return entries
+
+    def _request_flush ( self ):
+        """ Requests a flush of the preferences after **flush_delay** seconds
+            (if a GUI toolkit is running; otherwise the preferences are
+            flushed on exit).
+        """
+        if (self._flush_requested or
+            (trait_notifiers.ui_handler is None)):
+            return
+
+        from pyface.timer.api import do_after
+
+        self._flush_requested = True
+        try:
+            do_after( int( self.flush_delay * 1000.0 ), self._delayed_flush )
+        except NotImplementedError:
+            # The toolkit has no timers (e.g. the null toolkit), so leave the
+            # request pending and let the preferences be flushed on exit:
+            pass
+
+    def _delayed_flush ( self ):
+        """ Flushes the preferences when the delay requested by
+            **_request_flush** expires.
+        """
+        self._flush_requested = False
+        self.flush()
+
+#-------------------------------------------------------------------------------
+#  The user interface preferences store:
+#-------------------------------------------------------------------------------
+
+ui_prefs = UIPreferences()
+
+# Make sure any unsaved changes are written when the application exits:
+atexit.register( ui_prefs.flush )
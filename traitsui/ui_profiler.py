@@ -0,0 +1,294 @@
+#-------------------------------------------------------------------------------
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#-------------------------------------------------------------------------------
+
+""" Defines the UIProfiler class, which records where the time goes while
+    user interfaces are being built.
+
+    Profiling is off by default. It is turned on for a block of code by::
+
+        with profile_ui() as profiler:
+            object.edit_traits()
+        print profiler.report_text()
+
+    or for a whole process by setting the TRAITSUI_PROFILE environment
+    variable, in which case the report is written when the process exits (to
+    the file named by the variable if it ends in '.json', or to stderr as
+    text otherwise).
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import atexit
+import json
+import os
+import sys
+
+from contextlib import contextmanager
+from functools import wraps
+from time import time
+
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The report columns, in report order:
+Columns = ( 'calls', 'own_time', 'total_time' )
+
+# The column each sort order sorts by:
+SortColumns = { 'calls': 0, 'own': 1, 'total': 2 }
+
+#-------------------------------------------------------------------------------
+#  'UIProfiler' class:
+#-------------------------------------------------------------------------------
+
+class UIProfiler ( object ):
+    """ Records the number of calls and wall time of each phase of building
+        user interfaces, broken down by a detail (usually the class of the
+        object doing the work, e.g. the editor class), together with counts
+        (e.g. the number of trait listeners on each context object).
+
+        The own time of a phase excludes the time spent in the phases it
+        calls. The total time of a phase which calls itself (e.g. nested
+        groups) is only counted for the outermost call.
+    """
+
+    def __init__ ( self ):
+        # The statistics of each ( phase, detail ), as a list of the form:
+        # [ calls, own time, total time ]:
+        self.stats = {}
+
+        # The counts recorded for each ( name, detail ):
+        self.counts = {}
+
+        # The phases currently running, as a list of the form:
+        # [ key, start time, time spent in called phases ]:
+        self._stack = []
+
+        # The number of running calls of each ( phase, detail ):
+        self._running = {}
+
+    #---------------------------------------------------------------------------
+    #  Times a call:
+    #---------------------------------------------------------------------------
+
+    def call ( self, phase, detail, function, *args, **kw ):
+        """ Calls **function** with the specified arguments, recording it as
+            a call of **phase**, and returns its result.
+        """
+        key = ( phase, detail )
+        running = self._running
+        running[ key ] = running.get( key, 0 ) + 1
+        entry = [ key, time(), 0.0 ]
+        self._stack.append( entry )
+        try:
+            return function( *args, **kw )
+        finally:
+            self._stack.pop()
+            elapsed = time() - entry[1]
+            running[ key ] -= 1
+
+            stats = self.stats.get( key )
+            if stats is None:
+                stats = self.stats[ key ] = [ 0, 0.0, 0.0 ]
+            stats[0] += 1
+            stats[1] += elapsed - entry[2]
+            if running[ key ] == 0:
+                stats[2] += elapsed
+
+            if len( self._stack ) > 0:
+                self._stack[-1][2] += elapsed
+
+    #---------------------------------------------------------------------------
+    #  Records a count:
+    #---------------------------------------------------------------------------
+
+    def count ( self, name, detail, n = 1 ):
+        """ Adds **n** to the count of **name** for a detail.
+        """
+        key = ( name, detail )
+        self.counts[ key ] = self.counts.get( key, 0 ) + n
+
+    #---------------------------------------------------------------------------
+    #  Discards the recorded statistics:
+    #---------------------------------------------------------------------------
+
+    def clear ( self ):
+        """ Discards the recorded statistics and counts.
+        """
+        self.stats.clear()
+        self.counts.clear()
+
+    #---------------------------------------------------------------------------
+    #  Returns the report as a dictionary:
+    #---------------------------------------------------------------------------
+
+    def report ( self ):
+        """ Returns the recorded statistics as a dictionary of the form:
+            { 'phases': { phase: { detail: { column: value } } },
+            'counts': { name: { detail: count } } }, which can be written as
+            JSON.
+        """
+        phases = {}
+        for ( phase, detail ), stats in self.stats.iteritems():
+            phases.setdefault( phase, {} )[ detail ] = dict(
+                zip( Columns, stats ) )
+
+        counts = {}
+        for ( name, detail ), n in self.counts.iteritems():
+            counts.setdefault( name, {} )[ detail ] = n
+
+        return { 'phases': phases, 'counts': counts }
+
+    def report_json ( self, file = None ):
+        """ Returns the report as JSON text, or writes it to **file** if
+            specified.
+        """
+        if file is None:
+            return json.dumps( self.report(), indent = 2, sort_keys = True )
+
+        json.dump( self.report(), file, indent = 2, sort_keys = True )
+
+    #---------------------------------------------------------------------------
+    #  Returns the report as text:
+    #---------------------------------------------------------------------------
+
+    def report_text ( self, sort = 'total', limit = None ):
+        """ Returns the report as text in the style of the standard library's
+            pstats module, sorted (in decreasing order) by the 'calls', 'own'
+            or 'total' column.
+        """
+        column = SortColumns[ sort ]
+        rows   = sorted( self.stats.iteritems(),
+                         key = lambda row: row[1][ column ], reverse = True )
+        if limit is not None:
+            rows = rows[ : limit ]
+
+        lines = [ '%9s %9s %9s %9s %9s  phase (detail)' % (
+                  'ncalls', 'owntime', 'percall', 'cumtime', 'percall' ) ]
+        for ( phase, detail ), ( calls, own, total ) in rows:
+            if detail:
+                phase = '%s (%s)' % ( phase, detail )
+            lines.append( '%9d %9.3f %9.3f %9.3f %9.3f  %s' % (
+                          calls, own, own / calls, total, total / calls,
+                          phase ) )
+
+        if len( self.counts ) > 0:
+            lines.append( '' )
+            lines.append( '%9s  count (detail)' % 'n' )
+            for ( name, detail ), n in sorted( self.counts.iteritems() ):
+                if detail:
+                    name = '%s (%s)' % ( name, detail )
+                lines.append( '%9d  %s' % ( n, name ) )
+
+        return '\n'.join( lines ) + '\n'
+
+#-------------------------------------------------------------------------------
+#  The active profiler:
+#-------------------------------------------------------------------------------
+
+# The profiler recording the user interfaces being built (if any):
+_profiler = None
+
+def active_profiler ( ):
+    """ Returns the active UIProfiler, or None if profiling is off.
+    """
+    return _profiler
+
+@contextmanager
+def profile_ui ( profiler = None ):
+    """ Makes a UIProfiler (a new one if not specified) the active profiler
+        for the duration of a 'with' block.
+    """
+    global _profiler
+
+    if profiler is None:
+        profiler = UIProfiler()
+
+    previous, _profiler = _profiler, profiler
+    try:
+        yield profiler
+    finally:
+        _profiler = previous
+
+#-------------------------------------------------------------------------------
+#  Instrumentation helpers:
+#-------------------------------------------------------------------------------
+
+def profile_call ( phase, detail, function, *args, **kw ):
+    """ Calls **function** with the specified arguments, recording the call
+        as a call of **phase** if profiling is on. **detail** is either a
+        string or an object whose class name is used.
+    """
+    profiler = _profiler
+    if profiler is None:
+        return function( *args, **kw )
+
+    if not isinstance( detail, basestring ):
+        detail = detail.__class__.__name__
+
+    return profiler.call( phase, detail, function, *args, **kw )
+
+def profiled ( phase ):
+    """ Returns a decorator for methods which records each call as a call of
+        **phase**, with the class name of the object as the detail, if
+        profiling is on.
+    """
+    def decorator ( method ):
+        @wraps( method )
+        def wrapper ( self, *args, **kw ):
+            profiler = _profiler
+            if profiler is None:
+                return method( self, *args, **kw )
+
+            return profiler.call( phase, self.__class__.__name__, method,
+                                  self, *args, **kw )
+
+        return wrapper
+
+    return decorator
+
+def count_listeners ( object ):
+    """ Returns the number of trait change listeners on a HasTraits object
+        (i.e. the notifiers of the object and of its instance traits).
+    """
+    try:
+        n = len( object._notifiers( False ) or () )
+        for trait in object._instance_traits().itervalues():
+            n += len( trait._notifiers( False ) or () )
+    except AttributeError:
+        return 0
+
+    return n
+
+#-------------------------------------------------------------------------------
+#  Turns profiling on for the process if requested:
+#-------------------------------------------------------------------------------
+
+def _write_report ( profiler, destination ):
+    """ Writes the report of the process wide profiler.
+    """
+    if destination.endswith( '.json' ):
+        with open( destination, 'w' ) as file:
+            profiler.report_json( file )
+    else:
+        sys.stderr.write( profiler.report_text() )
+
+if os.environ.get( 'TRAITSUI_PROFILE' ):
+    _profiler = UIProfiler()
+    atexit.register( _write_report, _profiler,
+                     os.environ[ 'TRAITSUI_PROFILE' ] )
@@ -25,13 +25,23 @@
 
 from __future__ import absolute_import
 
+import cPickle
+
 from operator import isSequenceType
+from sys import getsizeof
+from tempfile import TemporaryFile
+from zlib import compress, decompress, crc32
 
-from traits.api import (Event, HasPrivateTraits, HasStrictTraits, HasTraits,
-    Instance, Int, List, Property, Str, Trait)
+from traits.api import (Any, Bool, Dict, Event, HasPrivateTraits,
+    HasStrictTraits, HasTraits, Instance, Int, List, Property, Str, Trait)
 
 from traits.trait_base import enumerate
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 #-------------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------------
@@ -39,6 +49,257 @@ from traits.trait_base import enumerate
 NumericTypes = ( int, long, float, complex )
 SimpleTypes  = ( str, unicode, int, long, float, complex )
 
+# Types whose values can be spilled to disk without losing their identity:
+PlainTypes = SimpleTypes + ( bool, type( None ) )
+
+# Values smaller than this many bytes are always stored whole:
+DeltaThreshold = 4096
+
+# The number of items compared at a time when looking for the common prefix
+# and suffix of two sequences:
+CompareChunk = 4096
+
+#-------------------------------------------------------------------------------
+#  Returns the number of bytes of memory used by a value:
+#-------------------------------------------------------------------------------
+
+def value_size ( value ):
+    """ Returns the (approximate) number of bytes of memory used by a value.
+        Note that the items of a list are not included, since they are shared
+        with the list the value was copied from.
+    """
+    if (numpy is not None) and isinstance( value, numpy.ndarray ):
+        return value.nbytes
+
+    try:
+        return getsizeof( value )
+    except TypeError:
+        return 0
+
+#-------------------------------------------------------------------------------
+#  Returns the lengths of the common prefix and suffix of two sequences:
+#-------------------------------------------------------------------------------
+
+def common_affixes ( s1, s2 ):
+    """ Returns the lengths of the common prefix and suffix of two sequences
+        as a tuple of the form: ( prefix, suffix ). The prefix and suffix do
+        not overlap.
+    """
+    n = min( len( s1 ), len( s2 ) )
+
+    # Compare whole chunks first, since slice comparisons are done in C:
+    prefix = 0
+    while (((prefix + CompareChunk) <= n) and
+           (s1[ prefix: prefix + CompareChunk ] ==
+            s2[ prefix: prefix + CompareChunk ])):
+        prefix += CompareChunk
+    while (prefix < n) and (s1[ prefix ] == s2[ prefix ]):
+        prefix += 1
+
+    n1, n2 = len( s1 ), len( s2 )
+    n     -= prefix
+    suffix = 0
+    while (((suffix + CompareChunk) <= n) and
+           (s1[ n1 - suffix - CompareChunk: n1 - suffix ] ==
+            s2[ n2 - suffix - CompareChunk: n2 - suffix ])):
+        suffix += CompareChunk
+    while (suffix < n) and (s1[ n1 - suffix - 1 ] == s2[ n2 - suffix - 1 ]):
+        suffix += 1
+
+    return ( prefix, suffix )
+
+#-------------------------------------------------------------------------------
+#  Returns the bytes of a numpy array:
+#-------------------------------------------------------------------------------
+
+def array_bytes ( array ):
+    """ Returns the contents of a numpy array as a one-dimensional uint8
+        array (which is a view of the original array whenever possible).
+    """
+    return numpy.ascontiguousarray( array ).reshape( -1 ).view( numpy.uint8 )
+
+#-------------------------------------------------------------------------------
+#  Returns a delta that recreates a value from a reference value:
+#-------------------------------------------------------------------------------
+
+def make_delta ( value, reference ):
+    """ Returns a delta object that can recreate **value** from
+        **reference**, or None if **value** should be stored whole (because it
+        is small, of an unsupported type, or differs too much from
+        **reference**).
+    """
+    size = value_size( value )
+    if (size < DeltaThreshold) or (type( value ) is not type( reference )):
+        return None
+
+    if isinstance( value, ( basestring, list ) ):
+        try:
+            prefix, suffix = common_affixes( value, reference )
+        except:
+            # Comparing the items of two lists can fail (e.g. numpy arrays):
+            return None
+
+        delta = SequenceDelta( prefix, suffix,
+                               value[ prefix: len( value ) - suffix ] )
+
+    elif ((numpy is not None) and isinstance( value, numpy.ndarray ) and
+          (value.shape == reference.shape) and
+          (value.dtype == reference.dtype) and (not value.dtype.hasobject)):
+        delta = ArrayDelta( value, reference )
+
+    else:
+        return None
+
+    if (delta.size * 2) > size:
+        return None
+
+    return delta
+
+#-------------------------------------------------------------------------------
+#  Returns whether a value can be spilled to disk:
+#-------------------------------------------------------------------------------
+
+def is_plain ( value ):
+    """ Returns whether a value can be pickled and unpickled without losing
+        anything but its identity (i.e. it does not refer to other objects).
+    """
+    if isinstance( value, SequenceDelta ):
+        value = value.middle
+    elif isinstance( value, ArrayDelta ):
+        return True
+
+    if type( value ) in PlainTypes:
+        return True
+
+    if (numpy is not None) and isinstance( value, numpy.ndarray ):
+        return (not value.dtype.hasobject)
+
+    if type( value ) in ( list, tuple ):
+        for item in value:
+            if type( item ) not in PlainTypes:
+                return False
+
+        return True
+
+    return False
+
+#-------------------------------------------------------------------------------
+#  'SequenceDelta' class:
+#-------------------------------------------------------------------------------
+
+class SequenceDelta ( object ):
+    """ A string, unicode or list value stored as the part of it which
+        differs from a reference value.
+    """
+
+    def __init__ ( self, prefix, suffix, middle ):
+        # The length of the prefix shared with the reference value:
+        self.prefix = prefix
+
+        # The length of the suffix shared with the reference value:
+        self.suffix = suffix
+
+        # The part of the value between the prefix and suffix:
+        self.middle = middle
+
+        # The number of bytes used by the delta:
+        self.size = value_size( middle )
+
+    def value ( self, reference ):
+        """ Returns the value recreated from the **reference** value.
+        """
+        return (reference[ : self.prefix ] + self.middle +
+                reference[ len( reference ) - self.suffix: ])
+
+#-------------------------------------------------------------------------------
+#  'ArrayDelta' class:
+#-------------------------------------------------------------------------------
+
+class ArrayDelta ( object ):
+    """ A numpy array stored as the compressed XOR of its bytes with those of
+        a reference array of the same shape and type.
+    """
+
+    def __init__ ( self, value, reference ):
+        reference_bytes = array_bytes( reference )
+
+        # The shape and type of the value:
+        self.shape = value.shape
+        self.dtype = value.dtype
+
+        # The checksum of the reference array (used to detect a reference
+        # array that has been modified in place):
+        self.checksum = crc32( reference_bytes )
+
+        # The compressed XOR of the value and reference bytes:
+        xor       = numpy.bitwise_xor( array_bytes( value ), reference_bytes )
+        self.data = compress( xor.tostring(), 1 )
+
+        # The number of bytes used by the delta:
+        self.size = len( self.data )
+
+    def value ( self, reference ):
+        """ Returns the value recreated from the **reference** value.
+        """
+        reference_bytes = array_bytes( reference )
+        if crc32( reference_bytes ) != self.checksum:
+            raise ValueError( 'The reference array has been modified.' )
+
+        xor = numpy.fromstring( decompress( self.data ), numpy.uint8 )
+
+        return numpy.bitwise_xor( reference_bytes, xor ).view(
+                   self.dtype ).reshape( self.shape )
+
+#-------------------------------------------------------------------------------
+#  'UndoSpillFile' class:
+#-------------------------------------------------------------------------------
+
+class UndoSpillFile ( HasPrivateTraits ):
+    """ A temporary file that undo items can spill their stored values to.
+    """
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # The temporary file
+    file = Any
+    # The number of bytes written to the file
+    size = Int
+
+    #---------------------------------------------------------------------------
+    #  Writes data to the file:
+    #---------------------------------------------------------------------------
+
+    def write ( self, data ):
+        """ Writes the compressed pickle of **data** to the file, and returns
+            the ( offset, length ) needed to read it back.
+        """
+        data   = compress( cPickle.dumps( data, cPickle.HIGHEST_PROTOCOL ), 1 )
+        offset = self.size
+        self.file.seek( offset )
+        self.file.write( data )
+        self.size += len( data )
+
+        return ( offset, len( data ) )
+
+    #---------------------------------------------------------------------------
+    #  Reads data back from the file:
+    #---------------------------------------------------------------------------
+
+    def read ( self, offset, length ):
+        """ Returns the data written to the file at **offset**.
+        """
+        self.file.seek( offset )
+
+        return cPickle.loads( decompress( self.file.read( length ) ) )
+
+    #---------------------------------------------------------------------------
+    #  Creates the temporary file:
+    #---------------------------------------------------------------------------
+
+    def _file_default ( self ):
+        return TemporaryFile()
+
 #-------------------------------------------------------------------------------
 #  'AbstractUndoItem' class:
 #-------------------------------------------------------------------------------
@@ -46,6 +307,13 @@ SimpleTypes  = ( str, unicode, int, long, float, complex )
 class AbstractUndoItem ( HasPrivateTraits ):
     """ Abstract base class for undo items.
     """
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # The number of bytes of memory used by the values stored in the item
+    memory_size = Property
+
     #---------------------------------------------------------------------------
     #  Undoes the change:
     #---------------------------------------------------------------------------
@@ -73,6 +341,54 @@ class AbstractUndoItem ( HasPrivateTraits ):
         """
         return False
 
+    #---------------------------------------------------------------------------
+    #  Reduces the memory used by the item:
+    #---------------------------------------------------------------------------
+
+    def compact ( self ):
+        """ Reduces the memory used by the values stored in the item.
+        """
+        pass
+
+    #---------------------------------------------------------------------------
+    #  Links the item to the next change made to the same object trait:
+    #---------------------------------------------------------------------------
+
+    def link ( self, undo_item ):
+        """ Links the item to **undo_item** (a later change) if it changes
+            the same object trait, so that the value the two items share is
+            only stored once. Returns whether the items were linked.
+        """
+        return False
+
+    #---------------------------------------------------------------------------
+    #  Unlinks the item from the next change made to the same object trait:
+    #---------------------------------------------------------------------------
+
+    def unlink ( self ):
+        """ Removes any link created by **link**, storing the shared value in
+            the item itself.
+        """
+        pass
+
+    #---------------------------------------------------------------------------
+    #  Spills the values stored in the item to a file:
+    #---------------------------------------------------------------------------
+
+    def spill ( self, file ):
+        """ Moves the values stored in the item to the UndoSpillFile **file**
+            (they are read back when next needed), and returns the number of
+            bytes of memory freed.
+        """
+        return 0
+
+    #---------------------------------------------------------------------------
+    #  Implementation of the 'memory_size' property:
+    #---------------------------------------------------------------------------
+
+    def _get_memory_size ( self ):
+        return 0
+
 #-------------------------------------------------------------------------------
 #  'UndoItem' class:
 #-------------------------------------------------------------------------------
@@ -95,23 +411,83 @@ class UndoItem ( AbstractUndoItem ):
 
     #---------------------------------------------------------------------------
     #  Implementation of the 'old_value' and 'new_value' properties:
+    #
+    #  The old value may be stored as a delta from the new value (see
+    #  'compact'), and the new value may be shared with the old value of the
+    #  next change made to the same object trait (see 'link'):
     #---------------------------------------------------------------------------
 
     def _get_old_value ( self ):
+        self._load()
+        if self._old_delta is not None:
+            return self._old_delta.value( self.new_value )
+
         return self._old_value
 
     def _set_old_value ( self, value ):
+        self._load()
         if isinstance( value, list ):
             value = value[:]
         self._old_value = value
+        self._old_delta = self._size = None
 
     def _get_new_value ( self ):
-        return self._new_value
+        # Follow the links to the first item storing the value, then recreate
+        # the value by applying the deltas found along the way:
+        deltas = []
+        item   = self
+        while True:
+            item._load()
+            next = item._next
+            if next is None:
+                value = item._new_value
+                break
+
+            next._load()
+            if next._old_delta is None:
+                value = next._old_value
+                break
+
+            deltas.append( next._old_delta )
+            item = next
+
+        for delta in reversed( deltas ):
+            value = delta.value( value )
+
+        return value
 
     def _set_new_value ( self, value ):
+        # Store the old value whole, since it may be a delta from the current
+        # new value:
+        self._load()
+        if self._old_delta is not None:
+            self._old_value = self.old_value
+            self._old_delta = None
+
         if isinstance( value, list ):
             value = value[:]
         self._new_value = value
+        self._next      = self._size = None
+
+    #---------------------------------------------------------------------------
+    #  Implementation of the 'memory_size' property:
+    #---------------------------------------------------------------------------
+
+    def _get_memory_size ( self ):
+        if self._size is None:
+            size = 0
+            if self._spilled is None:
+                if self._old_delta is not None:
+                    size = self._old_delta.size
+                else:
+                    size = value_size( self._old_value )
+
+                if self._next is None:
+                    size += value_size( self._new_value )
+
+            self._size = size
+
+        return self._size
 
     #---------------------------------------------------------------------------
     #  Undoes the change:
@@ -121,7 +497,15 @@ class UndoItem ( AbstractUndoItem ):
         """ Undoes the change.
         """
         try:
-            setattr( self.object, self.name, self.old_value )
+            value = self.old_value
+
+            # Keep the old value whole while it is the current value, so that
+            # undoing any earlier changes does not need to recreate it again:
+            if self._old_delta is not None:
+                self._old_value = value
+                self._old_delta = self._size = None
+
+            setattr( self.object, self.name, value )
         except:
             pass
 
@@ -134,9 +518,120 @@ class UndoItem ( AbstractUndoItem ):
         """
         try:
             setattr( self.object, self.name, self.new_value )
+            self.compact()
         except:
             pass
 
+    #---------------------------------------------------------------------------
+    #  Reduces the memory used by the item:
+    #---------------------------------------------------------------------------
+
+    def compact ( self ):
+        """ Stores the old value as a delta from the new value, if that uses
+            significantly less memory.
+        """
+        self._load()
+        if self._old_delta is None:
+            delta = make_delta( self._old_value, self.new_value )
+            if delta is not None:
+                self._old_delta = delta
+                self._old_value = self._size = None
+
+    #---------------------------------------------------------------------------
+    #  Links the item to the next change made to the same object trait:
+    #---------------------------------------------------------------------------
+
+    def link ( self, undo_item ):
+        """ Links the item to **undo_item** (a later change) if it changes
+            the same object trait, so that the value the two items share is
+            only stored once. Returns whether the items were linked.
+        """
+        if ((not isinstance( undo_item, UndoItem )) or
+            (self._next is not None)             or
+            (self.object is not undo_item.object) or
+            (self.name != undo_item.name)):
+            return False
+
+        self._load()
+        undo_item._load()
+        if undo_item._old_delta is not None:
+            return False
+
+        new = self._new_value
+        old = undo_item._old_value
+        if new is not old:
+            # List values are copies, so compare their contents instead:
+            if (type( new ) is not list) or (type( old ) is not list):
+                return False
+
+            try:
+                if new != old:
+                    return False
+            except:
+                return False
+
+        self._next      = undo_item
+        self._new_value = self._size = None
+
+        return True
+
+    #---------------------------------------------------------------------------
+    #  Unlinks the item from the next change made to the same object trait:
+    #---------------------------------------------------------------------------
+
+    def unlink ( self ):
+        """ Removes any link created by **link**, storing the shared value in
+            the item itself.
+        """
+        if self._next is not None:
+            value           = self.new_value
+            self._next      = self._size = None
+            self._new_value = value
+
+    #---------------------------------------------------------------------------
+    #  Spills the values stored in the item to a file:
+    #---------------------------------------------------------------------------
+
+    def spill ( self, file ):
+        """ Moves the values stored in the item to the UndoSpillFile **file**
+            (they are read back when next needed), and returns the number of
+            bytes of memory freed. Values which refer to other objects are
+            never spilled, since reading them back would create copies of the
+            objects.
+        """
+        if self._spilled is not None:
+            return 0
+
+        values = ( self._old_value, self._old_delta, self._new_value )
+        for value in values:
+            if not is_plain( value ):
+                return 0
+
+        size = self.memory_size
+        try:
+            offset, length = file.write( values )
+        except:
+            return 0
+
+        self._spilled   = ( file, offset, length )
+        self._old_value = self._old_delta = self._new_value = self._size = None
+
+        return size
+
+    #---------------------------------------------------------------------------
+    #  Reads back any values spilled to a file:
+    #---------------------------------------------------------------------------
+
+    def _load ( self ):
+        """ Reads back any values spilled to a file.
+        """
+        spilled = self._spilled
+        if spilled is not None:
+            file, offset, length = spilled
+            self._old_value, self._old_delta, self._new_value = \
+                file.read( offset, length )
+            self._spilled = self._size = None
+
     #---------------------------------------------------------------------------
     #  Merges two undo items if possible:
     #---------------------------------------------------------------------------
@@ -154,18 +649,14 @@ class UndoItem ( AbstractUndoItem ):
             t1 = type( v1 )
             if t1 is type( v2 ):
 
-                if isinstance(t1, basestring):
+                if issubclass( t1, basestring ):
                     # Merge two undo items if they have new values which are
                     # strings which only differ by one character (corresponding
                     # to a single character insertion, deletion or replacement
                     # operation in a text editor):
-                    n1 = len( v1 )
-                    n2 = len( v2 )
-                    n  = min( n1, n2 )
-                    i  = 0
-                    while (i < n) and (v1[i] == v2[i]):
-                        i += 1
-                    if v1[i + (n2 <= n1):] == v2[i + (n2 >= n1):]:
+                    prefix, suffix = common_affixes( v1, v2 )
+                    if ((len( v1 ) - prefix - suffix) <= 1 and
+                        (len( v2 ) - prefix - suffix) <= 1):
                         self.new_value = v2
                         return True
 
@@ -215,6 +706,115 @@ class UndoItem ( AbstractUndoItem ):
         return 'undo( %s.%s = %s )\nredo( %s.%s = %s )' % (
                       cn, n, self.old_value, cn, n, self.new_value )
 
+#-------------------------------------------------------------------------------
+#  'TextUndoItem' class:
+#-------------------------------------------------------------------------------
+
+class TextUndoItem ( AbstractUndoItem ):
+    """ A change to a string trait, stored as the replacement of one part of
+        the string, which can be undone.
+    """
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # Object that the change occurred on
+    object    = Trait( HasTraits )
+    # Name of the trait that changed
+    name      = Str
+    # Starting index of the replaced text
+    index     = Int
+    # Text added to the string
+    added     = Any( u'' )
+    # Text removed from the string
+    removed   = Any( u'' )
+
+    #---------------------------------------------------------------------------
+    #  Undoes the change:
+    #---------------------------------------------------------------------------
+
+    def undo ( self ):
+        """ Undoes the change.
+        """
+        try:
+            value = getattr( self.object, self.name )
+            setattr( self.object, self.name,
+                     value[ : self.index ] + self.removed +
+                     value[ self.index + len( self.added ): ] )
+        except:
+            pass
+
+    #---------------------------------------------------------------------------
+    #  Re-does the change:
+    #---------------------------------------------------------------------------
+
+    def redo ( self ):
+        """ Re-does the change.
+        """
+        try:
+            value = getattr( self.object, self.name )
+            setattr( self.object, self.name,
+                     value[ : self.index ] + self.added +
+                     value[ self.index + len( self.removed ): ] )
+        except:
+            pass
+
+    #---------------------------------------------------------------------------
+    #  Merges two undo items if possible:
+    #---------------------------------------------------------------------------
+
+    def merge_undo ( self, undo_item ):
+        """ Merges two undo items if possible.
+        """
+        # Merge a single character insertion, deletion or replacement which
+        # touches the text added by this item (i.e. continued typing):
+        if ((not isinstance( undo_item, self.__class__ )) or
+            (self.object is not undo_item.object)         or
+            (self.name  != undo_item.name)                or
+            (len( undo_item.added ) > 1)                  or
+            (len( undo_item.removed ) > 1)):
+            return False
+
+        i, j = self.index, self.index + len( self.added )
+        p, q = undo_item.index, undo_item.index + len( undo_item.removed )
+        if (p > j) or (q < i):
+            return False
+
+        # The parts of the text removed by the new item on either side of the
+        # text added by this item:
+        removed = undo_item.removed
+        before  = removed[ : max( i - p, 0 ) ]
+        after   = removed[ len( removed ) - max( q - j, 0 ): ]
+
+        # The replaced text after this item's change, as changed by the new
+        # item:
+        lo   = min( i, p )
+        text = before + self.added + after
+        self.added   = (text[ : p - lo ] + undo_item.added +
+                        text[ q - lo: ])
+        self.removed = before + self.removed + after
+        self.index   = lo
+
+        return True
+
+    #---------------------------------------------------------------------------
+    #  Implementation of the 'memory_size' property:
+    #---------------------------------------------------------------------------
+
+    def _get_memory_size ( self ):
+        return value_size( self.added ) + value_size( self.removed )
+
+    #---------------------------------------------------------------------------
+    #  Returns a 'pretty print' form of the object:
+    #---------------------------------------------------------------------------
+
+    def __repr__ ( self ):
+        """ Returns a 'pretty print' form of the object.
+        """
+        return 'undo( %s.%s[%d:%d] = %r )' % (
+                self.object.__class__.__name__, self.name, self.index,
+                self.index + len( self.added ), self.removed )
+
 #-------------------------------------------------------------------------------
 #  'ListUndoItem' class:
 #-------------------------------------------------------------------------------
@@ -292,6 +892,13 @@ class ListUndoItem ( AbstractUndoItem ):
                         return True
         return False
 
+    #---------------------------------------------------------------------------
+    #  Implementation of the 'memory_size' property:
+    #---------------------------------------------------------------------------
+
+    def _get_memory_size ( self ):
+        return value_size( self.added ) + value_size( self.removed )
+
     #---------------------------------------------------------------------------
     #  Returns a 'pretty print' form of the object:
     #---------------------------------------------------------------------------
@@ -326,6 +933,22 @@ class UndoHistory ( HasStrictTraits ):
     can_undo = Property
     # Can an action be redone?
     can_redo = Property
+    # The maximum number of bytes of memory used by the values stored in the
+    # history (0 means no limit). When the limit is exceeded, the oldest
+    # transactions are spilled to a temporary file (if 'spill' is True) or
+    # discarded
+    max_memory = Int( 0 )
+    # Should the oldest transactions be spilled to a temporary file when the
+    # memory limit is exceeded (rather than being discarded)?
+    spill = Bool( False )
+    # The number of bytes of memory used by the values stored in the history
+    memory_size = Property
+    # The number of bytes written to the spill file
+    spilled_size = Property
+    # The temporary file transactions are spilled to
+    _spill_file = Instance( UndoSpillFile )
+    # The most recent UndoItem for each ( id( object ), name ) trait
+    _latest = Dict
 
     #---------------------------------------------------------------------------
     #  Adds an UndoItem to the history:
@@ -343,16 +966,22 @@ class UndoHistory ( HasStrictTraits ):
         if now > 0:
             previous = self.history[ now - 1 ]
             if (len( previous ) == 1) and previous[0].merge_undo( undo_item ):
-                self.history[ now: ] = []
+                self._truncate()
+                previous[0].compact()
+                self._limit_memory()
                 return
 
         old_len = len( self.history )
-        self.history[ now: ] = [ [ undo_item ] ]
+        self._truncate()
+        self._link( undo_item )
+        undo_item.compact()
+        self.history.append( [ undo_item ] )
         self.now += 1
         if self.now == 1:
             self.undoable = True
         if self.now <= old_len:
             self.redoable = False
+        self._limit_memory()
 
     #---------------------------------------------------------------------------
     #  Extends the most recent 'undo' item:
@@ -367,7 +996,10 @@ class UndoHistory ( HasStrictTraits ):
         if self.now > 0:
             undo_list =  self.history[ self.now - 1 ]
             if not undo_list[-1].merge_undo( undo_item ):
+                self._link( undo_item )
                 undo_list.append( undo_item )
+            undo_list[-1].compact()
+            self._limit_memory()
 
     #---------------------------------------------------------------------------
     #  Undo an operation:
@@ -427,6 +1059,8 @@ class UndoHistory ( HasStrictTraits ):
         old_now  = self.now
         self.now = 0
         del self.history[:]
+        self._spill_file = None
+        self._latest     = {}
         if old_now > 0:
             self.undoable = False
         if old_now < old_len:
@@ -450,6 +1084,113 @@ class UndoHistory ( HasStrictTraits ):
         """
         return self.now < len( self.history )
 
+    #---------------------------------------------------------------------------
+    #  Returns the memory used by the history:
+    #---------------------------------------------------------------------------
+
+    def _get_memory_size ( self ):
+        """ Returns the number of bytes of memory used by the values stored
+            in the history.
+        """
+        return sum( [ item.memory_size for items in self.history
+                                       for item in items ] )
+
+    #---------------------------------------------------------------------------
+    #  Returns the number of bytes written to the spill file:
+    #---------------------------------------------------------------------------
+
+    def _get_spilled_size ( self ):
+        """ Returns the number of bytes written to the spill file.
+        """
+        if self._spill_file is None:
+            return 0
+
+        return self._spill_file.size
+
+    #---------------------------------------------------------------------------
+    #  Discards the transactions that can be redone:
+    #---------------------------------------------------------------------------
+
+    def _truncate ( self ):
+        """ Discards the transactions that can be redone (i.e. those after
+            the current position).
+        """
+        now = self.now
+        if now < len( self.history ):
+            discarded = set( [ id( item ) for items in self.history[ now: ]
+                                          for item in items ] )
+            del self.history[ now: ]
+
+            # Kept items linked to a discarded item must store their new value
+            # themselves, so that the discarded items can be freed:
+            latest = self._latest = {}
+            for items in self.history:
+                for item in items:
+                    if isinstance( item, UndoItem ):
+                        if id( item._next ) in discarded:
+                            item.unlink()
+                        latest[ ( id( item.object ), item.name ) ] = item
+
+    #---------------------------------------------------------------------------
+    #  Links a new undo item to the previous change to the same trait:
+    #---------------------------------------------------------------------------
+
+    def _link ( self, undo_item ):
+        """ Links a new undo item to the most recent change made to the same
+            object trait.
+        """
+        if isinstance( undo_item, UndoItem ):
+            key  = ( id( undo_item.object ), undo_item.name )
+            item = self._latest.get( key )
+            if item is not None:
+                item.link( undo_item )
+
+            self._latest[ key ] = undo_item
+
+        elif isinstance( undo_item, TextUndoItem ):
+            # The latest value of the trait is no longer stored by an UndoItem:
+            self._latest.pop( ( id( undo_item.object ), undo_item.name ), None )
+
+    #---------------------------------------------------------------------------
+    #  Keeps the memory used by the history within its limit:
+    #---------------------------------------------------------------------------
+
+    def _limit_memory ( self ):
+        """ Spills or discards the oldest transactions until the memory used
+            by the history is within its limit. The most recent transaction is
+            always kept.
+        """
+        limit = self.max_memory
+        if limit <= 0:
+            return
+
+        size = self.memory_size
+        if size <= limit:
+            return
+
+        if self.spill:
+            if self._spill_file is None:
+                self._spill_file = UndoSpillFile()
+
+            for items in self.history[ : self.now - 1 ]:
+                for item in items:
+                    size -= item.spill( self._spill_file )
+
+                if size <= limit:
+                    return
+
+        latest = self._latest
+        while (size > limit) and (self.now > 1):
+            for item in self.history[0]:
+                size -= item.memory_size
+                if isinstance( item, UndoItem ):
+                    key = ( id( item.object ), item.name )
+                    if latest.get( key ) is item:
+                        del latest[ key ]
+
+            del self.history[0]
+            self.now -= 1
+
 #-------------------------------------------------------------------------------
 #  'UndoHistoryUndoItem' class:
 #-------------------------------------------------------------------------------
@@ -0,0 +1,191 @@
+#-------------------------------------------------------------------------------
+#
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#-------------------------------------------------------------------------------
+
+""" Defines the UpdateScheduler class, which coalesces the editor updates
+    caused by rapid (and possibly background thread) trait changes.
+"""
+
+#-------------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+from thread import allocate_lock
+from time import time
+
+from traits import trait_notifiers
+from traits.api import Any, Bool, Float, HasPrivateTraits, Int
+
+#-------------------------------------------------------------------------------
+#  'UpdateScheduler' class:
+#-------------------------------------------------------------------------------
+
+class UpdateScheduler ( HasPrivateTraits ):
+    """ Coalesces the editor updates caused by trait changes.
+
+        Each trait change an editor is notified of (on any thread) is added to
+        a set of pending updates, replacing any pending update for the same
+        editor, so only the most recent value is shown. The pending updates
+        are applied on the UI thread at most once every **interval** seconds.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # The minimum time (in seconds) between applying the pending updates:
+    interval = Float( 1.0 / 60.0 )
+
+    # The number of updates scheduled:
+    scheduled = Int
+
+    # The number of updates merged into an already pending update for the
+    # same editor:
+    merged = Int
+
+    # The number of updates dropped because their editor or user interface
+    # was disposed of before they were applied:
+    dropped = Int
+
+    # The number of times the pending updates have been applied:
+    flushes = Int
+
+    #-- Private Traits ---------------------------------------------------------
+
+    # The lock protecting the pending updates:
+    _lock = Any
+
+    # The pending updates (mapping editors to [ object, name, old, new,
+    # external ], where 'external' is whether any of the merged changes was
+    # not made by the editor itself):
+    _pending = Any
+
+    # Has the UI thread been asked to apply the pending updates?
+    _requested = Bool( False )
+
+    # The time the pending updates were last applied:
+    _flushed = Float( 0.0 )
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, **traits ):
+        """ Initializes the object.
+        """
+        super( UpdateScheduler, self ).__init__( **traits )
+
+        self._lock    = allocate_lock()
+        self._pending = OrderedDict()
+
+    #---------------------------------------------------------------------------
+    #  Schedules an editor update:
+    #---------------------------------------------------------------------------
+
+    def schedule ( self, editor, object, name, old, new ):
+        """ Schedules a call to the editor's '_update_editor' method for the
+            specified trait change. Can be called on any thread.
+        """
+        # Note whether the editor made the change itself now, since it no
+        # longer knows by the time the update is applied:
+        external = (not editor._no_update)
+        self._lock.acquire()
+        try:
+            self.scheduled += 1
+            pending = self._pending.get( editor )
+            if pending is None:
+                self._pending[ editor ] = [ object, name, old, new, external ]
+            else:
+                # Keep the oldest 'old' value, so the merged update (and any
+                # undo item created for it) spans all of the merged changes:
+                pending[0], pending[1], pending[3] = object, name, new
+                pending[4] = pending[4] or external
+                self.merged += 1
+
+            request, self._requested = (not self._requested), True
+        finally:
+            self._lock.release()
+
+        if request:
+            ui_handler = trait_notifiers.ui_handler
+            if ui_handler is None:
+                self._request_flush()
+            else:
+                trait_notifiers.ui_dispatch( self._request_flush )
+
+    #---------------------------------------------------------------------------
+    #  Applies all pending updates:
+    #---------------------------------------------------------------------------
+
+    def flush ( self ):
+        """ Applies all pending updates. Must be called on the UI thread.
+        """
+        self._lock.acquire()
+        try:
+            pending, self._pending = self._pending, OrderedDict()
+            self._requested = False
+        finally:
+            self._lock.release()
+
+        self._flushed  = time()
+        self.flushes  += 1
+        for editor, ( object, name, old, new, external ) in \
+                pending.iteritems():
+            if editor.ui is None:
+                self.dropped += 1
+            elif external:
+                editor._update_editor( object, name, old, new )
+            else:
+                # The change is still logged, but the editor, which made all
+                # of the merged changes itself, is not updated:
+                no_update, editor._no_update = editor._no_update, True
+                try:
+                    editor._update_editor( object, name, old, new )
+                finally:
+                    editor._no_update = no_update
+
+    #---------------------------------------------------------------------------
+    #  Discards all pending updates:
+    #---------------------------------------------------------------------------
+
+    def discard ( self ):
+        """ Discards all pending updates (e.g. because the user interface is
+            being disposed of).
+        """
+        self._lock.acquire()
+        try:
+            self.dropped += len( self._pending )
+            self._pending.clear()
+        finally:
+            self._lock.release()
+
+    #-- Private Methods --------------------------------------------------------
+
+    def _request_flush ( self ):
+        """ Applies the pending updates as soon as **interval** seconds have
+            passed since they were last applied. Called on the UI thread.
+        """
+        delay = self._flushed + self.interval - time()
+        if (delay <= 0.0) or (trait_notifiers.ui_handler is None):
+            self.flush()
+        else:
+            from pyface.timer.api import do_after
+
+            try:
+                do_after( int( delay * 1000.0 ) + 1, self.flush )
+            except NotImplementedError:
+                # The toolkit has no timers (e.g. the null toolkit):
+                self.flush()
@@ -26,14 +26,25 @@ from __future__ import absolute_import
 
 import inspect
 
+from operator import itemgetter
 from types import FunctionType, MethodType
 
-from traits.api import Any, Bool, HasPrivateTraits, HasTraits, Instance, List, Str
+from traits.api import (Any, Bool, HasPrivateTraits, HasTraits, Instance, Int,
+    List, Str)
 
 from .tree_node import ObjectTreeNode, TreeNode, TreeNodeObject
 
 from .editors.tree_editor import TreeEditor
 
+#-------------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------------
+
+# The maximum number of children shown for a node. The children of nodes with
+# more children are grouped into (nested) ranges of this many children, which
+# are only created when the range is opened:
+ChildrenPerRange = 1000
+
 #-------------------------------------------------------------------------------
 #  'SingleValueTreeNodeObject' class:
 #-------------------------------------------------------------------------------
@@ -172,21 +183,10 @@ class SingleValueTreeNodeObject ( TreeNodeObject ):
     def node_for ( self, name, value ):
         """ Returns the correct node type for a specified value.
         """
-        for type, node in basic_types():
-            if isinstance( value, type ):
-                break
-        else:
-            node = OtherNode
-            if inspect.isclass( value ):
-                node = ClassNode
-
-            elif hasattr( value, '__class__' ):
-                node = ObjectNode
-
-        return node( parent   = self,
-                     name     = name,
-                     value    = value,
-                     readonly = self.readonly )
+        return node_type_for( value )( parent   = self,
+                                       name     = name,
+                                       value    = value,
+                                       readonly = self.readonly )
 
 #-------------------------------------------------------------------------------
 #  'MultiValueTreeNodeObject' class:
@@ -214,6 +214,40 @@ class MultiValueTreeNodeObject ( SingleValueTreeNodeObject ):
         """
         return True
 
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for a range of the object's children:
+    #---------------------------------------------------------------------------
+
+    def range_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**,
+            grouped into RangeNode objects if there are more than
+            ChildrenPerRange of them.
+        """
+        n = end - start
+        if n <= ChildrenPerRange:
+            return self.child_nodes( start, end )
+
+        size = ChildrenPerRange
+        while (size * ChildrenPerRange) < n:
+            size *= ChildrenPerRange
+
+        return [ RangeNode( parent   = self,
+                            owner    = self,
+                            start    = i,
+                            end      = min( i + size, end ),
+                            readonly = True )
+                 for i in xrange( start, end, size ) ]
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for the children from 'start' to 'end':
+    #---------------------------------------------------------------------------
+
+    def child_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**
+            (ungrouped). Overridden by subclasses which use **range_nodes**.
+        """
+        raise NotImplementedError
+
 #-------------------------------------------------------------------------------
 #  'StringNode' class:
 #-------------------------------------------------------------------------------
@@ -323,16 +357,18 @@ class TupleNode ( MultiValueTreeNodeObject ):
     def tno_get_children ( self, node ):
         """ Gets the object's children.
         """
-        node_for = self.node_for
-        value    = self.value
-        if len( value ) > 500:
-            return ([ node_for( '[%d]' % i, x )
-                      for i, x in enumerate( value[ : 250 ] ) ] +
-                    [ StringNode( value = '...', readonly = True ) ] +
-                    [ node_for( '[%d]' % i, x )
-                      for i, x in enumerate( value[ -250: ] ) ])
+        return self.range_nodes( 0, len( self.value ) )
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for the children from 'start' to 'end':
+    #---------------------------------------------------------------------------
 
-        return [ node_for( '[%d]' % i, x ) for i, x in enumerate( value ) ]
+    def child_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**.
+        """
+        node_for = self.node_for
+        return [ node_for( '[%d]' % i, x )
+                 for i, x in enumerate( self.value[ start: end ], start ) ]
 
 #-------------------------------------------------------------------------------
 #  'ListNode' class:
@@ -388,6 +424,29 @@ class SetNode ( ListNode ):
         """
         return 'Set(%d)' % len( value )
 
+    #---------------------------------------------------------------------------
+    #  Gets the object's children:
+    #---------------------------------------------------------------------------
+
+    def tno_get_children ( self, node ):
+        """ Gets the object's children.
+        """
+        # Sets cannot be sliced, so the ranges index a snapshot of the set:
+        self._items = list( self.value )
+
+        return self.range_nodes( 0, len( self._items ) )
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for the children from 'start' to 'end':
+    #---------------------------------------------------------------------------
+
+    def child_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**.
+        """
+        node_for = self.node_for
+        return [ node_for( '[%d]' % i, x )
+                 for i, x in enumerate( self._items[ start: end ], start ) ]
+
 #-------------------------------------------------------------------------------
 #  'ArrayNode' class:
 #-------------------------------------------------------------------------------
@@ -429,15 +488,30 @@ class DictNode ( TupleNode ):
     def tno_get_children ( self, node ):
         """ Gets the object's children.
         """
-        node_for = self.node_for
-        items    = [ ( repr( k ), v ) for k, v in self.value.items() ]
-        items.sort( lambda l, r: cmp( l[0], r[0] ) )
-        if len( items ) > 500:
-            return ([ node_for( '[%s]' % k, v ) for k, v in items[: 250 ] ] +
-                    [ StringNode( value = '...', readonly = True ) ]        +
-                    [ node_for( '[%s]' % k, v ) for k, v in items[ -250: ] ])
+        # Only the keys in the ranges opened are formatted, so the keys are
+        # sorted by value (unless they cannot be compared). The values are
+        # taken at the same time, in case keys are deleted before the ranges
+        # are opened:
+        value = self.value
+        keys  = value.keys()
+        try:
+            keys.sort()
+        except TypeError:
+            keys.sort( key = repr )
+        self._items = [ ( k, value[ k ] ) for k in keys ]
 
-        return [ node_for( '[%s]' % k, v ) for k, v in items ]
+        return self.range_nodes( 0, len( keys ) )
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for the children from 'start' to 'end':
+    #---------------------------------------------------------------------------
+
+    def child_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**.
+        """
+        node_for = self.node_for
+        return [ node_for( '[%r]' % ( k, ), v )
+                 for k, v in self._items[ start: end ] ]
 
     #---------------------------------------------------------------------------
     #  Returns whether or not the object's children can be deleted:
@@ -545,9 +619,21 @@ class ObjectNode ( MultiValueTreeNodeObject ):
     def tno_get_children ( self, node ):
         """ Gets the object's children.
         """
-        items = [ ( k, v ) for k, v in self.value.__dict__.items() ]
-        items.sort( lambda l, r: cmp( l[0], r[0] ) )
-        return [ self.node_for( '.' + k, v ) for k, v in items ]
+        items = self.value.__dict__.items()
+        items.sort( key = itemgetter( 0 ) )
+        self._items = items
+
+        return self.range_nodes( 0, len( items ) )
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for the children from 'start' to 'end':
+    #---------------------------------------------------------------------------
+
+    def child_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**.
+        """
+        node_for = self.node_for
+        return [ node_for( '.' + k, v ) for k, v in self._items[ start: end ] ]
 
 #-------------------------------------------------------------------------------
 #  'ClassNode' class:
@@ -592,10 +678,21 @@ class TraitsNode ( ObjectNode ):
         """
         names = self._get_names()
         names.sort()
+        self._names = names
+
+        return self.range_nodes( 0, len( names ) )
+
+    #---------------------------------------------------------------------------
+    #  Returns the nodes for the children from 'start' to 'end':
+    #---------------------------------------------------------------------------
+
+    def child_nodes ( self, start, end ):
+        """ Returns the nodes for the children from **start** to **end**.
+        """
         value    = self.value
         node_for = self.node_for
         nodes    = []
-        for name in names:
+        for name in self._names[ start: end ]:
             try:
                 item_value = getattr( value, name, '<unknown>' )
             except Exception, excp:
@@ -646,6 +743,56 @@ class TraitsNode ( ObjectNode ):
         """
         pass
 
+#-------------------------------------------------------------------------------
+#  'RangeNode' class:
+#-------------------------------------------------------------------------------
+
+class RangeNode ( MultiValueTreeNodeObject ):
+    """ A tree node for a range of the children of another node, whose
+        nodes are only created when the range is opened.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Trait definitions:
+    #---------------------------------------------------------------------------
+
+    # The node whose children are in the range:
+    owner = Instance( MultiValueTreeNodeObject )
+
+    # The index of the first child in the range:
+    start = Int
+
+    # The index after the last child in the range:
+    end = Int
+
+    #---------------------------------------------------------------------------
+    #  Gets the label to display for a specified object:
+    #---------------------------------------------------------------------------
+
+    def tno_get_label ( self, node ):
+        """ Gets the label to display for a specified object.
+        """
+        return '[%d..%d]' % ( self.start, self.end - 1 )
+
+    #---------------------------------------------------------------------------
+    #  Returns the icon for a specified object:
+    #---------------------------------------------------------------------------
+
+    def tno_get_icon ( self, node, is_expanded ):
+        """ Returns the icon for a specified object (the icon of the node
+            whose children are in the range).
+        """
+        return self.owner.tno_get_icon( node, is_expanded )
+
+    #---------------------------------------------------------------------------
+    #  Gets the object's children:
+    #---------------------------------------------------------------------------
+
+    def tno_get_children ( self, node ):
+        """ Gets the object's children.
+        """
+        return self.owner.range_nodes( self.start, self.end )
+
 #-------------------------------------------------------------------------------
 #  'RootNode' class:
 #-------------------------------------------------------------------------------
@@ -709,6 +856,35 @@ def basic_types ( ):
 
     return _basic_types
 
+#-------------------------------------------------------------------------------
+#  Returns the node class for a specified value:
+#-------------------------------------------------------------------------------
+
+# The node class for each type of value seen so far:
+_node_types = {}
+
+def node_type_for ( value ):
+    """ Returns the node class for a specified value. The class is looked up
+        once for each type of value, and cached.
+    """
+    value_type = type( value )
+    node       = _node_types.get( value_type )
+    if node is None:
+        for type_, node in basic_types():
+            if isinstance( value, type_ ):
+                break
+        else:
+            node = OtherNode
+            if inspect.isclass( value ):
+                node = ClassNode
+
+            elif hasattr( value, '__class__' ):
+                node = ObjectNode
+
+        _node_types[ value_type ] = node
+
+    return node
+
 #-------------------------------------------------------------------------------
 #  '_ValueTree' class:
 #-------------------------------------------------------------------------------
@@ -732,7 +908,7 @@ value_tree_nodes = [
         node_for = [ NoneNode, StringNode, BoolNode, IntNode, FloatNode,
                      ComplexNode, OtherNode, TupleNode, ListNode, ArrayNode,
                      DictNode, SetNode, FunctionNode, MethodNode, ObjectNode,
-                     TraitsNode, RootNode, ClassNode ] )
+                     TraitsNode, RootNode, ClassNode, RangeNode ] )
 ]
 
 # Editor for a value tree:
@@ -752,7 +928,8 @@ value_tree_editor_with_root = TreeEditor(
             node_for = [ NoneNode, StringNode, BoolNode, IntNode, FloatNode,
                          ComplexNode, OtherNode, TupleNode, ListNode, ArrayNode,
                          DictNode, SetNode, FunctionNode, MethodNode,
-                         ObjectNode, TraitsNode, RootNode, ClassNode ]
+                         ObjectNode, TraitsNode, RootNode, ClassNode,
+                         RangeNode ]
         ),
         TreeNode( node_for = [ _ValueTree ],
                   auto_open  = True,
@@ -32,6 +32,8 @@ from .view_element import ViewElement, ViewSubElement
 
 from .ui import UI
 
+from .ui_profiler import profiled
+
 from .ui_traits import (AButton, ATheme, AnObject, Buttons, DockStyle,
     EditorStyle, ExportType, HelpId, Image, SequenceTypes, ViewStatus)
 
@@ -301,6 +303,14 @@ class View ( ViewElement ):
     # The default theme to use for a contained item's label:
     label_theme = ATheme
 
+    # Should the editor updates caused by trait changes be coalesced, so that
+    # rapid (e.g. background thread) changes only update each editor with the
+    # most recent value, at most once every **update_interval** seconds?
+    coalesce_updates = Bool( False )
+
+    # The minimum time (in seconds) between coalesced editor updates:
+    update_interval = Float( 1.0 / 60.0 )
+
     # Note: Group objects delegate their 'object' and 'style' traits to the View
 
     #-- Deprecated Traits (DO NOT USE) -----------------------------------------
@@ -358,6 +368,7 @@ class View ( ViewElement ):
     #  Creates a UI user interface object:
     #---------------------------------------------------------------------------
 
+    @profiled( 'View.ui' )
     def ui ( self, context, parent        = None, kind       = None,
                             view_elements = None, handler    = None,
                             id            = '',   scrollable = None,
@@ -31,13 +31,13 @@ import wx.grid as wxg
 
 from traits.api \
     import HasPrivateTraits, Any, Str, Instance, Event, Bool, \
-           on_trait_change
+           TraitListEvent, on_trait_change
 
 from traitsui.api \
     import View, Item, Editor
 
 from traitsui.editors.table_editor \
-    import ReversedList
+    import ReversedList, TableFilterIndex, TableSortKeys, list_event_range
 
 from traitsui.table_filter \
     import TableFilter
@@ -121,7 +121,7 @@ class TableModel ( GridModel ):
 
         # Set up listeners for any of the model data changing:
         object.on_trait_change( self._on_data_changed, name, dispatch = 'ui' )
-        object.on_trait_change( self.fire_content_changed, name + '.-',
+        object.on_trait_change( self._on_item_changed, name + '.-',
                                 dispatch = 'ui' )
 
         # Set up listeners for any column definitions changing:
@@ -154,7 +154,7 @@ class TableModel ( GridModel ):
 
         # Remove listeners for any of the model data changing:
         object.on_trait_change( self._on_data_changed, name, remove = True )
-        object.on_trait_change( self.fire_content_changed, name + '.-',
+        object.on_trait_change( self._on_item_changed, name + '.-',
                                 remove = True )
 
         # Remove listeners for any column definitions changing:
@@ -264,7 +264,7 @@ class TableModel ( GridModel ):
     def no_column_sort ( self ):
         """ Resets any sorting being performed on the underlying model.
         """
-        self._sorter = self._filtered_cache = None
+        self._sort_column = self._sort_keys = self._filtered_cache = None
         self.column_sorted = GridSortEvent(index = -1)
         #self.fire_structure_changed()
 
@@ -278,7 +278,7 @@ class TableModel ( GridModel ):
     def _filter_modified ( self ):
         """ Handles the contents of the filter being changed.
         """
-        self._filtered_cache = None
+        self._filtered_cache = self._filter_index = None
         self.fire_structure_changed()
         self.editor.filter_modified()
 
@@ -390,9 +390,11 @@ class TableModel ( GridModel ):
         # Flush the object cache:
         self._filtered_cache = None
 
-        # Cache the sorting information for later:
-        self._sorter  = self.__get_column( col ).cmp
-        self._reverse = reverse
+        # Cache the sorting information for later (the sort keys are computed
+        # the next time they are needed):
+        self._sort_column = self.__get_column( col )
+        self._sort_keys   = None
+        self._reverse     = reverse
 
         # If model sorting is requested, do it now:
         self._sort_model()
@@ -720,14 +722,56 @@ class TableModel ( GridModel ):
     #  Trait event handlers:
     #---------------------------------------------------------------------------
 
-    def _on_data_changed ( self ):
+    def _on_data_changed ( self, object, name, old, new ):
         """ Forces the grid to refresh when the underlying list changes.
         """
+        # Re-apply the filter and compute the sort keys only for the items
+        # that were added (if possible):
+        if isinstance( new, TraitListEvent ):
+            items   = self.__items()
+            changes = list_event_range( items, new )
+            if self._filter_index is not None:
+                self._filter_index.update_items( items, *changes )
+            if self._sort_keys is not None:
+                self._sort_keys.update_items( items, *changes )
+        else:
+            self._filter_index = self._sort_keys = None
+
         # Invalidate the current cache (if any):
         self._filtered_cache = None
 
         self.fire_structure_changed()
 
+    def _on_item_changed ( self, object, name, old, new ):
+        """ Re-applies the filter to a model item and moves it to its new
+            sorted position (if necessary) when one of its traits changes.
+        """
+        index     = self._filter_index
+        sort_keys = self._sort_keys
+        if (index is not None) or (sort_keys is not None):
+            items = self.__items()
+            try:
+                row = items.index( object )
+            except ValueError:
+                row = -1
+
+            if row >= 0:
+                resort = ((sort_keys is not None) and
+                          sort_keys.update_item( items, row ))
+                if (index is not None) and index.update_item( items, row ):
+                    self._filtered_cache = None
+                    self.fire_structure_changed()
+                    return
+
+                fc = self._filtered_cache
+                if resort and (fc is not None):
+                    old, new = sort_keys.reposition(
+                                   self.editor.filtered_indices, row,
+                                   self._reverse )
+                    fc.insert( new, fc.pop( old ) )
+
+        self.fire_content_changed()
+
     def _mouse_cell_changed ( self, new ):
         """ Handles the user mousing over a specified cell.
         """
@@ -780,10 +824,12 @@ class TableModel ( GridModel ):
         """ Sorts the underlying model if that is what the user requested.
         """
         editor = self.editor
-        sorted = (editor.factory.sort_model and (self._sorter is not None))
+        sorted = (editor.factory.sort_model and
+                  (self._sort_column is not None))
         if sorted:
             items = self.__items( False )[:]
-            items.sort( self._sorter )
+            items = [ items[ i ] for i in
+                      TableSortKeys( self._sort_column, items ).order() ]
             if self.reverse ^ self._reverse:
                 items.reverse()
             editor.value = items
@@ -806,26 +852,25 @@ class TableModel ( GridModel ):
         """
         fc = self._filtered_cache
         if fc is None:
-            items  = self.__items()
-            filter = self.filter
-            if filter is None:
-                nitems = [ nitem for nitem in enumerate( items ) ]
-                self.filter_summary = 'All %s items' % len( nitems )
-            else:
-                if not callable( filter ):
-                    filter = filter.filter
-                nitems = [ nitem for nitem in enumerate( items )
-                           if filter( nitem[1] ) ]
-                self.filter_summary = '%s of %s items' % ( len( nitems ),
-                                                           len( items ) )
-            sorter = self._sorter
-            if sorter is not None:
-                nitems.sort( lambda l, r: sorter( l[1], r[1] ) )
+            items = self.__items()
+            index = self._filter_index
+            if index is None:
+                self._filter_index = index = TableFilterIndex()
+                index.reset( self.filter, items )
+
+            self.filter_summary = index.summary( items )
+            indices = index.indices[:]
+            if self._sort_column is not None:
+                sort_keys = self._sort_keys
+                if sort_keys is None:
+                    self._sort_keys = sort_keys = TableSortKeys(
+                                                      self._sort_column, items )
+                indices = sort_keys.order( indices )
                 if self._reverse:
-                    nitems.reverse()
+                    indices.reverse()
 
-            self.editor.filtered_indices = [ x[0] for x in nitems ]
-            self._filtered_cache = fc    = [ x[1] for x in nitems ]
+            self.editor.filtered_indices = indices
+            self._filtered_cache = fc    = [ items[ i ] for i in indices ]
             if self.auto_add_row is not None:
                 self._filtered_cache.append( self.auto_add_row )
 
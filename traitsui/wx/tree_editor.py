@@ -792,8 +792,9 @@ class SimpleEditor ( Editor ):
 
         # Select all nodes which understand this object:
         factory = self.factory
-        nodes   = [ node for node in factory.nodes
-                    if object is not None and node.is_node_for( object ) ]
+        nodes   = []
+        if object is not None:
+            nodes = factory.nodes_for( object )
 
         # If only one found, we're done, return it:
         if len( nodes ) == 1:
@@ -844,10 +845,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class ( self, klass ):
         """ Returns the TreeNode associated with a specified class.
         """
-        for node in self.factory.nodes:
-            if issubclass( klass, tuple( node.node_for ) ):
-                return node
-        return None
+        return self.factory.node_for_class( klass )
 
     #---------------------------------------------------------------------------
     #  Returns the node and class associated with a specified class name:
@@ -856,11 +854,7 @@ class SimpleEditor ( Editor ):
     def _node_for_class_name ( self, class_name ):
         """ Returns the node and class associated with a specified class name.
         """
-        for node in self.factory.nodes:
-            for klass in node.node_for:
-                if class_name == klass.__name__:
-                    return ( node, klass )
-        return ( None, None )
+        return self.factory.node_for_class_name( class_name )
 
     #---------------------------------------------------------------------------
     #  Updates the icon for a specified node:
@@ -47,6 +47,9 @@ from traitsui.dockable_view_element \
 from traitsui.help_template \
     import help_template
 
+from traitsui.ui_profiler \
+    import profiled
+
 from traitsui.menu \
     import UndoButton, RevertButton, HelpButton
 
@@ -844,6 +847,7 @@ class FillPanel ( object ):
     #  Adds a list of Item objects to the panel:
     #---------------------------------------------------------------------------
 
+    @profiled( 'FillPanel.add_items' )
     def add_items ( self, content, panel, sizer ):
         """ Adds a list of Item objects to the panel.
         """
@@ -987,27 +991,7 @@ class FillPanel ( object ):
                     label = self.dummy_label( panel, item_sizer )
 
             # Get the editor factory associated with the Item:
-            editor_factory = item.editor
-            if editor_factory is None:
-                editor_factory = trait.get_editor()
-
-                # If still no editor factory found, use a default text editor:
-                if editor_factory is None:
-                    from text_editor import ToolkitEditorFactory
-                    editor_factory = ToolkitEditorFactory()
-
-                # If the item has formatting traits set them in the editor
-                # factory:
-                if item.format_func is not None:
-                    editor_factory.format_func = item.format_func
-
-                if item.format_str != '':
-                    editor_factory.format_str = item.format_str
-
-                # If the item has an invalid state extended trait name, set it
-                # in the editor factory:
-                if item.invalid != '':
-                    editor_factory.invalid = item.invalid
+            editor_factory = ui.get_editor_factory( item, trait )
 
             # Set up the background image (if used):
             item_panel = panel